@@ -0,0 +1,9 @@
+"""Benchmarks for the Zenodotos hot paths.
+
+Run every benchmark, or those whose names contain the given words, with::
+
+    python -m benchmarks [NAME ...]
+
+Results are written as JSON and compared with a stored baseline; see
+``python -m benchmarks --help`` and the contributing guide.
+"""
@@ -0,0 +1,296 @@
+"""Run the benchmarks, save the results and compare them with a baseline.
+
+Every benchmark is run once to warm up, then timed ``rounds`` times. The
+median time per item is compared with the baseline's; a benchmark more than
+``threshold`` slower is flagged as a regression, and the run exits with
+status 1. So does a benchmark over its budget, baseline or not. Benchmarks
+registered with ``memory=True`` also report the memory their result holds
+per item, measured in one more, untimed run.
+
+The baseline committed in ``benchmarks/baseline.json`` was recorded on the
+machine described in it; record one on your own machine to compare with.
+
+Usage:
+    python -m benchmarks [NAME ...] [--scale 1.0] [--rounds 5]
+    python -m benchmarks --save-baseline
+"""
+
+import argparse
+import gc
+import json
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+from .suite import BENCHMARKS, Context
+
+RESULTS_DIR = Path(__file__).parent / "results"
+DEFAULT_OUTPUT = RESULTS_DIR / "latest.json"
+DEFAULT_BASELINE = Path(__file__).parent / "baseline.json"
+
+# Slowdown, relative to the baseline, flagged as a regression
+DEFAULT_THRESHOLD = 0.2
+
+
+def select(names: Iterable[str]) -> List[str]:
+    """Get the names of the benchmarks containing any of the given words.
+
+    Raises:
+        ValueError: If a word matches no benchmark.
+    """
+    names = list(names)
+    if not names:
+        return list(BENCHMARKS)
+    for name in names:
+        if not any(name in benchmark for benchmark in BENCHMARKS):
+            raise ValueError(f"No benchmark matches {name!r}")
+    return [b for b in BENCHMARKS if any(name in b for name in names)]
+
+
+def run(
+    names: Iterable[str],
+    scale: float = 1.0,
+    rounds: int = 5,
+    latency: float = 0.0,
+    progress=None,
+) -> Dict[str, Any]:
+    """Run benchmarks.
+
+    Args:
+        names: Names of the benchmarks to run.
+        scale: Factor applied to the number of items of every benchmark.
+        rounds: Number of timed runs of each benchmark.
+        latency: Seconds every request to the fake Drive server is delayed by.
+        progress: Optional callable receiving the name and result of each
+            benchmark as it completes.
+
+    Returns:
+        The results, as saved to JSON files: the settings and environment of
+        the run, and for each benchmark its items, round times in seconds,
+        median and best time per item, and budget per item, if any.
+    """
+    if rounds < 1:
+        raise ValueError("rounds must be at least 1")
+    context = Context(scale=scale, latency=latency)
+    results: Dict[str, Any] = {}
+    try:
+        for name in names:
+            operation, items = BENCHMARKS[name].setup(context)
+            operation()
+            times = []
+            for _ in range(rounds):
+                gc.collect()
+                start = time.perf_counter()
+                operation()
+                times.append(time.perf_counter() - start)
+            results[name] = {
+                "items": items,
+                "times": times,
+                "median_per_item": statistics.median(times) / items,
+                "best_per_item": min(times) / items,
+                "budget": BENCHMARKS[name].budget,
+            }
+            if BENCHMARKS[name].memory:
+                results[name]["memory_per_item"] = _held_memory(operation) / items
+            if progress:
+                progress(name, results[name])
+    finally:
+        context.close()
+
+    return {
+        "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "scale": scale,
+        "rounds": rounds,
+        "latency": latency,
+        "benchmarks": results,
+    }
+
+
+def compare(
+    results: Dict[str, Any],
+    baseline: Dict[str, Any],
+    threshold: float = DEFAULT_THRESHOLD,
+) -> Dict[str, Dict[str, Any]]:
+    """Compare results with a baseline.
+
+    Args:
+        results: Results returned by ``run``.
+        baseline: Earlier results, usually loaded from a baseline file.
+        threshold: Relative slowdown flagged as a regression; 0.2 flags
+            benchmarks more than 20% slower.
+
+    Returns:
+        For each benchmark found in both, its ``ratio`` of median time per
+        item to the baseline's and whether it is a ``regression``.
+    """
+    comparison = {}
+    for name, result in results["benchmarks"].items():
+        before = baseline.get("benchmarks", {}).get(name)
+        if not before or not before["median_per_item"]:
+            continue
+        ratio = result["median_per_item"] / before["median_per_item"]
+        comparison[name] = {"ratio": ratio, "regression": ratio > 1 + threshold}
+    return comparison
+
+
+def over_budget(results: Dict[str, Any]) -> List[str]:
+    """Get the names of the benchmarks whose median time exceeds their budget."""
+    return [
+        name
+        for name, result in results["benchmarks"].items()
+        if result.get("budget") is not None
+        and result["median_per_item"] > result["budget"]
+    ]
+
+
+def load(path: Path) -> Optional[Dict[str, Any]]:
+    """Load saved results, or None if the file does not exist."""
+    try:
+        return json.loads(Path(path).read_text(encoding="utf-8"))
+    except FileNotFoundError:
+        return None
+
+
+def save(results: Dict[str, Any], path: Path) -> None:
+    """Save results as JSON."""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(results, indent=2) + "\n", encoding="utf-8")
+
+
+def _held_memory(operation: Callable[[], object]) -> int:
+    """Measure the bytes allocated by an operation and held by its result."""
+    gc.collect()
+    # Tracing allocations slows the operation down, so it is not timed
+    tracemalloc.start()
+    try:
+        result = operation()
+        held, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del result
+    return held
+
+
+def _format_time(seconds: float) -> str:
+    for unit, factor in (("s", 1), ("ms", 1e3), ("us", 1e6)):
+        if seconds * factor >= 1:
+            return f"{seconds * factor:.2f} {unit}"
+    return f"{seconds * 1e9:.0f} ns"
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Run the benchmarks from the command line.
+
+    Returns:
+        The exit status: 1 if a regression was flagged or a benchmark is over
+        its budget, 0 otherwise.
+    """
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks",
+        description="Run the Zenodotos benchmarks and compare them with a baseline.",
+    )
+    parser.add_argument(
+        "names", nargs="*", metavar="NAME", help="run benchmarks containing NAME"
+    )
+    parser.add_argument("--list", action="store_true", help="list the benchmarks")
+    parser.add_argument(
+        "--scale", type=float, default=1.0, help="factor applied to item counts"
+    )
+    parser.add_argument("--rounds", type=int, default=5, help="timed runs each")
+    parser.add_argument(
+        "--latency",
+        type=float,
+        default=0.0,
+        help="seconds each fake Drive API request is delayed by",
+    )
+    parser.add_argument(
+        "--output", type=Path, default=DEFAULT_OUTPUT, help="where to save results"
+    )
+    parser.add_argument(
+        "--baseline",
+        type=Path,
+        default=DEFAULT_BASELINE,
+        help="results to compare with",
+    )
+    parser.add_argument(
+        "--save-baseline",
+        action="store_true",
+        help="also save the results as the new baseline",
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=DEFAULT_THRESHOLD,
+        help="relative slowdown flagged as a regression (default: 0.2)",
+    )
+    args = parser.parse_args(argv)
+
+    if args.list:
+        for benchmark in BENCHMARKS.values():
+            print(f"{benchmark.name:32} {benchmark.description}")
+        return 0
+
+    try:
+        names = select(args.names)
+    except ValueError as error:
+        parser.error(str(error))
+
+    baseline = None if args.save_baseline else load(args.baseline)
+
+    def progress(name: str, result: Dict[str, Any]) -> None:
+        memory = result.get("memory_per_item")
+        print(
+            f"{name:32} {result['items']:>8,} items  "
+            f"{_format_time(result['median_per_item']):>10}/item"
+            + (f"  {memory:,.0f} bytes/item" if memory is not None else ""),
+            flush=True,
+        )
+
+    results = run(
+        names,
+        scale=args.scale,
+        rounds=args.rounds,
+        latency=args.latency,
+        progress=progress,
+    )
+    save(results, args.output)
+    print(f"\nResults saved to {args.output}")
+    status = 0
+    for name in over_budget(results):
+        result = results["benchmarks"][name]
+        print(
+            f"{name:32} OVER BUDGET: {_format_time(result['median_per_item'])}"
+            f"/item, budget {_format_time(result['budget'])}"
+        )
+        status = 1
+    if args.save_baseline:
+        save(results, args.baseline)
+        print(f"Baseline saved to {args.baseline}")
+        return status
+    if baseline is None:
+        print(f"No baseline at {args.baseline}; save one with --save-baseline")
+        return status
+
+    if baseline.get("scale") != results["scale"]:
+        print("Warning: the baseline was run at a different --scale", file=sys.stderr)
+    comparison = compare(results, baseline, args.threshold)
+    print(f"\nCompared with {args.baseline} ({baseline.get('created')}):")
+    regressions = 0
+    for name, change in comparison.items():
+        flag = ""
+        if change["regression"]:
+            flag = "  REGRESSION"
+            regressions += 1
+        print(f"{name:32} {change['ratio']:>6.2f}x{flag}")
+    if regressions:
+        print(f"\n{regressions} regression(s) over {args.threshold:.0%}")
+        return 1
+    return status
@@ -0,0 +1,348 @@
+"""The benchmarks run by ``python -m benchmarks``.
+
+Each benchmark is a function registered with ``@benchmark``. It receives the
+run's ``Context`` and does its setup, then returns the operation to time and
+the number of items that operation handles. Setup is not timed. A benchmark
+may also have a budget, a median time per item it must stay under whatever
+the baseline.
+
+Benchmarks that talk to the Drive API use a ``FakeDriveServer`` on the
+loopback interface, shared by the whole run, so they measure the real cost of
+building requests, sending them and parsing the responses, with no network.
+Benchmarks comparing ways of making requests use a second server answering
+with the latency of the real API, where the number of round trips dominates.
+
+A run uses a temporary home directory and ignores ``ZENODOTOS_*`` variables,
+so it neither depends on nor writes to the developer's configuration.
+"""
+
+import os
+import subprocess
+import sys
+import tempfile
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from zenodotos.drive.client import DriveClient
+from zenodotos.drive.fake_server import CORPUS_MIME_TYPES, FakeDriveServer
+from zenodotos.drive.models import DriveFile
+from zenodotos.formatters.display import format_file_list
+from zenodotos.index import LocalIndex
+from zenodotos.utils import FieldParser
+
+# The operation to time and the number of items it handles
+Operation = Tuple[Callable[[], object], int]
+
+# Seconds the CLI may take to start and print its help, or answer a query
+# from the local index
+CLI_STARTUP_BUDGET = 0.3
+
+# Seconds the remote fake server delays every request by, about the latency
+# of a Drive API call
+API_LATENCY = 0.02
+
+
+@dataclass
+class Benchmark:
+    """A registered benchmark."""
+
+    name: str
+    description: str
+    setup: Callable[["Context"], Operation]
+    budget: Optional[float] = None
+    memory: bool = False
+
+
+BENCHMARKS: Dict[str, Benchmark] = {}
+
+
+def benchmark(
+    name: str, description: str, budget: Optional[float] = None, memory: bool = False
+):
+    """Register a benchmark function under a name.
+
+    Args:
+        name: The benchmark's name.
+        description: What the benchmark measures.
+        budget: Optional maximum median time per item, in seconds.
+        memory: Also measure the memory held by the operation's result.
+    """
+
+    def register(setup: Callable[["Context"], Operation]):
+        BENCHMARKS[name] = Benchmark(name, description, setup, budget, memory)
+        return setup
+
+    return register
+
+
+def make_rows(count: int) -> List[Dict[str, Any]]:
+    """Build synthetic files.list rows with the default field mask."""
+    return [
+        {
+            "id": f"1{n:032x}",
+            "name": f"Document {n}",
+            "mimeType": "application/vnd.google-apps.document",
+            "size": str(n * 17),
+            "createdTime": "2024-01-01T08:30:00.000Z",
+            "modifiedTime": f"2024-06-{n % 28 + 1:02d}T12:00:00.123Z",
+            "owners": [{"emailAddress": "owner@example.com"}],
+            "webViewLink": f"https://docs.google.com/document/d/{n}/edit",
+        }
+        for n in range(count)
+    ]
+
+
+class Context:
+    """Settings and shared resources of a benchmark run."""
+
+    def __init__(self, scale: float = 1.0, latency: float = 0.0):
+        """Initialize the context.
+
+        Args:
+            scale: Factor applied to the number of items of every benchmark.
+            latency: Seconds every request to the fake Drive server is
+                delayed by.
+        """
+        self.scale = scale
+        self.latency = latency
+        self._server: Optional[FakeDriveServer] = None
+        self._remote_server: Optional[FakeDriveServer] = None
+        self._directories: List[tempfile.TemporaryDirectory] = []
+        # The home directory of the run, replacing the developer's until close
+        self.home = self.temporary_directory()
+        names = [
+            "HOME",
+            *(name for name in os.environ if name.startswith("ZENODOTOS_")),
+        ]
+        self._saved_environ = {name: os.environ.get(name) for name in names}
+        for name in names:
+            os.environ.pop(name, None)
+        os.environ["HOME"] = str(self.home)
+
+    def count(self, items: int) -> int:
+        """Scale a number of items, keeping at least one."""
+        return max(1, int(items * self.scale))
+
+    @property
+    def server(self) -> FakeDriveServer:
+        """The fake Drive server, started on first use."""
+        if self._server is None:
+            self._server = FakeDriveServer(
+                size=self.count(10_000), latency=self.latency
+            ).start()
+        return self._server
+
+    @property
+    def remote_server(self) -> FakeDriveServer:
+        """A fake Drive server with API latency, started on first use.
+
+        Every request is delayed by ``API_LATENCY``, or the run's latency if
+        higher.
+        """
+        if self._remote_server is None:
+            self._remote_server = FakeDriveServer(
+                size=self.count(1_000), latency=max(self.latency, API_LATENCY)
+            ).start()
+        return self._remote_server
+
+    def client(self, server: Optional[FakeDriveServer] = None) -> DriveClient:
+        """Create a Drive client talking to a fake server.
+
+        Args:
+            server: The server to talk to. Defaults to ``server``.
+        """
+        server = server or self.server
+        client = DriveClient(api_endpoint=server.url)
+        # Build the service before timing starts
+        client.get_service()
+        return client
+
+    def file_ids(
+        self, count: int, mime_types: Optional[Iterable[str]] = None
+    ) -> List[str]:
+        """Get the IDs of up to ``count`` files of the fake drive."""
+        drive = self.server.drive
+        ids = [
+            file_id
+            for file_id in drive.file_ids()
+            if mime_types is None or drive.get(file_id)["mimeType"] in mime_types
+        ]
+        return ids[:count]
+
+    def temporary_directory(self) -> Path:
+        """Create a directory deleted when the run is over."""
+        directory = tempfile.TemporaryDirectory()
+        self._directories.append(directory)
+        return Path(directory.name)
+
+    def close(self) -> None:
+        """Stop the fake servers and restore the environment.
+
+        Temporary directories, the run's home directory included, are deleted.
+        """
+        for server in (self._server, self._remote_server):
+            if server is not None:
+                server.stop()
+        self._server = self._remote_server = None
+        for name, value in self._saved_environ.items():
+            if value is None:
+                os.environ.pop(name, None)
+            else:
+                os.environ[name] = value
+        self._saved_environ = {}
+        for directory in self._directories:
+            directory.cleanup()
+        self._directories = []
+
+
+@benchmark(
+    "drive_file.from_api_response",
+    "Build 1M DriveFile objects from API rows, as in a full-drive listing",
+    memory=True,
+)
+def drive_file_from_api_response(context: Context) -> Operation:
+    rows = make_rows(context.count(1_000_000))
+    return lambda: [DriveFile.from_api_response(row) for row in rows], len(rows)
+
+
+@benchmark("drive_file.timestamps", "Parse the timestamps of DriveFile objects")
+def drive_file_timestamps(context: Context) -> Operation:
+    rows = make_rows(context.count(100_000))
+    files = [DriveFile.from_api_response(row) for row in rows]
+
+    def parse_all():
+        # Timestamps are parsed once, on first access, so reset them first
+        for file, row in zip(files, rows):
+            file.created_time = row["createdTime"]
+            file.modified_time = row["modifiedTime"]
+            file.created_time
+            file.modified_time
+
+    return parse_all, len(files)
+
+
+@benchmark("format_file_list", "Format a table of 10k files with fitted columns")
+def format_file_list_rows(context: Context) -> Operation:
+    files = [
+        DriveFile.from_api_response(row) for row in make_rows(context.count(10_000))
+    ]
+    return lambda: format_file_list(files), len(files)
+
+
+@benchmark("field_parser.parse_fields", "Parse --fields options")
+def field_parser_parse_fields(context: Context) -> Operation:
+    parser = FieldParser()
+    options = [
+        None,
+        "name",
+        "id,name,size",
+        " id , name , mimeType , size , modifiedTime , name ",
+        "id,name,mimeType,size,createdTime,modifiedTime,description,owners,webViewLink",
+    ]
+    calls = [options[n % len(options)] for n in range(context.count(100_000))]
+    return lambda: [parser.parse_fields(option) for option in calls], len(calls)
+
+
+@benchmark("list_files.pagination", "List every file of the fake drive")
+def list_files_pagination(context: Context) -> Operation:
+    client = context.client()
+    total = len(context.server.drive.file_ids())
+
+    def list_all():
+        page_token = None
+        while True:
+            result = client.list_files(
+                page_size=1000, page_token=page_token, use_cache=False
+            )
+            page_token = result["next_page_token"]
+            if not page_token:
+                return
+
+    return list_all, total
+
+
+@benchmark("get_files.batch", "Get files by ID in batch requests")
+def get_files_batch(context: Context) -> Operation:
+    client = context.client()
+    file_ids = context.file_ids(context.count(1_000))
+    return lambda: client.get_files(file_ids), len(file_ids)
+
+
+@benchmark("get_file.sequential", "Get files by ID one request at a time")
+def get_file_sequential(context: Context) -> Operation:
+    client = context.client()
+    file_ids = context.file_ids(context.count(200))
+    return lambda: [client.get_file(file_id) for file_id in file_ids], len(file_ids)
+
+
+@benchmark("remote.get_files.batch", "Get files by ID in batch requests, with latency")
+def remote_get_files_batch(context: Context) -> Operation:
+    client = context.client(context.remote_server)
+    file_ids = context.remote_server.drive.file_ids()[: context.count(500)]
+    return lambda: client.get_files(file_ids), len(file_ids)
+
+
+@benchmark(
+    "remote.get_file.sequential",
+    "Get files by ID one request at a time, with latency",
+)
+def remote_get_file_sequential(context: Context) -> Operation:
+    client = context.client(context.remote_server)
+    file_ids = context.remote_server.drive.file_ids()[: context.count(50)]
+    return lambda: [client.get_file(file_id) for file_id in file_ids], len(file_ids)
+
+
+@benchmark("export_many", "Export documents through the worker pool")
+def export_many(context: Context) -> Operation:
+    client = context.client()
+    native = [m for m in CORPUS_MIME_TYPES if m.startswith("application/vnd.google")]
+    files = [
+        DriveFile.from_api_response(context.server.drive.get(file_id))
+        for file_id in context.file_ids(context.count(200), native)
+    ]
+
+    def export_all():
+        with tempfile.TemporaryDirectory() as output_dir:
+            result = client.export_many(files, output_dir=output_dir)
+        if result["failed"]:
+            raise RuntimeError(f"{len(result['failed'])} exports failed")
+
+    return export_all, len(files)
+
+
+@benchmark("cli.startup", "Start the CLI to print its help", budget=CLI_STARTUP_BUDGET)
+def cli_startup(context: Context) -> Operation:
+    command = [sys.executable, "-c", "from zenodotos.cli import cli; cli()", "--help"]
+    starts = context.count(10)
+
+    def start_all():
+        for _ in range(starts):
+            subprocess.run(command, check=True, stdout=subprocess.DEVNULL)
+
+    return start_all, starts
+
+
+@benchmark(
+    "cli.search",
+    "Start the CLI to search the local index",
+    budget=CLI_STARTUP_BUDGET,
+)
+def cli_search(context: Context) -> Operation:
+    local_index = LocalIndex(context.home / ".config" / "zenodotos" / "index.sqlite3")
+    local_index.sync(context.client())
+    local_index.close()
+    command = [
+        sys.executable,
+        "-c",
+        "from zenodotos.cli import cli; cli()",
+        "search",
+        "file 0",
+    ]
+    starts = context.count(10)
+
+    def search_all():
+        for _ in range(starts):
+            subprocess.run(command, check=True, stdout=subprocess.DEVNULL)
+
+    return search_all, starts
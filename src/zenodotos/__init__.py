@@ -1,32 +1,86 @@
 """Zenodotos - Google Drive Library and CLI Tool."""
 
-import importlib.metadata
-
-try:
-    __version__ = importlib.metadata.version(__name__)
-except importlib.metadata.PackageNotFoundError:
-    __version__ = "0.0.0"  # Fallback for development mode
-
-# Main library exports
-from .client import Zenodotos
-from .drive.client import DriveClient
-from .drive.models import DriveFile
-from .auth import Auth
-from .utils import FieldParser, validate_file_id, sanitize_filename, format_file_size
-from .config import Config, ZenodotosConfig
-from .exceptions import (
-    ZenodotosError,
-    AuthenticationError,
-    FileNotFoundError,
-    PermissionError,
-    ExportError,
-    ValidationError,
-    ConfigurationError,
-    RateLimitError,
-    NetworkError,
-    MultipleFilesFoundError,
-    NoFilesFoundError,
-)
+# First, so that the import phase of --timings covers everything else
+from . import timings  # noqa: F401
+
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .client import Zenodotos
+    from .drive.client import DriveClient
+    from .drive.models import DriveFile
+    from .auth import Auth
+    from .utils import (
+        FieldParser,
+        validate_file_id,
+        sanitize_filename,
+        format_file_size,
+    )
+    from .config import Config, ZenodotosConfig
+    from .exceptions import (
+        ZenodotosError,
+        AuthenticationError,
+        FileNotFoundError,
+        PermissionError,
+        ExportError,
+        ChecksumMismatchError,
+        ValidationError,
+        ConfigurationError,
+        RateLimitError,
+        NetworkError,
+        MultipleFilesFoundError,
+        NoFilesFoundError,
+    )
+
+# Module of each export. Exports are imported on first access, so that
+# importing the package, e.g. for ``zenodotos --help``, does not load the
+# Google API libraries.
+_EXPORTS = {
+    "Zenodotos": ".client",
+    "DriveClient": ".drive.client",
+    "DriveFile": ".drive.models",
+    "Auth": ".auth",
+    "FieldParser": ".utils",
+    "validate_file_id": ".utils",
+    "sanitize_filename": ".utils",
+    "format_file_size": ".utils",
+    "Config": ".config",
+    "ZenodotosConfig": ".config",
+    "ZenodotosError": ".exceptions",
+    "AuthenticationError": ".exceptions",
+    "FileNotFoundError": ".exceptions",
+    "PermissionError": ".exceptions",
+    "ExportError": ".exceptions",
+    "ChecksumMismatchError": ".exceptions",
+    "ValidationError": ".exceptions",
+    "ConfigurationError": ".exceptions",
+    "RateLimitError": ".exceptions",
+    "NetworkError": ".exceptions",
+    "MultipleFilesFoundError": ".exceptions",
+    "NoFilesFoundError": ".exceptions",
+}
+
+
+def __getattr__(name):
+    if name == "__version__":
+        from importlib import metadata
+
+        try:
+            value = metadata.version(__name__)
+        except metadata.PackageNotFoundError:
+            value = "0.0.0"  # Fallback for development mode
+    elif name in _EXPORTS:
+        value = getattr(importlib.import_module(_EXPORTS[name], __name__), name)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted({*globals(), *__all__})
+
 
 __all__ = [
     # High-level library interface
@@ -49,6 +103,7 @@ __all__ = [
     "FileNotFoundError",
     "PermissionError",
     "ExportError",
+    "ChecksumMismatchError",
     "ValidationError",
     "ConfigurationError",
     "RateLimitError",
@@ -0,0 +1,192 @@
+"""High-level asyncio Google Drive client library.
+
+Requires the optional ``httpx`` dependency (``pip install zenodotos[async]``).
+"""
+
+from typing import Any, AsyncIterator, Dict, List, Optional, Union
+
+from .drive.async_client import DEFAULT_MAX_CONCURRENCY, AsyncDriveClient
+from .drive.models import DriveFile
+
+
+class AsyncZenodotos:
+    """High-level Google Drive client for asyncio applications.
+
+    Mirrors the listing, lookup and export methods of ``Zenodotos`` as
+    coroutines. All requests made through one instance share a single
+    connection pool and are bounded by ``max_concurrency``.
+
+    Example:
+        ```python
+        from zenodotos.async_client import AsyncZenodotos
+
+        async with AsyncZenodotos(max_concurrency=100) as zenodotos:
+            files = await zenodotos.get_files(file_ids)
+            names = [
+                file.name
+                async for file in zenodotos.iter_files(query="trashed = false")
+            ]
+        ```
+    """
+
+    def __init__(
+        self,
+        credentials_path: Optional[str] = None,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    ):
+        """Initialize the AsyncZenodotos client.
+
+        Args:
+            credentials_path: Optional path to credentials file. If not provided,
+                uses default authentication configuration.
+            max_concurrency: Maximum number of requests in flight at once
+                (default: 64)
+        """
+        self._client = AsyncDriveClient(
+            credentials_path=credentials_path, max_concurrency=max_concurrency
+        )
+
+    async def __aenter__(self) -> "AsyncZenodotos":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Close the client's HTTP connections."""
+        await self._client.aclose()
+
+    async def list_files(
+        self,
+        page_size: int = 10,
+        query: Optional[str] = None,
+        fields: Optional[List[str]] = None,
+    ) -> List[DriveFile]:
+        """List files with simplified interface.
+
+        Args:
+            page_size: Number of files to return (default: 10)
+            query: Search query to filter files (e.g., "name contains 'report'")
+            fields: List of fields to include in response
+
+        Returns:
+            List of DriveFile objects
+
+        Raises:
+            PermissionError: If authentication fails or insufficient permissions
+            RuntimeError: For other API errors
+        """
+        result = await self._client.list_files(
+            page_size=page_size, query=query, fields=fields
+        )
+        return result["files"]
+
+    async def list_files_with_pagination(
+        self,
+        page_size: int = 10,
+        page_token: Optional[str] = None,
+        query: Optional[str] = None,
+        fields: Optional[List[str]] = None,
+    ) -> Dict[str, Any]:
+        """List files with pagination information.
+
+        Args:
+            page_size: Number of files to return per page
+            page_token: Token for the next page of results
+            query: Search query to filter files
+            fields: List of fields to include in response
+
+        Returns:
+            Dict containing:
+                - files: List of DriveFile objects
+                - next_page_token: Token for the next page (if any)
+
+        Raises:
+            PermissionError: If authentication fails or insufficient permissions
+            RuntimeError: For other API errors
+        """
+        return await self._client.list_files(
+            page_size=page_size, page_token=page_token, query=query, fields=fields
+        )
+
+    def iter_files(
+        self,
+        query: Optional[str] = None,
+        fields: Optional[List[str]] = None,
+        page_size: int = 100,
+        limit: Optional[int] = None,
+    ) -> AsyncIterator[DriveFile]:
+        """Iterate over every matching file, fetching pages as they are needed.
+
+        Args:
+            query: Search query to filter files
+            fields: List of fields to include in response
+            page_size: Number of files to request per page (default: 100)
+            limit: Maximum number of files to yield (default: no limit)
+
+        Returns:
+            Async iterator of DriveFile objects in the order returned by the API
+        """
+        return self._client.iter_files(
+            query=query, fields=fields, page_size=page_size, limit=limit
+        )
+
+    async def get_file(self, file_id: str) -> DriveFile:
+        """Get detailed information about a specific file.
+
+        Args:
+            file_id: The Google Drive file ID
+
+        Returns:
+            DriveFile object with file metadata
+
+        Raises:
+            FileNotFoundError: If the file doesn't exist
+            PermissionError: If user doesn't have permission to access the file
+            RuntimeError: For other API errors
+        """
+        return await self._client.get_file(file_id)
+
+    async def get_files(
+        self, file_ids: List[str], fields: Optional[List[str]] = None
+    ) -> List[Union[DriveFile, Exception]]:
+        """Get details for several files concurrently.
+
+        Args:
+            file_ids: The Google Drive file IDs
+            fields: List of fields to include for each file
+
+        Returns:
+            List with one entry per file ID, in input order. Each entry is a
+            DriveFile, or the exception raised for that ID.
+        """
+        return await self._client.get_files(file_ids, fields=fields)
+
+    async def export_file(
+        self,
+        file_id: str,
+        output_path: Optional[str] = None,
+        format: Optional[str] = None,
+        file: Optional[DriveFile] = None,
+    ) -> str:
+        """Export a file from Google Drive.
+
+        Args:
+            file_id: The Google Drive file ID
+            output_path: Output path for the exported file. If not provided,
+                saves to current directory with document name
+            format: Export format (html, pdf, xlsx, csv, md). If not provided,
+                uses smart default based on file type
+            file: DriveFile already retrieved for file_id. When provided, its
+                name and MIME type are used and no metadata request is made
+
+        Returns:
+            Path to the exported file
+
+        Raises:
+            FileNotFoundError: If the file doesn't exist
+            PermissionError: If user doesn't have permission to export the file
+            ValueError: If the format is not supported
+            RuntimeError: For other API errors
+        """
+        return await self._client.export(file_id, output_path, format, file=file)
@@ -4,10 +4,9 @@ import os
 import json
 from typing import Optional
 from google.oauth2.credentials import Credentials
-from google_auth_oauthlib.flow import InstalledAppFlow
-from google.auth.transport.requests import Request
 
 from .config import Config
+from .timings import phase
 
 
 class Auth:
@@ -31,6 +30,10 @@ class Auth:
         4. If no token exists, start OAuth flow using credentials file
         5. Save new token after OAuth flow
         """
+        with phase("auth"):
+            return self._get_credentials()
+
+    def _get_credentials(self):
         # Try to load credentials from token file
         if os.path.exists(self.config.get_token_path()):
             with open(self.config.get_token_path(), "r") as token:
@@ -48,7 +51,10 @@ class Auth:
             and self.credentials.expired
             and self.credentials.refresh_token
         ):
-            self.credentials.refresh(Request())
+            from google.auth.transport.requests import Request
+
+            with phase("token refresh"):
+                self.credentials.refresh(Request())
             self._save_token()
             return self.credentials
 
@@ -59,6 +65,8 @@ class Auth:
                 "Please download it from Google Cloud Console and place it in the config directory."
             )
 
+        from google_auth_oauthlib.flow import InstalledAppFlow
+
         self.config.ensure_config_dir()
         flow = InstalledAppFlow.from_client_secrets_file(
             self.config.get_credentials_path(), self.SCOPES
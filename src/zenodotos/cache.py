@@ -0,0 +1,294 @@
+"""Persistent metadata cache for Google Drive API responses."""
+
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS files (
+    file_id TEXT NOT NULL,
+    fields TEXT NOT NULL,
+    version TEXT,
+    data TEXT NOT NULL,
+    stored_at REAL NOT NULL,
+    PRIMARY KEY (file_id, fields)
+);
+CREATE TABLE IF NOT EXISTS listings (
+    key TEXT PRIMARY KEY,
+    data TEXT NOT NULL,
+    stored_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS listing_files (
+    key TEXT NOT NULL,
+    file_id TEXT NOT NULL,
+    version TEXT
+);
+CREATE INDEX IF NOT EXISTS listing_files_file_id ON listing_files (file_id);
+CREATE INDEX IF NOT EXISTS listing_files_key ON listing_files (key);
+"""
+
+
+def file_version(data: Dict[str, Any]) -> Optional[str]:
+    """Get the value identifying a revision of a file's metadata.
+
+    Args:
+        data: File data from the API.
+
+    Returns:
+        The file's ``version`` if it was requested, else its ``modifiedTime``.
+    """
+    version = data.get("version") or data.get("modifiedTime")
+    return str(version) if version is not None else None
+
+
+def normalize_query(query: Optional[str]) -> str:
+    """Normalize a Drive query so equivalent spellings share cache entries.
+
+    Args:
+        query: The Drive query string.
+
+    Returns:
+        The query with surrounding whitespace removed and inner runs of
+        whitespace collapsed, or an empty string for no query.
+    """
+    return " ".join(query.split()) if query else ""
+
+
+class MetadataCache:
+    """SQLite-backed cache of file metadata and file listings.
+
+    File entries are keyed by file ID and field mask; listing entries by the
+    normalized query, page size, page token and field mask. Entries expire
+    after ``ttl_seconds``, and every entry mentioning a file is dropped as soon
+    as a different version of that file is seen in any API response.
+
+    The database runs in WAL mode so several CLI processes can read it while
+    another one writes. Expired entries are deleted on the first write of each
+    process and then every ``purge_interval`` writes, so the database does not
+    grow without bound.
+    """
+
+    def __init__(self, path: Path, ttl_seconds: int = 3600, purge_interval: int = 500):
+        """Initialize the cache.
+
+        Args:
+            path: Location of the SQLite database. It is created on first use.
+            ttl_seconds: How long entries stay valid.
+            purge_interval: Number of writes between purges of expired entries.
+        """
+        self.path = Path(path)
+        self.ttl_seconds = ttl_seconds
+        self.purge_interval = purge_interval
+        self._connection: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+        self._writes = 0
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the database on first use."""
+        if self._connection is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            connection = sqlite3.connect(
+                str(self.path), timeout=5.0, check_same_thread=False
+            )
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            connection.executescript(_SCHEMA)
+            self._connection = connection
+        return self._connection
+
+    def _is_fresh(self, stored_at: float) -> bool:
+        return time.time() - stored_at < self.ttl_seconds
+
+    def get_file(self, file_id: str, fields: str) -> Optional[Dict[str, Any]]:
+        """Get cached metadata for a file.
+
+        Args:
+            file_id: The file ID.
+            fields: The field mask the metadata was requested with.
+
+        Returns:
+            The file data from the API, or None if missing or expired.
+        """
+        with self._lock:
+            row = (
+                self._connect()
+                .execute(
+                    "SELECT data, stored_at FROM files WHERE file_id = ? AND fields = ?",
+                    (file_id, fields),
+                )
+                .fetchone()
+            )
+        if row is None or not self._is_fresh(row[1]):
+            return None
+        return json.loads(row[0])
+
+    def put_file(self, file_id: str, fields: str, data: Dict[str, Any]) -> None:
+        """Store metadata for a file.
+
+        Args:
+            file_id: The file ID.
+            fields: The field mask the metadata was requested with.
+            data: The file data from the API.
+        """
+        version = file_version(data)
+        with self._lock:
+            connection = self._connect()
+            with connection:
+                self._maybe_purge(connection)
+                if version is not None:
+                    self._invalidate_stale(connection, file_id, version)
+                connection.execute(
+                    "INSERT OR REPLACE INTO files VALUES (?, ?, ?, ?, ?)",
+                    (file_id, fields, version, json.dumps(data), time.time()),
+                )
+
+    def get_listing(
+        self,
+        query: Optional[str],
+        page_size: int,
+        page_token: Optional[str],
+        fields: str,
+    ) -> Optional[Dict[str, Any]]:
+        """Get a cached page of a file listing.
+
+        Args:
+            query: The Drive query string.
+            page_size: Number of files per page.
+            page_token: Token of the page.
+            fields: The field mask the listing was requested with.
+
+        Returns:
+            The raw API response for the page, or None if missing or expired.
+        """
+        key = self._listing_key(query, page_size, page_token, fields)
+        with self._lock:
+            row = (
+                self._connect()
+                .execute("SELECT data, stored_at FROM listings WHERE key = ?", (key,))
+                .fetchone()
+            )
+        if row is None or not self._is_fresh(row[1]):
+            return None
+        return json.loads(row[0])
+
+    def put_listing(
+        self,
+        query: Optional[str],
+        page_size: int,
+        page_token: Optional[str],
+        fields: str,
+        data: Dict[str, Any],
+    ) -> None:
+        """Store a page of a file listing.
+
+        Any cached entry holding an older version of a listed file is dropped.
+
+        Args:
+            query: The Drive query string.
+            page_size: Number of files per page.
+            page_token: Token of the page.
+            fields: The field mask the listing was requested with.
+            data: The raw API response for the page.
+        """
+        key = self._listing_key(query, page_size, page_token, fields)
+        files = [f for f in data.get("files", []) if f.get("id")]
+        with self._lock:
+            connection = self._connect()
+            with connection:
+                self._maybe_purge(connection)
+                for file in files:
+                    version = file_version(file)
+                    if version is not None:
+                        self._invalidate_stale(connection, file["id"], version)
+                connection.execute("DELETE FROM listing_files WHERE key = ?", (key,))
+                connection.execute(
+                    "INSERT OR REPLACE INTO listings VALUES (?, ?, ?)",
+                    (key, json.dumps(data), time.time()),
+                )
+                connection.executemany(
+                    "INSERT INTO listing_files VALUES (?, ?, ?)",
+                    [(key, f["id"], file_version(f)) for f in files],
+                )
+
+    def invalidate(self, file_ids: Iterable[str]) -> None:
+        """Drop every cached entry mentioning the given files.
+
+        Args:
+            file_ids: IDs of the files whose entries should be dropped.
+        """
+        with self._lock:
+            connection = self._connect()
+            with connection:
+                for file_id in file_ids:
+                    self._invalidate_stale(connection, file_id, None)
+
+    def clear(self) -> None:
+        """Drop every cached entry."""
+        with self._lock:
+            connection = self._connect()
+            with connection:
+                connection.execute("DELETE FROM files")
+                connection.execute("DELETE FROM listings")
+                connection.execute("DELETE FROM listing_files")
+
+    def purge_expired(self) -> None:
+        """Delete expired entries from the database."""
+        with self._lock:
+            connection = self._connect()
+            with connection:
+                self._purge_expired(connection)
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+    def _maybe_purge(self, connection: sqlite3.Connection) -> None:
+        """Purge expired entries on the first write, then every few writes."""
+        if self._writes % self.purge_interval == 0:
+            self._purge_expired(connection)
+        self._writes += 1
+
+    def _purge_expired(self, connection: sqlite3.Connection) -> None:
+        cutoff = time.time() - self.ttl_seconds
+        connection.execute("DELETE FROM files WHERE stored_at < ?", (cutoff,))
+        connection.execute(
+            "DELETE FROM listing_files WHERE key IN "
+            "(SELECT key FROM listings WHERE stored_at < ?)",
+            (cutoff,),
+        )
+        connection.execute("DELETE FROM listings WHERE stored_at < ?", (cutoff,))
+
+    def _invalidate_stale(
+        self, connection: sqlite3.Connection, file_id: str, version: Optional[str]
+    ) -> None:
+        """Delete entries holding a version of a file other than ``version``.
+
+        With ``version`` set to None, every entry mentioning the file is deleted.
+        """
+        connection.execute(
+            "DELETE FROM files WHERE file_id = ? AND version IS NOT ?",
+            (file_id, version),
+        )
+        stale_keys = connection.execute(
+            "SELECT DISTINCT key FROM listing_files "
+            "WHERE file_id = ? AND version IS NOT ?",
+            (file_id, version),
+        ).fetchall()
+        for (key,) in stale_keys:
+            connection.execute("DELETE FROM listings WHERE key = ?", (key,))
+            connection.execute("DELETE FROM listing_files WHERE key = ?", (key,))
+
+    def _listing_key(
+        self,
+        query: Optional[str],
+        page_size: int,
+        page_token: Optional[str],
+        fields: str,
+    ) -> str:
+        return json.dumps([normalize_query(query), page_size, page_token, fields])
@@ -1,20 +1,67 @@
 """Command-line interface for Zenodotos."""
 
+import time
+
 import click
-from .commands import list_files, get_file, export
+from zenodotos import timings
+from .lazy import LazyGroup
+
+# Subcommands, imported only when used, so --help and --version stay fast
+COMMANDS = {
+    "list-files": "zenodotos.cli.commands:list_files",
+    "get-file": "zenodotos.cli.commands:get_file",
+    "export": "zenodotos.cli.commands:export",
+    "download": "zenodotos.cli.commands:download",
+    "mirror": "zenodotos.cli.commands:mirror",
+    "search": "zenodotos.cli.commands:search",
+    "index": "zenodotos.cli.commands:index",
+}
 
 
-@click.group()
+@click.group(cls=LazyGroup, lazy_commands=COMMANDS)
 @click.version_option()
-def cli():
+@click.option(
+    "--timings",
+    "show_timings",
+    is_flag=True,
+    help="Print the time spent importing, loading configuration, authorizing, "
+    "building the Drive service, in each API method, parsing responses and "
+    "formatting output to stderr when the command ends.",
+)
+@click.option(
+    "--profile",
+    "profile_path",
+    default=None,
+    type=click.Path(dir_okay=False, writable=True),
+    help="Profile the command with cProfile and save the stats to this file, "
+    "for reading with 'python -m pstats'.",
+)
+@click.pass_context
+def cli(ctx, show_timings, profile_path):
     """Zenodotos - Google Drive CLI Tool."""
-    pass
+    if show_timings:
+        recorder = timings.enable_timings(started=timings.IMPORT_STARTED)
+        recorder.add("import", time.perf_counter() - recorder.started)
+
+        def report():
+            click.echo(recorder.report(), err=True)
+            timings.disable_timings()
+
+        ctx.call_on_close(report)
+
+    if profile_path:
+        import cProfile
+
+        profiler = cProfile.Profile()
+
+        def save_profile():
+            profiler.disable()
+            profiler.dump_stats(profile_path)
 
+        # Registered last so it runs first, leaving the report out of the profile
+        ctx.call_on_close(save_profile)
+        profiler.enable()
 
-# Register commands
-cli.add_command(list_files)
-cli.add_command(get_file)
-cli.add_command(export)
 
 # Export the main CLI for external use
 __all__ = ["cli"]
@@ -1,18 +1,116 @@
 """CLI command definitions."""
 
+import os
+import sys
+
 import click
-from zenodotos import Zenodotos
 from zenodotos.exceptions import MultipleFilesFoundError, NoFilesFoundError
-from zenodotos.formatters.display import format_file_list
+from zenodotos.formatters.display import (
+    FIELD_CONFIG,
+    format_file_list,
+    format_file_stream,
+)
+from zenodotos.formatters.records import OUTPUT_FORMATS, format_records
+from zenodotos.utils import DEFAULT_JOBS
 from .navigation import interactive_pagination
+from .prefetch import DEFAULT_PREFETCH_DEPTH
+
+
+# Columns shown by list-files --recursive when no --fields are given
+WALK_TABLE_FIELDS = ["path", "mimeType", "size"]
+
+# Files requested per API call when streaming every file with --all
+STREAM_PAGE_SIZE = 1000
+
+
+def _zenodotos():
+    """Create the library client, importing it on first use."""
+    from zenodotos.client import Zenodotos
+
+    return Zenodotos()
+
+
+def _parse_column_widths(ctx, param, value):
+    """Parse a --column-widths value such as "name=60,mimeType=40"."""
+    if not value:
+        return {}
+    widths = {}
+    for item in value.split(","):
+        field, _, width = item.strip().partition("=")
+        if field not in FIELD_CONFIG or not width.isdigit() or int(width) < 1:
+            raise click.BadParameter(
+                f"expected FIELD=WIDTH with a positive width, got '{item.strip()}'"
+            )
+        widths[field] = int(width)
+    return widths
+
+
+def _iter_pages(zenodotos, page_size, query, fields, offline, use_cache):
+    """Yield the files of every matching page, one page at a time."""
+    page_token = None
+    while True:
+        result = zenodotos.list_files_with_pagination(
+            page_size=page_size,
+            page_token=page_token,
+            query=query,
+            fields=fields,
+            offline=offline,
+            use_cache=use_cache,
+        )
+        yield result["files"]
+        page_token = result.get("next_page_token")
+        if not page_token:
+            return
+
+
+def _echo_stream(chunks):
+    """Write chunks of output as they are produced.
+
+    Stops quietly if the reader goes away, e.g. when piped into head.
+    """
+    try:
+        for chunk in chunks:
+            click.echo(chunk, nl=False)
+    except BrokenPipeError:
+        # Python flushes stdout again on exit, so point it at /dev/null first
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+        sys.exit(1)
+
+
+def _echo_files(files, all_fields, requested_fields, output_format):
+    """Display files as a table or in a machine-readable format."""
+    if output_format == "table":
+        click.echo(format_file_list(files, requested_fields))
+    else:
+        _echo_stream(
+            format_records([files], requested_fields or all_fields, output_format)
+        )
+
+
+_output_format_option = click.option(
+    "--output-format",
+    type=click.Choice(OUTPUT_FORMATS),
+    default="table",
+    show_default=True,
+    help="Output format. ndjson, csv and json print the raw field values "
+    "requested with --fields, for processing by other tools.",
+)
+
+_no_cache_option = click.option(
+    "--no-cache",
+    is_flag=True,
+    help="Fetch fresh metadata from the Drive API instead of the metadata cache, "
+    "and do not store the results in it.",
+)
 
 
 @click.command()
 @click.option(
     "--page-size",
-    default=10,
-    type=int,
-    help="Number of files to display per page (default: 10)",
+    default=None,
+    type=click.IntRange(min=1),
+    help="Number of files to display per page (default: 10). "
+    f"With --all, number of files fetched per request (default: {STREAM_PAGE_SIZE}).",
 )
 @click.option(
     "--page-token",
@@ -36,18 +134,152 @@ from .navigation import interactive_pagination
     is_flag=True,
     help="Disable interactive pagination and show only the first page",
 )
-def list_files(page_size, page_token, query, fields, no_interactive):
-    """List files in your Google Drive with interactive pagination."""
-    zenodotos = Zenodotos()
+@click.option(
+    "--prefetch",
+    type=click.IntRange(min=0),
+    default=DEFAULT_PREFETCH_DEPTH,
+    show_default=True,
+    help="Number of pages to fetch in the background ahead of the current one "
+    "during interactive pagination (0 disables prefetching)",
+)
+@click.option(
+    "--offline",
+    is_flag=True,
+    help="Evaluate --query against the local index instead of the Drive API. "
+    "Requires a previous 'zenodotos index sync'.",
+)
+@click.option(
+    "--all",
+    "list_all",
+    is_flag=True,
+    help="Print every matching file, page by page as results arrive, "
+    "instead of paginating. Memory use stays bounded, so the output can be "
+    "piped into other tools.",
+)
+@click.option(
+    "--column-widths",
+    default=None,
+    callback=_parse_column_widths,
+    help="Fixed column widths for --all and --recursive output as FIELD=WIDTH pairs "
+    '(e.g., "name=60,mimeType=40"). Longer values are truncated.',
+)
+@click.option(
+    "--recursive",
+    "folder_id",
+    default=None,
+    metavar="FOLDER_ID",
+    help="Print every file below FOLDER_ID with its path, exploring subfolders "
+    "breadth first. Output streams as folders are listed.",
+)
+@click.option(
+    "--jobs",
+    default=DEFAULT_JOBS,
+    type=click.IntRange(min=1),
+    help="Number of folders listed in parallel with --recursive "
+    f"(default: {DEFAULT_JOBS})",
+)
+@_no_cache_option
+@_output_format_option
+def list_files(
+    page_size,
+    page_token,
+    query,
+    fields,
+    no_interactive,
+    prefetch,
+    offline,
+    list_all,
+    column_widths,
+    folder_id,
+    jobs,
+    no_cache,
+    output_format,
+):
+    """List files in your Google Drive with interactive pagination.
+
+    With a machine-readable --output-format, the first page is printed
+    without pagination, or every page with --all.
+    """
+    if list_all and page_token is not None:
+        raise click.ClickException("--all and --page-token are mutually exclusive")
+    if folder_id is not None and (query or page_token is not None or offline):
+        raise click.ClickException(
+            "--recursive cannot be combined with --query, --page-token or --offline"
+        )
+
+    zenodotos = _zenodotos()
 
     # Use the library's field parser for consistent field handling
     field_parser = zenodotos.get_field_parser()
     all_fields, requested_fields = field_parser.parse_fields(fields)
 
+    if folder_id is not None:
+        files = zenodotos.walk(
+            folder_id, fields=[f for f in all_fields if f != "path"], jobs=jobs
+        )
+        # One page per file, so each line is printed as soon as it is known
+        pages = ([file] for file in files)
+        if output_format == "table":
+            chunks = (
+                chunk + "\n"
+                for chunk in format_file_stream(
+                    pages, requested_fields or WALK_TABLE_FIELDS, column_widths
+                )
+            )
+        else:
+            chunks = format_records(
+                pages, requested_fields or ["path", *all_fields], output_format
+            )
+        _echo_stream(chunks)
+        return
+
+    if list_all:
+        pages = _iter_pages(
+            zenodotos,
+            page_size or STREAM_PAGE_SIZE,
+            query,
+            all_fields,
+            offline,
+            not no_cache,
+        )
+        if output_format == "table":
+            chunks = (
+                chunk + "\n"
+                for chunk in format_file_stream(pages, requested_fields, column_widths)
+            )
+        else:
+            chunks = format_records(
+                pages, requested_fields or all_fields, output_format
+            )
+        _echo_stream(chunks)
+        return
+
+    page_size = page_size or 10
+
+    if output_format != "table":
+        result = zenodotos.list_files_with_pagination(
+            page_size=page_size,
+            page_token=page_token,
+            query=query,
+            fields=all_fields,
+            offline=offline,
+            use_cache=not no_cache,
+        )
+        _echo_files(result["files"], all_fields, requested_fields, output_format)
+        # Keep stdout parseable: the token goes to stderr
+        if result.get("next_page_token"):
+            click.echo(f"Next page token: {result['next_page_token']}", err=True)
+        return
+
     # If page_token is provided or no-interactive is set, use single page mode
     if page_token is not None or no_interactive:
         result = zenodotos.list_files_with_pagination(
-            page_size=page_size, page_token=page_token, query=query, fields=all_fields
+            page_size=page_size,
+            page_token=page_token,
+            query=query,
+            fields=all_fields,
+            offline=offline,
+            use_cache=not no_cache,
         )
         click.echo(format_file_list(result["files"], requested_fields))
 
@@ -58,12 +290,19 @@ def list_files(page_size, page_token, query, fields, no_interactive):
     else:
         # Use interactive pagination by default
         interactive_pagination(
-            zenodotos, page_size, query, all_fields, requested_fields
+            zenodotos,
+            page_size,
+            query,
+            all_fields,
+            requested_fields,
+            prefetch_depth=prefetch,
+            offline=offline,
+            use_cache=not no_cache,
         )
 
 
 @click.command()
-@click.argument("file_id", required=False)
+@click.argument("file_ids", nargs=-1, metavar="[FILE_ID]...")
 @click.option(
     "--query",
     help="Search query to find files to get details for (e.g., \"name contains 'report'\")",
@@ -75,37 +314,50 @@ def list_files(page_size, page_token, query, fields, no_interactive):
     "Defaults to: id,name,mimeType,size,createdTime,modifiedTime,description,owners,webViewLink. "
     "Note: name, mimeType, and size are always included for proper display.",
 )
-def get_file(file_id, query, fields):
+@click.option(
+    "--offline",
+    is_flag=True,
+    help="Look files up in the local index instead of the Drive API. "
+    "Requires a previous 'zenodotos index sync'.",
+)
+@_no_cache_option
+@_output_format_option
+def get_file(file_ids, query, fields, offline, no_cache, output_format):
     """Get detailed information about a specific file from Google Drive.
 
     Retrieves and displays comprehensive metadata for a single file identified by its ID or search query.
+    Several FILE_IDs can be given at once; they are fetched together using batched API requests.
     Use --fields to customize which information is displayed.
 
     Either FILE_ID or --query must be provided. Use --query to search for files by name or other criteria.
+    Use --offline to answer from the local index without contacting Google Drive.
     """
     # Validate that either file_id or query is provided
-    if not file_id and not query:
+    if not file_ids and not query:
         raise click.ClickException("Either FILE_ID or --query must be provided")
 
-    if file_id and query:
+    if file_ids and query:
         raise click.ClickException("FILE_ID and --query are mutually exclusive")
 
-    zenodotos = Zenodotos()
+    zenodotos = _zenodotos()
 
     # Use the library's field parser for consistent field handling
     field_parser = zenodotos.get_field_parser()
     all_fields, requested_fields = field_parser.parse_fields(fields)
+    failures = []
 
     try:
         # Handle query-based file retrieval
         if query:
             try:
                 # Get the file using the library's search_and_get_file method
-                file = zenodotos.search_and_get_file(query)
+                file = zenodotos.search_and_get_file(
+                    query, offline=offline, use_cache=not no_cache
+                )
 
                 # Display the file information using the existing formatter
                 # Pass as a single-item list since format_file_list expects a list
-                click.echo(format_file_list([file], requested_fields))
+                _echo_files([file], all_fields, requested_fields, output_format)
 
             except ValueError:
                 # Multiple matches - show the options
@@ -113,7 +365,12 @@ def get_file(file_id, query, fields):
                 click.echo("", err=True)
 
                 # Get the list of matching files to show options
-                files = zenodotos.list_files(query=query, page_size=100)
+                files = zenodotos.list_files(
+                    query=query,
+                    page_size=100,
+                    offline=offline,
+                    use_cache=not no_cache,
+                )
                 for file in files:
                     click.echo(
                         f"  {file.id} - {file.name} ({file.mime_type})", err=True
@@ -128,14 +385,36 @@ def get_file(file_id, query, fields):
                 click.echo("No files found matching the query.", err=True)
                 raise click.ClickException("No files found")
 
+        # Handle several file IDs with a single batched lookup
+        elif len(file_ids) > 1:
+            results = zenodotos.get_files(
+                list(file_ids),
+                fields=all_fields,
+                offline=offline,
+                use_cache=not no_cache,
+            )
+            files = [r for r in results if not isinstance(r, Exception)]
+            failures = [
+                (file_id, r)
+                for file_id, r in zip(file_ids, results)
+                if isinstance(r, Exception)
+            ]
+
+            if files:
+                _echo_files(files, all_fields, requested_fields, output_format)
+            for file_id, error in failures:
+                click.echo(f"Error: {file_id}: {str(error)}", err=True)
+
         # Handle file ID-based retrieval (existing functionality)
         else:
             # Get the file using the library interface
-            file = zenodotos.get_file(file_id)
+            file = zenodotos.get_file(
+                file_ids[0], offline=offline, use_cache=not no_cache
+            )
 
             # Display the file information using the existing formatter
             # Pass as a single-item list since format_file_list expects a list
-            click.echo(format_file_list([file], requested_fields))
+            _echo_files([file], all_fields, requested_fields, output_format)
 
     except FileNotFoundError as e:
         click.echo(f"Error: {str(e)}", err=True)
@@ -147,6 +426,11 @@ def get_file(file_id, query, fields):
         click.echo(f"Error: {str(e)}", err=True)
         raise click.ClickException("Failed to get file")
 
+    if failures:
+        raise click.ClickException(
+            f"Failed to get {len(failures)} of {len(file_ids)} files"
+        )
+
 
 @click.command()
 @click.argument("file_id", required=False)
@@ -166,12 +450,25 @@ def get_file(file_id, query, fields):
     ),
     help="Export format (auto-detected if not specified)",
 )
+@click.option(
+    "--all",
+    "export_all",
+    is_flag=True,
+    help="Export every file matching --query instead of requiring a single match. "
+    "--output is then the directory where the files are saved.",
+)
+@click.option(
+    "--jobs",
+    default=DEFAULT_JOBS,
+    type=click.IntRange(min=1),
+    help=f"Number of files exported in parallel with --all (default: {DEFAULT_JOBS})",
+)
 @click.option(
     "--verbose",
     is_flag=True,
     help="Show detailed progress information",
 )
-def export(file_id, query, output, format, verbose):
+def export(file_id, query, output, format, export_all, jobs, verbose):
     """Export a file from Google Drive.
 
     Supports Google Workspace documents (Docs, Sheets, Slides) with smart format defaults:
@@ -192,11 +489,37 @@ def export(file_id, query, output, format, verbose):
     if file_id and query:
         raise click.ClickException("FILE_ID and --query are mutually exclusive")
 
+    if export_all and not query:
+        raise click.ClickException("--all requires --query")
+
+    bulk_failures = {}
     try:
-        zenodotos = Zenodotos()
+        zenodotos = _zenodotos()
+
+        # Handle bulk export of every match
+        if export_all:
+            if verbose:
+                click.echo(f"Searching for files with query: {query}")
+
+            try:
+                summary = zenodotos.search_and_export_all(
+                    query, output_dir=output, format=format, jobs=jobs
+                )
+            except NoFilesFoundError:
+                click.echo("No files found matching the query.", err=True)
+                raise click.ClickException("No files found")
+
+            for path in summary["exported"].values():
+                click.echo(f"Successfully exported to: {path}")
+            for failed_id, error in summary["failed"].items():
+                click.echo(f"Error: {failed_id}: {str(error)}", err=True)
+
+            bulk_failures = summary["failed"]
+            bulk_total = len(summary["exported"]) + len(bulk_failures)
+            click.echo(f"Exported {len(summary['exported'])} of {bulk_total} files")
 
         # Handle query-based export using the library's search_and_export method
-        if query:
+        elif query:
             if verbose:
                 click.echo(f"Searching for files with query: {query}")
 
@@ -244,3 +567,186 @@ def export(file_id, query, output, format, verbose):
     except Exception as e:
         click.echo(f"Error: {str(e)}", err=True)
         raise click.ClickException("Export failed")
+
+    if bulk_failures:
+        raise click.ClickException(
+            f"Failed to export {len(bulk_failures)} of {bulk_total} files"
+        )
+
+
+@click.command()
+@click.argument("file_id")
+@click.option(
+    "--output",
+    help="Output path for the downloaded file (default: the file name)",
+)
+@click.option("--verbose", is_flag=True, help="Show detailed progress information")
+def download(file_id, output, verbose):
+    """Download a binary file, such as a PDF or image, from Google Drive.
+
+    Interrupted downloads resume where they stopped when run again, and the
+    content is checked against the file's MD5 checksum. Google Workspace
+    documents cannot be downloaded; use export instead.
+    """
+    try:
+        zenodotos = _zenodotos()
+        if verbose:
+            click.echo(f"Downloading file with ID: {file_id}")
+        result_path = zenodotos.download_file(file_id, output_path=output)
+        click.echo(f"Successfully downloaded to: {result_path}")
+    except FileNotFoundError as e:
+        click.echo(f"Error: {str(e)}", err=True)
+        raise click.ClickException("File not found")
+    except PermissionError as e:
+        click.echo(f"Error: {str(e)}", err=True)
+        raise click.ClickException("Permission denied")
+    except ValueError as e:
+        click.echo(f"Error: {str(e)}", err=True)
+        raise click.ClickException("Cannot download file")
+    except Exception as e:
+        click.echo(f"Error: {str(e)}", err=True)
+        raise click.ClickException("Download failed")
+
+
+@click.command()
+@click.argument("folder_id")
+@click.argument("destination", type=click.Path(file_okay=False))
+@click.option(
+    "--delete",
+    is_flag=True,
+    help="Delete local copies of files that are no longer in the folder",
+)
+@click.option(
+    "--jobs",
+    default=DEFAULT_JOBS,
+    type=click.IntRange(min=1),
+    help="Number of folders listed, and files transferred, in parallel "
+    f"(default: {DEFAULT_JOBS})",
+)
+def mirror(folder_id, destination, delete, jobs):
+    """Mirror a Google Drive folder tree into a local directory.
+
+    Binary files are downloaded and Google Workspace documents exported in
+    their default format. Later runs only transfer files whose checksum,
+    version or modification time changed, and move renamed files locally.
+    """
+    try:
+        zenodotos = _zenodotos()
+        summary = zenodotos.mirror_folder(
+            folder_id, destination, delete=delete, jobs=jobs
+        )
+    except PermissionError as e:
+        click.echo(f"Error: {str(e)}", err=True)
+        raise click.ClickException("Permission denied")
+    except Exception as e:
+        click.echo(f"Error: {str(e)}", err=True)
+        raise click.ClickException("Mirror failed")
+
+    for path, error in summary["failed"].items():
+        click.echo(f"Error: {path}: {str(error)}", err=True)
+
+    click.echo(
+        f"Mirror complete: {summary['downloaded']} downloaded, "
+        f"{summary['exported']} exported, {summary['moved']} moved, "
+        f"{summary['unchanged']} unchanged, {summary['deleted']} deleted"
+    )
+    if summary["unsupported"]:
+        click.echo(
+            f"Skipped {summary['unsupported']} Google files that cannot be exported"
+        )
+    if summary["failed"]:
+        raise click.ClickException(f"Failed to transfer {len(summary['failed'])} files")
+
+
+@click.command()
+@click.argument("text")
+@click.option(
+    "--limit",
+    default=20,
+    type=click.IntRange(min=1),
+    help="Maximum number of files to show (default: 20)",
+)
+@click.option(
+    "--include-trashed",
+    is_flag=True,
+    help="Also show files in the trash",
+)
+@click.option(
+    "--fields",
+    default=None,
+    help="Comma-separated list of fields to display for each file. "
+    "Defaults to: id,name,mimeType,size,createdTime,modifiedTime,description,owners,webViewLink. "
+    "Note: name, mimeType, and size are always included for proper display.",
+)
+def search(text, limit, include_trashed, fields):
+    """Search file names and descriptions in the local index.
+
+    Every word of TEXT must match the start of a word in the file's name or
+    description, ignoring case and accents. Name matches are listed first.
+    No API calls are made; run 'zenodotos index sync' to refresh the index.
+    """
+    zenodotos = _zenodotos()
+    _, requested_fields = zenodotos.get_field_parser().parse_fields(fields)
+
+    try:
+        files = zenodotos.search_files(
+            text, limit=limit, include_trashed=include_trashed
+        )
+    except Exception as e:
+        click.echo(f"Error: {str(e)}", err=True)
+        raise click.ClickException("Search failed")
+
+    if not files:
+        click.echo("No files found.", err=True)
+        raise click.ClickException("No files found")
+
+    click.echo(format_file_list(files, requested_fields))
+
+
+@click.group()
+def index():
+    """Manage the local index of Google Drive file metadata."""
+    pass
+
+
+@index.command("sync")
+@click.option(
+    "--full",
+    is_flag=True,
+    help="Rebuild the index from a complete listing instead of applying changes",
+)
+def index_sync(full):
+    """Sync the local index with Google Drive.
+
+    The first sync lists every file in your drive. Later syncs only apply
+    the changes made since the previous one, including deletions, trashing
+    and moves.
+    """
+    try:
+        zenodotos = _zenodotos()
+        result = zenodotos.sync_index(full=full)
+    except PermissionError as e:
+        click.echo(f"Error: {str(e)}", err=True)
+        raise click.ClickException("Permission denied")
+    except Exception as e:
+        click.echo(f"Error: {str(e)}", err=True)
+        raise click.ClickException("Index sync failed")
+
+    kind = "Full sync" if result["full"] else "Incremental sync"
+    click.echo(
+        f"{kind} complete: {result['updated']} updated, {result['removed']} removed "
+        f"({result['api_calls']} API calls)"
+    )
+
+
+@index.command("status")
+def index_status():
+    """Show the size of the local index and when it was last synced."""
+    local_index = _zenodotos().get_index()
+    last_synced = local_index.last_synced
+    if last_synced is None:
+        click.echo("The index has not been synced yet. Run: zenodotos index sync")
+        return
+
+    click.echo(f"Files: {local_index.count():,}")
+    click.echo(f"Last synced: {last_synced.astimezone():%Y-%m-%d %H:%M:%S}")
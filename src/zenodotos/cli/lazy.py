@@ -0,0 +1,38 @@
+"""Click group importing its subcommands on first use."""
+
+import importlib
+from typing import Dict, List, Optional
+
+import click
+
+from ..timings import phase
+
+
+class LazyGroup(click.Group):
+    """Group whose subcommands are only imported when they are looked up.
+
+    Subcommands are given as ``"module:attribute"`` import paths, so parsing
+    the group's own options, as for ``--version``, imports none of them.
+    """
+
+    def __init__(self, *args, lazy_commands: Optional[Dict[str, str]] = None, **kwargs):
+        """Initialize the group.
+
+        Args:
+            lazy_commands: Import path of each subcommand, by name.
+        """
+        super().__init__(*args, **kwargs)
+        self.lazy_commands = dict(lazy_commands or {})
+
+    def list_commands(self, ctx: click.Context) -> List[str]:
+        """List the names of every subcommand, loaded or not."""
+        return sorted({*super().list_commands(ctx), *self.lazy_commands})
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> Optional[click.Command]:
+        """Get a subcommand, importing it first if needed."""
+        if cmd_name not in self.commands and cmd_name in self.lazy_commands:
+            module_name, _, attribute = self.lazy_commands[cmd_name].partition(":")
+            with phase("import"):
+                module = importlib.import_module(module_name)
+            self.add_command(getattr(module, attribute), cmd_name)
+        return super().get_command(ctx, cmd_name)
@@ -1,23 +1,40 @@
 """Navigation helper functions for interactive CLI commands."""
 
 import click
-from typing import List, Dict, Any, Optional
-from zenodotos import Zenodotos
+from typing import TYPE_CHECKING, List, Dict, Any, Optional
 from zenodotos.formatters.display import format_file_list
 from .pagination import PaginationState
+from .prefetch import DEFAULT_PREFETCH_DEPTH, PagePrefetcher
+
+if TYPE_CHECKING:
+    from zenodotos import Zenodotos
 
 
 def fetch_page(
-    zenodotos: Zenodotos, state: PaginationState, fields: List[str]
+    zenodotos: "Zenodotos",
+    state: PaginationState,
+    fields: List[str],
+    prefetcher: Optional[PagePrefetcher] = None,
 ) -> Dict[str, Any]:
-    """Fetch a page of files from the API."""
-    result = zenodotos.list_files_with_pagination(
-        page_size=state.page_size,
-        page_token=state.page_token,
-        query=state.query,
-        fields=fields,
-    )
+    """Fetch a page of files, reusing the stored result of a page already seen."""
+    cached = state.get_cached_page(state.page_number)
+    if cached is not None:
+        state.current_result = cached
+        return cached
+
+    if prefetcher is not None:
+        result = prefetcher.fetch(state)
+    else:
+        result = zenodotos.list_files_with_pagination(
+            page_size=state.page_size,
+            page_token=state.page_token,
+            query=state.query,
+            fields=fields,
+            offline=state.offline,
+            use_cache=state.use_cache,
+        )
     state.current_result = result
+    state.cache_page(state.page_number, result)
     return result
 
 
@@ -27,6 +44,12 @@ def display_page(result: Dict[str, Any], requested_fields: Optional[List[str]])
     click.echo(format_file_list(result["files"], requested_fields))
 
 
+def display_error(state: PaginationState) -> None:
+    """Display the error that prevented the current page from loading."""
+    click.clear()
+    click.echo(f"Error loading page {state.page_number}: {state.error}", err=True)
+
+
 def get_navigation_options(state: PaginationState) -> List[str]:
     """Get available navigation options based on current state."""
     options = []
@@ -34,6 +57,8 @@ def get_navigation_options(state: PaginationState) -> List[str]:
         options.append("[P]rev")
     if state.has_next_page():
         options.append("[N]ext")
+    if state.has_error():
+        options.append("[R]etry")
     options.append("[Q]uit")
     return options
 
@@ -52,6 +77,8 @@ def handle_user_input(state: PaginationState) -> str:
                 return "next"
             elif choice == "p" and state.has_previous_page():
                 return "previous"
+            elif choice == "r" and state.has_error():
+                return "retry"
             else:
                 click.echo("\nInvalid choice. Please try again.")
                 click.echo(f"{' '.join(options)}: ", nl=False)
@@ -60,60 +87,58 @@ def handle_user_input(state: PaginationState) -> str:
             return "quit"
 
 
-def navigate_to_previous_page(
-    zenodotos: Zenodotos, state: PaginationState, fields: List[str]
-) -> None:
-    """Navigate to the previous page by rebuilding the path from the beginning."""
-    if state.page_number == 2:
-        # Simple case: go back to first page
-        state.reset_to_first_page()
-    else:
-        # Complex case: rebuild path to previous page
-        target_page = state.page_number - 1
-        state.reset_to_first_page()
-
-        # Navigate to target page by going through all pages
-        for _ in range(target_page - 1):
-            temp_result = zenodotos.list_files_with_pagination(
-                page_size=state.page_size,
-                page_token=state.page_token,
-                query=state.query,
-                fields=fields,
-            )
-            state.page_token = temp_result.get("next_page_token")
-            if not state.page_token:
-                break
-
-        state.page_number = target_page
+def navigate_to_previous_page(state: PaginationState) -> None:
+    """Navigate to the previous page using its recorded page token."""
+    state.go_to_previous_page()
 
 
 def interactive_pagination(
-    zenodotos: Zenodotos,
+    zenodotos: "Zenodotos",
     page_size: int,
     query: Optional[str],
     all_fields: List[str],
     requested_fields: Optional[List[str]],
+    prefetch_depth: int = DEFAULT_PREFETCH_DEPTH,
+    offline: bool = False,
+    use_cache: bool = True,
 ) -> None:
-    """Handle interactive pagination for file listing."""
-    state = PaginationState(page_size, query)
-
-    try:
-        while True:
-            # Fetch and display current page
-            result = fetch_page(zenodotos, state, all_fields)
-            display_page(result, requested_fields)
-
-            # Handle user navigation
-            action = handle_user_input(state)
-
-            if action == "quit":
-                click.echo("\nGoodbye!")
-                return
-            elif action == "next":
-                state.go_to_next_page()
-            elif action == "previous":
-                navigate_to_previous_page(zenodotos, state, all_fields)
-
-    except KeyboardInterrupt:
-        click.echo("\n\nGoodbye!")
-        return
+    """Handle interactive pagination for file listing.
+
+    While a page is shown, the following ``prefetch_depth`` pages are fetched
+    in the background so turning the page does not wait for the API. With
+    ``offline``, pages are read from the local index instead. Without
+    ``use_cache``, pages are always requested from the API rather than the
+    metadata cache.
+    """
+    state = PaginationState(page_size, query, offline=offline, use_cache=use_cache)
+
+    with PagePrefetcher(zenodotos, all_fields, prefetch_depth) as prefetcher:
+        try:
+            while True:
+                # Fetch and display current page
+                try:
+                    result = fetch_page(zenodotos, state, all_fields, prefetcher)
+                except Exception as e:
+                    state.current_result = None
+                    state.error = e
+                    display_error(state)
+                else:
+                    display_page(result, requested_fields)
+                    prefetcher.schedule(state)
+
+                # Handle user navigation
+                action = handle_user_input(state)
+
+                if action == "quit":
+                    click.echo("\nGoodbye!")
+                    return
+                elif action == "next":
+                    state.go_to_next_page()
+                elif action == "previous":
+                    navigate_to_previous_page(state)
+                elif action == "retry":
+                    state.error = None
+
+        except KeyboardInterrupt:
+            click.echo("\n\nGoodbye!")
+            return
@@ -1,22 +1,47 @@
 """Pagination state management for CLI commands."""
 
+from collections import OrderedDict
 from typing import Optional, Dict, Any
 
+DEFAULT_MAX_CACHED_PAGES = 20
+
 
 class PaginationState:
-    """Manages pagination state for interactive file listing."""
+    """Manages pagination state for interactive file listing.
+
+    The page token of every visited page is remembered, so any of them can be
+    revisited directly. The results of the most recently shown pages are kept
+    in a small LRU cache, so revisiting them needs no API call at all.
+    """
 
-    def __init__(self, page_size: int, query: Optional[str]):
+    def __init__(
+        self,
+        page_size: int,
+        query: Optional[str],
+        max_cached_pages: int = DEFAULT_MAX_CACHED_PAGES,
+        offline: bool = False,
+        use_cache: bool = True,
+    ):
         self.page_size = page_size
         self.query = query
+        self.offline = offline
+        self.use_cache = use_cache
         self.page_number = 1
         self.page_token: Optional[str] = None
         self.current_result: Optional[Dict[str, Any]] = None
+        self.error: Optional[Exception] = None
+        self.max_cached_pages = max_cached_pages
+        self.page_tokens: Dict[int, Optional[str]] = {1: None}
+        self._page_cache: "OrderedDict[int, Dict[str, Any]]" = OrderedDict()
 
     def has_next_page(self) -> bool:
         """Check if there's a next page available."""
         return bool(self.current_result and self.current_result.get("next_page_token"))
 
+    def has_error(self) -> bool:
+        """Check if loading the current page failed."""
+        return self.error is not None
+
     def has_previous_page(self) -> bool:
         """Check if there's a previous page available."""
         return self.page_number > 1
@@ -26,8 +51,58 @@ class PaginationState:
         if self.has_next_page():
             self.page_token = self.current_result["next_page_token"]
             self.page_number += 1
+            self.page_tokens[self.page_number] = self.page_token
+            self.error = None
+
+    def go_to_previous_page(self) -> None:
+        """Move to the previous page using the recorded page token."""
+        if self.has_previous_page():
+            self.go_to_page(self.page_number - 1)
+
+    def go_to_page(self, page_number: int) -> None:
+        """Move to a page that has already been visited.
+
+        Args:
+            page_number: The one-based page number.
+
+        Raises:
+            ValueError: If the page's token is unknown.
+        """
+        if page_number not in self.page_tokens:
+            raise ValueError(f"Page {page_number} has not been visited")
+        self.page_number = page_number
+        self.page_token = self.page_tokens[page_number]
+        self.current_result = self._page_cache.get(page_number)
+        self.error = None
 
     def reset_to_first_page(self) -> None:
         """Reset to the first page."""
-        self.page_token = None
-        self.page_number = 1
+        self.go_to_page(1)
+
+    def get_cached_page(self, page_number: int) -> Optional[Dict[str, Any]]:
+        """Get the stored result of a page, marking it as recently used.
+
+        Args:
+            page_number: The one-based page number.
+
+        Returns:
+            The page result, or None if it is not cached.
+        """
+        result = self._page_cache.get(page_number)
+        if result is not None:
+            self._page_cache.move_to_end(page_number)
+        return result
+
+    def cache_page(self, page_number: int, result: Dict[str, Any]) -> None:
+        """Store the result of a page, evicting the least recently used one.
+
+        Args:
+            page_number: The one-based page number.
+            result: The page result returned by the API.
+        """
+        if self.max_cached_pages <= 0:
+            return
+        self._page_cache[page_number] = result
+        self._page_cache.move_to_end(page_number)
+        while len(self._page_cache) > self.max_cached_pages:
+            self._page_cache.popitem(last=False)
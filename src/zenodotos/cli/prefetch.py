@@ -0,0 +1,222 @@
+"""Background page prefetching for interactive CLI commands."""
+
+import queue
+import threading
+from concurrent.futures import Future
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Union
+
+from .pagination import PaginationState
+
+if TYPE_CHECKING:
+    from zenodotos import Zenodotos
+
+DEFAULT_PREFETCH_DEPTH = 1
+
+Page = Dict[str, Any]
+
+
+class _Worker:
+    """Runs calls one at a time on a daemon thread.
+
+    ``ThreadPoolExecutor`` joins its threads when the interpreter exits, so a
+    page request still in flight when the user quits, retries and backoff
+    included, would hold up the exit until it returned. A daemon thread is
+    simply abandoned.
+    """
+
+    def __init__(self, name: str):
+        self._calls: "queue.SimpleQueue[Any]" = queue.SimpleQueue()
+        self._shutdown = False
+        self._thread = threading.Thread(target=self._run, name=name, daemon=True)
+        self._thread.start()
+
+    def submit(self, func: Callable[..., Any], *args: Any) -> Future:
+        """Queue a call, returning the future of its result."""
+        if self._shutdown:
+            raise RuntimeError("cannot submit calls after shutdown")
+        future: Future = Future()
+        self._calls.put((future, func, args))
+        return future
+
+    def shutdown(self) -> None:
+        """Stop once the running call, if any, returns; queued calls never run."""
+        self._shutdown = True
+        self._calls.put(None)
+
+    def _run(self) -> None:
+        while True:
+            call = self._calls.get()
+            if call is None or self._shutdown:
+                return
+            future, func, args = call
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                result = func(*args)
+            except BaseException as error:
+                future.set_exception(error)
+            else:
+                future.set_result(result)
+
+
+class PagePrefetcher:
+    """Fetches the pages following the one being shown on a background thread.
+
+    Every fetch, prefetched or not, runs on a single worker thread so the Drive
+    client is never used by two threads at once. Up to ``depth`` pages ahead of
+    the current one are queued after each page is shown. A failed prefetch is
+    kept and raised when its page is requested, so the error surfaces on the
+    page where it happened. The worker is a daemon thread, so a request still
+    running when the user quits does not delay exiting.
+    """
+
+    def __init__(
+        self,
+        zenodotos: "Zenodotos",
+        fields: List[str],
+        depth: int = DEFAULT_PREFETCH_DEPTH,
+    ):
+        """Initialize the prefetcher.
+
+        Args:
+            zenodotos: The client used to list files.
+            fields: Fields to request for each file.
+            depth: Number of pages to fetch ahead of the current one. Zero
+                disables prefetching.
+
+        Raises:
+            ValueError: If depth is negative.
+        """
+        if depth < 0:
+            raise ValueError("depth must not be negative")
+        self.zenodotos = zenodotos
+        self.fields = fields
+        self.depth = depth
+        self._futures: Dict[int, "Future[Optional[Page]]"] = {}
+        self._cancelled = threading.Event()
+        self._worker = _Worker("zenodotos-prefetch")
+
+    def __enter__(self) -> "PagePrefetcher":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def fetch(self, state: PaginationState) -> Page:
+        """Get the current page, waiting for its prefetch if one was queued.
+
+        Args:
+            state: The pagination state pointing at the page to get.
+
+        Returns:
+            The page result returned by the API.
+
+        Raises:
+            Exception: Whatever the API call raised, including a failure of the
+                page's earlier prefetch.
+        """
+        future = self._futures.pop(state.page_number, None)
+        if future is not None:
+            try:
+                result = future.result()
+            except Exception:
+                # Pages queued behind a failed one were chained to its result
+                self._discard_after(state.page_number)
+                raise
+            if result is not None:
+                return result
+
+        return self._worker.submit(
+            self._list_files,
+            state.page_size,
+            state.page_token,
+            state.query,
+            state.offline,
+            state.use_cache,
+        ).result()
+
+    def schedule(self, state: PaginationState) -> None:
+        """Queue the pages following the current one.
+
+        Pages that are cached in the state or already queued are not fetched
+        again.
+
+        Args:
+            state: The pagination state pointing at the page being shown.
+        """
+        if self._cancelled.is_set():
+            return
+
+        previous: Union[Page, "Future[Optional[Page]]", None] = state.current_result
+        first = state.page_number + 1
+        for page_number in range(first, first + self.depth):
+            if previous is None or (
+                isinstance(previous, dict) and not previous.get("next_page_token")
+            ):
+                return
+            source = state.get_cached_page(page_number) or self._futures.get(
+                page_number
+            )
+            if source is None:
+                source = self._worker.submit(
+                    self._fetch_after,
+                    state.page_size,
+                    state.query,
+                    state.offline,
+                    state.use_cache,
+                    previous,
+                )
+                self._futures[page_number] = source
+            previous = source
+
+    def close(self) -> None:
+        """Cancel queued prefetches and stop the worker thread without waiting."""
+        self._cancelled.set()
+        for future in self._futures.values():
+            future.cancel()
+        self._futures.clear()
+        self._worker.shutdown()
+
+    def _fetch_after(
+        self,
+        page_size: int,
+        query: Optional[str],
+        offline: bool,
+        use_cache: bool,
+        previous: Union[Page, "Future[Optional[Page]]"],
+    ) -> Optional[Page]:
+        """Fetch the page following ``previous``.
+
+        Returns:
+            The page result, or None if there is no such page or prefetching
+            was cancelled.
+        """
+        if self._cancelled.is_set():
+            return None
+        page = previous.result() if isinstance(previous, Future) else previous
+        if not page or not page.get("next_page_token"):
+            return None
+        return self._list_files(
+            page_size, page["next_page_token"], query, offline, use_cache
+        )
+
+    def _list_files(
+        self,
+        page_size: int,
+        page_token: Optional[str],
+        query: Optional[str],
+        offline: bool,
+        use_cache: bool,
+    ) -> Page:
+        return self.zenodotos.list_files_with_pagination(
+            page_size=page_size,
+            page_token=page_token,
+            query=query,
+            fields=self.fields,
+            offline=offline,
+            use_cache=use_cache,
+        )
+
+    def _discard_after(self, page_number: int) -> None:
+        for queued in [number for number in self._futures if number > page_number]:
+            self._futures.pop(queued).cancel()
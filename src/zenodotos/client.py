@@ -1,10 +1,17 @@
 """High-level Google Drive client library."""
 
-from typing import List, Optional, Dict, Any
+from pathlib import Path
+from typing import TYPE_CHECKING, List, Optional, Dict, Any, Iterator, Sequence, Union
 
-from .drive.client import DriveClient
+from .config import Config
 from .drive.models import DriveFile
-from .utils import FieldParser
+from .exceptions import NoFilesFoundError
+from .index import LocalIndex
+from .timings import phase
+from .utils import DEFAULT_JOBS, FieldParser
+
+if TYPE_CHECKING:
+    from .drive.client import DriveClient
 
 
 class Zenodotos:
@@ -37,13 +44,31 @@ class Zenodotos:
             credentials_path: Optional path to credentials file. If not provided,
                 uses default authentication configuration.
         """
-        self._client = DriveClient(credentials_path=credentials_path)
+        self._credentials_path = credentials_path
+        self._drive_client: Optional["DriveClient"] = None
+        self._index: Optional[LocalIndex] = None
+
+    @property
+    def _client(self) -> "DriveClient":
+        """The Drive API client, created when an API call is first made.
+
+        It loads the Google API libraries, which offline queries of the local
+        index never need.
+        """
+        if self._drive_client is None:
+            with phase("import"):
+                from .drive.client import DriveClient
+
+            self._drive_client = DriveClient(credentials_path=self._credentials_path)
+        return self._drive_client
 
     def list_files(
         self,
         page_size: int = 10,
         query: Optional[str] = None,
         fields: Optional[List[str]] = None,
+        offline: bool = False,
+        use_cache: bool = True,
     ) -> List[DriveFile]:
         """List files with simplified interface.
 
@@ -51,17 +76,28 @@ class Zenodotos:
             page_size: Number of files to return (default: 10)
             query: Search query to filter files (e.g., "name contains 'report'")
             fields: List of fields to include in response
+            offline: Evaluate the query against the local index instead of
+                calling the API (default: False)
+            use_cache: Let the metadata cache answer and store API responses
+                (default: True)
 
         Returns:
             List of DriveFile objects
 
         Raises:
             PermissionError: If authentication fails or insufficient permissions
-            RuntimeError: For other API errors
+            ValidationError: If offline and the query cannot be evaluated locally
+            RuntimeError: For other API errors, or if offline and the index has
+                never been synced
         """
-        result = self._client.list_files(
-            page_size=page_size, query=query, fields=fields
-        )
+        if offline:
+            result = self._get_synced_index().list_files(
+                page_size=page_size, query=query
+            )
+        else:
+            result = self._client.list_files(
+                page_size=page_size, query=query, fields=fields, use_cache=use_cache
+            )
         return result["files"]
 
     def list_files_with_pagination(
@@ -70,6 +106,8 @@ class Zenodotos:
         page_token: Optional[str] = None,
         query: Optional[str] = None,
         fields: Optional[List[str]] = None,
+        offline: bool = False,
+        use_cache: bool = True,
     ) -> Dict[str, Any]:
         """List files with pagination information (for CLI and advanced use).
 
@@ -78,6 +116,10 @@ class Zenodotos:
             page_token: Token for the next page of results
             query: Search query to filter files
             fields: List of fields to include in response
+            offline: Evaluate the query against the local index instead of
+                calling the API (default: False)
+            use_cache: Let the metadata cache answer and store API responses
+                (default: True)
 
         Returns:
             Dict containing:
@@ -86,17 +128,80 @@ class Zenodotos:
 
         Raises:
             PermissionError: If authentication fails or insufficient permissions
-            RuntimeError: For other API errors
+            ValidationError: If offline and the query cannot be evaluated locally
+            RuntimeError: For other API errors, or if offline and the index has
+                never been synced
         """
-        return self._client.list_files(
-            page_size=page_size, page_token=page_token, query=query, fields=fields
-        )
+        return self._list_page(page_size, page_token, query, fields, offline, use_cache)
+
+    def iter_files(
+        self,
+        query: Optional[str] = None,
+        fields: Optional[List[str]] = None,
+        page_size: int = 100,
+        limit: Optional[int] = None,
+        offline: bool = False,
+        use_cache: bool = True,
+    ) -> Iterator[DriveFile]:
+        """Iterate over every matching file, fetching pages as they are needed.
+
+        Page tokens are followed transparently and only one page is held in
+        memory at a time. The next page is requested only once every file of
+        the previous one has been consumed.
+
+        Args:
+            query: Search query to filter files
+            fields: List of fields to include in response
+            page_size: Number of files to request per page (default: 100)
+            limit: Maximum number of files to yield (default: no limit)
+            offline: Evaluate the query against the local index instead of
+                calling the API (default: False)
+            use_cache: Let the metadata cache answer and store API responses
+                (default: True)
 
-    def get_file(self, file_id: str) -> DriveFile:
+        Yields:
+            DriveFile objects in the order returned by the API
+
+        Raises:
+            ValueError: If page_size is not positive or limit is negative
+            PermissionError: If authentication fails or insufficient permissions
+            ValidationError: If offline and the query cannot be evaluated locally
+            RuntimeError: For other API errors, or if offline and the index has
+                never been synced
+        """
+        if page_size < 1:
+            raise ValueError("page_size must be at least 1")
+        if limit is not None and limit < 0:
+            raise ValueError("limit must not be negative")
+
+        remaining = limit
+        page_token = None
+        while remaining is None or remaining > 0:
+            size = page_size if remaining is None else min(page_size, remaining)
+            result = self._list_page(
+                size, page_token, query, fields, offline, use_cache
+            )
+            files = result["files"]
+            if remaining is not None:
+                files = files[:remaining]
+                remaining -= len(files)
+            yield from files
+
+            page_token = result.get("next_page_token")
+            if not page_token:
+                return
+
+    def get_file(
+        self, file_id: str, offline: bool = False, use_cache: bool = True
+    ) -> DriveFile:
         """Get detailed information about a specific file.
 
         Args:
             file_id: The Google Drive file ID
+            offline: Read the file from the local index instead of calling the
+                API (default: False)
+            use_cache: Let the metadata cache answer and store API responses
+                (default: True)
 
         Returns:
             DriveFile object with file metadata
@@ -104,15 +209,59 @@ class Zenodotos:
         Raises:
             FileNotFoundError: If the file doesn't exist
             PermissionError: If user doesn't have permission to access the file
-            RuntimeError: For other API errors
+            RuntimeError: For other API errors, or if offline and the index has
+                never been synced
         """
-        return self._client.get_file(file_id)
+        if offline:
+            file = self._get_synced_index().get_file(file_id)
+            if file is None:
+                raise FileNotFoundError(f"File not found in the index: {file_id}")
+            return file
+        return self._client.get_file(file_id, use_cache=use_cache)
+
+    def get_files(
+        self,
+        file_ids: List[str],
+        fields: Optional[List[str]] = None,
+        offline: bool = False,
+        use_cache: bool = True,
+    ) -> List[Union[DriveFile, Exception]]:
+        """Get details for several files at once using batched API requests.
+
+        Args:
+            file_ids: The Google Drive file IDs
+            fields: List of fields to include for each file
+            offline: Read the files from the local index instead of calling
+                the API (default: False)
+            use_cache: Let the metadata cache answer and store API responses
+                (default: True)
+
+        Returns:
+            List with one entry per file ID, in input order. Each entry is a
+            DriveFile, or the exception raised for that ID (FileNotFoundError,
+            PermissionError or RuntimeError).
+
+        Raises:
+            PermissionError: If authentication fails for the whole batch
+            RuntimeError: For other API errors affecting the whole batch, or
+                if offline and the index has never been synced
+        """
+        if offline:
+            results: List[Union[DriveFile, Exception]] = []
+            for file_id in file_ids:
+                try:
+                    results.append(self.get_file(file_id, offline=True))
+                except FileNotFoundError as e:
+                    results.append(e)
+            return results
+        return self._client.get_files(file_ids, fields=fields, use_cache=use_cache)
 
     def export_file(
         self,
         file_id: str,
         output_path: Optional[str] = None,
         format: Optional[str] = None,
+        file: Optional[DriveFile] = None,
     ) -> str:
         """Export a file from Google Drive.
 
@@ -122,6 +271,8 @@ class Zenodotos:
                 saves to current directory with document name
             format: Export format (html, pdf, xlsx, csv, md). If not provided,
                 uses smart default based on file type
+            file: DriveFile already retrieved for file_id. When provided, its
+                name and MIME type are used and no metadata request is made
 
         Returns:
             Path to the exported file
@@ -132,7 +283,115 @@ class Zenodotos:
             ValueError: If the format is not supported
             RuntimeError: For other API errors
         """
-        return self._client.export(file_id, output_path, format)
+        return self._client.export(file_id, output_path, format, file=file)
+
+    def download_file(
+        self,
+        file_id: str,
+        output_path: Optional[str] = None,
+        file: Optional[DriveFile] = None,
+    ) -> str:
+        """Download a binary file from Google Drive.
+
+        Interrupted downloads resume from the bytes already received, and the
+        content is verified against the file's MD5 checksum.
+
+        Args:
+            file_id: The Google Drive file ID
+            output_path: Output path for the downloaded file. If not provided,
+                saves to current directory with the file name
+            file: DriveFile already retrieved for file_id, including its MIME
+                type and md5Checksum. When provided, no metadata request is made
+
+        Returns:
+            Path to the downloaded file
+
+        Raises:
+            FileNotFoundError: If the file doesn't exist
+            PermissionError: If user doesn't have permission to access the file
+            ValueError: If the file is a Google Workspace document
+            ChecksumMismatchError: If the downloaded content is corrupted
+            RuntimeError: For other API errors
+        """
+        return self._client.download(file_id, output_path, file=file)
+
+    def export_many(
+        self,
+        files: Sequence[Union[str, DriveFile]],
+        output_dir: Optional[str] = None,
+        format: Optional[str] = None,
+        jobs: int = DEFAULT_JOBS,
+    ) -> Dict[str, Any]:
+        """Export several files in parallel.
+
+        Args:
+            files: DriveFile objects or file IDs to export. IDs are resolved
+                with a single batched metadata lookup.
+            output_dir: Directory for the exported files. If not provided,
+                saves to the current directory with document names
+            format: Export format (html, pdf, xlsx, csv, md). If not provided,
+                uses smart default based on each file's type
+            jobs: Maximum number of concurrent exports (default: 4)
+
+        Returns:
+            Dict containing:
+                - exported: Mapping of file ID to exported file path
+                - failed: Mapping of file ID to the exception raised for it
+
+        Raises:
+            ValueError: If the format is not supported
+            PermissionError: If authentication fails
+            RuntimeError: For other API errors affecting the whole operation
+        """
+        failed: Dict[str, Exception] = {}
+        ids = [f for f in files if isinstance(f, str)]
+        resolved = dict(zip(ids, self._client.get_files(ids))) if ids else {}
+
+        to_export = []
+        for item in files:
+            file = resolved.get(item) if isinstance(item, str) else item
+            if isinstance(file, Exception):
+                failed[item] = file
+            else:
+                to_export.append(file)
+
+        summary = self._client.export_many(
+            to_export, output_dir=output_dir, format=format, jobs=jobs
+        )
+        summary["failed"].update(failed)
+        return summary
+
+    def search_and_export_all(
+        self,
+        query: str,
+        output_dir: Optional[str] = None,
+        format: Optional[str] = None,
+        jobs: int = DEFAULT_JOBS,
+    ) -> Dict[str, Any]:
+        """Search for files and export every match in parallel.
+
+        Args:
+            query: Search query to find files
+            output_dir: Directory for the exported files
+            format: Export format (html, pdf, xlsx, csv, md)
+            jobs: Maximum number of concurrent exports (default: 4)
+
+        Returns:
+            Dict containing:
+                - exported: Mapping of file ID to exported file path
+                - failed: Mapping of file ID to the exception raised for it
+
+        Raises:
+            NoFilesFoundError: If no files found matching the query
+            PermissionError: If user doesn't have permission
+            RuntimeError: For other API errors
+        """
+        files = list(self.iter_files(query=query))
+
+        if not files:
+            raise NoFilesFoundError("No files found matching the query")
+
+        return self.export_many(files, output_dir=output_dir, format=format, jobs=jobs)
 
     def search_and_export(
         self,
@@ -164,13 +423,19 @@ class Zenodotos:
         if len(files) > 1:
             raise ValueError(f"Multiple files found ({len(files)} matches)")
 
-        return self.export_file(files[0].id, output_path, format)
+        return self.export_file(files[0].id, output_path, format, file=files[0])
 
-    def search_and_get_file(self, query: str) -> DriveFile:
+    def search_and_get_file(
+        self, query: str, offline: bool = False, use_cache: bool = True
+    ) -> DriveFile:
         """Search for files and get single match (for CLI get-file --query).
 
         Args:
             query: Search query to find files
+            offline: Search the local index instead of calling the API
+                (default: False)
+            use_cache: Let the metadata cache answer and store API responses
+                (default: True)
 
         Returns:
             DriveFile object with file metadata
@@ -179,9 +444,13 @@ class Zenodotos:
             FileNotFoundError: If no files found matching the query
             ValueError: If multiple files found matching the query
             PermissionError: If user doesn't have permission
-            RuntimeError: For other API errors
+            ValidationError: If offline and the query cannot be evaluated locally
+            RuntimeError: For other API errors, or if offline and the index has
+                never been synced
         """
-        files = self.list_files(query=query, page_size=100)
+        files = self.list_files(
+            query=query, page_size=100, offline=offline, use_cache=use_cache
+        )
 
         if not files:
             raise FileNotFoundError("No files found matching the query")
@@ -189,7 +458,176 @@ class Zenodotos:
         if len(files) > 1:
             raise ValueError(f"Multiple files found ({len(files)} matches)")
 
-        return self.get_file(files[0].id)
+        if offline:
+            return files[0]
+        return self.get_file(files[0].id, use_cache=use_cache)
+
+    def walk(
+        self,
+        folder_id: str,
+        fields: Optional[List[str]] = None,
+        jobs: int = DEFAULT_JOBS,
+    ) -> Iterator[DriveFile]:
+        """Iterate over every file and folder below a folder, with its path.
+
+        Subfolders are explored breadth first, with up to ``jobs`` folders
+        listed concurrently. Files are yielded as each folder's listing
+        arrives, so large trees stream instead of being collected first.
+
+        Args:
+            folder_id: ID of the folder to walk
+            fields: List of fields to include for each file. id, name and
+                mimeType are always included
+            jobs: Maximum number of folders listed at the same time (default: 4)
+
+        Yields:
+            DriveFile objects whose ``path`` is the slash-separated path from
+            the walked folder, such as ``"Reports/2024/summary.pdf"``. A folder
+            is yielded before its contents
+
+        Raises:
+            ValueError: If jobs is not positive
+            PermissionError: If authentication fails or insufficient permissions
+            RuntimeError: For other API errors
+        """
+        from .walker import FolderWalker
+
+        return FolderWalker(self._client, fields=fields, jobs=jobs).walk(folder_id)
+
+    def mirror_folder(
+        self,
+        folder_id: str,
+        destination: Union[str, Path],
+        delete: bool = False,
+        jobs: int = DEFAULT_JOBS,
+    ) -> Dict[str, Any]:
+        """Copy a Drive folder tree to a local directory, moving only what changed.
+
+        Binary files are downloaded and Google Workspace documents exported
+        in their default format. A state file in the destination records the
+        checksum, modification time and version of every copy, so later runs
+        skip unchanged files and move renamed ones locally.
+
+        Args:
+            folder_id: ID of the Drive folder to mirror
+            destination: Local directory the folder tree is copied into
+            delete: Delete local copies of files no longer in the folder tree
+                (default: False)
+            jobs: Maximum number of transfers running at the same time (default: 4)
+
+        Returns:
+            Dict containing:
+                - downloaded: Number of binary files downloaded
+                - exported: Number of Google Workspace documents exported
+                - moved: Number of files renamed or moved locally
+                - unchanged: Number of files skipped as unchanged
+                - deleted: Number of local files deleted
+                - unsupported: Number of native files that cannot be exported
+                - failed: Mapping of relative path to the exception that
+                  stopped its transfer
+
+        Raises:
+            ValueError: If the destination mirrors a different folder or jobs
+                is not positive
+            PermissionError: If authentication fails or insufficient permissions
+            RuntimeError: For other API errors while listing the folder tree
+        """
+        from .mirror import FolderMirror
+
+        return FolderMirror(
+            self._client, folder_id, Path(destination), delete=delete, jobs=jobs
+        ).run()
+
+    def get_index(self) -> LocalIndex:
+        """Get the local metadata index stored in the configuration directory.
+
+        Returns:
+            The LocalIndex instance, which may not have been synced yet
+        """
+        if self._index is None:
+            self._index = LocalIndex(Config().config_dir / "index.sqlite3")
+        return self._index
+
+    def sync_index(self, full: bool = False) -> Dict[str, Any]:
+        """Bring the local metadata index up to date with Google Drive.
+
+        The first sync lists every file; later ones apply only the changes
+        made since the previous sync.
+
+        Args:
+            full: Rebuild the index from a complete listing (default: False)
+
+        Returns:
+            Dict containing:
+                - full: Whether a complete listing was done
+                - updated: Number of files added or updated
+                - removed: Number of files removed
+                - api_calls: Number of Drive API requests made
+
+        Raises:
+            PermissionError: If authentication fails or insufficient permissions
+            RuntimeError: For other API errors
+        """
+        return self.get_index().sync(self._client, full=full)
+
+    def search_files(
+        self, text: str, limit: int = 20, include_trashed: bool = False
+    ) -> List[DriveFile]:
+        """Find files by words in their name or description, without API calls.
+
+        Uses the full-text search index kept alongside the local index, so the
+        index must have been synced. Each word matches as a prefix, ignoring
+        case and accents, and name matches rank first.
+
+        Args:
+            text: The words to look for (e.g., "quarterly rep")
+            limit: Maximum number of files to return (default: 20)
+            include_trashed: Also return files in the trash (default: False)
+
+        Returns:
+            List of DriveFile objects, best match first
+
+        Raises:
+            RuntimeError: If the index has never been synced
+        """
+        return self._get_synced_index().search(
+            text, limit=limit, include_trashed=include_trashed
+        )
+
+    def _get_synced_index(self) -> LocalIndex:
+        """Get the local index for offline queries, which must have been synced."""
+        index = self.get_index()
+        if index.last_synced is None:
+            raise RuntimeError(
+                "The local index has not been synced yet. Run: zenodotos index sync"
+            )
+        return index
+
+    def _list_page(
+        self,
+        page_size: int,
+        page_token: Optional[str],
+        query: Optional[str],
+        fields: Optional[List[str]],
+        offline: bool,
+        use_cache: bool = True,
+    ) -> Dict[str, Any]:
+        """List a page of files from the API or, offline, from the local index.
+
+        The index stores every field the CLI displays, so ``fields`` only
+        applies to API requests.
+        """
+        if offline:
+            return self._get_synced_index().list_files(
+                page_size=page_size, page_token=page_token, query=query
+            )
+        return self._client.list_files(
+            page_size=page_size,
+            page_token=page_token,
+            query=query,
+            fields=fields,
+            use_cache=use_cache,
+        )
 
     def get_field_parser(self) -> "FieldParser":
         """Get field parsing utilities (for CLI --fields option).
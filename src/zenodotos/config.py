@@ -7,6 +7,7 @@ from typing import Any, Dict, Optional
 from dataclasses import dataclass, field
 
 from .exceptions import ConfigurationError
+from .timings import phase
 
 
 @dataclass
@@ -21,6 +22,7 @@ class ZenodotosConfig:
     page_size: int = 10
     max_retries: int = 3
     timeout_seconds: int = 30
+    api_endpoint: Optional[str] = None
 
     # Export settings
     default_export_format: str = "auto"
@@ -46,6 +48,7 @@ class ZenodotosConfig:
     # Logging settings
     log_level: str = "INFO"
     log_file: Optional[str] = None
+    metrics_textfile: Optional[str] = None
 
     # Development settings
     debug_mode: bool = False
@@ -66,14 +69,15 @@ class Config:
             Path(config_file) if config_file else self.config_dir / "config.yaml"
         )
 
-        # Initialize with defaults
-        self._config = ZenodotosConfig()
+        with phase("config"):
+            # Initialize with defaults
+            self._config = ZenodotosConfig()
 
-        # Load configuration from various sources (in order of precedence)
-        self._load_configuration()
+            # Load configuration from various sources (in order of precedence)
+            self._load_configuration()
 
-        # Validate configuration
-        self._validate_configuration()
+            # Validate configuration
+            self._validate_configuration()
 
         # Backward compatibility attributes
         self.credentials_file = Path(self.get_credentials_path())
@@ -146,6 +150,7 @@ class Config:
             "ZENODOTOS_PAGE_SIZE": "page_size",
             "ZENODOTOS_MAX_RETRIES": "max_retries",
             "ZENODOTOS_TIMEOUT_SECONDS": "timeout_seconds",
+            "ZENODOTOS_API_ENDPOINT": "api_endpoint",
             "ZENODOTOS_DEFAULT_EXPORT_FORMAT": "default_export_format",
             "ZENODOTOS_EXPORT_DIRECTORY": "export_directory",
             "ZENODOTOS_MAX_DISPLAY_WIDTH": "max_display_width",
@@ -153,6 +158,7 @@ class Config:
             "ZENODOTOS_CACHE_TTL_SECONDS": "cache_ttl_seconds",
             "ZENODOTOS_LOG_LEVEL": "log_level",
             "ZENODOTOS_LOG_FILE": "log_file",
+            "ZENODOTOS_METRICS_TEXTFILE": "metrics_textfile",
             "ZENODOTOS_DEBUG_MODE": "debug_mode",
             "ZENODOTOS_VERBOSE_OUTPUT": "verbose_output",
         }
@@ -272,6 +278,7 @@ class Config:
             "page_size": self._config.page_size,
             "max_retries": self._config.max_retries,
             "timeout_seconds": self._config.timeout_seconds,
+            "api_endpoint": self._config.api_endpoint,
             "default_export_format": self._config.default_export_format,
             "export_directory": self._config.export_directory,
             "default_fields": self._config.default_fields,
@@ -280,6 +287,7 @@ class Config:
             "cache_ttl_seconds": self._config.cache_ttl_seconds,
             "log_level": self._config.log_level,
             "log_file": self._config.log_file,
+            "metrics_textfile": self._config.metrics_textfile,
             "debug_mode": self._config.debug_mode,
             "verbose_output": self._config.verbose_output,
         }
@@ -333,6 +341,7 @@ class Config:
             "page_size": self.get("page_size"),
             "max_retries": self.get("max_retries"),
             "timeout_seconds": self.get("timeout_seconds"),
+            "api_endpoint": self.get("api_endpoint"),
             "default_export_format": self.get("default_export_format"),
             "export_directory": self.get("export_directory"),
             "default_fields": self.get("default_fields"),
@@ -341,6 +350,7 @@ class Config:
             "cache_ttl_seconds": self.get("cache_ttl_seconds"),
             "log_level": self.get("log_level"),
             "log_file": self.get("log_file"),
+            "metrics_textfile": self.get("metrics_textfile"),
             "debug_mode": self.get("debug_mode"),
             "verbose_output": self.get("verbose_output"),
         }
@@ -0,0 +1,570 @@
+"""Asynchronous Google Drive API client.
+
+Requires the optional ``httpx`` dependency (``pip install zenodotos[async]``).
+"""
+
+import asyncio
+import os
+import time
+import uuid
+from pathlib import Path
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple, Union
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover - exercised only without the extra
+    httpx = None
+
+from ..auth import Auth
+from ..exceptions import NetworkError, RateLimitError
+from .formats import ExportFormatsMixin
+from .hooks import RequestEvent, RequestHook
+from .metrics import textfile_exporter
+from .models import (
+    DEFAULT_CHUNK_SIZE,
+    DEFAULT_FIELDS,
+    EXPORT_METADATA_FIELDS,
+    DriveFile,
+)
+from .retry import (
+    RETRYABLE_STATUS_CODES,
+    RetryPolicy,
+    is_rate_limit_status,
+    parse_retry_after,
+)
+
+DRIVE_API_URL = "https://www.googleapis.com/drive/v3"
+
+# Default number of requests allowed in flight at the same time
+DEFAULT_MAX_CONCURRENCY = 64
+
+# Seconds to wait for a connection, a read or a write before giving up
+DEFAULT_TIMEOUT = 60.0
+
+
+class AsyncDriveClient(ExportFormatsMixin):
+    """Google Drive API client for asyncio applications.
+
+    Requests go through a single pooled ``httpx.AsyncClient``. Every request
+    first acquires a shared semaphore, so any number of concurrent callers
+    never have more than ``max_concurrency`` requests in flight. Transient
+    failures are retried with the same backoff as ``DriveClient``, sleeping
+    without holding the semaphore. Requests are reported to hooks like those
+    of ``DriveClient``; a streamed export ends when its body has been saved.
+
+    Example:
+        ```python
+        async with AsyncDriveClient() as client:
+            files = await client.get_files(file_ids)
+        ```
+    """
+
+    def __init__(
+        self,
+        credentials_path: Optional[str] = None,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        transport: Optional["httpx.AsyncBaseTransport"] = None,
+        api_endpoint: Optional[str] = None,
+    ):
+        """Initialize the client.
+
+        Args:
+            credentials_path: Optional path to credentials file.
+            max_concurrency: Maximum number of requests in flight at once.
+            chunk_size: Bytes written per chunk when streaming exports to disk.
+            transport: Optional httpx transport, mainly for testing.
+            api_endpoint: Root URL of a stand-in for the Drive API, such as
+                the fake server in ``zenodotos.drive.fake_server``. Defaults
+                to the ``api_endpoint`` setting. Requests to it are not
+                authorized.
+
+        When the ``metrics_textfile`` setting is set, request metrics are
+        exported to that file in the Prometheus text format.
+
+        Raises:
+            ImportError: If httpx is not installed.
+            ValueError: If max_concurrency is not positive.
+        """
+        if httpx is None:
+            raise ImportError(
+                "AsyncDriveClient requires httpx. "
+                "Install it with: pip install 'zenodotos[async]'"
+            )
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+
+        self.auth = Auth(credentials_path=credentials_path)
+        self.chunk_size = chunk_size
+        self.api_endpoint = api_endpoint or self.auth.config.get("api_endpoint")
+        self.retry_policy = RetryPolicy(
+            max_retries=self.auth.config.get("max_retries", 3)
+        )
+        self.hooks: List[RequestHook] = []
+        metrics_textfile = self.auth.config.get("metrics_textfile")
+        if metrics_textfile:
+            self.add_hook(textfile_exporter(metrics_textfile))
+        # Events of streamed responses, reported once the body has been read
+        self._streaming: Dict["httpx.Response", Tuple[RequestEvent, float]] = {}
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._credentials = None
+        self._credentials_lock = asyncio.Lock()
+        # The semaphore bounds concurrency, so waiting for a pooled
+        # connection must never time out
+        self._http = httpx.AsyncClient(
+            base_url=f"{self.api_endpoint.rstrip('/')}/drive/v3"
+            if self.api_endpoint
+            else DRIVE_API_URL,
+            transport=transport,
+            limits=httpx.Limits(
+                max_connections=max_concurrency,
+                max_keepalive_connections=max_concurrency,
+            ),
+            timeout=httpx.Timeout(DEFAULT_TIMEOUT, pool=None),
+        )
+
+    async def __aenter__(self) -> "AsyncDriveClient":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Close the pooled HTTP connections."""
+        await self._http.aclose()
+
+    def add_hook(self, hook: RequestHook) -> None:
+        """Report every request made from now on to a hook.
+
+        Hooks are called from the event loop's thread, between requests of
+        other tasks, so each event's start and end may interleave with those
+        of concurrent requests.
+
+        Args:
+            hook: The hook, such as a collector from ``zenodotos.drive.metrics``.
+        """
+        self.hooks.append(hook)
+
+    def remove_hook(self, hook: RequestHook) -> None:
+        """Stop reporting requests to a hook.
+
+        Raises:
+            ValueError: If the hook was not added.
+        """
+        self.hooks.remove(hook)
+
+    async def list_files(
+        self,
+        page_size: int = 10,
+        page_token: Optional[str] = None,
+        query: Optional[str] = None,
+        fields: Optional[List[str]] = None,
+    ) -> Dict[str, Any]:
+        """List files in Google Drive.
+
+        Args:
+            page_size: Number of files to return per page.
+            page_token: Token for the next page of results.
+            query: Query string to filter files.
+            fields: List of fields to include in the response.
+
+        Returns:
+            Dict containing:
+                - files: List of DriveFile objects
+                - next_page_token: Token for the next page (if any)
+
+        Raises:
+            PermissionError: If authentication fails or access is denied.
+            RuntimeError: For other API errors.
+        """
+        fields_to_request = fields or DEFAULT_FIELDS
+        params = {
+            "pageSize": page_size,
+            "fields": f"nextPageToken, files({', '.join(fields_to_request)})",
+            "orderBy": "modifiedTime desc",
+        }
+        if page_token:
+            params["pageToken"] = page_token
+        if query:
+            params["q"] = query
+
+        response = await self._send("drive.files.list", "GET", "/files", params=params)
+        if response.status_code == 401:
+            raise PermissionError(
+                "Authentication failed. Please check your credentials."
+            )
+        if response.status_code == 403:
+            raise PermissionError("Insufficient permissions to access Google Drive.")
+        if response.is_error:
+            raise RuntimeError(f"Failed to list files: {_describe(response)}")
+
+        results = response.json()
+        return {
+            "files": [DriveFile.from_api_response(f) for f in results.get("files", [])],
+            "next_page_token": results.get("nextPageToken"),
+        }
+
+    async def iter_files(
+        self,
+        query: Optional[str] = None,
+        fields: Optional[List[str]] = None,
+        page_size: int = 100,
+        limit: Optional[int] = None,
+    ) -> AsyncIterator[DriveFile]:
+        """Iterate over every matching file, fetching pages as they are needed.
+
+        Args:
+            query: Query string to filter files.
+            fields: List of fields to include in the response.
+            page_size: Number of files to request per page.
+            limit: Maximum number of files to yield.
+
+        Yields:
+            DriveFile objects in the order returned by the API.
+
+        Raises:
+            ValueError: If page_size is not positive or limit is negative.
+            PermissionError: If authentication fails or access is denied.
+            RuntimeError: For other API errors.
+        """
+        if page_size < 1:
+            raise ValueError("page_size must be at least 1")
+        if limit is not None and limit < 0:
+            raise ValueError("limit must not be negative")
+
+        remaining = limit
+        page_token = None
+        while remaining is None or remaining > 0:
+            size = page_size if remaining is None else min(page_size, remaining)
+            result = await self.list_files(
+                page_size=size, page_token=page_token, query=query, fields=fields
+            )
+            files = result["files"]
+            if remaining is not None:
+                files = files[:remaining]
+                remaining -= len(files)
+            for file in files:
+                yield file
+
+            page_token = result["next_page_token"]
+            if not page_token:
+                return
+
+    async def get_file(
+        self, file_id: str, fields: Optional[List[str]] = None
+    ) -> DriveFile:
+        """Get a specific file by ID.
+
+        Args:
+            file_id: The ID of the file to retrieve.
+            fields: List of fields to include in the response.
+
+        Returns:
+            DriveFile object representing the requested file.
+
+        Raises:
+            FileNotFoundError: If the file doesn't exist.
+            PermissionError: If the user doesn't have permission to access the file.
+            RateLimitError: If the request is still rate limited after all retries.
+            RuntimeError: For other API errors.
+        """
+        response = await self._send(
+            "drive.files.get",
+            "GET",
+            f"/files/{file_id}",
+            params={"fields": ",".join(fields or DEFAULT_FIELDS)},
+        )
+        if response.status_code == 404:
+            raise FileNotFoundError(f"File with ID {file_id} not found.")
+        if response.status_code in (401, 403):
+            raise PermissionError("Insufficient permissions to access the file.")
+        if response.is_error:
+            raise RuntimeError(f"Failed to get file: {_describe(response)}")
+        return DriveFile.from_api_response(response.json())
+
+    async def get_files(
+        self, file_ids: List[str], fields: Optional[List[str]] = None
+    ) -> List[Union[DriveFile, Exception]]:
+        """Get several files by ID concurrently.
+
+        Every lookup runs as its own request, bounded by the client's
+        semaphore.
+
+        Args:
+            file_ids: The IDs of the files to retrieve.
+            fields: List of fields to include for each file.
+
+        Returns:
+            A list with one entry per requested ID, in input order. Each entry
+            is either a DriveFile or the exception raised for that ID.
+        """
+        return await asyncio.gather(
+            *(self.get_file(file_id, fields) for file_id in file_ids),
+            return_exceptions=True,
+        )
+
+    async def export(
+        self,
+        file_id: str,
+        output_path: Optional[str] = None,
+        format: Optional[str] = None,
+        file: Optional[DriveFile] = None,
+    ) -> str:
+        """Export a file from Google Drive, streaming it to disk.
+
+        The file's metadata is fetched only when ``file`` is not given and
+        either ``output_path`` or ``format`` is missing.
+
+        Args:
+            file_id: The ID of the file to export.
+            output_path: Optional path where to save the file. If not provided,
+                         saves to current directory with the document name.
+            format: Optional export format. If not provided, uses smart defaults
+                   based on file type.
+            file: Optional DriveFile already retrieved for ``file_id``.
+
+        Returns:
+            String path where the file was saved.
+
+        Raises:
+            FileNotFoundError: If the file doesn't exist.
+            PermissionError: If the user doesn't have permission to export the file.
+            ValueError: If the specified format is not supported.
+            RuntimeError: For other API errors.
+        """
+        if format:
+            self._validate_format(format)
+
+        if file is None and (format is None or output_path is None):
+            file = await self.get_file(
+                file_id, fields=EXPORT_METADATA_FIELDS.split(",")
+            )
+
+        if not format:
+            format = self._get_default_format_for_mime_type(file.mime_type)
+
+        if output_path is None:
+            output_path = f"{file.name}.{self._get_file_extension_for_format(format)}"
+
+        output_file = Path(output_path)
+        response = await self._send(
+            "drive.files.export",
+            "GET",
+            f"/files/{file_id}/export",
+            params={"mimeType": self._get_mime_type_for_format(format)},
+            stream=True,
+        )
+        try:
+            if response.status_code == 404:
+                raise FileNotFoundError(f"File with ID {file_id} not found.")
+            if response.status_code in (401, 403):
+                raise PermissionError("Insufficient permissions to export the file.")
+            if response.is_error:
+                raise RuntimeError(f"Failed to export file: {_describe(response)}")
+            await self._download_to_file(response, output_file)
+        except BaseException as error:
+            await self._close(response, error)
+            raise
+        await self._close(response)
+
+        return str(output_file)
+
+    async def _download_to_file(
+        self, response: "httpx.Response", output_file: Path
+    ) -> None:
+        """Stream a response body to disk through a temporary file.
+
+        Args:
+            response: The streamed response to read.
+            output_file: Where the downloaded content should end up.
+        """
+        temp_file = output_file.with_name(
+            f".{output_file.name}.{uuid.uuid4().hex[:8]}.part"
+        )
+        try:
+            with open(temp_file, "wb") as fh:
+                async for chunk in response.aiter_bytes(self.chunk_size):
+                    fh.write(chunk)
+            os.replace(temp_file, output_file)
+        except BaseException:
+            temp_file.unlink(missing_ok=True)
+            raise
+
+    async def _send(
+        self, api_method: str, method: str, url: str, stream: bool = False, **kwargs
+    ) -> "httpx.Response":
+        """Send an authorized request, retrying transient failures.
+
+        The request is reported to the hooks. When a successful response is
+        streamed, its request ends when the caller closes it with ``_close``.
+
+        Args:
+            api_method: The API method, as reported in the request's event.
+            method: The HTTP method.
+            url: The URL, relative to the Drive API root.
+            stream: Whether to leave the body of a successful response unread.
+                The caller must then close the response.
+            **kwargs: Passed to ``httpx.AsyncClient.build_request``.
+
+        Returns:
+            The final response, which may be an error response that is not
+            worth retrying.
+
+        Raises:
+            RateLimitError: If the request is still rate limited after all
+                retries.
+            NetworkError: If the network is still failing after all retries.
+        """
+        if not self.hooks:
+            return await self._send_with_retries(None, method, url, stream, **kwargs)
+
+        event = RequestEvent(method=api_method, start_time=time.time())
+        for hook in self.hooks:
+            hook.request_started(event)
+        started = time.perf_counter()
+        try:
+            response = await self._send_with_retries(
+                event, method, url, stream, **kwargs
+            )
+        except BaseException as error:
+            event.error = error
+            self._finish(event, started)
+            raise
+        if stream and not response.is_error:
+            self._streaming[response] = (event, started)
+        else:
+            self._finish(event, started)
+        return response
+
+    async def _close(
+        self, response: "httpx.Response", error: Optional[BaseException] = None
+    ) -> None:
+        """Close a streamed response, ending its request.
+
+        Args:
+            response: A response returned by ``_send`` with ``stream=True``.
+            error: The exception that stopped the body from being read, if any.
+        """
+        try:
+            await response.aclose()
+        finally:
+            pending = self._streaming.pop(response, None)
+            if pending is not None:
+                event, started = pending
+                event.bytes_received += response.num_bytes_downloaded
+                event.error = error
+                self._finish(event, started)
+
+    def _finish(self, event: RequestEvent, started: float) -> None:
+        """Report the end of a request to the hooks."""
+        event.latency = time.perf_counter() - started
+        for hook in self.hooks:
+            hook.request_finished(event)
+
+    async def _send_with_retries(
+        self,
+        event: Optional[RequestEvent],
+        method: str,
+        url: str,
+        stream: bool,
+        **kwargs,
+    ) -> "httpx.Response":
+        """Send a request until it succeeds or is not worth retrying.
+
+        Args:
+            event: The request's event, recording each response's status and
+                size and the number of retries, or None.
+            method: The HTTP method.
+            url: The URL, relative to the Drive API root.
+            stream: Whether to leave the body of a successful response unread.
+            **kwargs: Passed to ``httpx.AsyncClient.build_request``.
+
+        Returns:
+            The final response.
+        """
+        attempt = 0
+        while True:
+            try:
+                async with self._semaphore:
+                    headers: Dict[str, str] = {}
+                    await self._authorize(headers)
+                    request = self._http.build_request(
+                        method, url, headers=headers, **kwargs
+                    )
+                    response = await self._http.send(request, stream=stream)
+                    if stream and response.is_error:
+                        await response.aread()
+            except httpx.TransportError as error:
+                if attempt >= self.retry_policy.max_retries:
+                    raise NetworkError(
+                        f"Network error after {attempt} retries: {error}",
+                        original_error=error,
+                    ) from error
+                delay = None
+            else:
+                if event is not None:
+                    event.status = response.status_code
+                    # A streamed body is counted once the caller has read it
+                    if not stream or response.is_error:
+                        event.bytes_received += response.num_bytes_downloaded
+                rate_limited = is_rate_limit_status(
+                    response.status_code, _error_reasons(response)
+                )
+                if not (rate_limited or response.status_code in RETRYABLE_STATUS_CODES):
+                    return response
+                if attempt >= self.retry_policy.max_retries:
+                    if rate_limited:
+                        raise RateLimitError(
+                            "Google Drive API rate limit exceeded "
+                            f"after {attempt} retries."
+                        )
+                    return response
+                await response.aclose()
+                delay = parse_retry_after(response.headers.get("retry-after"))
+
+            await asyncio.sleep(self.retry_policy.retry_delay(attempt, delay))
+            attempt += 1
+            if event is not None:
+                event.retries = attempt
+
+    async def _authorize(self, headers: Dict[str, str]) -> None:
+        """Add the authorization header, loading or refreshing credentials.
+
+        Loading and refreshing block on file and network access, so they run
+        in a worker thread, once for all concurrent requests.
+        """
+        if self.api_endpoint:
+            return
+        if self._credentials is None or not self._credentials.valid:
+            async with self._credentials_lock:
+                if self._credentials is None:
+                    self._credentials = await asyncio.to_thread(
+                        self.auth.get_credentials
+                    )
+                elif not self._credentials.valid:
+                    from google.auth.transport.requests import Request
+
+                    await asyncio.to_thread(self._credentials.refresh, Request())
+        self._credentials.apply(headers)
+
+
+def _error_reasons(response: "httpx.Response") -> List[str]:
+    """Get the ``reason`` values of the errors in an error response body."""
+    if not response.is_error:
+        return []
+    try:
+        errors = response.json()["error"]["errors"]
+    except (ValueError, KeyError, TypeError):
+        return []
+    if not isinstance(errors, list):
+        return []
+    return [e.get("reason") for e in errors if isinstance(e, dict)]
+
+
+def _describe(response: "httpx.Response") -> str:
+    """Describe an error response for an exception message."""
+    try:
+        message = response.json()["error"]["message"]
+    except (ValueError, KeyError, TypeError):
+        message = response.text
+    return f"{response.status_code} {message}".strip()
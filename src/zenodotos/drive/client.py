@@ -1,43 +1,181 @@
 """Google Drive API client implementation."""
 
-from typing import List, Optional, Dict, Any
+import copy
+import hashlib
+import logging
+import os
+import re
+import sqlite3
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, List, Optional, Dict, Any, Set, TypeVar, Union
 from pathlib import Path
 
-from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
+from googleapiclient.http import MediaIoBaseDownload
 
 from ..auth import Auth
-from .models import DriveFile
-
-
-class DriveClient:
+from ..cache import MetadataCache
+from ..utils import DEFAULT_JOBS, sanitize_filename
+from ..exceptions import ChecksumMismatchError, RateLimitError
+from ..timings import get_timings, phase
+from .discovery import build_service
+from .formats import EXPORTABLE_MIME_TYPES, ExportFormatsMixin
+from .hooks import RequestEvent, RequestHook, set_active_event
+from .metrics import TimingsHook, textfile_exporter
+from .models import (
+    DEFAULT_CHUNK_SIZE,
+    DEFAULT_FIELDS,
+    EXPORT_METADATA_FIELDS,
+    DriveFile,
+)
+from .transport import build_metered_http
+from .retry import RetryPolicy, is_rate_limit_error, is_retryable_error
+
+T = TypeVar("T")
+
+logger = logging.getLogger(__name__)
+
+# Maximum number of calls the Drive API accepts in a single batch request
+BATCH_SIZE_LIMIT = 100
+
+# Metadata fetched once per download for output naming and verification
+DOWNLOAD_METADATA_FIELDS = "name,mimeType,size,md5Checksum"
+
+# Request headers not carried over to ranged media requests; compressed
+# responses would not line up with the requested byte ranges
+MEDIA_EXCLUDED_HEADERS = frozenset({"accept", "accept-encoding", "user-agent"})
+
+
+class DriveClient(ExportFormatsMixin):
     """Google Drive API client."""
 
-    def __init__(self, credentials_path: Optional[str] = None):
+    def __init__(
+        self,
+        credentials_path: Optional[str] = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        api_endpoint: Optional[str] = None,
+    ):
+        """Initialize the client.
+
+        Args:
+            credentials_path: Optional path to credentials file.
+            chunk_size: Bytes requested per chunk when streaming exports and
+                downloads to disk.
+            api_endpoint: Root URL of a stand-in for the Drive API, such as
+                the fake server in ``zenodotos.drive.fake_server``. Defaults
+                to the ``api_endpoint`` setting. Requests to it are not
+                authorized and the metadata cache is not used.
+
+        When the ``metrics_textfile`` setting is set, request metrics are
+        exported to that file in the Prometheus text format. While timings
+        are recorded, requests are timed as phases named after their method.
+        """
         self.auth = Auth(credentials_path=credentials_path)
         self.service = None
+        self.chunk_size = chunk_size
+        self.api_endpoint = api_endpoint or self.auth.config.get("api_endpoint")
+        self.retry_policy = RetryPolicy(
+            max_retries=self.auth.config.get("max_retries", 3)
+        )
+        self.hooks: List[RequestHook] = []
+        metrics_textfile = self.auth.config.get("metrics_textfile")
+        if metrics_textfile:
+            self.add_hook(textfile_exporter(metrics_textfile))
+        timings = get_timings()
+        if timings:
+            self.add_hook(TimingsHook(timings))
+        self.cache: Optional[MetadataCache] = None
+        # Where the prepared discovery document is saved for later processes
+        self.discovery_cache_dir: Optional[Path] = None
+        if self.auth.config.get("enable_cache", True):
+            self.discovery_cache_dir = self.auth.config.config_dir
+            if not self.api_endpoint:
+                self.cache = MetadataCache(
+                    self.auth.config.config_dir / "cache.sqlite3",
+                    ttl_seconds=self.auth.config.get("cache_ttl_seconds", 3600),
+                )
 
     def get_service(self):
-        """Get or create the Drive API service."""
+        """Get or create the Drive API service.
+
+        The service is built from the packaged discovery document, which is
+        parsed once per process, so no network access is needed. Unless the
+        cache is disabled, the prepared document is saved next to the metadata
+        cache so later processes skip preparing it.
+        """
         if not self.service:
-            credentials = self.auth.get_credentials()
-            self.service = build("drive", "v3", credentials=credentials)
+            # The metered transport reports response sizes and statuses to hooks
+            if self.api_endpoint:
+                with phase("service build"):
+                    self.service = build_service(
+                        None,
+                        root_url=self.api_endpoint,
+                        http=build_metered_http(),
+                        cache_dir=self.discovery_cache_dir,
+                    )
+            else:
+                credentials = self.auth.get_credentials()
+                with phase("service build"):
+                    self.service = build_service(
+                        credentials,
+                        http=build_metered_http(),
+                        cache_dir=self.discovery_cache_dir,
+                    )
         return self.service
 
+    def clone(self) -> "DriveClient":
+        """Return a client sharing this client's credentials with its own service.
+
+        The httplib2 transport behind a Drive service object is not thread-safe,
+        so every worker thread must use its own client.
+        """
+        clone = copy.copy(self)
+        clone.service = None
+        return clone
+
+    def add_hook(self, hook: RequestHook) -> None:
+        """Report every request made from now on to a hook.
+
+        Hooks are shared with clones, including those made before the hook
+        was added, so the requests of worker threads are reported too.
+
+        Args:
+            hook: The hook, such as a collector from ``zenodotos.drive.metrics``.
+        """
+        self.hooks.append(hook)
+
+    def remove_hook(self, hook: RequestHook) -> None:
+        """Stop reporting requests to a hook.
+
+        Raises:
+            ValueError: If the hook was not added.
+        """
+        self.hooks.remove(hook)
+
     def list_files(
         self,
         page_size: int = 10,
         page_token: Optional[str] = None,
         query: Optional[str] = None,
         fields: Optional[List[str]] = None,
+        use_cache: bool = True,
     ) -> Dict[str, Any]:
         """List files in Google Drive.
 
+        Pages are served from the metadata cache when caching is enabled and
+        the same query, page and fields were listed within the cache TTL. If
+        the cache cannot be read or written, the error is logged and the API
+        is used instead.
+
         Args:
             page_size: Number of files to return per page.
             page_token: Token for the next page of results.
             query: Query string to filter files.
             fields: List of fields to include in the response.
+            use_cache: Whether the metadata cache may serve and store the page.
 
         Returns:
             Dict containing:
@@ -48,34 +186,37 @@ class DriveClient:
             service = self.get_service()
 
             # Build the fields string
-            default_fields = [
-                "id",
-                "name",
-                "mimeType",
-                "size",
-                "createdTime",
-                "modifiedTime",
-                "description",
-                "owners",
-                "webViewLink",
-            ]
-            fields_to_request = fields or default_fields
+            fields_to_request = fields or DEFAULT_FIELDS
             fields_str = f"nextPageToken, files({', '.join(fields_to_request)})"
 
-            # Build the request
-            request = service.files().list(
-                pageSize=page_size,
-                pageToken=page_token,
-                q=query,
-                fields=fields_str,
-                orderBy="modifiedTime desc",
-            )
+            results = None
+            if use_cache:
+                results = self._cache_call(
+                    "get_listing", query, page_size, page_token, fields_str
+                )
 
-            # Execute the request
-            results = request.execute()
+            if results is None:
+                # Build the request
+                request = service.files().list(
+                    pageSize=page_size,
+                    pageToken=page_token,
+                    q=query,
+                    fields=fields_str,
+                    orderBy="modifiedTime desc",
+                )
+
+                # Execute the request
+                results = self._execute(request)
+                if use_cache:
+                    self._cache_call(
+                        "put_listing", query, page_size, page_token, fields_str, results
+                    )
 
             # Convert API response to DriveFile objects
-            files = [DriveFile.from_api_response(f) for f in results.get("files", [])]
+            with phase("parse"):
+                files = [
+                    DriveFile.from_api_response(f) for f in results.get("files", [])
+                ]
 
             return {
                 "files": files,
@@ -93,11 +234,106 @@ class DriveClient:
                 ) from error
             raise RuntimeError(f"Failed to list files: {error}") from error
 
-    def get_file(self, file_id: str) -> DriveFile:
+    def get_start_page_token(self) -> str:
+        """Get the token marking the current point in the drive's change log.
+
+        Returns:
+            The page token to pass to ``list_changes`` to get every change made
+            from now on.
+
+        Raises:
+            PermissionError: If the user doesn't have permission.
+            RuntimeError: For other API errors.
+        """
+        try:
+            service = self.get_service()
+            response = self._execute(service.changes().getStartPageToken())
+            return response["startPageToken"]
+        except HttpError as error:
+            if error.resp.status in (401, 403):
+                raise PermissionError(
+                    "Insufficient permissions to access Google Drive."
+                ) from error
+            raise RuntimeError(f"Failed to get start page token: {error}") from error
+
+    def list_changes(
+        self,
+        page_token: str,
+        page_size: int = 1000,
+        fields: Optional[List[str]] = None,
+    ) -> Dict[str, Any]:
+        """List a page of changes made to files since a change log token.
+
+        Args:
+            page_token: Token from ``get_start_page_token`` or from a previous
+                page of changes.
+            page_size: Maximum number of changes to return.
+            fields: List of file fields to include for changed files.
+
+        Returns:
+            Dict containing:
+                - changes: List of dicts with ``file_id``, ``removed`` (True
+                  when the file was deleted or is no longer accessible) and
+                  ``file`` (a DriveFile, or None when removed)
+                - next_page_token: Token for the next page of changes (if any)
+                - new_start_page_token: Token to use for future changes, only
+                  present on the last page
+
+        Raises:
+            PermissionError: If the user doesn't have permission.
+            RuntimeError: For other API errors.
+        """
+        fields_str = (
+            "nextPageToken, newStartPageToken, "
+            f"changes(fileId, removed, file({', '.join(fields or DEFAULT_FIELDS)}))"
+        )
+        try:
+            service = self.get_service()
+            response = self._execute(
+                service.changes().list(
+                    pageToken=page_token,
+                    pageSize=page_size,
+                    includeRemoved=True,
+                    spaces="drive",
+                    fields=fields_str,
+                )
+            )
+        except HttpError as error:
+            if error.resp.status in (401, 403):
+                raise PermissionError(
+                    "Insufficient permissions to access Google Drive."
+                ) from error
+            raise RuntimeError(f"Failed to list changes: {error}") from error
+
+        changes = []
+        for change in response.get("changes", []):
+            # Shared drive changes carry no file ID and are not file changes
+            if not change.get("fileId"):
+                continue
+            file_data = change.get("file")
+            removed = bool(change.get("removed")) or file_data is None
+            changes.append(
+                {
+                    "file_id": change.get("fileId"),
+                    "removed": removed,
+                    "file": None if removed else DriveFile.from_api_response(file_data),
+                }
+            )
+        return {
+            "changes": changes,
+            "next_page_token": response.get("nextPageToken"),
+            "new_start_page_token": response.get("newStartPageToken"),
+        }
+
+    def get_file(self, file_id: str, use_cache: bool = True) -> DriveFile:
         """Get a specific file by ID.
 
+        The file is served from the metadata cache when caching is enabled and
+        it was retrieved within the cache TTL.
+
         Args:
             file_id: The ID of the file to retrieve.
+            use_cache: Whether the metadata cache may serve and store the file.
 
         Returns:
             DriveFile object representing the requested file.
@@ -107,43 +343,236 @@ class DriveClient:
             PermissionError: If the user doesn't have permission to access the file.
             RuntimeError: For other API errors.
         """
+        fields_str = ",".join(DEFAULT_FIELDS)
+        if use_cache:
+            cached = self._cache_call("get_file", file_id, fields_str)
+            if cached is not None:
+                return DriveFile.from_api_response(cached)
+
         try:
             service = self.get_service()
-            file = (
-                service.files()
-                .get(
+            file = self._execute(
+                service.files().get(
                     fileId=file_id,
-                    fields="id,name,mimeType,size,createdTime,modifiedTime,description,owners,webViewLink",
+                    fields=fields_str,
                 )
-                .execute()
             )
-            return DriveFile.from_api_response(file)
+            if use_cache:
+                self._cache_call("put_file", file_id, fields_str, file)
+            with phase("parse"):
+                return DriveFile.from_api_response(file)
 
         except HttpError as error:
-            if error.resp.status == 404:
-                raise FileNotFoundError(f"File with ID {file_id} not found.") from error
+            raise self._get_file_error(file_id, error) from error
+
+    def get_files(
+        self,
+        file_ids: List[str],
+        fields: Optional[List[str]] = None,
+        use_cache: bool = True,
+    ) -> List[Union[DriveFile, Exception]]:
+        """Get several files by ID using Drive batch requests.
+
+        Lookups are packed into batches of up to ``BATCH_SIZE_LIMIT`` calls,
+        so fetching hundreds of files costs a handful of HTTP round trips.
+        Lookups that are rate limited or hit a server error inside a batch are
+        retried in a follow-up batch, following the client's retry policy.
+        Files found in the metadata cache are not requested at all.
+
+        Args:
+            file_ids: The IDs of the files to retrieve.
+            fields: List of fields to include for each file.
+            use_cache: Whether the metadata cache may serve and store the files.
+
+        Returns:
+            A list with one entry per requested ID, in input order. Each entry
+            is either a DriveFile or the exception describing why that ID
+            could not be retrieved (FileNotFoundError, PermissionError,
+            RateLimitError or RuntimeError), so one bad ID does not fail the
+            whole lookup.
+
+        Raises:
+            PermissionError: If the batch request itself is rejected.
+            RuntimeError: For other errors affecting the whole batch.
+        """
+        fields_str = ",".join(fields or DEFAULT_FIELDS)
+        results: List[Union[DriveFile, Exception, None]] = [None] * len(file_ids)
+        pending = []
+        for index, file_id in enumerate(file_ids):
+            cached = (
+                self._cache_call("get_file", file_id, fields_str) if use_cache else None
+            )
+            if cached is not None:
+                results[index] = DriveFile.from_api_response(cached)
+            else:
+                pending.append(index)
+        retries: List[int] = []
+        attempt = 0
+
+        def callback(request_id, response, exception):
+            index = int(request_id)
+            if exception is not None:
+                if isinstance(exception, HttpError):
+                    if (
+                        is_retryable_error(exception)
+                        and attempt < self.retry_policy.max_retries
+                    ):
+                        retries.append(index)
+                        return
+                    exception = self._get_file_error(file_ids[index], exception)
+                results[index] = exception
+            else:
+                if use_cache:
+                    self._cache_call("put_file", file_ids[index], fields_str, response)
+                with phase("parse"):
+                    results[index] = DriveFile.from_api_response(response)
+
+        try:
+            service = self.get_service()
+            # Each call to files() builds the resource and its methods anew
+            files = service.files()
+            while pending:
+                for start in range(0, len(pending), BATCH_SIZE_LIMIT):
+                    batch = service.new_batch_http_request(callback=callback)
+                    for index in pending[start : start + BATCH_SIZE_LIMIT]:
+                        batch.add(
+                            files.get(fileId=file_ids[index], fields=fields_str),
+                            request_id=str(index),
+                        )
+                    self._call("batch", batch.execute)
+
+                if not retries:
+                    break
+                time.sleep(self.retry_policy.backoff_delay(attempt))
+                pending, retries = sorted(retries), []
+                attempt += 1
+        except HttpError as error:
             if error.resp.status in (401, 403):
                 raise PermissionError(
-                    "Insufficient permissions to access the file."
+                    "Insufficient permissions to access Google Drive."
                 ) from error
-            raise RuntimeError(f"Failed to get file: {error}") from error
+            raise RuntimeError(f"Failed to get files: {error}") from error
+
+        return results
+
+    def _cache_call(self, method: str, *args) -> Any:
+        """Read from or write to the metadata cache, if enabled and working.
+
+        A cache that cannot be opened, read or written, such as one in a
+        read-only directory or a corrupt database, must not fail the request
+        it was meant to speed up: the error is logged and the cache is
+        disabled for this client and its clones made from now on.
+
+        Args:
+            method: Name of the ``MetadataCache`` method to call.
+            *args: Arguments of the method.
+
+        Returns:
+            What the method returned, or None if the cache is disabled or
+            failed.
+        """
+        cache = self.cache
+        if cache is None:
+            return None
+        try:
+            return getattr(cache, method)(*args)
+        except (sqlite3.Error, OSError) as error:
+            logger.warning("Metadata cache at %s disabled: %s", cache.path, error)
+            self.cache = None
+            return None
+
+    def _get_file_error(self, file_id: str, error: HttpError) -> Exception:
+        """Map an HttpError raised while getting a file to a library exception.
+
+        Args:
+            file_id: The ID of the file that was requested.
+            error: The error returned by the API.
+
+        Returns:
+            The exception to raise or report for the file.
+        """
+        if is_rate_limit_error(error):
+            return RateLimitError(
+                f"Rate limit exceeded while getting file {file_id}.",
+                original_error=error,
+            )
+        if error.resp.status == 404:
+            return FileNotFoundError(f"File with ID {file_id} not found.")
+        if error.resp.status in (401, 403):
+            return PermissionError("Insufficient permissions to access the file.")
+        return RuntimeError(f"Failed to get file: {error}")
+
+    def _execute(self, request) -> Any:
+        """Execute an API request, retrying transient failures.
+
+        Args:
+            request: The HttpRequest to execute.
+
+        Returns:
+            The deserialized API response.
+        """
+        return self._call(request.methodId, request.execute)
+
+    def _call(self, method: str, func: Callable[[], T]) -> T:
+        """Make a request through the retry policy, reporting it to the hooks.
+
+        Args:
+            method: The API method, as reported in the request's event.
+            func: The function sending the request.
+
+        Returns:
+            Whatever the function returns.
+        """
+        if not self.hooks:
+            return self.retry_policy.call(func)
+
+        event = RequestEvent(method=method, start_time=time.time())
+        for hook in self.hooks:
+            hook.request_started(event)
+        attempts = 0
+
+        def attempt() -> T:
+            nonlocal attempts
+            attempts += 1
+            return func()
+
+        previous = set_active_event(event)
+        started = time.perf_counter()
+        try:
+            return self.retry_policy.call(attempt)
+        except BaseException as error:
+            event.error = error
+            raise
+        finally:
+            event.latency = time.perf_counter() - started
+            event.retries = max(attempts - 1, 0)
+            set_active_event(previous)
+            for hook in self.hooks:
+                hook.request_finished(event)
 
     def export(
         self,
         file_id: str,
         output_path: Optional[str] = None,
         format: Optional[str] = None,
+        file: Optional[DriveFile] = None,
     ) -> str:
         """Export a file from Google Drive.
 
         Currently supports Google Docs export to HTML format (ZIP file).
 
+        The file's metadata is fetched at most once and reused for both format
+        detection and output naming. It is not fetched at all when ``file`` is
+        given, or when both ``output_path`` and ``format`` are.
+
         Args:
             file_id: The ID of the file to export.
             output_path: Optional path where to save the file. If not provided,
                          saves to current directory with the document name.
             format: Optional export format. If not provided, uses smart defaults
                    based on file type.
+            file: Optional DriveFile already retrieved for ``file_id``, providing
+                  its name and MIME type.
 
         Returns:
             String path where the file was saved.
@@ -160,30 +589,36 @@ class DriveClient:
             # Validate format if provided
             if format:
                 self._validate_format(format)
-            else:
+
+            # Fetch metadata in a single call, only when something needs it
+            if file is None and (format is None or output_path is None):
+                file = DriveFile.from_api_response(
+                    self._execute(
+                        service.files().get(
+                            fileId=file_id, fields=EXPORT_METADATA_FIELDS
+                        )
+                    )
+                )
+
+            if not format:
                 # Use smart default based on file type
-                format = self._get_smart_default_format(file_id)
+                format = self._get_default_format_for_mime_type(file.mime_type)
 
             # Get MIME type for the format
             mime_type = self._get_mime_type_for_format(format)
 
-            # If no output path provided, get the file name and use current directory
+            # If no output path provided, use the file name in current directory
             if output_path is None:
-                file_metadata = (
-                    service.files().get(fileId=file_id, fields="name").execute()
-                )
-                file_name = file_metadata["name"]
                 output_path = (
-                    f"{file_name}.{self._get_file_extension_for_format(format)}"
+                    f"{file.name}.{self._get_file_extension_for_format(format)}"
                 )
 
-            # Export the document
-            export_request = service.files().export(fileId=file_id, mimeType=mime_type)
-            export_content = export_request.execute()
-
-            # Save the content to file
+            # Stream the exported document to disk chunk by chunk
+            export_request = service.files().export_media(
+                fileId=file_id, mimeType=mime_type
+            )
             output_file = Path(output_path)
-            output_file.write_bytes(export_content)
+            self._download_to_file(export_request, output_file)
 
             return str(output_file)
 
@@ -196,103 +631,323 @@ class DriveClient:
                 ) from error
             raise RuntimeError(f"Failed to export file: {error}") from error
 
-    def _validate_format(self, format: str) -> None:
-        """Validate that the specified format is supported.
+    def download(
+        self,
+        file_id: str,
+        output_path: Optional[str] = None,
+        file: Optional[DriveFile] = None,
+    ) -> str:
+        """Download the content of a file stored in Google Drive.
+
+        This is for binary files such as PDFs or images. Google Workspace
+        documents have no content of their own and must be exported instead.
+
+        Content is fetched in ``chunk_size`` byte ranges. If a download is
+        interrupted, the bytes received so far are kept next to the output
+        path, and downloading the same file again resumes where it stopped.
+        The MD5 of the complete content is checked against the file's
+        ``md5Checksum`` before it is moved into place.
 
         Args:
-            format: The format to validate.
+            file_id: The ID of the file to download.
+            output_path: Optional path where to save the file. If not provided,
+                         saves to current directory with the file name.
+            file: Optional DriveFile already retrieved for ``file_id``,
+                  providing its MIME type and checksum.
+
+        Returns:
+            String path where the file was saved.
 
         Raises:
-            ValueError: If the format is not supported.
+            FileNotFoundError: If the file doesn't exist.
+            PermissionError: If the user doesn't have permission to download the file.
+            ValueError: If the file is a Google Workspace document.
+            ChecksumMismatchError: If the downloaded content does not match
+                the file's checksum.
+            RuntimeError: For other API errors.
         """
-        supported_formats = [
-            "html",
-            "pdf",
-            "xlsx",
-            "csv",
-            "md",
-            "rtf",
-            "txt",
-            "odt",
-            "ods",
-            "epub",
-        ]
-        if format not in supported_formats:
-            raise ValueError(f"Unsupported format: {format}")
-
-    def _get_smart_default_format(self, file_id: str) -> str:
-        """Get the smart default format based on file type.
+        try:
+            service = self.get_service()
+
+            if file is None:
+                file = DriveFile.from_api_response(
+                    self._execute(
+                        service.files().get(
+                            fileId=file_id, fields=DOWNLOAD_METADATA_FIELDS
+                        )
+                    )
+                )
+
+            if file.mime_type and file.mime_type.startswith(
+                "application/vnd.google-apps."
+            ):
+                raise ValueError(
+                    f"{file.name} is a Google Workspace document; export it instead."
+                )
+
+            if output_path is None:
+                output_path = sanitize_filename(file.name)
+
+            output_file = Path(output_path)
+            request = service.files().get_media(fileId=file_id)
+            if file.md5_checksum:
+                self._download_resumable(request, output_file, file.md5_checksum)
+            else:
+                # Without a checksum a partial file cannot be matched to the
+                # current content, so start from scratch every time
+                self._download_to_file(request, output_file)
+            return str(output_file)
+
+        except HttpError as error:
+            if error.resp.status == 404:
+                raise FileNotFoundError(f"File with ID {file_id} not found.") from error
+            if error.resp.status in (401, 403):
+                raise PermissionError(
+                    "Insufficient permissions to download the file."
+                ) from error
+            raise RuntimeError(f"Failed to download file: {error}") from error
+
+    def export_many(
+        self,
+        files: List[DriveFile],
+        output_dir: Optional[str] = None,
+        format: Optional[str] = None,
+        jobs: int = DEFAULT_JOBS,
+    ) -> Dict[str, Any]:
+        """Export several files concurrently through a bounded worker pool.
+
+        Each worker thread uses its own Drive service object. Output names are
+        derived from the document names and made unique within the run, so two
+        documents called "Report" end up as "Report.pdf" and "Report (2).pdf".
+
+        Only Google Workspace documents can be exported. Other files, such as
+        PDFs or images, are reported as failed with a ``ValueError`` without
+        any request being made; use ``download`` for them.
 
         Args:
-            file_id: The ID of the file to check.
+            files: The files to export.
+            output_dir: Directory where the files are saved. Defaults to the
+                        current directory.
+            format: Optional export format applied to every file. If not
+                    provided, uses smart defaults based on each file's type.
+            jobs: Maximum number of exports running at the same time.
 
         Returns:
-            The default format for the file type.
+            Dict containing:
+                - exported: Mapping of file ID to the path it was saved to
+                - failed: Mapping of file ID to the exception that stopped it
+
+        Raises:
+            ValueError: If the format is not supported or jobs is not positive.
         """
-        service = self.get_service()
-        file_metadata = service.files().get(fileId=file_id, fields="mimeType").execute()
-        mime_type = file_metadata["mimeType"]
-
-        # Smart defaults based on MIME type
-        format_mapping = {
-            "application/vnd.google-apps.document": "html",
-            "application/vnd.google-apps.spreadsheet": "xlsx",
-            "application/vnd.google-apps.presentation": "pdf",
-            "application/vnd.google-apps.drawing": "png",
-            "application/vnd.google-apps.form": "zip",
-        }
+        if format:
+            self._validate_format(format)
+        if jobs < 1:
+            raise ValueError("jobs must be at least 1")
+
+        directory = Path(output_dir) if output_dir else Path(".")
+        directory.mkdir(parents=True, exist_ok=True)
+
+        # Plan every output path up front so concurrent exports never collide
+        taken: Set[str] = set()
+        plan = []
+        failed: Dict[str, Exception] = {}
+        for file in files:
+            if file.mime_type and file.mime_type not in EXPORTABLE_MIME_TYPES:
+                failed[file.id] = ValueError(
+                    f"{file.name} is not a Google Workspace document and cannot "
+                    "be exported; download it instead."
+                )
+                continue
+            file_format = format or self._get_default_format_for_mime_type(
+                file.mime_type
+            )
+            extension = self._get_file_extension_for_format(file_format)
+            output_path = self._unique_output_path(
+                directory, sanitize_filename(file.name), extension, taken
+            )
+            plan.append((file, output_path))
+
+        # Make sure credentials are loaded (and refreshed) once, before the
+        # workers start sharing them
+        self.get_service()
+        local = threading.local()
+
+        def export_one(file: DriveFile, output_path: Path) -> str:
+            client = getattr(local, "client", None)
+            if client is None:
+                client = local.client = self.clone()
+            return client.export(file.id, str(output_path), format, file=file)
+
+        with ThreadPoolExecutor(max_workers=jobs) as executor:
+            futures = [executor.submit(export_one, *item) for item in plan]
 
-        # For non-native files, return the original format
-        if mime_type not in format_mapping:
-            # Extract format from MIME type (e.g., "application/pdf" -> "pdf")
-            if "/" in mime_type:
-                return mime_type.split("/")[-1]
-            return "zip"  # Default fallback
+        exported: Dict[str, str] = {}
+        for (file, _), future in zip(plan, futures):
+            try:
+                exported[file.id] = future.result()
+            except Exception as error:
+                failed[file.id] = error
 
-        return format_mapping[mime_type]
+        return {"exported": exported, "failed": failed}
 
-    def _get_mime_type_for_format(self, format: str) -> str:
-        """Get the MIME type for a given format.
+    def _unique_output_path(
+        self, directory: Path, stem: str, extension: str, taken: Set[str]
+    ) -> Path:
+        """Pick an output path that no other file in the same run uses.
 
         Args:
-            format: The format to get MIME type for.
+            directory: Directory where the file is saved.
+            stem: Preferred file name without extension.
+            extension: File extension for the export format.
+            taken: Lower-cased names already assigned; updated in place.
 
         Returns:
-            The MIME type for the format.
+            The output path for the file.
         """
-        mime_type_mapping = {
-            "html": "application/zip",  # Google Docs HTML export is ZIP format
-            "pdf": "application/pdf",
-            "xlsx": "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
-            "csv": "text/csv",
-            "md": "text/markdown",
-            "rtf": "application/rtf",
-            "txt": "text/plain",
-            "odt": "application/vnd.oasis.opendocument.text",
-            "ods": "application/vnd.oasis.opendocument.spreadsheet",
-            "epub": "application/epub+zip",
-        }
-        return mime_type_mapping.get(format, "application/zip")
+        name = f"{stem}.{extension}"
+        counter = 2
+        while name.lower() in taken:
+            name = f"{stem} ({counter}).{extension}"
+            counter += 1
+        taken.add(name.lower())
+        return directory / name
+
+    def _download_resumable(
+        self, request, output_file: Path, md5_checksum: str
+    ) -> None:
+        """Download media in byte ranges, resuming from an earlier attempt.
+
+        Content is appended to a partial file next to ``output_file`` whose
+        name includes the expected checksum, so a partial file is only ever
+        resumed for the same content. The partial file is kept if the
+        transfer is interrupted, and renamed into place once complete and
+        verified. Partial files left for other checksums, by earlier attempts
+        at content that has changed since, are deleted.
+
+        Args:
+            request: The media HttpRequest to download.
+            output_file: Where the downloaded content should end up.
+            md5_checksum: The MD5 checksum Drive reports for the content.
+
+        Raises:
+            ChecksumMismatchError: If the content does not match the checksum;
+                the partial file is deleted.
+        """
+        partial_file = output_file.with_name(f".{output_file.name}.{md5_checksum}.part")
+        self._remove_stale_partials(output_file, partial_file)
+        digest = hashlib.md5()
+        try:
+            with open(partial_file, "a+b") as fh:
+                # Hash what an earlier attempt already received
+                fh.seek(0)
+                for block in iter(lambda: fh.read(self.chunk_size), b""):
+                    digest.update(block)
+                offset = fh.tell()
+
+                total = None
+                while total is None or offset < total:
+                    response, content = self._call(
+                        request.methodId, lambda: self._fetch_range(request, offset)
+                    )
+                    if response.status == 206:
+                        total = _content_range_total(response)
+                    elif response.status == 200:
+                        # The server sent the whole content instead of the range
+                        fh.truncate(0)
+                        digest = hashlib.md5()
+                        offset = 0
+                        total = len(content)
+                    else:
+                        # 416: nothing left at this offset
+                        total = _content_range_total(response)
+                        if total != offset:
+                            # The partial file is longer than the content
+                            fh.truncate(0)
+                            digest = hashlib.md5()
+                            offset = 0
+                        continue
+                    fh.write(content)
+                    digest.update(content)
+                    offset += len(content)
+        except BaseException:
+            # Keep received bytes for the next attempt, but not empty files
+            if partial_file.exists() and partial_file.stat().st_size == 0:
+                partial_file.unlink()
+            raise
+
+        if digest.hexdigest() != md5_checksum:
+            partial_file.unlink(missing_ok=True)
+            raise ChecksumMismatchError(
+                f"Checksum mismatch for {output_file.name}: expected "
+                f"{md5_checksum}, got {digest.hexdigest()}"
+            )
+        os.replace(partial_file, output_file)
+
+    def _remove_stale_partials(self, output_file: Path, keep: Path) -> None:
+        """Delete partial downloads of an output file other than ``keep``."""
+        stale = re.compile(
+            re.escape(f".{output_file.name}.") + r"[0-9a-f]{32}" + re.escape(".part")
+        )
+        try:
+            siblings = list(output_file.parent.iterdir())
+        except FileNotFoundError:
+            return
+        for sibling in siblings:
+            if sibling != keep and stale.fullmatch(sibling.name):
+                sibling.unlink(missing_ok=True)
 
-    def _get_file_extension_for_format(self, format: str) -> str:
-        """Get the file extension for a given format.
+    def _fetch_range(self, request, start: int):
+        """Request one chunk of media content starting at ``start``.
 
         Args:
-            format: The format to get extension for.
+            request: The media HttpRequest being downloaded.
+            start: Offset of the first byte to fetch.
 
         Returns:
-            The file extension for the format.
+            The response and content for a 200, 206 or 416 status.
+
+        Raises:
+            HttpError: For any other status.
         """
-        extension_mapping = {
-            "html": "zip",  # HTML export comes as ZIP
-            "pdf": "pdf",
-            "xlsx": "xlsx",
-            "csv": "csv",
-            "md": "md",
-            "rtf": "rtf",
-            "txt": "txt",
-            "odt": "odt",
-            "ods": "ods",
-            "epub": "epub",
+        headers = {
+            name: value
+            for name, value in request.headers.items()
+            if name.lower() not in MEDIA_EXCLUDED_HEADERS
         }
-        return extension_mapping.get(format, "zip")
+        headers["range"] = f"bytes={start}-{start + self.chunk_size - 1}"
+        response, content = request.http.request(request.uri, "GET", headers=headers)
+        if response.status not in (200, 206, 416):
+            raise HttpError(response, content, uri=request.uri)
+        return response, content
+
+    def _download_to_file(self, request, output_file: Path) -> None:
+        """Stream a media request to disk without buffering it in memory.
+
+        The content is written in ``chunk_size`` pieces to a temporary file
+        next to ``output_file``, which is renamed into place once the transfer
+        completes. An interrupted transfer never leaves a truncated file at
+        ``output_file``.
+
+        Args:
+            request: The media HttpRequest to download.
+            output_file: Where the downloaded content should end up.
+        """
+        temp_file = output_file.with_name(
+            f".{output_file.name}.{uuid.uuid4().hex[:8]}.part"
+        )
+        try:
+            with open(temp_file, "wb") as fh:
+                downloader = MediaIoBaseDownload(fh, request, chunksize=self.chunk_size)
+                done = False
+                while not done:
+                    _, done = self._call(request.methodId, downloader.next_chunk)
+            os.replace(temp_file, output_file)
+        except BaseException:
+            temp_file.unlink(missing_ok=True)
+            raise
+
+
+def _content_range_total(response) -> int:
+    """Read the complete length from a response's Content-Range header."""
+    return int(response["content-range"].rsplit("/", 1)[1])
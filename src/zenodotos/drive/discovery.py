@@ -0,0 +1,192 @@
+"""Drive API discovery document handling."""
+
+import json
+import os
+import threading
+from contextlib import suppress
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from google_auth_httplib2 import AuthorizedHttp
+from googleapiclient import discovery_cache
+from googleapiclient.discovery import build, build_from_document
+from googleapiclient.http import build_http
+from googleapiclient.version import __version__ as CLIENT_VERSION
+
+API_NAME = "drive"
+API_VERSION = "v3"
+
+# Version of the layout of preprocessed documents saved on disk; bump it
+# whenever what is saved changes
+DOCUMENT_CACHE_FORMAT = 1
+
+# Name of the preprocessed document saved in the cache directory
+DOCUMENT_CACHE_NAME = f"discovery-{API_NAME}-{API_VERSION}.json"
+
+_lock = threading.Lock()
+_document: Optional[Dict[str, Any]] = None
+
+
+def load_discovery_document(
+    cache_dir: Optional[Path] = None,
+) -> Optional[Dict[str, Any]]:
+    """Load the packaged Drive discovery document, parsing it once per process.
+
+    google-api-python-client ships static discovery documents, so no network
+    access is needed. The parsed document is kept in memory and shared by every
+    service built afterwards.
+
+    Preparing the document for use takes several times longer than parsing
+    it, so with ``cache_dir`` the prepared document is also saved there and
+    later processes load it as is. The saved copy is used only if it was
+    written in the current format from the installed version of
+    google-api-python-client, and is rewritten otherwise.
+
+    Args:
+        cache_dir: Optional directory where the prepared document is saved.
+
+    Returns:
+        The parsed discovery document, or None if the installed
+        google-api-python-client does not ship a usable Drive v3 document.
+    """
+    global _document
+
+    with _lock:
+        if _document is None:
+            document = _read_cached_document(cache_dir) if cache_dir else None
+            if document is None:
+                document = _prepare_packaged_document()
+                if document is None:
+                    return None
+                if cache_dir:
+                    _write_cached_document(cache_dir, document)
+            _document = document
+
+    return _document
+
+
+def _prepare_packaged_document() -> Optional[Dict[str, Any]]:
+    """Parse the packaged discovery document and prepare it for sharing."""
+    content = discovery_cache.get_static_doc(API_NAME, API_VERSION)
+    if not content:
+        return None
+
+    document = json.loads(content)
+    if not _is_supported(document):
+        return None
+
+    # googleapiclient fills in method parameters in place the first time
+    # each resource is accessed. Do that once here so the shared document
+    # is never modified while worker threads build services.
+    service = build_from_document(document, http=build_http())
+    for resource_name in document.get("resources", {}):
+        getattr(service, resource_name)()
+    return document
+
+
+def _read_cached_document(cache_dir: Path) -> Optional[Dict[str, Any]]:
+    """Read the prepared document saved in a directory, if it is current."""
+    try:
+        with open(Path(cache_dir) / DOCUMENT_CACHE_NAME, encoding="utf-8") as f:
+            saved = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if (
+        not isinstance(saved, dict)
+        or saved.get("format") != DOCUMENT_CACHE_FORMAT
+        or saved.get("client_version") != CLIENT_VERSION
+        or not isinstance(saved.get("document"), dict)
+        or not _is_supported(saved["document"])
+    ):
+        return None
+    return saved["document"]
+
+
+def _write_cached_document(cache_dir: Path, document: Dict[str, Any]) -> None:
+    """Save a prepared document, leaving any previous copy on failure."""
+    path = Path(cache_dir) / DOCUMENT_CACHE_NAME
+    temporary = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    saved = {
+        "format": DOCUMENT_CACHE_FORMAT,
+        "client_version": CLIENT_VERSION,
+        "document": document,
+    }
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(temporary, "w", encoding="utf-8") as f:
+            json.dump(saved, f, separators=(",", ":"))
+        # Readers in other processes see either the old file or the new one
+        os.replace(temporary, path)
+    except OSError:
+        # The saved copy only saves time; the document is still usable
+        with suppress(OSError):
+            temporary.unlink()
+
+
+def _is_supported(document: Dict[str, Any]) -> bool:
+    """Check that a discovery document describes the Drive API version we use.
+
+    Args:
+        document: The parsed discovery document.
+
+    Returns:
+        True if the document can be used to build the Drive service.
+    """
+    return (
+        document.get("name") == API_NAME
+        and document.get("version") == API_VERSION
+        and "files" in document.get("resources", {})
+    )
+
+
+def build_service(
+    credentials,
+    root_url: Optional[str] = None,
+    http=None,
+    cache_dir: Optional[Path] = None,
+):
+    """Build a Drive API service from the cached discovery document.
+
+    Args:
+        credentials: Credentials used to authorize the service's requests.
+            Ignored when ``root_url`` is given.
+        root_url: Root URL of a stand-in for the Drive API, such as the fake
+            server in ``zenodotos.drive.fake_server``. Requests to it are not
+            authorized.
+        http: Optional ``httplib2.Http`` transport to send requests through,
+            authorized with ``credentials`` unless ``root_url`` is given.
+        cache_dir: Optional directory where the prepared discovery document
+            is saved for later processes.
+
+    Returns:
+        A Drive v3 service resource.
+
+    Raises:
+        RuntimeError: If ``root_url`` is given but google-api-python-client
+            does not ship a usable Drive v3 discovery document.
+    """
+    document = load_discovery_document(cache_dir)
+    if root_url is not None:
+        if document is None:
+            raise RuntimeError(
+                "A custom API endpoint needs the Drive v3 discovery document "
+                "shipped with google-api-python-client"
+            )
+        # Batch requests are sent to the document's root URL, whatever the
+        # client options say, so point the document itself at the stand-in
+        root_url = root_url.rstrip("/") + "/"
+        document = dict(
+            document,
+            rootUrl=root_url,
+            mtlsRootUrl=root_url,
+            baseUrl=root_url + document["servicePath"],
+        )
+        return build_from_document(document, http=http or build_http())
+    if http is not None:
+        http = AuthorizedHttp(credentials, http=http)
+        if document is None:
+            return build(API_NAME, API_VERSION, http=http)
+        return build_from_document(document, http=http)
+    if document is None:
+        return build(API_NAME, API_VERSION, credentials=credentials)
+    return build_from_document(document, credentials=credentials)
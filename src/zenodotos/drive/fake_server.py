@@ -0,0 +1,904 @@
+"""Local stand-in for the Google Drive API, for offline benchmarks and tests.
+
+``FakeDriveServer`` serves the parts of the Drive v3 REST API that Zenodotos
+uses over a synthetic drive:
+
+- ``files.list``, with search queries, paging and partial responses
+- ``files.get``, including ``alt=media`` downloads with byte ranges
+- ``files.export``
+- ``changes.getStartPageToken`` and ``changes.list``
+- batch requests
+
+Requests go through a real HTTP server on the loopback interface, so the
+discovery-based service, the transport, the batch encoding and the JSON
+parsing all run as they do against Google. Every request can be delayed, and
+a share of requests can fail with Drive's error responses, to measure how the
+client copes with slow or flaky connections.
+
+Point a ``DriveClient`` at a running server with its ``api_endpoint``
+argument, or with the ``api_endpoint`` configuration setting or the
+``ZENODOTOS_API_ENDPOINT`` environment variable. No credentials are needed.
+
+The server can also be run on its own::
+
+    python -m zenodotos.drive.fake_server --size 10000 --latency 0.05
+"""
+
+import email.parser
+import hashlib
+import json
+import random
+import re
+import threading
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+from urllib.parse import parse_qs, unquote, urlsplit
+
+import click
+
+from ..exceptions import ValidationError
+from ..index import LocalIndex
+from .models import DriveFile
+
+FOLDER_MIME_TYPE = "application/vnd.google-apps.folder"
+
+# Synthetic files cycle through these types; Google Workspace documents have
+# no content of their own and can only be exported
+CORPUS_MIME_TYPES = [
+    "application/vnd.google-apps.document",
+    "application/pdf",
+    "application/vnd.google-apps.spreadsheet",
+    "image/jpeg",
+    "text/plain",
+    "application/vnd.google-apps.presentation",
+]
+
+# Number of entries per synthetic folder, and how many of them are folders
+FILES_PER_FOLDER = 20
+FOLDERS_PER_FOLDER = 4
+
+# Largest size of a synthetic binary file, in bytes
+DEFAULT_MAX_FILE_SIZE = 64 * 1024
+
+# Owner reported for every synthetic file
+FAKE_OWNER = {"displayName": "Fake User", "emailAddress": "fake.user@example.com"}
+
+# Statuses returned by injected errors when none are given
+DEFAULT_ERROR_STATUSES = (429, 500, 503)
+
+# Drive's default and largest page sizes for files.list and changes.list
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 1000
+
+# Error reasons Drive reports with each status
+_ERROR_REASONS = {
+    400: "invalid",
+    403: "forbidden",
+    404: "notFound",
+    416: "requestedRangeNotSatisfiable",
+    429: "rateLimitExceeded",
+    500: "backendError",
+    502: "backendError",
+    503: "backendError",
+    504: "backendError",
+}
+
+_DEFAULT_FILE_FIELDS = "kind,id,name,mimeType"
+
+_RANGE_RE = re.compile(r"bytes=(\d+)-(\d*)$")
+
+# A status, the response headers and the response body
+Response = Tuple[int, Dict[str, str], bytes]
+
+
+class SyntheticDrive:
+    """In-memory drive holding file metadata, contents and a change log.
+
+    The drive can be generated at any size with ``generate`` and changed with
+    ``add_file``, ``update_file`` and ``delete_file``. Every change is
+    recorded in the change log read by ``changes.list``.
+
+    Its ``get_start_page_token``, ``list_files`` and ``list_changes`` methods
+    behave like those of ``DriveClient``, so a ``LocalIndex`` can sync from
+    it; the server evaluates search queries that way.
+    """
+
+    def __init__(self, max_file_size: int = DEFAULT_MAX_FILE_SIZE, seed: int = 0):
+        """Initialize an empty drive.
+
+        Args:
+            max_file_size: Largest size, in bytes, of generated binary files.
+            seed: Seed for the sizes and timestamps of generated files.
+        """
+        self.max_file_size = max_file_size
+        self._random = random.Random(seed)
+        self._files: Dict[str, Dict[str, Any]] = {}
+        self._contents: Dict[str, bytes] = {}
+        self._changes: List[str] = []
+        self._clock = datetime(2024, 1, 1, tzinfo=timezone.utc)
+        self._next_id = 1
+        self._lock = threading.RLock()
+        self._index = LocalIndex(Path(":memory:"))
+        self._indexed_token: Optional[str] = None
+
+    @classmethod
+    def generate(
+        cls,
+        size: int,
+        max_file_size: int = DEFAULT_MAX_FILE_SIZE,
+        seed: int = 0,
+    ) -> "SyntheticDrive":
+        """Generate a drive with a folder tree of the given number of files.
+
+        The same arguments always generate the same drive. Every folder holds
+        ``FILES_PER_FOLDER`` entries, ``FOLDERS_PER_FOLDER`` of them
+        subfolders, under a top folder named ``Corpus`` in ``root``.
+
+        Args:
+            size: Number of files, folders included, below the top folder.
+            max_file_size: Largest size, in bytes, of binary files.
+            seed: Seed for the sizes and timestamps of the files.
+
+        Returns:
+            The generated drive.
+        """
+        drive = cls(max_file_size=max_file_size, seed=seed)
+        folders = [drive.add_file("Corpus", FOLDER_MIME_TYPE)["id"]]
+        for number in range(size):
+            parent = folders[number // FILES_PER_FOLDER]
+            if number % FILES_PER_FOLDER < FOLDERS_PER_FOLDER:
+                folder = drive.add_file(
+                    f"Folder {number:06d}", FOLDER_MIME_TYPE, parent
+                )
+                folders.append(folder["id"])
+            else:
+                mime_type = CORPUS_MIME_TYPES[number % len(CORPUS_MIME_TYPES)]
+                drive.add_file(f"File {number:06d}", mime_type, parent)
+        return drive
+
+    def add_file(
+        self,
+        name: str,
+        mime_type: str,
+        parent: str = "root",
+        content: Optional[bytes] = None,
+    ) -> Dict[str, Any]:
+        """Add a file.
+
+        Args:
+            name: The file name.
+            mime_type: The MIME type.
+            parent: ID of the folder holding the file.
+            content: Content of a binary file. Random-sized content is
+                generated when omitted.
+
+        Returns:
+            The file's metadata.
+        """
+        with self._lock:
+            file_id = f"fake{self._next_id:08d}"
+            self._next_id += 1
+            timestamp = self._tick()
+            metadata = {
+                "kind": "drive#file",
+                "id": file_id,
+                "name": name,
+                "mimeType": mime_type,
+                "parents": [parent],
+                "createdTime": timestamp,
+                "modifiedTime": timestamp,
+                "version": "1",
+                "trashed": False,
+                "owners": [dict(FAKE_OWNER)],
+                "webViewLink": f"https://drive.example.com/file/d/{file_id}/view",
+            }
+            self._files[file_id] = metadata
+            if not mime_type.startswith("application/vnd.google-apps."):
+                if content is None:
+                    size = self._random.randint(0, self.max_file_size)
+                    content = _generated_content(file_id, size)
+                self._set_content(file_id, content)
+            self._changes.append(file_id)
+            return dict(metadata)
+
+    def update_file(
+        self,
+        file_id: str,
+        name: Optional[str] = None,
+        content: Optional[bytes] = None,
+        parent: Optional[str] = None,
+        trashed: Optional[bool] = None,
+    ) -> Dict[str, Any]:
+        """Change a file, bumping its version and modification time.
+
+        Args:
+            file_id: ID of the file.
+            name: New name.
+            content: New content of a binary file.
+            parent: ID of the folder to move the file to.
+            trashed: Whether the file is in the trash.
+
+        Returns:
+            The file's updated metadata.
+
+        Raises:
+            KeyError: If there is no such file.
+        """
+        with self._lock:
+            metadata = self._files[file_id]
+            if name is not None:
+                metadata["name"] = name
+            if content is not None:
+                self._set_content(file_id, content)
+            if parent is not None:
+                metadata["parents"] = [parent]
+            if trashed is not None:
+                metadata["trashed"] = trashed
+            metadata["version"] = str(int(metadata["version"]) + 1)
+            metadata["modifiedTime"] = self._tick()
+            self._changes.append(file_id)
+            return dict(metadata)
+
+    def delete_file(self, file_id: str) -> None:
+        """Delete a file for good.
+
+        Raises:
+            KeyError: If there is no such file.
+        """
+        with self._lock:
+            del self._files[file_id]
+            self._contents.pop(file_id, None)
+            self._changes.append(file_id)
+
+    def file_ids(self) -> List[str]:
+        """Get the IDs of every file, in creation order."""
+        with self._lock:
+            return list(self._files)
+
+    def get(self, file_id: str) -> Optional[Dict[str, Any]]:
+        """Get a file's metadata, or None if there is no such file."""
+        with self._lock:
+            metadata = self._files.get(file_id)
+            return dict(metadata) if metadata is not None else None
+
+    def content(self, file_id: str) -> Optional[bytes]:
+        """Get a binary file's content, or None for other files."""
+        with self._lock:
+            return self._contents.get(file_id)
+
+    def search(
+        self, query: Optional[str], page_size: int, page_token: Optional[str]
+    ) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        """Get a page of the files matching a Drive search query.
+
+        Files are ordered by modification time, most recent first.
+
+        Returns:
+            The metadata of the files on the page and the next page token.
+
+        Raises:
+            ValidationError: If the query or the page token is invalid.
+        """
+        with self._lock:
+            if self._indexed_token != self.get_start_page_token():
+                self._index.sync(self)
+                self._indexed_token = self.get_start_page_token()
+            page = self._index.list_files(
+                page_size=page_size, page_token=page_token, query=query
+            )
+            files = [dict(self._files[file.id]) for file in page["files"]]
+        return files, page["next_page_token"]
+
+    def changes(
+        self, page_token: str, page_size: int
+    ) -> Tuple[List[Dict[str, Any]], Optional[str], Optional[str]]:
+        """Get a page of the change log, in the Drive API format.
+
+        Returns:
+            The changes, the next page token and, on the last page, the new
+            start page token.
+
+        Raises:
+            ValidationError: If the page token is invalid.
+        """
+        with self._lock:
+            try:
+                start = int(page_token) - 1
+            except ValueError:
+                start = -1
+            if not 0 <= start <= len(self._changes):
+                raise ValidationError(f"Invalid page token: {page_token}")
+            end = min(start + page_size, len(self._changes))
+            changes = []
+            for file_id in self._changes[start:end]:
+                metadata = self._files.get(file_id)
+                change: Dict[str, Any] = {
+                    "kind": "drive#change",
+                    "changeType": "file",
+                    "fileId": file_id,
+                    "removed": metadata is None,
+                }
+                if metadata is not None:
+                    change["file"] = dict(metadata)
+                changes.append(change)
+            if end < len(self._changes):
+                return changes, str(end + 1), None
+            return changes, None, self.get_start_page_token()
+
+    # The DriveClient interface used by LocalIndex.sync
+
+    def get_start_page_token(self) -> str:
+        """Get the token marking the current end of the change log."""
+        with self._lock:
+            return str(len(self._changes) + 1)
+
+    def list_files(
+        self,
+        page_size: int = 10,
+        page_token: Optional[str] = None,
+        query: Optional[str] = None,
+        fields: Optional[List[str]] = None,
+        use_cache: bool = True,
+    ) -> Dict[str, Any]:
+        """List every file, in creation order, like ``DriveClient.list_files``.
+
+        Only used for full syncs of the query index, so ``query`` and
+        ``fields`` are ignored.
+        """
+        with self._lock:
+            start = int(page_token) if page_token else 0
+            files = list(self._files.values())[start : start + page_size]
+            end = start + len(files)
+            return {
+                "files": [DriveFile.from_api_response(f) for f in files],
+                "next_page_token": str(end) if end < len(self._files) else None,
+            }
+
+    def list_changes(
+        self,
+        page_token: str,
+        page_size: int = 1000,
+        fields: Optional[List[str]] = None,
+    ) -> Dict[str, Any]:
+        """List a page of changes, like ``DriveClient.list_changes``."""
+        changes, next_page_token, new_start_page_token = self.changes(
+            page_token, page_size
+        )
+        return {
+            "changes": [
+                {
+                    "file_id": change["fileId"],
+                    "removed": change["removed"],
+                    "file": DriveFile.from_api_response(change["file"])
+                    if not change["removed"]
+                    else None,
+                }
+                for change in changes
+            ],
+            "next_page_token": next_page_token,
+            "new_start_page_token": new_start_page_token,
+        }
+
+    def _set_content(self, file_id: str, content: bytes) -> None:
+        self._contents[file_id] = content
+        self._files[file_id]["size"] = str(len(content))
+        self._files[file_id]["md5Checksum"] = hashlib.md5(content).hexdigest()
+
+    def _tick(self) -> str:
+        """Advance the drive's clock by a random step and format it."""
+        self._clock += timedelta(seconds=self._random.randint(1, 3600))
+        return self._clock.strftime("%Y-%m-%dT%H:%M:%S.000Z")
+
+
+class FakeDriveServer:
+    """HTTP server answering Drive v3 API requests from a ``SyntheticDrive``.
+
+    Example:
+        ```python
+        with FakeDriveServer(size=10_000, latency=0.02) as server:
+            client = DriveClient(api_endpoint=server.url)
+            client.list_files(page_size=1000)
+        ```
+    """
+
+    def __init__(
+        self,
+        drive: Optional[SyntheticDrive] = None,
+        size: int = 1000,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        error_rate: float = 0.0,
+        error_statuses: Iterable[int] = DEFAULT_ERROR_STATUSES,
+        seed: int = 0,
+        host: str = "127.0.0.1",
+        port: int = 0,
+    ):
+        """Initialize the server.
+
+        Args:
+            drive: The drive to serve. A drive of ``size`` files is generated
+                when omitted.
+            size: Number of files of the generated drive.
+            latency: Seconds every HTTP request is delayed by.
+            jitter: Up to this many seconds are randomly added to the delay.
+            error_rate: Share of requests, from 0 to 1, that fail with one of
+                ``error_statuses``. Calls inside a batch fail on their own,
+                as they do in Drive.
+            error_statuses: HTTP statuses of the injected errors.
+            seed: Seed for the generated drive and the injected errors.
+            host: Interface to listen on.
+            port: Port to listen on. A free port is picked when 0.
+
+        Raises:
+            ValueError: If latency or jitter is negative, or error_rate is not
+                between 0 and 1.
+        """
+        if latency < 0 or jitter < 0:
+            raise ValueError("latency and jitter must not be negative")
+        if not 0 <= error_rate <= 1:
+            raise ValueError("error_rate must be between 0 and 1")
+        self.drive = (
+            drive if drive is not None else SyntheticDrive.generate(size, seed=seed)
+        )
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.error_statuses = tuple(error_statuses)
+        self.request_count = 0
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer((host, port), _Handler)
+        self._server.daemon_threads = True
+        self._server.fake = self
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        """Root URL of the server, to use as the client's API endpoint."""
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}/"
+
+    def start(self) -> "FakeDriveServer":
+        """Serve requests from a background thread."""
+        if self._thread is None:
+            # Poll often, so stopping the server does not hold up tests
+            self._thread = threading.Thread(
+                target=self._server.serve_forever,
+                kwargs={"poll_interval": 0.05},
+                name="fake-drive",
+                daemon=True,
+            )
+            self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """Stop serving requests and close the listening socket."""
+        if self._thread is not None:
+            self._server.shutdown()
+            self._thread.join()
+            self._thread = None
+        self._server.server_close()
+
+    def serve_forever(self) -> None:
+        """Serve requests from the calling thread until interrupted."""
+        try:
+            self._server.serve_forever()
+        finally:
+            self._server.server_close()
+
+    def __enter__(self) -> "FakeDriveServer":
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+    def handle(
+        self, method: str, target: str, headers: Dict[str, str], body: bytes = b""
+    ) -> Response:
+        """Answer one API request, without the injected delay.
+
+        Args:
+            method: The HTTP method.
+            target: The request path and query string.
+            headers: The request headers, with lowercase names.
+            body: The request body.
+
+        Returns:
+            The status, headers and body of the response.
+        """
+        url = urlsplit(target)
+        path = url.path.rstrip("/")
+        params = {key: values[-1] for key, values in parse_qs(url.query).items()}
+
+        if method == "POST" and path == "/batch/drive/v3":
+            return self._batch(headers, body)
+        status = self._injected_error()
+        if status is not None:
+            return _error(status, "Injected error")
+        if method != "GET":
+            return _error(405, f"Method {method} not supported")
+
+        try:
+            if path == "/drive/v3/files":
+                return self._list_files(params)
+            if path == "/drive/v3/changes/startPageToken":
+                return _json(
+                    {
+                        "kind": "drive#startPageToken",
+                        "startPageToken": self.drive.get_start_page_token(),
+                    },
+                    params,
+                )
+            if path == "/drive/v3/changes":
+                return self._list_changes(params)
+            match = re.fullmatch(r"/drive/v3/files/([^/]+)(/export)?", path)
+            if match:
+                file_id = unquote(match.group(1))
+                if match.group(2):
+                    return self._export(file_id, params)
+                if params.get("alt") == "media":
+                    return self._download(file_id, headers)
+                metadata = self.drive.get(file_id)
+                if metadata is None:
+                    return _not_found(file_id)
+                return _json(metadata, params, _DEFAULT_FILE_FIELDS)
+        except (ValidationError, ValueError) as error:
+            return _error(400, str(error))
+        return _error(404, f"Unknown path: {path}")
+
+    def delay(self) -> None:
+        """Sleep for the configured latency."""
+        if self.latency or self.jitter:
+            with self._lock:
+                extra = self._random.uniform(0, self.jitter)
+            time.sleep(self.latency + extra)
+
+    def _injected_error(self) -> Optional[int]:
+        if not self.error_rate or not self.error_statuses:
+            return None
+        with self._lock:
+            if self._random.random() >= self.error_rate:
+                return None
+            return self._random.choice(self.error_statuses)
+
+    def _list_files(self, params: Dict[str, str]) -> Response:
+        files, next_page_token = self.drive.search(
+            params.get("q"), _page_size(params), params.get("pageToken")
+        )
+        result: Dict[str, Any] = {
+            "kind": "drive#fileList",
+            "incompleteSearch": False,
+            "files": files,
+        }
+        if next_page_token:
+            result["nextPageToken"] = next_page_token
+        return _json(
+            result,
+            params,
+            f"kind,nextPageToken,incompleteSearch,files({_DEFAULT_FILE_FIELDS})",
+        )
+
+    def _list_changes(self, params: Dict[str, str]) -> Response:
+        if "pageToken" not in params:
+            return _error(400, "Required parameter: pageToken")
+        changes, next_page_token, new_start_page_token = self.drive.changes(
+            params["pageToken"], _page_size(params)
+        )
+        result: Dict[str, Any] = {"kind": "drive#changeList", "changes": changes}
+        if next_page_token:
+            result["nextPageToken"] = next_page_token
+        if new_start_page_token:
+            result["newStartPageToken"] = new_start_page_token
+        return _json(
+            result,
+            params,
+            "kind,nextPageToken,newStartPageToken,"
+            f"changes(kind,changeType,fileId,removed,file({_DEFAULT_FILE_FIELDS}))",
+        )
+
+    def _export(self, file_id: str, params: Dict[str, str]) -> Response:
+        metadata = self.drive.get(file_id)
+        if metadata is None:
+            return _not_found(file_id)
+        mime_type = params.get("mimeType")
+        if not mime_type:
+            return _error(400, "Required parameter: mimeType")
+        native = metadata["mimeType"].startswith("application/vnd.google-apps.")
+        if not native or metadata["mimeType"] == FOLDER_MIME_TYPE:
+            return _error(
+                403,
+                "Export only supports Docs Editors files.",
+                "fileNotExportable",
+            )
+        content = (
+            f"{metadata['name']} (version {metadata['version']}) "
+            f"exported as {mime_type}\n"
+        ).encode("utf-8")
+        return 200, {"Content-Type": mime_type}, content
+
+    def _download(self, file_id: str, headers: Dict[str, str]) -> Response:
+        metadata = self.drive.get(file_id)
+        if metadata is None:
+            return _not_found(file_id)
+        content = self.drive.content(file_id)
+        if content is None:
+            return _error(
+                403,
+                "Only files with binary content can be downloaded. "
+                "Use Export with Docs Editors files.",
+                "fileNotDownloadable",
+            )
+        content_type = {"Content-Type": metadata["mimeType"]}
+        match = _RANGE_RE.match(headers.get("range", ""))
+        if not match:
+            return 200, content_type, content
+        start = int(match.group(1))
+        if start >= len(content):
+            return 416, {"Content-Range": f"bytes */{len(content)}"}, b""
+        end = min(int(match.group(2) or len(content) - 1), len(content) - 1)
+        content_type["Content-Range"] = f"bytes {start}-{end}/{len(content)}"
+        return 206, content_type, content[start : end + 1]
+
+    def _batch(self, headers: Dict[str, str], body: bytes) -> Response:
+        """Answer a batch request, running its calls one after the other."""
+        message = email.parser.BytesParser().parsebytes(
+            f"Content-Type: {headers.get('content-type', '')}\r\n\r\n".encode() + body
+        )
+        if not message.is_multipart():
+            return _error(400, "Batch requests must be multipart/mixed")
+
+        boundary = f"batch_{uuid.uuid4().hex}"
+        parts = []
+        for part in message.get_payload():
+            payload = part.get_payload()
+            head, _, inner_body = payload.replace("\r\n", "\n").partition("\n\n")
+            request_line, *header_lines = head.split("\n")
+            method, target = request_line.split(" ")[:2]
+            inner_headers = {}
+            for line in header_lines:
+                name, _, value = line.partition(":")
+                inner_headers[name.strip().lower()] = value.strip()
+            status, response_headers, content = self.handle(
+                method, target, inner_headers, inner_body.encode("utf-8")
+            )
+            content_id = part.get("Content-ID", "")
+            lines = [
+                f"--{boundary}",
+                "Content-Type: application/http",
+                f"Content-ID: <response-{content_id.strip('<>')}>",
+                "",
+                f"HTTP/1.1 {status} {_reason(status)}",
+                *(f"{name}: {value}" for name, value in response_headers.items()),
+                "",
+                content.decode("utf-8", errors="replace"),
+            ]
+            parts.append("\r\n".join(lines))
+        response = "\r\n".join(parts) + f"\r\n--{boundary}--\r\n"
+        return (
+            200,
+            {"Content-Type": f"multipart/mixed; boundary={boundary}"},
+            response.encode("utf-8"),
+        )
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """Hands HTTP requests to the ``FakeDriveServer`` owning the socket."""
+
+    protocol_version = "HTTP/1.1"
+    # Headers and body are written separately; without this, Nagle's
+    # algorithm would hold back the body until the client's delayed ACK
+    disable_nagle_algorithm = True
+
+    def do_GET(self) -> None:
+        self._respond("GET")
+
+    def do_POST(self) -> None:
+        self._respond("POST")
+
+    def _respond(self, method: str) -> None:
+        fake: FakeDriveServer = self.server.fake
+        with fake._lock:
+            fake.request_count += 1
+        length = int(self.headers.get("Content-Length") or 0)
+        body = self.rfile.read(length) if length else b""
+        headers = {name.lower(): value for name, value in self.headers.items()}
+        fake.delay()
+        status, response_headers, content = fake.handle(
+            method, self.path, headers, body
+        )
+        self.send_response(status)
+        for name, value in response_headers.items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+    def log_message(self, format: str, *args: Any) -> None:
+        """Keep the console quiet; benchmarks send many requests."""
+
+
+def parse_fields(fields: str) -> Dict[str, Any]:
+    """Parse a partial response field selector.
+
+    Args:
+        fields: A selector such as ``nextPageToken,files(id,name)``.
+
+    Returns:
+        A dict mapping each selected field to the selector of its subfields,
+        or to None when the whole field is selected.
+
+    Raises:
+        ValidationError: If the parentheses do not match.
+    """
+    selector, position = _parse_selector(fields, 0)
+    if position != len(fields):
+        raise ValidationError(f"Invalid field selection: {fields}")
+    return selector
+
+
+def select_fields(value: Any, selector: Optional[Dict[str, Any]]) -> Any:
+    """Keep only the selected fields of a response, as Drive does.
+
+    Args:
+        value: A response value; selectors apply to each item of a list.
+        selector: A selector from ``parse_fields``, or None to keep everything.
+
+    Returns:
+        The selected part of the value.
+    """
+    if selector is None or "*" in selector:
+        return value
+    if isinstance(value, list):
+        return [select_fields(item, selector) for item in value]
+    if not isinstance(value, dict):
+        return value
+    return {
+        key: select_fields(value[key], subfields)
+        for key, subfields in selector.items()
+        if key in value
+    }
+
+
+def _parse_selector(fields: str, position: int) -> Tuple[Dict[str, Any], int]:
+    selector: Dict[str, Any] = {}
+    while position < len(fields) and fields[position] != ")":
+        match = re.compile(r"\s*([^,()\s]*)\s*").match(fields, position)
+        name, position = match.group(1), match.end()
+        subfields = None
+        if position < len(fields) and fields[position] == "(":
+            subfields, position = _parse_selector(fields, position + 1)
+            if position >= len(fields) or fields[position] != ")":
+                raise ValidationError(f"Invalid field selection: {fields}")
+            position += 1
+        if name:
+            # Slash paths select subfields too: "file/id" is "file(id)"
+            head, *rest = name.split("/")
+            for part in reversed(rest):
+                subfields = {part: subfields}
+            if head in selector and selector[head] is not None and subfields:
+                selector[head].update(subfields)
+            else:
+                selector[head] = subfields
+        while position < len(fields) and fields[position] in ", ":
+            position += 1
+    return selector, position
+
+
+def _json(
+    result: Dict[str, Any], params: Dict[str, str], default_fields: str = "*"
+) -> Response:
+    selector = parse_fields(params.get("fields") or default_fields)
+    content = json.dumps(select_fields(result, selector)).encode("utf-8")
+    return 200, {"Content-Type": "application/json; charset=UTF-8"}, content
+
+
+def _error(status: int, message: str, reason: Optional[str] = None) -> Response:
+    """Build an error response with a body in the Drive API format."""
+    reason = reason or _ERROR_REASONS.get(status, "error")
+    body = {
+        "error": {
+            "code": status,
+            "message": message,
+            "errors": [
+                {
+                    "domain": "usageLimits" if status == 429 else "global",
+                    "reason": reason,
+                    "message": message,
+                }
+            ],
+        }
+    }
+    headers = {"Content-Type": "application/json; charset=UTF-8"}
+    return status, headers, json.dumps(body).encode("utf-8")
+
+
+def _not_found(file_id: str) -> Response:
+    return _error(404, f"File not found: {file_id}.")
+
+
+def _page_size(params: Dict[str, str]) -> int:
+    page_size = int(params.get("pageSize", DEFAULT_PAGE_SIZE))
+    if not 1 <= page_size <= MAX_PAGE_SIZE:
+        raise ValidationError(f"pageSize must be between 1 and {MAX_PAGE_SIZE}")
+    return page_size
+
+
+def _reason(status: int) -> str:
+    return BaseHTTPRequestHandler.responses.get(status, ("",))[0]
+
+
+def _generated_content(file_id: str, size: int) -> bytes:
+    """Make the deterministic content of a generated binary file."""
+    block = hashlib.sha256(file_id.encode("utf-8")).digest()
+    return (block * (size // len(block) + 1))[:size]
+
+
+@click.command()
+@click.option(
+    "--host", default="127.0.0.1", show_default=True, help="Interface to listen on."
+)
+@click.option(
+    "--port", type=int, default=8080, show_default=True, help="Port to listen on."
+)
+@click.option(
+    "--size",
+    type=click.IntRange(min=0),
+    default=1000,
+    show_default=True,
+    help="Number of synthetic files.",
+)
+@click.option(
+    "--latency",
+    type=click.FloatRange(min=0),
+    default=0.0,
+    show_default=True,
+    help="Seconds every request is delayed by.",
+)
+@click.option(
+    "--jitter",
+    type=click.FloatRange(min=0),
+    default=0.0,
+    show_default=True,
+    help="Up to this many seconds are randomly added to the delay.",
+)
+@click.option(
+    "--error-rate",
+    type=click.FloatRange(0, 1),
+    default=0.0,
+    show_default=True,
+    help="Share of requests that fail with a 429, 500 or 503.",
+)
+@click.option(
+    "--seed",
+    type=int,
+    default=0,
+    show_default=True,
+    help="Seed for the synthetic drive and the injected errors.",
+)
+def main(host, port, size, latency, jitter, error_rate, seed):
+    """Serve a synthetic drive through a local fake Drive API."""
+    server = FakeDriveServer(
+        size=size,
+        latency=latency,
+        jitter=jitter,
+        error_rate=error_rate,
+        seed=seed,
+        host=host,
+        port=port,
+    )
+    click.echo(f"Serving {size} synthetic files at {server.url}")
+    click.echo(
+        f"Point Zenodotos at it with: export ZENODOTOS_API_ENDPOINT={server.url}"
+    )
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+"""Export format handling shared by the Drive clients."""
+
+# Google Workspace types that can be exported; other native types, such as
+# shortcuts, forms and sites, have no content to export, and binary files are
+# downloaded instead
+EXPORTABLE_MIME_TYPES = frozenset(
+    {
+        "application/vnd.google-apps.document",
+        "application/vnd.google-apps.spreadsheet",
+        "application/vnd.google-apps.presentation",
+        "application/vnd.google-apps.drawing",
+    }
+)
+
+
+class ExportFormatsMixin:
+    """Maps export formats to MIME types and file extensions."""
+
+    def _validate_format(self, format: str) -> None:
+        """Validate that the specified format is supported.
+
+        Args:
+            format: The format to validate.
+
+        Raises:
+            ValueError: If the format is not supported.
+        """
+        supported_formats = [
+            "html",
+            "pdf",
+            "xlsx",
+            "csv",
+            "md",
+            "rtf",
+            "txt",
+            "odt",
+            "ods",
+            "epub",
+        ]
+        if format not in supported_formats:
+            raise ValueError(f"Unsupported format: {format}")
+
+    def _get_default_format_for_mime_type(self, mime_type: str) -> str:
+        """Get the smart default export format for a MIME type.
+
+        Args:
+            mime_type: The MIME type of the file.
+
+        Returns:
+            The default format for the file type.
+        """
+        # Smart defaults based on MIME type
+        format_mapping = {
+            "application/vnd.google-apps.document": "html",
+            "application/vnd.google-apps.spreadsheet": "xlsx",
+            "application/vnd.google-apps.presentation": "pdf",
+            "application/vnd.google-apps.drawing": "png",
+            "application/vnd.google-apps.form": "zip",
+        }
+
+        # For non-native files, return the original format
+        if mime_type not in format_mapping:
+            # Extract format from MIME type (e.g., "application/pdf" -> "pdf")
+            if "/" in mime_type:
+                return mime_type.split("/")[-1]
+            return "zip"  # Default fallback
+
+        return format_mapping[mime_type]
+
+    def _get_mime_type_for_format(self, format: str) -> str:
+        """Get the MIME type for a given format.
+
+        Args:
+            format: The format to get MIME type for.
+
+        Returns:
+            The MIME type for the format.
+        """
+        mime_type_mapping = {
+            "html": "application/zip",  # Google Docs HTML export is ZIP format
+            "pdf": "application/pdf",
+            "xlsx": "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+            "csv": "text/csv",
+            "md": "text/markdown",
+            "rtf": "application/rtf",
+            "txt": "text/plain",
+            "odt": "application/vnd.oasis.opendocument.text",
+            "ods": "application/vnd.oasis.opendocument.spreadsheet",
+            "epub": "application/epub+zip",
+            "png": "image/png",
+        }
+        return mime_type_mapping.get(format, "application/zip")
+
+    def _get_file_extension_for_format(self, format: str) -> str:
+        """Get the file extension for a given format.
+
+        Args:
+            format: The format to get extension for.
+
+        Returns:
+            The file extension for the format.
+        """
+        extension_mapping = {
+            "html": "zip",  # HTML export comes as ZIP
+            "pdf": "pdf",
+            "xlsx": "xlsx",
+            "csv": "csv",
+            "md": "md",
+            "rtf": "rtf",
+            "txt": "txt",
+            "odt": "odt",
+            "ods": "ods",
+            "epub": "epub",
+            "png": "png",
+        }
+        return extension_mapping.get(format, "zip")
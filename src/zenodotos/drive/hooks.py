@@ -0,0 +1,93 @@
+"""Instrumentation hooks for Drive API requests.
+
+Every request ``DriveClient`` makes, metadata calls, batches and each chunk of
+a download or export alike, is reported to the client's hooks: once when it
+starts and once when it ends, retries included. ``AsyncDriveClient`` reports
+its requests the same way. Register a hook with ``add_hook``;
+``zenodotos.drive.metrics`` has collectors ready to use.
+
+This module only uses the standard library, so hooks can be written and used
+with the async client without loading the Google API client libraries.
+
+Example:
+    ```python
+    logger = logging.getLogger(__name__)
+
+    class SlowRequestLogger(RequestHook):
+        def request_finished(self, event):
+            if event.latency > 1.0:
+                logger.warning("%s took %.1fs", event.method, event.latency)
+
+    client.add_hook(SlowRequestLogger())
+    ```
+"""
+
+import threading
+from dataclasses import dataclass
+from typing import Optional
+
+# The event of the request being made by each thread, if any
+_active = threading.local()
+
+
+@dataclass
+class RequestEvent:
+    """A Drive API request, as reported to hooks.
+
+    Attributes:
+        method: The API method, such as ``drive.files.list``, or ``batch``
+            for a batch request.
+        start_time: When the request started, as a Unix timestamp.
+        status: HTTP status of the last response received, or None if no
+            response was received.
+        bytes_received: Size of the response bodies received, every attempt
+            included.
+        latency: Seconds from start to end, retries and backoff included.
+            None until the request ends.
+        retries: Number of times the request was retried.
+        error: The exception the request failed with, or None.
+    """
+
+    method: str
+    start_time: float
+    status: Optional[int] = None
+    bytes_received: int = 0
+    latency: Optional[float] = None
+    retries: int = 0
+    error: Optional[BaseException] = None
+
+    @property
+    def attempts(self) -> int:
+        """Number of times the request was sent, each one using quota."""
+        return self.retries + 1
+
+
+class RequestHook:
+    """Receives an event at the start and end of every Drive API request.
+
+    Subclasses override either method. Both are called from the thread making
+    the request, so hooks shared by clients used in worker threads must be
+    thread-safe. Exceptions raised by hooks propagate to the caller.
+    """
+
+    def request_started(self, event: RequestEvent) -> None:
+        """Called before the request is first sent."""
+
+    def request_finished(self, event: RequestEvent) -> None:
+        """Called after the request succeeded or failed for good."""
+
+
+def set_active_event(event: Optional[RequestEvent]) -> Optional[RequestEvent]:
+    """Make an event the one this thread's responses are recorded in.
+
+    Returns:
+        The previously active event, to restore afterwards.
+    """
+    previous = getattr(_active, "event", None)
+    _active.event = event
+    return previous
+
+
+def get_active_event() -> Optional[RequestEvent]:
+    """Get the event this thread's responses are recorded in, if any."""
+    return getattr(_active, "event", None)
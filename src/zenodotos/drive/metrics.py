@@ -0,0 +1,350 @@
+"""Request metrics collected through the Drive client's hooks.
+
+``LatencyHistogram`` keeps in-process latency histograms and counters per API
+method. ``PrometheusTextfileExporter`` also writes them, in the Prometheus
+text format, to a file read by the node exporter's textfile collector, so
+Drive API latency and quota use can be graphed and alerted on.
+
+Example:
+    ```python
+    histogram = LatencyHistogram()
+    client.add_hook(histogram)
+    client.list_files()
+    p95 = histogram.quantile("drive.files.list", 0.95)
+    ```
+"""
+
+import atexit
+import bisect
+import os
+import threading
+import time
+import uuid
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+from ..timings import Timings
+from .hooks import RequestEvent, RequestHook
+
+# Upper bounds, in seconds, of the latency buckets
+DEFAULT_BUCKETS = (0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+# Prefix of the exported metric names
+METRIC_PREFIX = "zenodotos_drive"
+
+# Minimum number of seconds between two writes of the textfile
+DEFAULT_WRITE_INTERVAL = 15.0
+
+
+class _MethodStats:
+    """Counters of one API method."""
+
+    __slots__ = ("buckets", "count", "sum", "retries", "bytes_received", "statuses")
+
+    def __init__(self, bucket_count: int):
+        self.buckets = [0] * (bucket_count + 1)
+        self.count = 0
+        self.sum = 0.0
+        self.retries = 0
+        self.bytes_received = 0
+        self.statuses: Dict[Optional[int], int] = {}
+
+
+class LatencyHistogram(RequestHook):
+    """Latency histogram and request counters per API method.
+
+    Safe to share between clients used in different threads.
+    """
+
+    def __init__(self, buckets: Iterable[float] = DEFAULT_BUCKETS):
+        """Initialize the histogram.
+
+        Args:
+            buckets: Upper bounds of the latency buckets, in seconds.
+
+        Raises:
+            ValueError: If no buckets are given.
+        """
+        self.buckets = sorted(buckets)
+        if not self.buckets:
+            raise ValueError("At least one bucket is needed")
+        self._methods: Dict[str, _MethodStats] = {}
+        self._lock = threading.Lock()
+
+    def request_finished(self, event: RequestEvent) -> None:
+        """Record a finished request."""
+        with self._lock:
+            stats = self._methods.get(event.method)
+            if stats is None:
+                stats = self._methods[event.method] = _MethodStats(len(self.buckets))
+            stats.buckets[bisect.bisect_left(self.buckets, event.latency)] += 1
+            stats.count += 1
+            stats.sum += event.latency
+            stats.retries += event.retries
+            stats.bytes_received += event.bytes_received
+            stats.statuses[event.status] = stats.statuses.get(event.status, 0) + 1
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """Get a copy of the counters of every method.
+
+        Returns:
+            Dict mapping each API method to a dict containing:
+                - count: Number of requests
+                - sum: Total latency in seconds
+                - buckets: List of (upper bound, cumulative count) pairs, the
+                  last one with an infinite upper bound
+                - retries: Number of retries
+                - attempts: Number of times requests were sent
+                - bytes_received: Size of the response bodies
+                - statuses: Number of requests by final HTTP status, None for
+                  requests that got no response
+        """
+        with self._lock:
+            methods = {name: self._copy(stats) for name, stats in self._methods.items()}
+        return methods
+
+    def quantile(self, method: str, q: float) -> Optional[float]:
+        """Estimate a latency quantile of a method from its buckets.
+
+        As Prometheus' ``histogram_quantile``, interpolates linearly within
+        the bucket holding the quantile.
+
+        Args:
+            method: The API method.
+            q: The quantile, between 0 and 1.
+
+        Returns:
+            The estimated latency in seconds, or None if the method has no
+            requests. Quantiles above the largest bucket are reported as its
+            upper bound.
+        """
+        stats = self.snapshot().get(method)
+        if not stats or not stats["count"]:
+            return None
+        rank = q * stats["count"]
+        lower_bound, lower_count = 0.0, 0
+        for upper_bound, count in stats["buckets"]:
+            if count >= rank:
+                if upper_bound == float("inf"):
+                    return lower_bound
+                if count == lower_count:
+                    return upper_bound
+                share = (rank - lower_count) / (count - lower_count)
+                return lower_bound + (upper_bound - lower_bound) * share
+            lower_bound, lower_count = upper_bound, count
+        return lower_bound
+
+    def summary(self) -> Dict[str, Dict[str, Any]]:
+        """Summarize the requests of every method.
+
+        Returns:
+            Dict mapping each API method to a dict containing count, errors
+            (requests whose final status was not 2xx or 3xx), retries,
+            bytes_received, mean latency and the p50, p95 and p99 latency
+            estimates, in seconds.
+        """
+        summary = {}
+        for method, stats in self.snapshot().items():
+            summary[method] = {
+                "count": stats["count"],
+                "errors": sum(
+                    count
+                    for status, count in stats["statuses"].items()
+                    if status is None or status >= 400
+                ),
+                "retries": stats["retries"],
+                "bytes_received": stats["bytes_received"],
+                "mean": stats["sum"] / stats["count"],
+                "p50": self.quantile(method, 0.5),
+                "p95": self.quantile(method, 0.95),
+                "p99": self.quantile(method, 0.99),
+            }
+        return summary
+
+    def reset(self) -> None:
+        """Forget every recorded request."""
+        with self._lock:
+            self._methods.clear()
+
+    def _copy(self, stats: _MethodStats) -> Dict[str, Any]:
+        cumulative = 0
+        buckets = []
+        for upper_bound, count in zip([*self.buckets, float("inf")], stats.buckets):
+            cumulative += count
+            buckets.append((upper_bound, cumulative))
+        return {
+            "count": stats.count,
+            "sum": stats.sum,
+            "buckets": buckets,
+            "retries": stats.retries,
+            "attempts": stats.count + stats.retries,
+            "bytes_received": stats.bytes_received,
+            "statuses": dict(stats.statuses),
+        }
+
+
+class PrometheusTextfileExporter(LatencyHistogram):
+    """Latency histogram written to a file in the Prometheus text format.
+
+    The file is meant for the node exporter's textfile collector. It is
+    rewritten atomically when a request finishes, at most once every
+    ``write_interval`` seconds, and when ``write`` is called. Counters start
+    from zero in every process, which Prometheus treats as a counter reset.
+
+    Exported metrics, labelled by API method:
+
+    - ``zenodotos_drive_request_duration_seconds``: latency histogram,
+      retries and backoff included
+    - ``zenodotos_drive_requests_total``: requests, also labelled by final
+      HTTP status (``none`` when no response was received)
+    - ``zenodotos_drive_request_attempts_total``: requests sent, retries
+      included; every attempt uses quota
+    - ``zenodotos_drive_response_bytes_total``: size of the response bodies
+    """
+
+    def __init__(
+        self,
+        path: os.PathLike,
+        buckets: Iterable[float] = DEFAULT_BUCKETS,
+        write_interval: float = DEFAULT_WRITE_INTERVAL,
+    ):
+        """Initialize the exporter.
+
+        Args:
+            path: The file to write, usually ending in ``.prom``.
+            buckets: Upper bounds of the latency buckets, in seconds.
+            write_interval: Minimum number of seconds between automatic
+                writes.
+        """
+        super().__init__(buckets)
+        self.path = Path(path)
+        self.write_interval = write_interval
+        self._last_write: Optional[float] = None
+        self._write_lock = threading.Lock()
+
+    def request_finished(self, event: RequestEvent) -> None:
+        """Record a finished request, writing the file if it is due."""
+        super().request_finished(event)
+        now = time.monotonic()
+        if self._last_write is None or now - self._last_write >= self.write_interval:
+            self.write()
+
+    def render(self) -> str:
+        """Render the metrics in the Prometheus text format."""
+        methods = self.snapshot()
+        name = f"{METRIC_PREFIX}_request_duration_seconds"
+        lines = [
+            f"# HELP {name} Latency of Drive API requests, retries included.",
+            f"# TYPE {name} histogram",
+        ]
+        for method, stats in sorted(methods.items()):
+            for upper_bound, count in stats["buckets"]:
+                le = "+Inf" if upper_bound == float("inf") else repr(upper_bound)
+                lines.append(f"{name}_bucket{_labels(method=method, le=le)} {count}")
+            lines.append(f"{name}_sum{_labels(method=method)} {stats['sum']!r}")
+            lines.append(f"{name}_count{_labels(method=method)} {stats['count']}")
+
+        name = f"{METRIC_PREFIX}_requests_total"
+        lines += [
+            f"# HELP {name} Drive API requests by final HTTP status.",
+            f"# TYPE {name} counter",
+        ]
+        for method, stats in sorted(methods.items()):
+            for status, count in sorted(
+                stats["statuses"].items(), key=lambda item: item[0] or 0
+            ):
+                status_label = "none" if status is None else str(status)
+                lines.append(
+                    f"{name}{_labels(method=method, status=status_label)} {count}"
+                )
+
+        for metric, key, description in (
+            (
+                "request_attempts_total",
+                "attempts",
+                "Drive API requests sent, retries included.",
+            ),
+            (
+                "response_bytes_total",
+                "bytes_received",
+                "Size of Drive API response bodies.",
+            ),
+        ):
+            name = f"{METRIC_PREFIX}_{metric}"
+            lines += [f"# HELP {name} {description}", f"# TYPE {name} counter"]
+            for method, stats in sorted(methods.items()):
+                lines.append(f"{name}{_labels(method=method)} {stats[key]}")
+
+        return "\n".join(lines) + "\n"
+
+    def write(self) -> None:
+        """Write the metrics to the file atomically."""
+        with self._write_lock:
+            self._last_write = time.monotonic()
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            temp_file = self.path.with_name(
+                f".{self.path.name}.{uuid.uuid4().hex[:8]}.part"
+            )
+            try:
+                temp_file.write_text(self.render(), encoding="utf-8")
+                os.replace(temp_file, self.path)
+            except BaseException:
+                temp_file.unlink(missing_ok=True)
+                raise
+
+
+class TimingsHook(RequestHook):
+    """Times every request as a phase named after its method.
+
+    Registered on every client while ``zenodotos --timings`` is recording.
+    """
+
+    def __init__(self, timings: Timings):
+        """Initialize the hook.
+
+        Args:
+            timings: The timings to record the requests in.
+        """
+        self.timings = timings
+
+    def request_started(self, event: RequestEvent) -> None:
+        """Start the request's phase."""
+        self.timings.start(f"api {event.method}")
+
+    def request_finished(self, event: RequestEvent) -> None:
+        """Stop the request's phase."""
+        self.timings.stop()
+
+
+_exporters: Dict[Path, PrometheusTextfileExporter] = {}
+_exporters_lock = threading.Lock()
+
+
+def textfile_exporter(path: os.PathLike) -> PrometheusTextfileExporter:
+    """Get the process-wide exporter writing to a file.
+
+    Every client configured with the same ``metrics_textfile`` shares one
+    exporter, so the file covers all of their requests. The file is written
+    one last time when the process exits.
+
+    Args:
+        path: The file to write.
+
+    Returns:
+        The exporter for that file.
+    """
+    path = Path(path).expanduser().absolute()
+    with _exporters_lock:
+        exporter = _exporters.get(path)
+        if exporter is None:
+            exporter = _exporters[path] = PrometheusTextfileExporter(path)
+            atexit.register(exporter.write)
+    return exporter
+
+
+def _labels(**labels: str) -> str:
+    escaped: List[str] = []
+    for name, value in labels.items():
+        value = value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+        escaped.append(f'{name}="{value}"')
+    return "{" + ",".join(escaped) + "}"
@@ -1,13 +1,77 @@
 """Google Drive data models."""
 
 from datetime import datetime
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Union
 
-from dateutil.parser import parse
+# File fields requested when the caller does not choose any
+DEFAULT_FIELDS = [
+    "id",
+    "name",
+    "mimeType",
+    "size",
+    "createdTime",
+    "modifiedTime",
+    "description",
+    "owners",
+    "webViewLink",
+]
+
+# Metadata fetched once per export for format detection and output naming
+EXPORT_METADATA_FIELDS = "name,mimeType,modifiedTime,size"
+
+# Bytes requested per chunk when streaming exports and downloads to disk
+DEFAULT_CHUNK_SIZE = 10 * 1024 * 1024
+
+
+def _parse_timestamp(value: str) -> datetime:
+    """Parse an RFC 3339 timestamp, as returned by the Drive API."""
+    try:
+        # Handles everything Drive returns, including the "Z" suffix
+        return datetime.fromisoformat(value)
+    except ValueError:
+        # Rarely needed, so dateutil is only imported here
+        from dateutil.parser import parse
+
+        return parse(value)
+
+
+def _format_timestamp(value: Union[datetime, str, None]) -> Optional[str]:
+    """Format a timestamp as RFC 3339, keeping strings from the API as is."""
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return value
+
+
+def _format_int64(value: Optional[int]) -> Optional[str]:
+    """Format a number the way the API encodes int64 fields, as a string."""
+    return str(value) if value is not None else None
 
 
 class DriveFile:
-    """Represents a Google Drive file."""
+    """Represents a Google Drive file.
+
+    Instances use ``__slots__`` to keep large listings compact. Timestamps
+    may be given as RFC 3339 strings; they are kept as such and only parsed
+    into datetimes when first read. A missing name or MIME type reads as
+    "N/A", but is kept as given for ``to_dict``.
+    """
+
+    __slots__ = (
+        "id",
+        "_name",
+        "_mime_type",
+        "size",
+        "_created_time",
+        "_modified_time",
+        "description",
+        "owners",
+        "web_view_link",
+        "parents",
+        "trashed",
+        "md5_checksum",
+        "version",
+        "path",
+    )
 
     def __init__(
         self,
@@ -15,11 +79,16 @@ class DriveFile:
         name: Optional[str] = None,
         mime_type: Optional[str] = None,
         size: Optional[int] = None,
-        created_time: Optional[datetime] = None,
-        modified_time: Optional[datetime] = None,
+        created_time: Union[datetime, str, None] = None,
+        modified_time: Union[datetime, str, None] = None,
         description: Optional[str] = None,
         owners: Optional[List[Dict[str, str]]] = None,
         web_view_link: Optional[str] = None,
+        parents: Optional[List[str]] = None,
+        trashed: Optional[bool] = None,
+        md5_checksum: Optional[str] = None,
+        version: Optional[int] = None,
+        path: Optional[str] = None,
     ):
         """Initialize a DriveFile instance.
 
@@ -28,21 +97,74 @@ class DriveFile:
             name: The file's name.
             mime_type: The file's MIME type.
             size: The file's size in bytes.
-            created_time: When the file was created.
-            modified_time: When the file was last modified.
+            created_time: When the file was created, as a datetime or an
+                RFC 3339 string.
+            modified_time: When the file was last modified, as a datetime or
+                an RFC 3339 string.
             description: The file's description.
             owners: List of file owners with their details.
             web_view_link: URL to view the file in a web browser.
+            parents: IDs of the folders containing the file.
+            trashed: Whether the file is in the trash.
+            md5_checksum: MD5 checksum of the content. Only binary files have one.
+            version: Version number, increased on every change to the file.
+            path: Path of the file within a walked folder tree. Not an API
+                field; set when the file comes from a folder walk.
         """
         self.id = id
-        self.name = name or "N/A"
-        self.mime_type = mime_type or "N/A"
+        self._name = name
+        self._mime_type = mime_type
         self.size = size
-        self.created_time = created_time
-        self.modified_time = modified_time
+        self._created_time = created_time
+        self._modified_time = modified_time
         self.description = description
         self.owners = owners
         self.web_view_link = web_view_link
+        self.parents = parents
+        self.trashed = trashed
+        self.md5_checksum = md5_checksum
+        self.version = version
+        self.path = path
+
+    @property
+    def name(self) -> str:
+        """The file's name, or "N/A" if unknown."""
+        return self._name or "N/A"
+
+    @name.setter
+    def name(self, value: Optional[str]) -> None:
+        self._name = value
+
+    @property
+    def mime_type(self) -> str:
+        """The file's MIME type, or "N/A" if unknown."""
+        return self._mime_type or "N/A"
+
+    @mime_type.setter
+    def mime_type(self, value: Optional[str]) -> None:
+        self._mime_type = value
+
+    @property
+    def created_time(self) -> Optional[datetime]:
+        """When the file was created."""
+        if isinstance(self._created_time, str):
+            self._created_time = _parse_timestamp(self._created_time)
+        return self._created_time
+
+    @created_time.setter
+    def created_time(self, value: Union[datetime, str, None]) -> None:
+        self._created_time = value
+
+    @property
+    def modified_time(self) -> Optional[datetime]:
+        """When the file was last modified."""
+        if isinstance(self._modified_time, str):
+            self._modified_time = _parse_timestamp(self._modified_time)
+        return self._modified_time
+
+    @modified_time.setter
+    def modified_time(self, value: Union[datetime, str, None]) -> None:
+        self._modified_time = value
 
     @classmethod
     def from_api_response(cls, data: Dict[str, Any]) -> "DriveFile":
@@ -52,29 +174,64 @@ class DriveFile:
             data: Dictionary containing file data from the API.
 
         Returns:
-            A new DriveFile instance.
+            A new DriveFile instance. Its timestamps are parsed on first access.
         """
         # Convert size to integer if present
         size = int(data["size"]) if data.get("size") else None
 
-        # Parse timestamps if present
-        created_time = parse(data["createdTime"]) if data.get("createdTime") else None
-        modified_time = (
-            parse(data["modifiedTime"]) if data.get("modifiedTime") else None
-        )
-
         return cls(
             id=data.get("id"),
             name=data.get("name"),
             mime_type=data.get("mimeType"),
             size=size,
-            created_time=created_time,
-            modified_time=modified_time,
+            created_time=data.get("createdTime") or None,
+            modified_time=data.get("modifiedTime") or None,
             description=data.get("description"),
             owners=data.get("owners"),
             web_view_link=data.get("webViewLink"),
+            parents=data.get("parents"),
+            trashed=data.get("trashed"),
+            md5_checksum=data.get("md5Checksum"),
+            version=int(data["version"]) if data.get("version") else None,
         )
 
+    def to_dict(self, fields: Optional[List[str]] = None) -> Dict[str, Any]:
+        """Get the file's metadata keyed by API field name.
+
+        Values are those of the API, for machine-readable output: missing
+        fields are None rather than a display placeholder, int64 fields such
+        as ``size`` are strings as in the API's JSON, and timestamps are RFC
+        3339 strings, returned without being parsed when received from the API.
+
+        Args:
+            fields: API field names to include, in order. Defaults to every
+                field. Fields a DriveFile does not hold are set to None.
+                ``path`` may also be requested, but is not included by default
+                as it is not an API field.
+
+        Returns:
+            Dictionary of field values, ready for JSON encoding.
+        """
+        values = {
+            "id": self.id,
+            "name": self._name,
+            "mimeType": self._mime_type,
+            "size": _format_int64(self.size),
+            "createdTime": _format_timestamp(self._created_time),
+            "modifiedTime": _format_timestamp(self._modified_time),
+            "description": self.description,
+            "owners": self.owners,
+            "webViewLink": self.web_view_link,
+            "parents": self.parents,
+            "trashed": self.trashed,
+            "md5Checksum": self.md5_checksum,
+            "version": _format_int64(self.version),
+        }
+        if fields is None:
+            return values
+        values["path"] = self.path
+        return {field: values.get(field) for field in fields}
+
     def __str__(self) -> str:
         """Return a string representation of the file."""
         return f"{self.name} ({self.mime_type})"
@@ -100,4 +257,14 @@ class DriveFile:
             attrs.append(f"owners={self.owners}")
         if self.web_view_link is not None:
             attrs.append(f"web_view_link='{self.web_view_link}'")
+        if self.parents is not None:
+            attrs.append(f"parents={self.parents}")
+        if self.trashed is not None:
+            attrs.append(f"trashed={self.trashed}")
+        if self.md5_checksum is not None:
+            attrs.append(f"md5_checksum='{self.md5_checksum}'")
+        if self.version is not None:
+            attrs.append(f"version={self.version}")
+        if self.path is not None:
+            attrs.append(f"path='{self.path}'")
         return f"DriveFile({', '.join(attrs)})"
@@ -0,0 +1,209 @@
+"""Retry handling for transient Google Drive API failures.
+
+The Google API client libraries are only imported by ``RetryPolicy.call``,
+so the async client can share the policy without loading them.
+"""
+
+import email.utils
+import random
+import time
+from typing import TYPE_CHECKING, Callable, Iterable, Optional, TypeVar
+
+from ..exceptions import NetworkError, RateLimitError
+
+if TYPE_CHECKING:
+    from googleapiclient.errors import HttpError
+
+T = TypeVar("T")
+
+RETRYABLE_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+
+# Drive reports per-user quota bursts as 403s carrying one of these reasons
+RATE_LIMIT_REASONS = frozenset({"rateLimitExceeded", "userRateLimitExceeded"})
+
+# Network errors worth retrying; RetryPolicy.call adds httplib2's errors
+TRANSIENT_NETWORK_ERRORS = (ConnectionError, TimeoutError)
+
+
+def is_rate_limit_status(status: int, reasons: Iterable[str]) -> bool:
+    """Check whether an error response means the request was rate limited.
+
+    Args:
+        status: The HTTP status code of the response.
+        reasons: The ``reason`` values of the errors in the response body.
+
+    Returns:
+        True for 429 responses and for 403 responses with a rate limit reason.
+    """
+    if status == 429:
+        return True
+    return status == 403 and any(reason in RATE_LIMIT_REASONS for reason in reasons)
+
+
+def is_rate_limit_error(error: "HttpError") -> bool:
+    """Check whether an API error means the request was rate limited.
+
+    Args:
+        error: The error returned by the API.
+
+    Returns:
+        True for 429 responses and for 403 responses with a rate limit reason.
+    """
+    details = error.error_details if isinstance(error.error_details, list) else []
+    reasons = [detail.get("reason") for detail in details if isinstance(detail, dict)]
+    return is_rate_limit_status(error.resp.status, reasons)
+
+
+def is_retryable_error(error: "HttpError") -> bool:
+    """Check whether an API error is worth retrying.
+
+    Args:
+        error: The error returned by the API.
+
+    Returns:
+        True for rate limiting and server-side (5xx) errors.
+    """
+    return error.resp.status in RETRYABLE_STATUS_CODES or is_rate_limit_error(error)
+
+
+def retry_after_seconds(error: "HttpError") -> Optional[float]:
+    """Read the delay requested by the server in a Retry-After header.
+
+    Args:
+        error: The error returned by the API.
+
+    Returns:
+        Seconds to wait before retrying, or None if the header is absent or
+        cannot be parsed.
+    """
+    value = error.resp.get("retry-after") if hasattr(error.resp, "get") else None
+    return parse_retry_after(value)
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parse a Retry-After header value.
+
+    Args:
+        value: The header value, either a number of seconds or an HTTP date.
+
+    Returns:
+        Seconds to wait before retrying, or None if the value is absent or
+        cannot be parsed.
+    """
+    if not isinstance(value, str):
+        return None
+
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+
+    try:
+        retry_at = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, retry_at.timestamp() - time.time())
+
+
+class RetryPolicy:
+    """Exponential backoff with full jitter for transient API failures.
+
+    Rate limiting (429 and rate-limit 403s), server errors (5xx) and transient
+    network errors are retried up to ``max_retries`` times. Each retry waits a
+    random delay between zero and ``base_delay * 2 ** attempt`` seconds, capped
+    at ``max_delay``, unless the server asks for a specific delay through a
+    Retry-After header. Requested delays are capped at ``max_delay`` too, so
+    a bogus header cannot stall the caller for hours.
+    """
+
+    def __init__(
+        self,
+        max_retries: int = 3,
+        base_delay: float = 1.0,
+        max_delay: float = 32.0,
+    ):
+        """Initialize the retry policy.
+
+        Args:
+            max_retries: Maximum number of retries after the first attempt.
+            base_delay: Upper bound in seconds of the first backoff delay.
+            max_delay: Upper bound in seconds of any delay, including those
+                requested through Retry-After.
+        """
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+
+    def backoff_delay(self, attempt: int) -> float:
+        """Get a full-jitter backoff delay for a retry attempt.
+
+        Args:
+            attempt: Zero-based number of the retry about to be made.
+
+        Returns:
+            Seconds to wait before retrying.
+        """
+        return random.uniform(0, min(self.max_delay, self.base_delay * 2**attempt))
+
+    def retry_delay(self, attempt: int, requested: Optional[float] = None) -> float:
+        """Get the delay before a retry attempt.
+
+        Args:
+            attempt: Zero-based number of the retry about to be made.
+            requested: Seconds the server asked to wait through a Retry-After
+                header, if any.
+
+        Returns:
+            The requested delay capped at ``max_delay``, or a backoff delay if
+            none was requested.
+        """
+        if requested is None:
+            return self.backoff_delay(attempt)
+        return min(requested, self.max_delay)
+
+    def call(self, func: Callable[[], T]) -> T:
+        """Call a function, retrying it on transient failures.
+
+        Args:
+            func: The function performing the API request.
+
+        Returns:
+            Whatever the function returns.
+
+        Raises:
+            RateLimitError: If the request is still rate limited after all
+                retries.
+            NetworkError: If the network is still failing after all retries.
+            HttpError: For errors that are not retryable, and for server errors
+                that persist after all retries.
+        """
+        import httplib2
+        from googleapiclient.errors import HttpError
+
+        network_errors = (*TRANSIENT_NETWORK_ERRORS, httplib2.HttpLib2Error)
+        attempt = 0
+        while True:
+            try:
+                return func()
+            except HttpError as error:
+                if not is_retryable_error(error):
+                    raise
+                if attempt >= self.max_retries:
+                    if is_rate_limit_error(error):
+                        raise RateLimitError(
+                            "Google Drive API rate limit exceeded "
+                            f"after {attempt} retries.",
+                            original_error=error,
+                        ) from error
+                    raise
+                delay = retry_after_seconds(error)
+            except network_errors as error:
+                if attempt >= self.max_retries:
+                    raise NetworkError(
+                        f"Network error after {attempt} retries: {error}",
+                        original_error=error,
+                    ) from error
+                delay = None
+
+            time.sleep(self.retry_delay(attempt, delay))
+            attempt += 1
@@ -0,0 +1,26 @@
+"""HTTP transport reporting the responses of ``DriveClient`` to its hooks."""
+
+import httplib2
+from googleapiclient.http import build_http
+
+from .hooks import get_active_event
+
+
+class MeteredHttp(httplib2.Http):
+    """HTTP transport recording responses in the current request's event."""
+
+    def request(self, uri, method="GET", body=None, headers=None, *args, **kwargs):
+        response, content = super().request(uri, method, body, headers, *args, **kwargs)
+        event = get_active_event()
+        if event is not None:
+            event.status = response.status
+            event.bytes_received += len(content or b"")
+        return response, content
+
+
+def build_metered_http() -> MeteredHttp:
+    """Build a ``MeteredHttp`` configured like googleapiclient's transport."""
+    template = build_http()
+    http = MeteredHttp(timeout=template.timeout)
+    http.redirect_codes = template.redirect_codes
+    return http
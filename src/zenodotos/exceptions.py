@@ -66,6 +66,17 @@ class ExportError(ZenodotosError):
     pass
 
 
+class ChecksumMismatchError(ZenodotosError):
+    """Downloaded content does not match the checksum reported by Drive.
+
+    Raised when:
+    - A download was corrupted in transit
+    - The file changed on Google Drive while it was being downloaded
+    """
+
+    pass
+
+
 class ValidationError(ZenodotosError):
     """Input validation errors.
 
@@ -1,7 +1,25 @@
 """Formatting functions for CLI output."""
 
-from typing import List, Optional
+from typing import Dict, Iterable, Iterator, List, Optional
 from ..drive.models import DriveFile
+from ..timings import phase
+
+# Display configuration of each field, with the maximum column width
+FIELD_CONFIG = {
+    "id": {"header": "ID", "width": 45, "align": "<"},
+    "name": {"header": "Name", "width": 40, "align": "<"},
+    "mimeType": {"header": "Type", "width": 25, "align": "<"},
+    "size": {"header": "Size", "width": 10, "align": ">"},
+    "createdTime": {"header": "Created", "width": 20, "align": "<"},
+    "modifiedTime": {"header": "Modified", "width": 20, "align": "<"},
+    "description": {"header": "Description", "width": 30, "align": "<"},
+    "owners": {"header": "Owners", "width": 25, "align": "<"},
+    "webViewLink": {"header": "Link", "width": 30, "align": "<"},
+    "path": {"header": "Path", "width": 60, "align": "<"},
+}
+
+# Columns shown when no fields are requested
+DEFAULT_STREAM_FIELDS = ["name", "mimeType", "size"]
 
 
 def format_file_list(
@@ -16,12 +34,57 @@ def format_file_list(
     if not files:
         return "No files found."
 
-    # If no requested fields specified, use default display (backward compatibility)
-    if not requested_fields:
-        return _format_default_display(files)
+    with phase("format"):
+        # If no requested fields specified, use default display (backward compatibility)
+        if not requested_fields:
+            return _format_default_display(files)
+
+        # For dynamic display, show requested fields that are available
+        return _format_dynamic_display(files, requested_fields)
+
 
-    # For dynamic display, show requested fields that are available
-    return _format_dynamic_display(files, requested_fields)
+def format_file_stream(
+    pages: Iterable[List[DriveFile]],
+    requested_fields: Optional[List[str]] = None,
+    column_widths: Optional[Dict[str, int]] = None,
+) -> Iterator[str]:
+    """Format pages of files as a table, one chunk of text per page.
+
+    Unlike ``format_file_list``, column widths are fixed up front instead of
+    fitted to the content, so each page can be printed as soon as it arrives
+    and only one page is held in memory. Longer values are truncated.
+
+    Args:
+        pages: Iterable of lists of DriveFile objects, such as API result pages
+        requested_fields: List of field names to display (default: name, type
+            and size)
+        column_widths: Width of the column of each field, overriding the
+            default maximum width of that field
+
+    Yields:
+        The header with the first non-empty page, then the rows of each
+        following page, without trailing newlines. "No files found." if
+        every page is empty.
+    """
+    fields = [f for f in requested_fields or [] if f in FIELD_CONFIG]
+    fields = fields or DEFAULT_STREAM_FIELDS
+    widths = {f: FIELD_CONFIG[f]["width"] for f in fields}
+    widths.update((f, w) for f, w in (column_widths or {}).items() if f in widths)
+
+    header_sent = False
+    for files in pages:
+        if not files:
+            continue
+        with phase("format"):
+            rows = [_format_row(file, fields, widths) for file in files]
+            if not header_sent:
+                header_sent = True
+                rows[:0] = _format_header(fields, widths)
+            text = "\n".join(rows)
+        yield text
+
+    if not header_sent:
+        yield "No files found."
 
 
 def _format_default_display(files: List[DriveFile]) -> str:
@@ -47,21 +110,8 @@ def _format_default_display(files: List[DriveFile]) -> str:
 
 def _format_dynamic_display(files: List[DriveFile], requested_fields: List[str]) -> str:
     """Format files showing only the requested fields in a dynamic layout."""
-    # Define field display configuration
-    field_config = {
-        "id": {"header": "ID", "width": 45, "align": "<"},
-        "name": {"header": "Name", "width": 40, "align": "<"},
-        "mimeType": {"header": "Type", "width": 25, "align": "<"},
-        "size": {"header": "Size", "width": 10, "align": ">"},
-        "createdTime": {"header": "Created", "width": 20, "align": "<"},
-        "modifiedTime": {"header": "Modified", "width": 20, "align": "<"},
-        "description": {"header": "Description", "width": 30, "align": "<"},
-        "owners": {"header": "Owners", "width": 25, "align": "<"},
-        "webViewLink": {"header": "Link", "width": 30, "align": "<"},
-    }
-
     # Filter requested fields to only those we can display
-    displayable_fields = [f for f in requested_fields if f in field_config]
+    displayable_fields = [f for f in requested_fields if f in FIELD_CONFIG]
 
     if not displayable_fields:
         return _format_default_display(files)
@@ -69,40 +119,52 @@ def _format_dynamic_display(files: List[DriveFile], requested_fields: List[str])
     # Calculate actual column widths based on content
     field_widths = {}
     for field in displayable_fields:
-        max_width = len(field_config[field]["header"])
+        max_width = len(FIELD_CONFIG[field]["header"])
         for file in files:
             value = _get_field_value(file, field)
             max_width = max(max_width, len(str(value)))
-        field_widths[field] = min(max_width, field_config[field]["width"])
+        field_widths[field] = min(max_width, FIELD_CONFIG[field]["width"])
 
-    # Create header
+    # Format the header and each file
+    rows = _format_header(displayable_fields, field_widths)
+    for file in files:
+        rows.append(_format_row(file, displayable_fields, field_widths))
+
+    return "\n".join(rows)
+
+
+def _format_header(fields: List[str], widths: Dict[str, int]) -> List[str]:
+    """Format the header and separator lines of a table."""
     header_parts = []
     separator_parts = []
-    for field in displayable_fields:
-        width = field_widths[field]
-        align = field_config[field]["align"]
-        header_text = field_config[field]["header"]
+    for field in fields:
+        width = widths[field]
+        align = FIELD_CONFIG[field]["align"]
+        header_text = _truncate(FIELD_CONFIG[field]["header"], width)
         header_parts.append(f"{header_text:{align}{width}}")
         separator_parts.append("-" * width)
 
-    header = "  ".join(header_parts)
-    separator = "  ".join(separator_parts)
+    return ["  ".join(header_parts), "  ".join(separator_parts)]
 
-    # Format each file
-    rows = [header, separator]
-    for file in files:
-        row_parts = []
-        for field in displayable_fields:
-            width = field_widths[field]
-            align = field_config[field]["align"]
-            value = _get_field_value(file, field)
-            # Truncate long values
-            if len(str(value)) > width:
-                value = str(value)[: width - 3] + "..."
-            row_parts.append(f"{value:{align}{width}}")
-        rows.append("  ".join(row_parts))
 
-    return "\n".join(rows)
+def _format_row(file: DriveFile, fields: List[str], widths: Dict[str, int]) -> str:
+    """Format one table row, truncating values longer than their column."""
+    row_parts = []
+    for field in fields:
+        width = widths[field]
+        align = FIELD_CONFIG[field]["align"]
+        value = _truncate(str(_get_field_value(file, field)), width)
+        row_parts.append(f"{value:{align}{width}}")
+    return "  ".join(row_parts)
+
+
+def _truncate(value: str, width: int) -> str:
+    """Shorten a value to the width, marking the cut with an ellipsis."""
+    if len(value) <= width:
+        return value
+    if width <= 3:
+        return value[:width]
+    return value[: width - 3] + "..."
 
 
 def _get_field_value(file: DriveFile, field: str) -> str:
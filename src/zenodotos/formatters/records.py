@@ -0,0 +1,96 @@
+"""Machine-readable output formats for file metadata."""
+
+import csv
+import io
+import json
+from typing import Any, Iterable, Iterator, List
+
+from ..drive.models import DriveFile
+from ..timings import phase
+
+# Formats accepted by the CLI --output-format options
+OUTPUT_FORMATS = ["table", "ndjson", "csv", "json"]
+
+
+def format_records(
+    pages: Iterable[List[DriveFile]], fields: List[str], output_format: str
+) -> Iterator[str]:
+    """Format pages of files as NDJSON, CSV or a JSON array.
+
+    Every format is streamed: one chunk of text is produced per page, so a
+    page can be written out as soon as it arrives. Values are the raw API
+    field values, with no display formatting.
+
+    Args:
+        pages: Iterable of lists of DriveFile objects, such as API result pages
+        fields: API field names to output, in order
+        output_format: One of "ndjson", "csv" or "json"
+
+    Yields:
+        Chunks of text, each ending with a newline.
+
+    Raises:
+        ValueError: If the output format is not supported
+    """
+    if output_format == "ndjson":
+        return _format_ndjson(pages, fields)
+    if output_format == "csv":
+        return _format_csv(pages, fields)
+    if output_format == "json":
+        return _format_json(pages, fields)
+    raise ValueError(f"Unsupported output format: {output_format}")
+
+
+def _format_ndjson(
+    pages: Iterable[List[DriveFile]], fields: List[str]
+) -> Iterator[str]:
+    for files in pages:
+        if files:
+            with phase("format"):
+                text = "".join(_to_json(file.to_dict(fields)) + "\n" for file in files)
+            yield text
+
+
+def _format_csv(pages: Iterable[List[DriveFile]], fields: List[str]) -> Iterator[str]:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator="\n")
+    writer.writerow(fields)
+    for files in pages:
+        with phase("format"):
+            writer.writerows(
+                [_csv_value(value) for value in file.to_dict(fields).values()]
+                for file in files
+            )
+        if buffer.tell():
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+    if buffer.tell():
+        # Every page was empty: still output the header
+        yield buffer.getvalue()
+
+
+def _format_json(pages: Iterable[List[DriveFile]], fields: List[str]) -> Iterator[str]:
+    separator = "[\n"
+    for files in pages:
+        if files:
+            with phase("format"):
+                text = separator + ",\n".join(
+                    _to_json(file.to_dict(fields)) for file in files
+                )
+            yield text
+            separator = ",\n"
+    yield "[]\n" if separator == "[\n" else "\n]\n"
+
+
+def _to_json(record: dict) -> str:
+    return json.dumps(record, ensure_ascii=False, separators=(",", ":"))
+
+
+def _csv_value(value: Any) -> Any:
+    """Encode lists, objects and booleans as JSON within the cell."""
+    if value is None:
+        return ""
+    if isinstance(value, (list, dict, bool)):
+        return _to_json(value)
+    return value
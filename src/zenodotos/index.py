@@ -0,0 +1,475 @@
+"""Local index of Google Drive file metadata, kept in sync incrementally."""
+
+import json
+import re
+import sqlite3
+import threading
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional
+
+from .drive.models import DEFAULT_FIELDS, DriveFile
+from .exceptions import ValidationError
+from .query import compile_query, format_timestamp
+
+if TYPE_CHECKING:
+    from .drive.client import DriveClient
+
+# File fields stored for every indexed file
+INDEX_FIELDS = DEFAULT_FIELDS + ["parents", "trashed"]
+
+# Largest page size accepted by files.list and changes.list
+SYNC_PAGE_SIZE = 1000
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS files (
+    id TEXT PRIMARY KEY,
+    name TEXT NOT NULL,
+    mime_type TEXT NOT NULL,
+    size INTEGER,
+    created_time TEXT,
+    modified_time TEXT,
+    description TEXT,
+    owners TEXT,
+    web_view_link TEXT,
+    trashed INTEGER NOT NULL DEFAULT 0
+);
+CREATE TABLE IF NOT EXISTS file_parents (
+    file_id TEXT NOT NULL,
+    parent_id TEXT NOT NULL,
+    PRIMARY KEY (file_id, parent_id)
+);
+CREATE INDEX IF NOT EXISTS file_parents_parent_id ON file_parents (parent_id);
+CREATE TABLE IF NOT EXISTS state (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+"""
+
+# Full-text index over names and descriptions, kept in step with the files
+# table by triggers. The prefix indexes make short prefix searches as cheap
+# as whole-word ones.
+_SEARCH_SCHEMA = """
+CREATE VIRTUAL TABLE files_fts USING fts5(
+    name,
+    description,
+    content='files',
+    prefix='2 3 4',
+    tokenize='unicode61 remove_diacritics 2'
+);
+CREATE TRIGGER files_fts_insert AFTER INSERT ON files BEGIN
+    INSERT INTO files_fts (rowid, name, description)
+    VALUES (new.rowid, new.name, new.description);
+END;
+CREATE TRIGGER files_fts_delete AFTER DELETE ON files BEGIN
+    INSERT INTO files_fts (files_fts, rowid, name, description)
+    VALUES ('delete', old.rowid, old.name, old.description);
+END;
+CREATE TRIGGER files_fts_update AFTER UPDATE ON files BEGIN
+    INSERT INTO files_fts (files_fts, rowid, name, description)
+    VALUES ('delete', old.rowid, old.name, old.description);
+    INSERT INTO files_fts (rowid, name, description)
+    VALUES (new.rowid, new.name, new.description);
+END;
+INSERT INTO files_fts (files_fts) VALUES ('rebuild');
+"""
+
+# Relative weight of name and description matches when ranking search results
+_SEARCH_WEIGHTS = (10.0, 1.0)
+
+_WORD_RE = re.compile(r"\w+")
+
+_COLUMNS = (
+    "id, name, mime_type, size, created_time, modified_time, description, "
+    "owners, web_view_link, trashed"
+)
+
+
+def _parse_time(value: Optional[str]) -> Optional[datetime]:
+    return datetime.fromisoformat(value) if value else None
+
+
+class LocalIndex:
+    """SQLite mirror of the metadata of every file in a drive.
+
+    The first sync lists every file. Later syncs read only the changes made
+    since the previous one from the Drive Changes API, starting at the stored
+    page token, so a sync with nothing new costs a single API call.
+
+    Like the metadata cache, the database runs in WAL mode so it can be read
+    while another process syncs it.
+    """
+
+    def __init__(self, path: Path):
+        """Initialize the index.
+
+        Args:
+            path: Location of the SQLite database. It is created on first use.
+        """
+        self.path = Path(path)
+        self._connection: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the database on first use."""
+        if self._connection is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            connection = sqlite3.connect(
+                str(self.path), timeout=5.0, check_same_thread=False
+            )
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            connection.executescript(_SCHEMA)
+            has_search = connection.execute(
+                "SELECT 1 FROM sqlite_master WHERE name = 'files_fts'"
+            ).fetchone()
+            if not has_search:
+                # Also indexes the files of an index created before search
+                connection.executescript(_SEARCH_SCHEMA)
+            self._connection = connection
+        return self._connection
+
+    @property
+    def start_page_token(self) -> Optional[str]:
+        """The change log token the next incremental sync starts from."""
+        return self._get_state("start_page_token")
+
+    @property
+    def last_synced(self) -> Optional[datetime]:
+        """When the index was last synced, or None if it never was."""
+        value = self._get_state("last_synced")
+        return datetime.fromtimestamp(float(value), timezone.utc) if value else None
+
+    def count(self) -> int:
+        """Get the number of indexed files, trashed ones included."""
+        with self._lock:
+            return self._connect().execute("SELECT COUNT(*) FROM files").fetchone()[0]
+
+    def get_file(self, file_id: str) -> Optional[DriveFile]:
+        """Get an indexed file.
+
+        Args:
+            file_id: The file ID.
+
+        Returns:
+            The file, or None if it is not in the index.
+        """
+        files = self._select("WHERE id = ?", (file_id,))
+        return files[0] if files else None
+
+    def query(
+        self,
+        query: Optional[str] = None,
+        limit: Optional[int] = None,
+        offset: int = 0,
+    ) -> List[DriveFile]:
+        """Get the indexed files matching a Drive search query.
+
+        Files are ordered by modification time, most recent first, like the
+        Drive listings. As in Drive, trashed files are included unless the
+        query says ``trashed = false``.
+
+        Args:
+            query: The Drive query string. All files match when omitted.
+            limit: Maximum number of files to return.
+            offset: Number of matching files to skip.
+
+        Returns:
+            The matching files.
+
+        Raises:
+            ValidationError: If the query is malformed or uses unsupported terms.
+        """
+        where, params = compile_query(query) if query else ("1", [])
+        clause = f"WHERE {where} ORDER BY modified_time DESC, id"
+        if limit is not None:
+            clause += " LIMIT ? OFFSET ?"
+            params = params + [limit, offset]
+        return self._select(clause, params)
+
+    def list_files(
+        self,
+        page_size: int = 10,
+        page_token: Optional[str] = None,
+        query: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """List a page of indexed files, like ``DriveClient.list_files``.
+
+        Args:
+            page_size: Number of files to return per page.
+            page_token: Token for the next page of results, as returned by a
+                previous call.
+            query: The Drive query string.
+
+        Returns:
+            Dict containing:
+                - files: List of DriveFile objects
+                - next_page_token: Token for the next page (if any)
+
+        Raises:
+            ValidationError: If the query or page token is invalid.
+        """
+        try:
+            offset = int(page_token) if page_token else 0
+        except ValueError:
+            raise ValidationError(f"Invalid page token: {page_token}") from None
+        files = self.query(query, limit=page_size + 1, offset=offset)
+        return {
+            "files": files[:page_size],
+            "next_page_token": str(offset + page_size)
+            if len(files) > page_size
+            else None,
+        }
+
+    def search(
+        self, text: str, limit: int = 20, include_trashed: bool = False
+    ) -> List[DriveFile]:
+        """Find files whose name or description contains words of ``text``.
+
+        Every word must match the start of a word in the name or description,
+        ignoring case and accents, so ``"quart rep"`` finds "Quarterly
+        Report". Name matches rank above description matches.
+
+        Args:
+            text: The words to look for.
+            limit: Maximum number of files to return.
+            include_trashed: Also return files in the trash.
+
+        Returns:
+            The matching files, best match first.
+        """
+        words = _WORD_RE.findall(text)
+        if not words or limit < 1:
+            return []
+        match = " ".join(f'"{word}"*' for word in words)
+        trashed = "" if include_trashed else "AND files.trashed = 0"
+        with self._lock:
+            ids = [
+                row[0]
+                for row in self._connect().execute(
+                    "SELECT files.id FROM files_fts "
+                    "JOIN files ON files.rowid = files_fts.rowid "
+                    f"WHERE files_fts MATCH ? {trashed} "
+                    "ORDER BY bm25(files_fts, ?, ?), files.modified_time DESC "
+                    "LIMIT ?",
+                    (match, *_SEARCH_WEIGHTS, limit),
+                )
+            ]
+        if not ids:
+            return []
+        placeholders = ", ".join("?" * len(ids))
+        files = {f.id: f for f in self._select(f"WHERE id IN ({placeholders})", ids)}
+        return [files[file_id] for file_id in ids]
+
+    def sync(self, client: "DriveClient", full: bool = False) -> Dict[str, Any]:
+        """Bring the index up to date with the drive.
+
+        Args:
+            client: The Drive client used to read files and changes.
+            full: Rebuild the index from a complete listing even if it was
+                synced before.
+
+        Returns:
+            Dict containing:
+                - full: Whether a complete listing was done
+                - updated: Number of files added or updated
+                - removed: Number of files removed
+                - api_calls: Number of Drive API requests made
+        """
+        if full or self.start_page_token is None:
+            return self._full_sync(client)
+        return self._incremental_sync(client)
+
+    def clear(self) -> None:
+        """Drop every indexed file and the sync state."""
+        with self._lock:
+            connection = self._connect()
+            with connection:
+                self._clear(connection)
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+    def _full_sync(self, client: "DriveClient") -> Dict[str, Any]:
+        """Replace the index with a complete listing of the drive.
+
+        The change log token is taken before listing, so changes made while
+        the listing runs are picked up by the next incremental sync. The
+        listing is written in a single transaction, so a failed sync leaves
+        the previous index untouched.
+        """
+        start_page_token = client.get_start_page_token()
+        api_calls = 1
+        updated = 0
+        with self._lock:
+            connection = self._connect()
+            with connection:
+                self._clear(connection)
+                page_token = None
+                while True:
+                    result = client.list_files(
+                        page_size=SYNC_PAGE_SIZE,
+                        page_token=page_token,
+                        fields=INDEX_FIELDS,
+                        use_cache=False,
+                    )
+                    api_calls += 1
+                    self._upsert(connection, result["files"])
+                    updated += len(result["files"])
+                    page_token = result.get("next_page_token")
+                    if not page_token:
+                        break
+                self._set_synced(connection, start_page_token)
+
+        return {"full": True, "updated": updated, "removed": 0, "api_calls": api_calls}
+
+    def _incremental_sync(self, client: "DriveClient") -> Dict[str, Any]:
+        """Apply the changes made since the stored change log token.
+
+        Each page of changes is applied together with the token of the next
+        page, so an interrupted sync resumes where it stopped.
+        """
+        page_token = self.start_page_token
+        api_calls = 0
+        updated = 0
+        removed = 0
+        with self._lock:
+            connection = self._connect()
+            while page_token:
+                result = client.list_changes(
+                    page_token, page_size=SYNC_PAGE_SIZE, fields=INDEX_FIELDS
+                )
+                api_calls += 1
+                changes = result["changes"]
+                removed_ids = [c["file_id"] for c in changes if c["removed"]]
+                files = [c["file"] for c in changes if not c["removed"]]
+                page_token = result.get("next_page_token")
+                with connection:
+                    self._delete(connection, removed_ids)
+                    self._upsert(connection, files)
+                    self._set_synced(
+                        connection, page_token or result["new_start_page_token"]
+                    )
+                updated += len(files)
+                removed += len(removed_ids)
+
+        return {
+            "full": False,
+            "updated": updated,
+            "removed": removed,
+            "api_calls": api_calls,
+        }
+
+    def _upsert(self, connection: sqlite3.Connection, files: List[DriveFile]) -> None:
+        # An upsert rather than INSERT OR REPLACE, so that the search index
+        # triggers see updates
+        updates = ", ".join(
+            f"{column} = excluded.{column}" for column in _COLUMNS.split(", ")[1:]
+        )
+        connection.executemany(
+            f"INSERT INTO files ({_COLUMNS}) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?) "
+            f"ON CONFLICT (id) DO UPDATE SET {updates}",
+            [
+                (
+                    f.id,
+                    f.name,
+                    f.mime_type,
+                    f.size,
+                    format_timestamp(f.created_time),
+                    format_timestamp(f.modified_time),
+                    f.description,
+                    json.dumps(f.owners) if f.owners is not None else None,
+                    f.web_view_link,
+                    int(bool(f.trashed)),
+                )
+                for f in files
+            ],
+        )
+        connection.executemany(
+            "DELETE FROM file_parents WHERE file_id = ?", [(f.id,) for f in files]
+        )
+        connection.executemany(
+            "INSERT OR IGNORE INTO file_parents VALUES (?, ?)",
+            [(f.id, parent) for f in files for parent in f.parents or []],
+        )
+
+    def _delete(self, connection: sqlite3.Connection, file_ids: List[str]) -> None:
+        params = [(file_id,) for file_id in file_ids]
+        connection.executemany("DELETE FROM files WHERE id = ?", params)
+        connection.executemany("DELETE FROM file_parents WHERE file_id = ?", params)
+
+    def _clear(self, connection: sqlite3.Connection) -> None:
+        connection.execute("DELETE FROM files")
+        connection.execute("DELETE FROM file_parents")
+        connection.execute("DELETE FROM state")
+
+    def _set_synced(
+        self, connection: sqlite3.Connection, start_page_token: str
+    ) -> None:
+        connection.executemany(
+            "INSERT OR REPLACE INTO state VALUES (?, ?)",
+            [
+                ("start_page_token", start_page_token),
+                ("last_synced", str(time.time())),
+            ],
+        )
+
+    def _get_state(self, key: str) -> Optional[str]:
+        with self._lock:
+            row = (
+                self._connect()
+                .execute("SELECT value FROM state WHERE key = ?", (key,))
+                .fetchone()
+            )
+        return row[0] if row else None
+
+    def _select(self, where: str = "", params: Iterable[Any] = ()) -> List[DriveFile]:
+        """Get the indexed files matching a SQL condition.
+
+        Args:
+            where: A ``WHERE`` clause over the ``files`` table, optionally
+                followed by ``ORDER BY`` and ``LIMIT`` clauses.
+            params: Values for the clause's placeholders.
+
+        Returns:
+            The matching files.
+        """
+        with self._lock:
+            connection = self._connect()
+            rows = connection.execute(
+                f"SELECT {_COLUMNS} FROM files {where}", tuple(params)
+            ).fetchall()
+            parents: Dict[str, List[str]] = {}
+            ids = [row[0] for row in rows]
+            # Stay well below SQLite's limit on the number of placeholders
+            for start in range(0, len(ids), 500):
+                chunk = ids[start : start + 500]
+                placeholders = ", ".join("?" * len(chunk))
+                for file_id, parent_id in connection.execute(
+                    "SELECT file_id, parent_id FROM file_parents "
+                    f"WHERE file_id IN ({placeholders})",
+                    chunk,
+                ):
+                    parents.setdefault(file_id, []).append(parent_id)
+        return [self._row_to_file(row, parents.get(row[0], [])) for row in rows]
+
+    def _row_to_file(self, row: tuple, parents: List[str]) -> DriveFile:
+        return DriveFile(
+            id=row[0],
+            name=row[1],
+            mime_type=row[2],
+            size=row[3],
+            created_time=_parse_time(row[4]),
+            modified_time=_parse_time(row[5]),
+            description=row[6],
+            owners=json.loads(row[7]) if row[7] is not None else None,
+            web_view_link=row[8],
+            parents=parents,
+            trashed=bool(row[9]),
+        )
@@ -0,0 +1,279 @@
+"""One-way mirror of a Google Drive folder tree to local disk."""
+
+import json
+import os
+import threading
+import uuid
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path, PurePosixPath
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
+
+from .drive.client import DEFAULT_JOBS, DriveClient
+from .drive.formats import EXPORTABLE_MIME_TYPES
+from .drive.models import DriveFile
+from .utils import sanitize_filename
+from .walker import FOLDER_MIME_TYPE, FolderWalker
+
+# File fields needed to lay out the tree and detect changes
+MIRROR_FIELDS = ["id", "name", "mimeType", "modifiedTime", "md5Checksum", "version"]
+
+# Name of the state file kept in the destination directory
+STATE_FILE_NAME = ".zenodotos-mirror.json"
+
+
+class FolderMirror:
+    """Copies a Drive folder tree to a local directory, moving only what changed.
+
+    A state file in the destination records where every file was saved,
+    together with its ``md5Checksum``, ``modifiedTime`` and ``version``. On
+    later runs a file is transferred again only if its checksum changed or,
+    for Google Workspace documents, which have no checksum, its version or
+    modification time did. A file that was only renamed or moved is moved
+    locally instead of being transferred again.
+
+    Binary files are downloaded as they are. Google Workspace documents are
+    exported in the default format for their type, as with ``export``.
+    """
+
+    def __init__(
+        self,
+        client: DriveClient,
+        folder_id: str,
+        destination: Path,
+        delete: bool = False,
+        jobs: int = DEFAULT_JOBS,
+    ):
+        """Initialize the mirror.
+
+        Args:
+            client: The Drive client used to list and transfer files.
+            folder_id: ID of the Drive folder to mirror.
+            destination: Local directory the folder tree is copied into.
+            delete: Delete local copies of files that are no longer in the
+                folder tree. Only files written by the mirror are deleted.
+            jobs: Maximum number of folders listed, and of files transferred,
+                at the same time.
+        """
+        if jobs < 1:
+            raise ValueError("jobs must be at least 1")
+        self.client = client
+        self.folder_id = folder_id
+        self.destination = Path(destination)
+        self.delete = delete
+        self.jobs = jobs
+
+    @property
+    def state_path(self) -> Path:
+        """Location of the state file."""
+        return self.destination / STATE_FILE_NAME
+
+    def run(self) -> Dict[str, Any]:
+        """Bring the local copy up to date with the Drive folder.
+
+        The state file is saved even if the run is interrupted, so the files
+        transferred so far are not transferred again.
+
+        Returns:
+            Dict containing:
+                - downloaded: Number of binary files downloaded
+                - exported: Number of Google Workspace documents exported
+                - moved: Number of files renamed or moved locally
+                - unchanged: Number of files skipped as unchanged
+                - deleted: Number of local files deleted
+                - unsupported: Number of native files that cannot be exported
+                - failed: Mapping of relative path to the exception that
+                  stopped its transfer
+
+        Raises:
+            ValueError: If the destination mirrors a different folder.
+            PermissionError: If authentication fails or access is denied.
+            RuntimeError: For other API errors while listing the folder tree.
+        """
+        self.destination.mkdir(parents=True, exist_ok=True)
+        previous = self._load_state()
+        current: Dict[str, Dict[str, Any]] = {}
+        summary: Dict[str, Any] = {
+            "downloaded": 0,
+            "exported": 0,
+            "moved": 0,
+            "unchanged": 0,
+            "deleted": 0,
+            "unsupported": 0,
+            "failed": {},
+        }
+
+        try:
+            transfers = []
+            seen: Set[str] = set()
+            for file, path in self._walk(summary):
+                seen.add(file.id)
+                entry = self._entry(file, path)
+                old = previous.get(file.id)
+                if old is not None and self._unchanged(old, entry):
+                    if old["path"] != path:
+                        self._move(old["path"], path)
+                        summary["moved"] += 1
+                    else:
+                        summary["unchanged"] += 1
+                    current[file.id] = entry
+                else:
+                    transfers.append((file, entry, old))
+
+            self._transfer(transfers, current, summary)
+
+            if self.delete:
+                for file_id, old in list(previous.items()):
+                    if file_id not in seen:
+                        (self.destination / old["path"]).unlink(missing_ok=True)
+                        del previous[file_id]
+                        summary["deleted"] += 1
+        finally:
+            # Keep the entries of files that were not transferred or reached,
+            # so their local copies are still recognized on the next run
+            for file_id, old in previous.items():
+                current.setdefault(file_id, old)
+            self._save_state(current)
+
+        return summary
+
+    def _walk(self, summary: Dict[str, Any]) -> Iterator[Tuple[DriveFile, str]]:
+        """List the folder tree, creating its local directories.
+
+        Children are named in a stable order, so files whose names collide
+        keep the same local names from one run to the next.
+
+        Yields:
+            Each file to mirror with its path relative to the destination.
+        """
+        directories = {self.folder_id: PurePosixPath()}
+        visited = {self.folder_id}
+        walker = FolderWalker(self.client, fields=MIRROR_FIELDS, jobs=self.jobs)
+        for folder_id, children in walker.listings(self.folder_id):
+            directory = directories.pop(folder_id)
+            (self.destination / directory).mkdir(parents=True, exist_ok=True)
+            taken = {STATE_FILE_NAME.lower()}
+            for child in sorted(children, key=_sort_key):
+                if child.id in visited:
+                    continue
+                visited.add(child.id)
+                if child.mime_type == FOLDER_MIME_TYPE:
+                    name = _unique_name(sanitize_filename(child.name), "", taken)
+                    directories[child.id] = directory / name
+                elif child.mime_type in EXPORTABLE_MIME_TYPES:
+                    extension = self.client._get_file_extension_for_format(
+                        self.client._get_default_format_for_mime_type(child.mime_type)
+                    )
+                    name = _unique_name(
+                        sanitize_filename(child.name), f".{extension}", taken
+                    )
+                    yield child, str(directory / name)
+                elif child.mime_type.startswith("application/vnd.google-apps."):
+                    summary["unsupported"] += 1
+                else:
+                    stem, extension = os.path.splitext(sanitize_filename(child.name))
+                    yield child, str(directory / _unique_name(stem, extension, taken))
+
+    def _transfer(
+        self,
+        transfers: List[Tuple[DriveFile, Dict[str, Any], Optional[Dict[str, Any]]]],
+        current: Dict[str, Dict[str, Any]],
+        summary: Dict[str, Any],
+    ) -> None:
+        """Download or export files through a bounded worker pool."""
+        if not transfers:
+            return
+
+        # Load credentials once, before the workers start sharing them
+        self.client.get_service()
+        local = threading.local()
+
+        def transfer_one(file: DriveFile, path: str) -> str:
+            client = getattr(local, "client", None)
+            if client is None:
+                client = local.client = self.client.clone()
+            output_path = str(self.destination / path)
+            if file.mime_type in EXPORTABLE_MIME_TYPES:
+                client.export(file.id, output_path, file=file)
+                return "exported"
+            client.download(file.id, output_path, file=file)
+            return "downloaded"
+
+        with ThreadPoolExecutor(max_workers=self.jobs) as executor:
+            futures = {
+                executor.submit(transfer_one, file, entry["path"]): (entry, old)
+                for file, entry, old in transfers
+            }
+            try:
+                for future in as_completed(futures):
+                    entry, old = futures[future]
+                    try:
+                        summary[future.result()] += 1
+                    except Exception as error:
+                        summary["failed"][entry["path"]] = error
+                        continue
+                    current[entry["id"]] = entry
+                    if old is not None and old["path"] != entry["path"]:
+                        (self.destination / old["path"]).unlink(missing_ok=True)
+            except BaseException:
+                for future in futures:
+                    future.cancel()
+                raise
+
+    def _entry(self, file: DriveFile, path: str) -> Dict[str, Any]:
+        """Build the state entry recorded for a mirrored file."""
+        entry = file.to_dict(["id", "md5Checksum", "modifiedTime", "version"])
+        entry["path"] = path
+        return entry
+
+    def _unchanged(self, old: Dict[str, Any], new: Dict[str, Any]) -> bool:
+        """Whether a file's local copy, wherever it is, is still current."""
+        if not (self.destination / old["path"]).exists():
+            return False
+        if new["md5Checksum"]:
+            return old.get("md5Checksum") == new["md5Checksum"]
+        return (
+            old.get("version") == new["version"]
+            and old.get("modifiedTime") == new["modifiedTime"]
+        )
+
+    def _move(self, old_path: str, new_path: str) -> None:
+        target = self.destination / new_path
+        target.parent.mkdir(parents=True, exist_ok=True)
+        os.replace(self.destination / old_path, target)
+
+    def _load_state(self) -> Dict[str, Dict[str, Any]]:
+        """Read the entries of the files mirrored by previous runs."""
+        try:
+            state = json.loads(self.state_path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return {}
+        if state.get("folder_id") != self.folder_id:
+            raise ValueError(
+                f"{self.destination} is a mirror of folder {state.get('folder_id')}, "
+                f"not {self.folder_id}"
+            )
+        return {entry["id"]: entry for entry in state.get("files", [])}
+
+    def _save_state(self, entries: Dict[str, Dict[str, Any]]) -> None:
+        """Write the state file atomically."""
+        state = {"folder_id": self.folder_id, "files": list(entries.values())}
+        temp_file = self.state_path.with_name(
+            f"{STATE_FILE_NAME}.{uuid.uuid4().hex[:8]}.part"
+        )
+        temp_file.write_text(json.dumps(state, indent=1), encoding="utf-8")
+        os.replace(temp_file, self.state_path)
+
+
+def _sort_key(file: DriveFile) -> Tuple[str, str]:
+    return (file.name, file.id or "")
+
+
+def _unique_name(stem: str, extension: str, taken: Set[str]) -> str:
+    """Pick a name not yet used in the directory, updating ``taken``."""
+    name = f"{stem}{extension}"
+    counter = 2
+    while name.lower() in taken:
+        name = f"{stem} ({counter}){extension}"
+        counter += 1
+    taken.add(name.lower())
+    return name
@@ -0,0 +1,265 @@
+"""Evaluation of Google Drive search queries against the local index.
+
+Supports the common part of the Drive query grammar:
+
+- ``name contains 'x'``, ``name = 'x'``, ``name != 'x'``
+- ``fullText contains 'x'`` (matched against names and descriptions)
+- ``mimeType = 'x'``, ``mimeType != 'x'``, ``mimeType contains 'x'``
+- ``modifiedTime`` and ``createdTime`` with ``=``, ``!=``, ``<``, ``<=``,
+  ``>`` and ``>=`` against RFC 3339 timestamps
+- ``trashed = true``, ``trashed = false`` and ``!=``
+- ``'x' in parents`` and ``'x' in owners``
+- ``and``, ``or``, ``not`` and parentheses
+
+Queries are compiled to a parameterized SQL condition over the index tables.
+``contains`` matches any case-insensitive substring, which finds everything
+Drive's word-prefix matching would, and sometimes a little more.
+"""
+
+import re
+from datetime import datetime, timezone
+from typing import Any, List, NoReturn, Optional, Tuple
+
+from .exceptions import ValidationError
+
+_TOKEN_RE = re.compile(
+    r"""
+    (?P<space>\s+)
+    | (?P<string>'(?:[^'\\]|\\.)*'|"(?:[^"\\]|\\.)*")
+    | (?P<op>!=|<=|>=|=|<|>)
+    | (?P<paren>[()])
+    | (?P<word>[A-Za-z_][A-Za-z0-9_]*)
+    """,
+    re.VERBOSE,
+)
+
+_TIME_COLUMNS = {"modifiedTime": "modified_time", "createdTime": "created_time"}
+_COMPARISONS = {"=", "!=", "<", "<=", ">", ">="}
+
+Token = Tuple[str, str, int]
+
+
+def format_timestamp(value: Optional[datetime]) -> Optional[str]:
+    """Format a timestamp so that string order matches chronological order.
+
+    Naive timestamps are taken to be in UTC, as in Drive queries.
+
+    Args:
+        value: The timestamp.
+
+    Returns:
+        The timestamp in UTC as ISO 8601 with microseconds, or None.
+    """
+    if value is None:
+        return None
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc).isoformat(timespec="microseconds")
+
+
+def compile_query(query: str) -> Tuple[str, List[Any]]:
+    """Compile a Drive search query to a SQL condition over the index.
+
+    Args:
+        query: The Drive query string.
+
+    Returns:
+        A tuple of the SQL condition, usable in a ``WHERE`` clause over the
+        ``files`` table, and the values for its placeholders.
+
+    Raises:
+        ValidationError: If the query is malformed or uses unsupported terms.
+    """
+    parser = _Parser(_tokenize(query))
+    sql, params = parser.parse_or()
+    if not parser.at_end():
+        parser.fail("Unexpected")
+    return sql, params
+
+
+def _tokenize(query: str) -> List[Token]:
+    tokens = []
+    position = 0
+    while position < len(query):
+        match = _TOKEN_RE.match(query, position)
+        if match is None:
+            raise ValidationError(
+                f"Invalid query: unexpected character {query[position]!r} "
+                f"at position {position}"
+            )
+        if match.lastgroup != "space":
+            tokens.append((match.lastgroup, match.group(), position))
+        position = match.end()
+    return tokens
+
+
+def _unquote(token: str) -> str:
+    return re.sub(r"\\(.)", r"\1", token[1:-1])
+
+
+def _like_pattern(value: str) -> str:
+    escaped = value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    return f"%{escaped}%"
+
+
+class _Parser:
+    """Recursive descent parser producing SQL as it goes."""
+
+    def __init__(self, tokens: List[Token]):
+        self.tokens = tokens
+        self.position = 0
+
+    def at_end(self) -> bool:
+        return self.position >= len(self.tokens)
+
+    def peek_word(self) -> Optional[str]:
+        if self.at_end():
+            return None
+        kind, text, _ = self.tokens[self.position]
+        return text.lower() if kind == "word" else None
+
+    def next(self, expected: str) -> Token:
+        if self.at_end():
+            raise ValidationError(f"Invalid query: expected {expected} at end")
+        token = self.tokens[self.position]
+        self.position += 1
+        return token
+
+    def fail(self, message: str) -> NoReturn:
+        if self.at_end():
+            raise ValidationError(f"Invalid query: {message} end of query")
+        _, text, position = self.tokens[self.position]
+        raise ValidationError(
+            f"Invalid query: {message} {text!r} at position {position}"
+        )
+
+    def parse_or(self) -> Tuple[str, List[Any]]:
+        sql, params = self.parse_and()
+        while self.peek_word() == "or":
+            self.position += 1
+            right_sql, right_params = self.parse_and()
+            sql, params = f"({sql} OR {right_sql})", params + right_params
+        return sql, params
+
+    def parse_and(self) -> Tuple[str, List[Any]]:
+        sql, params = self.parse_not()
+        while self.peek_word() == "and":
+            self.position += 1
+            right_sql, right_params = self.parse_not()
+            sql, params = f"({sql} AND {right_sql})", params + right_params
+        return sql, params
+
+    def parse_not(self) -> Tuple[str, List[Any]]:
+        if self.peek_word() == "not":
+            self.position += 1
+            sql, params = self.parse_not()
+            return f"(NOT {sql})", params
+        return self.parse_primary()
+
+    def parse_primary(self) -> Tuple[str, List[Any]]:
+        kind, text, _ = self.next("a search term")
+        if kind == "paren" and text == "(":
+            sql, params = self.parse_or()
+            kind, text, _ = self.next("')'")
+            if text != ")":
+                self.position -= 1
+                self.fail("Expected ')' before")
+            return sql, params
+        if kind == "string":
+            return self.parse_membership(_unquote(text))
+        if kind == "word":
+            return self.parse_field_term(text)
+        self.position -= 1
+        self.fail("Unexpected")
+
+    def parse_membership(self, value: str) -> Tuple[str, List[Any]]:
+        if self.peek_word() != "in":
+            self.fail("Expected 'in' before")
+        self.position += 1
+        _, collection, _ = self.next("'parents' or 'owners'")
+        if collection == "parents":
+            return (
+                "id IN (SELECT file_id FROM file_parents WHERE parent_id = ?)",
+                [value],
+            )
+        if collection == "owners":
+            return (
+                "EXISTS (SELECT 1 FROM json_each(files.owners) "
+                "WHERE json_extract(json_each.value, '$.emailAddress') = ?)",
+                [value],
+            )
+        self.position -= 1
+        self.fail("Unsupported collection")
+
+    def parse_field_term(self, field: str) -> Tuple[str, List[Any]]:
+        operator = self.parse_operator()
+
+        if field == "trashed":
+            if operator not in ("=", "!="):
+                self.fail_operator(field, operator)
+            value = self.parse_boolean()
+            return f"trashed {operator} ?", [int(value)]
+
+        value = self.parse_string()
+
+        if field in ("name", "mimeType"):
+            column = "name" if field == "name" else "mime_type"
+            if operator == "contains":
+                return f"{column} LIKE ? ESCAPE '\\'", [_like_pattern(value)]
+            if operator in ("=", "!="):
+                return f"{column} {operator} ?", [value]
+            self.fail_operator(field, operator)
+
+        if field == "fullText":
+            if operator != "contains":
+                self.fail_operator(field, operator)
+            pattern = _like_pattern(value)
+            return (
+                "(name LIKE ? ESCAPE '\\' "
+                "OR COALESCE(description, '') LIKE ? ESCAPE '\\')",
+                [pattern, pattern],
+            )
+
+        if field in _TIME_COLUMNS:
+            if operator not in _COMPARISONS:
+                self.fail_operator(field, operator)
+            try:
+                timestamp = datetime.fromisoformat(value)
+            except ValueError:
+                raise ValidationError(
+                    f"Invalid query: {value!r} is not an RFC 3339 timestamp"
+                ) from None
+            return (
+                f"{_TIME_COLUMNS[field]} {operator} ?",
+                [format_timestamp(timestamp)],
+            )
+
+        raise ValidationError(f"Invalid query: unsupported field {field!r}")
+
+    def parse_operator(self) -> str:
+        kind, text, _ = self.next("an operator")
+        if kind == "op":
+            return text
+        if kind == "word" and text.lower() == "contains":
+            return "contains"
+        self.position -= 1
+        self.fail("Expected an operator before")
+
+    def parse_string(self) -> str:
+        kind, text, _ = self.next("a quoted value")
+        if kind != "string":
+            self.position -= 1
+            self.fail("Expected a quoted value before")
+        return _unquote(text)
+
+    def parse_boolean(self) -> bool:
+        kind, text, _ = self.next("true or false")
+        if kind == "word" and text.lower() in ("true", "false"):
+            return text.lower() == "true"
+        self.position -= 1
+        self.fail("Expected true or false before")
+
+    def fail_operator(self, field: str, operator: str) -> NoReturn:
+        raise ValidationError(
+            f"Invalid query: operator {operator!r} is not supported for {field!r}"
+        )
@@ -0,0 +1,154 @@
+"""Wall-clock timing of the phases of a command, for ``zenodotos --timings``.
+
+Code doing notable work wraps it in ``phase``: loading configuration,
+authorizing, building the Drive service, parsing API responses and
+formatting output. Drive API requests are timed through the client's
+request hooks. Phases are free when timing is disabled, which is the default.
+
+Time is attributed to the innermost phase only: a response parsed while a
+batch request is running counts as parsing, not as the request, so the
+phases of a thread add up to at most the time it ran.
+
+This module only uses the standard library and is imported before anything
+else in the package, so that the import phase covers the rest of it.
+"""
+
+import threading
+import time
+from contextlib import nullcontext
+from typing import Dict, List, Optional
+
+# When the package started being imported
+IMPORT_STARTED = time.perf_counter()
+
+# The timings being recorded, if any
+_timings: Optional["Timings"] = None
+
+_NO_PHASE = nullcontext()
+
+
+class Timings:
+    """Time and number of occurrences of each phase of a command."""
+
+    def __init__(self, started: Optional[float] = None):
+        """Initialize the timings.
+
+        Args:
+            started: When the command started, as a ``time.perf_counter``
+                value. Defaults to now.
+        """
+        self.started = time.perf_counter() if started is None else started
+        self._phases: Dict[str, List[float]] = {}
+        self._threads = set()
+        self._local = threading.local()
+        self._lock = threading.Lock()
+
+    def add(self, name: str, seconds: float) -> None:
+        """Add one occurrence of a phase."""
+        with self._lock:
+            totals = self._phases.setdefault(name, [0.0, 0])
+            totals[0] += seconds
+            totals[1] += 1
+            self._threads.add(threading.get_ident())
+
+    def start(self, name: str) -> None:
+        """Start a phase in the current thread, pausing the enclosing one."""
+        stack = self._stack()
+        stack.append([name, time.perf_counter(), 0.0])
+
+    def stop(self) -> None:
+        """Stop the current thread's innermost phase."""
+        stack = self._stack()
+        name, started, nested = stack.pop()
+        elapsed = time.perf_counter() - started
+        if stack:
+            stack[-1][2] += elapsed
+        self.add(name, elapsed - nested)
+
+    def phases(self) -> Dict[str, Dict[str, float]]:
+        """Get the time and count of each phase, in the order first seen."""
+        with self._lock:
+            return {
+                name: {"seconds": seconds, "count": count}
+                for name, (seconds, count) in self._phases.items()
+            }
+
+    def report(self) -> str:
+        """Format the phases as a table, with the time left unaccounted for."""
+        total = time.perf_counter() - self.started
+        phases = self.phases()
+        width = max([len(name) for name in phases] + [len("other")])
+        lines = ["Timings (seconds):"]
+        for name, phase in phases.items():
+            count = f"{phase['count']:,}x"
+            lines.append(f"  {name:<{width}}  {count:>8}  {phase['seconds']:9.3f}")
+        accounted = sum(phase["seconds"] for phase in phases.values())
+        if len(self._threads) > 1:
+            lines.append(
+                "  (phases of worker threads overlap, so they can add up to "
+                "more than the total)"
+            )
+        elif total > accounted:
+            lines.append(f"  {'other':<{width}}  {'':>8}  {total - accounted:9.3f}")
+        lines.append(f"  {'total':<{width}}  {'':>8}  {total:9.3f}")
+        return "\n".join(lines)
+
+    def _stack(self) -> list:
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+
+class _Phase:
+    __slots__ = ("timings", "name")
+
+    def __init__(self, timings: Timings, name: str):
+        self.timings = timings
+        self.name = name
+
+    def __enter__(self):
+        self.timings.start(self.name)
+
+    def __exit__(self, *exc_info):
+        self.timings.stop()
+
+
+def enable_timings(started: Optional[float] = None) -> Timings:
+    """Start recording the phases of the current process.
+
+    Args:
+        started: When the command started, as a ``time.perf_counter`` value.
+            Defaults to now.
+
+    Returns:
+        The new timings, also returned by ``get_timings``.
+    """
+    global _timings
+    _timings = Timings(started)
+    return _timings
+
+
+def disable_timings() -> None:
+    """Stop recording phases."""
+    global _timings
+    _timings = None
+
+
+def get_timings() -> Optional[Timings]:
+    """Get the timings being recorded, or None when timing is disabled."""
+    return _timings
+
+
+def phase(name: str):
+    """Time a block of code as a phase, when timing is enabled.
+
+    Example:
+        ```python
+        with phase("parse"):
+            files = [DriveFile.from_api_response(f) for f in rows]
+        ```
+    """
+    if _timings is None:
+        return _NO_PHASE
+    return _Phase(_timings, name)
@@ -2,6 +2,9 @@
 
 from typing import Any, List, Optional
 
+# Default number of concurrent workers for bulk operations
+DEFAULT_JOBS = 4
+
 
 class FieldParser:
     """Helper for parsing and validating field options."""
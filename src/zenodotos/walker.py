@@ -0,0 +1,142 @@
+"""Concurrent breadth-first listing of Google Drive folder trees."""
+
+import threading
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Iterator, List, Optional, Set, Tuple
+
+from .drive.client import DEFAULT_JOBS, DriveClient
+from .drive.models import DriveFile
+
+FOLDER_MIME_TYPE = "application/vnd.google-apps.folder"
+
+# Fields the walker needs to follow the tree
+WALK_FIELDS = ["id", "name", "mimeType"]
+
+# Largest page size accepted by files.list
+LIST_PAGE_SIZE = 1000
+
+
+class FolderWalker:
+    """Lists every file below a Drive folder, several folders at a time.
+
+    Folders are queued breadth first and listed by a bounded pool of worker
+    threads, each with its own Drive client, with one ``'id' in parents``
+    query per folder. Listings are handed out as soon as they complete, so
+    results stream in while deeper folders are still being listed. Files in
+    the trash are skipped.
+    """
+
+    def __init__(
+        self,
+        client: DriveClient,
+        fields: Optional[List[str]] = None,
+        jobs: int = DEFAULT_JOBS,
+    ):
+        """Initialize the walker.
+
+        Args:
+            client: The Drive client used to list folders.
+            fields: File fields to request. The fields needed to follow the
+                tree are always added. Defaults to the client's default fields.
+            jobs: Maximum number of folders listed at the same time.
+        """
+        if jobs < 1:
+            raise ValueError("jobs must be at least 1")
+        self.client = client
+        self.fields = fields and list(dict.fromkeys(WALK_FIELDS + fields))
+        self.jobs = jobs
+
+    def walk(self, folder_id: str) -> Iterator[DriveFile]:
+        """Yield every file and folder below a folder, with its path.
+
+        Each file's ``path`` is set to the names of the folders leading to
+        it, joined by slashes, ending with its own name. A folder is always
+        yielded before its contents, and the files of one folder are yielded
+        together, sorted by name.
+
+        Args:
+            folder_id: ID of the folder to walk.
+
+        Yields:
+            DriveFile objects with ``path`` set.
+
+        Raises:
+            PermissionError: If authentication fails or access is denied.
+            RuntimeError: For other API errors.
+        """
+        paths = {folder_id: ""}
+        for parent_id, children in self.listings(folder_id):
+            directory = paths.pop(parent_id)
+            for child in sorted(children, key=_sort_key):
+                child.path = f"{directory}{child.name}"
+                if child.mime_type == FOLDER_MIME_TYPE:
+                    paths.setdefault(child.id, f"{child.path}/")
+                yield child
+
+    def listings(self, folder_id: str) -> Iterator[Tuple[str, List[DriveFile]]]:
+        """Yield the contents of every folder in the tree as it is listed.
+
+        Listings are yielded in the order they complete, which is roughly
+        breadth first. A folder reachable through several parents is listed
+        only once, for the first parent whose listing is yielded.
+
+        Args:
+            folder_id: ID of the folder at the top of the tree.
+
+        Yields:
+            Tuples of a folder ID and the files directly inside it.
+        """
+        # Load credentials once, before the workers start sharing them
+        self.client.get_service()
+        local = threading.local()
+
+        def list_folder(parent_id: str) -> Tuple[str, List[DriveFile]]:
+            client = getattr(local, "client", None)
+            if client is None:
+                client = local.client = self.client.clone()
+            return parent_id, self._children(client, parent_id)
+
+        pending = deque([folder_id])
+        visited = {folder_id}
+        running: Set[Future] = set()
+        executor = ThreadPoolExecutor(max_workers=self.jobs)
+        try:
+            while pending or running:
+                while pending and len(running) < self.jobs:
+                    running.add(executor.submit(list_folder, pending.popleft()))
+                done, running = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    parent_id, children = future.result()
+                    for child in children:
+                        if (
+                            child.mime_type == FOLDER_MIME_TYPE
+                            and child.id not in visited
+                        ):
+                            visited.add(child.id)
+                            pending.append(child.id)
+                    yield parent_id, children
+        finally:
+            # Also reached when the caller stops iterating early
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def _children(self, client: DriveClient, folder_id: str) -> List[DriveFile]:
+        """List every file directly inside a folder."""
+        children: List[DriveFile] = []
+        page_token = None
+        while True:
+            result = client.list_files(
+                page_size=LIST_PAGE_SIZE,
+                page_token=page_token,
+                query=f"'{folder_id}' in parents and trashed = false",
+                fields=self.fields,
+                use_cache=False,
+            )
+            children.extend(result["files"])
+            page_token = result.get("next_page_token")
+            if not page_token:
+                return children
+
+
+def _sort_key(file: DriveFile) -> Tuple[str, str]:
+    return (file.name, file.id or "")
@@ -1,6 +1,7 @@
 """Test configuration and fixtures."""
 
 import pytest
+from unittest.mock import patch
 from zenodotos.config import Config
 from zenodotos.drive.client import DriveClient
 
@@ -15,3 +16,16 @@ def config():
 def drive_client():
     """Provide a Drive client instance."""
     return DriveClient()
+
+
+@pytest.fixture(autouse=True)
+def no_retry_sleep():
+    """Skip real backoff delays when API requests are retried."""
+    with patch("zenodotos.drive.retry.time.sleep") as mock_sleep:
+        yield mock_sleep
+
+
+@pytest.fixture(autouse=True)
+def disable_metadata_cache(monkeypatch):
+    """Keep tests from reading or writing the user's metadata cache."""
+    monkeypatch.setenv("ZENODOTOS_ENABLE_CACHE", "false")
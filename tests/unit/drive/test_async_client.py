@@ -0,0 +1,422 @@
+"""Tests for the asyncio Drive client."""
+
+import asyncio
+import subprocess
+import sys
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+
+httpx = pytest.importorskip("httpx")
+
+from zenodotos.config import Config  # noqa: E402
+from zenodotos.drive.async_client import AsyncDriveClient  # noqa: E402
+from zenodotos.drive.fake_server import FakeDriveServer, SyntheticDrive  # noqa: E402
+from zenodotos.drive.hooks import RequestHook  # noqa: E402
+from zenodotos.drive.metrics import textfile_exporter  # noqa: E402
+from zenodotos.drive.models import DriveFile  # noqa: E402
+from zenodotos.exceptions import NetworkError, RateLimitError  # noqa: E402
+
+
+class FakeCredentials:
+    """Credentials that are always valid and add a fixed bearer token."""
+
+    valid = True
+
+    def apply(self, headers):
+        headers["authorization"] = "Bearer test-token"
+
+
+@pytest.fixture(autouse=True)
+def no_async_sleep():
+    """Skip backoff delays in async retries."""
+    with patch(
+        "zenodotos.drive.async_client.asyncio.sleep", new_callable=AsyncMock
+    ) as mock_sleep:
+        yield mock_sleep
+
+
+@pytest.fixture
+def mock_auth():
+    """Patch Auth so no credentials files are touched."""
+    with patch("zenodotos.drive.async_client.Auth") as mock_auth_class:
+        auth = Mock()
+        auth.config = Config()
+        auth.get_credentials.return_value = FakeCredentials()
+        mock_auth_class.return_value = auth
+        yield auth
+
+
+def make_client(handler, **kwargs):
+    """Create a client whose requests are answered by ``handler``."""
+    return AsyncDriveClient(transport=httpx.MockTransport(handler), **kwargs)
+
+
+def error_response(status, reason="error", message="Something failed"):
+    """Build a Drive API error response."""
+    body = {
+        "error": {"code": status, "message": message, "errors": [{"reason": reason}]}
+    }
+    return httpx.Response(status, json=body)
+
+
+def test_no_google_api_client_imports():
+    """Test the async client and its hooks load no googleapiclient or httplib2."""
+    script = (
+        "import sys\n"
+        "import zenodotos.async_client, zenodotos.drive.metrics\n"
+        "print(sorted({m.split('.')[0] for m in sys.modules}))\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", script], capture_output=True, text=True, check=True
+    )
+
+    modules = result.stdout.splitlines()[-1]
+    for module in ("googleapiclient", "httplib2", "google_auth_oauthlib"):
+        assert repr(module) not in modules
+
+
+@pytest.mark.usefixtures("mock_auth")
+class TestAsyncDriveClient:
+    """Tests for AsyncDriveClient."""
+
+    def test_list_files(self):
+        """Test list_files sends the query and parses the page."""
+        requests = []
+
+        def handler(request):
+            requests.append(request)
+            return httpx.Response(
+                200,
+                json={
+                    "files": [{"id": "1", "name": "Doc", "size": "10"}],
+                    "nextPageToken": "next",
+                },
+            )
+
+        async def run():
+            async with make_client(handler) as client:
+                return await client.list_files(
+                    page_size=5, query="name contains 'x'", fields=["id", "name"]
+                )
+
+        result = asyncio.run(run())
+
+        assert result["next_page_token"] == "next"
+        assert result["files"][0].id == "1"
+        assert result["files"][0].size == 10
+        params = requests[0].url.params
+        assert requests[0].url.path == "/drive/v3/files"
+        assert params["pageSize"] == "5"
+        assert params["q"] == "name contains 'x'"
+        assert params["fields"] == "nextPageToken, files(id, name)"
+        assert "pageToken" not in params
+        assert requests[0].headers["authorization"] == "Bearer test-token"
+
+    def test_iter_files_follows_page_tokens(self):
+        """Test iter_files yields files from every page up to the limit."""
+        pages = {
+            None: {"files": [{"id": "1"}, {"id": "2"}], "nextPageToken": "p2"},
+            "p2": {"files": [{"id": "3"}, {"id": "4"}], "nextPageToken": "p3"},
+        }
+        tokens = []
+
+        def handler(request):
+            token = request.url.params.get("pageToken")
+            tokens.append(token)
+            return httpx.Response(200, json=pages[token])
+
+        async def run():
+            async with make_client(handler) as client:
+                return [f.id async for f in client.iter_files(page_size=2, limit=3)]
+
+        assert asyncio.run(run()) == ["1", "2", "3"]
+        assert tokens == [None, "p2"]
+
+    def test_get_file_not_found(self):
+        """Test get_file raises FileNotFoundError for a 404."""
+
+        async def run():
+            async with make_client(lambda request: error_response(404)) as client:
+                await client.get_file("missing")
+
+        with pytest.raises(FileNotFoundError, match="missing"):
+            asyncio.run(run())
+
+    def test_get_files_bounded_concurrency(self):
+        """Test get_files runs lookups concurrently under the semaphore."""
+        in_flight = 0
+        peak = 0
+
+        async def handler(request):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            # asyncio.sleep is patched out, so yield to the loop explicitly
+            resumed = asyncio.get_running_loop().create_future()
+            asyncio.get_running_loop().call_soon(resumed.set_result, None)
+            await resumed
+            in_flight -= 1
+            file_id = request.url.path.rsplit("/", 1)[-1]
+            if file_id == "missing":
+                return error_response(404)
+            return httpx.Response(200, json={"id": file_id, "name": file_id})
+
+        file_ids = [str(n) for n in range(50)] + ["missing"]
+
+        async def run():
+            async with make_client(handler, max_concurrency=5) as client:
+                return await client.get_files(file_ids)
+
+        results = asyncio.run(run())
+
+        assert [r.id for r in results[:50]] == file_ids[:50]
+        assert isinstance(results[50], FileNotFoundError)
+        assert 1 < peak <= 5
+
+    def test_retries_rate_limit_then_succeeds(self, no_async_sleep):
+        """Test rate limited requests are retried with the Retry-After delay."""
+        responses = [
+            httpx.Response(429, headers={"retry-after": "7"}),
+            error_response(403, reason="userRateLimitExceeded"),
+            httpx.Response(200, json={"id": "1", "name": "Doc"}),
+        ]
+
+        async def run():
+            async with make_client(lambda request: responses.pop(0)) as client:
+                return await client.get_file("1")
+
+        file = asyncio.run(run())
+
+        assert file.name == "Doc"
+        assert no_async_sleep.await_count == 2
+        assert no_async_sleep.await_args_list[0].args == (7.0,)
+
+    def test_rate_limit_exhausted(self):
+        """Test RateLimitError is raised once retries run out."""
+
+        async def run():
+            async with make_client(lambda request: httpx.Response(429)) as client:
+                await client.get_file("1")
+
+        with pytest.raises(RateLimitError):
+            asyncio.run(run())
+
+    def test_network_error_exhausted(self):
+        """Test NetworkError is raised when the connection keeps failing."""
+
+        def handler(request):
+            raise httpx.ConnectError("connection refused")
+
+        async def run():
+            async with make_client(handler) as client:
+                await client.list_files()
+
+        with pytest.raises(NetworkError, match="connection refused"):
+            asyncio.run(run())
+
+    def test_permission_denied_is_not_retried(self, no_async_sleep):
+        """Test a plain 403 raises PermissionError without retrying."""
+
+        async def run():
+            async with make_client(lambda request: error_response(403)) as client:
+                await client.list_files()
+
+        with pytest.raises(PermissionError):
+            asyncio.run(run())
+        no_async_sleep.assert_not_awaited()
+
+    def test_export_streams_to_file(self, tmp_path):
+        """Test export fetches metadata once and streams the content to disk."""
+        requests = []
+
+        def handler(request):
+            requests.append(request)
+            if request.url.path.endswith("/export"):
+                return httpx.Response(200, content=b"x" * 2500)
+            return httpx.Response(
+                200,
+                json={
+                    "name": "Report",
+                    "mimeType": "application/vnd.google-apps.document",
+                },
+            )
+
+        output = tmp_path / "report.zip"
+
+        async def run():
+            async with make_client(handler, chunk_size=1000) as client:
+                return await client.export("doc1", str(output))
+
+        assert asyncio.run(run()) == str(output)
+        assert output.read_bytes() == b"x" * 2500
+        assert len(requests) == 2
+        assert requests[0].url.params["fields"] == "name,mimeType,modifiedTime,size"
+        assert requests[1].url.params["mimeType"] == "application/zip"
+        assert list(tmp_path.iterdir()) == [output]
+
+    def test_export_with_known_file_skips_metadata(self, tmp_path, monkeypatch):
+        """Test export makes a single request when given the DriveFile."""
+        requests = []
+
+        def handler(request):
+            requests.append(request)
+            return httpx.Response(200, content=b"pdf")
+
+        file = DriveFile(id="doc1", name="Report", mime_type="application/pdf")
+
+        async def run():
+            async with make_client(handler) as client:
+                return await client.export("doc1", format="pdf", file=file)
+
+        monkeypatch.chdir(tmp_path)
+
+        assert asyncio.run(run()) == "Report.pdf"
+        assert (tmp_path / "Report.pdf").read_bytes() == b"pdf"
+        assert len(requests) == 1
+
+    def test_export_error_leaves_no_file(self, tmp_path):
+        """Test a failed export raises and leaves nothing behind."""
+        output = tmp_path / "out.pdf"
+
+        async def run():
+            async with make_client(lambda request: error_response(404)) as client:
+                await client.export("doc1", str(output), format="pdf")
+
+        with pytest.raises(FileNotFoundError):
+            asyncio.run(run())
+        assert list(tmp_path.iterdir()) == []
+
+    def test_credentials_loaded_once_for_concurrent_requests(self, mock_auth):
+        """Test concurrent requests share a single credentials load."""
+
+        def handler(request):
+            return httpx.Response(200, json={"id": "1", "name": "Doc"})
+
+        async def run():
+            async with make_client(handler) as client:
+                await client.get_files(["1", "2", "3"])
+
+        asyncio.run(run())
+
+        mock_auth.get_credentials.assert_called_once()
+
+    def test_invalid_max_concurrency(self):
+        """Test max_concurrency must be positive."""
+        with pytest.raises(ValueError, match="max_concurrency must be at least 1"):
+            AsyncDriveClient(max_concurrency=0)
+
+
+class Recorder(RequestHook):
+    """Hook keeping every event it receives."""
+
+    def __init__(self):
+        self.started = []
+        self.finished = []
+
+    def request_started(self, event):
+        self.started.append(event)
+
+    def request_finished(self, event):
+        self.finished.append(event)
+
+
+@pytest.mark.usefixtures("mock_auth")
+class TestAsyncHooks:
+    """Tests for the hooks of AsyncDriveClient."""
+
+    def test_requests_are_reported(self, tmp_path):
+        """Test lookups, listings and streamed exports reach the hooks."""
+        drive = SyntheticDrive()
+        doc_id = drive.add_file("Report", "application/vnd.google-apps.document")["id"]
+        recorder = Recorder()
+
+        async def run():
+            async with AsyncDriveClient(api_endpoint=server.url) as client:
+                client.add_hook(recorder)
+                await client.list_files()
+                file = await client.get_file(doc_id)
+                await client.export(doc_id, str(tmp_path / "report.pdf"), "pdf", file)
+
+        with FakeDriveServer(drive) as server:
+            asyncio.run(run())
+
+        assert [e.method for e in recorder.finished] == [
+            "drive.files.list",
+            "drive.files.get",
+            "drive.files.export",
+        ]
+        assert recorder.started == recorder.finished
+        assert all(e.status == 200 and e.retries == 0 for e in recorder.finished)
+        assert all(e.latency > 0 and e.bytes_received > 0 for e in recorder.finished)
+        exported = (tmp_path / "report.pdf").stat().st_size
+        assert recorder.finished[2].bytes_received == exported
+
+    def test_retries_and_errors_are_reported(self):
+        """Test retries are counted and the final error is reported."""
+        recorder = Recorder()
+
+        async def run():
+            async with make_client(lambda request: httpx.Response(429)) as client:
+                client.add_hook(recorder)
+                await client.get_file("1")
+
+        with pytest.raises(RateLimitError):
+            asyncio.run(run())
+
+        (finished,) = recorder.finished
+        assert finished.status == 429
+        assert finished.retries == 3
+        assert isinstance(finished.error, RateLimitError)
+
+    def test_failed_stream_is_reported(self, tmp_path):
+        """Test an export failing while its body is read ends with the error."""
+
+        async def body():
+            yield b"x" * 10
+            raise httpx.ReadError("connection reset")
+
+        def handler(request):
+            return httpx.Response(200, content=body())
+
+        recorder = Recorder()
+        file = DriveFile(
+            id="doc1", name="Report", mime_type="application/vnd.google-apps.document"
+        )
+
+        async def run():
+            async with make_client(handler) as client:
+                client.add_hook(recorder)
+                await client.export("doc1", str(tmp_path / "report.zip"), file=file)
+
+        with pytest.raises(httpx.ReadError):
+            asyncio.run(run())
+
+        (finished,) = recorder.finished
+        assert isinstance(finished.error, httpx.ReadError)
+        assert finished.status == 200
+
+    def test_remove_hook(self):
+        """Test a removed hook hears of no more requests."""
+        recorder = Recorder()
+
+        async def run():
+            handler = lambda request: httpx.Response(200, json={"files": []})  # noqa: E731
+            async with make_client(handler) as client:
+                client.add_hook(recorder)
+                client.remove_hook(recorder)
+                await client.list_files()
+
+        asyncio.run(run())
+
+        assert recorder.finished == []
+
+    def test_metrics_textfile_setting(self, mock_auth, tmp_path):
+        """Test the metrics_textfile setting registers the shared exporter."""
+        path = tmp_path / "drive.prom"
+        mock_auth.config.set("metrics_textfile", str(path))
+
+        client = AsyncDriveClient()
+
+        assert client.hooks == [textfile_exporter(path)]
+        asyncio.run(client.aclose())
@@ -6,8 +6,11 @@ from googleapiclient.errors import HttpError
 
 import pytest
 
-from zenodotos.drive.client import DriveClient
+from zenodotos.cache import MetadataCache
+from zenodotos.config import Config
+from zenodotos.drive.client import BATCH_SIZE_LIMIT, DriveClient
 from zenodotos.drive.models import DriveFile
+from zenodotos.exceptions import RateLimitError
 
 
 @pytest.fixture
@@ -31,6 +34,7 @@ def mock_auth(mock_credentials):
     with patch("zenodotos.drive.client.Auth") as mock_auth_class:
         mock_auth_instance = Mock()
         mock_auth_instance.get_credentials.return_value = mock_credentials
+        mock_auth_instance.config = Config()
         mock_auth_class.return_value = mock_auth_instance
         yield mock_auth_instance
 
@@ -38,7 +42,7 @@ def mock_auth(mock_credentials):
 @pytest.fixture
 def drive_client(mock_auth, mock_service):
     """Create a DriveClient instance with mocked dependencies."""
-    with patch("zenodotos.drive.client.build", return_value=mock_service):
+    with patch("zenodotos.drive.client.build_service", return_value=mock_service):
         client = DriveClient()
         client.service = mock_service
         return client
@@ -249,6 +253,337 @@ def test_get_file_error_handling(
         drive_client.get_file("123")
 
 
+class FakeBatch:
+    """Stand-in for BatchHttpRequest that runs each added request on execute."""
+
+    def __init__(self, callback):
+        self.callback = callback
+        self.requests = []
+
+    def add(self, request, request_id):
+        self.requests.append((request_id, request))
+
+    def execute(self):
+        for request_id, request in self.requests:
+            try:
+                response, exception = request.execute(), None
+            except HttpError as error:
+                response, exception = None, error
+            self.callback(request_id, response, exception)
+
+
+def _http_error(status_code):
+    resp = Mock()
+    resp.status = status_code
+    resp.reason = "Test error"
+    return HttpError(resp, b"error")
+
+
+def test_get_files_returns_results_in_input_order(drive_client, mock_service):
+    """Test get_files returns one result per ID, keeping the input order."""
+    batches = []
+
+    def new_batch(callback):
+        batches.append(FakeBatch(callback))
+        return batches[-1]
+
+    def get(fileId, fields):
+        request = Mock()
+        if fileId == "missing":
+            request.execute.side_effect = _http_error(404)
+        else:
+            request.execute.return_value = {"id": fileId, "name": f"{fileId}.txt"}
+        return request
+
+    mock_service.new_batch_http_request = Mock(side_effect=new_batch)
+    mock_service.files().get = Mock(side_effect=get)
+
+    results = drive_client.get_files(["a", "missing", "b"], fields=["id", "name"])
+
+    assert len(batches) == 1
+    assert [r.id for r in (results[0], results[2])] == ["a", "b"]
+    assert isinstance(results[1], FileNotFoundError)
+    assert "File with ID missing not found." in str(results[1])
+    mock_service.files().get.assert_any_call(fileId="a", fields="id,name")
+
+
+def test_get_files_splits_into_batches(drive_client, mock_service):
+    """Test get_files never puts more than the batch limit in one request."""
+    batches = []
+
+    def new_batch(callback):
+        batches.append(FakeBatch(callback))
+        return batches[-1]
+
+    def get(fileId, fields):
+        request = Mock()
+        request.execute.return_value = {"id": fileId}
+        return request
+
+    mock_service.new_batch_http_request = Mock(side_effect=new_batch)
+    mock_service.files().get = Mock(side_effect=get)
+
+    file_ids = [f"id{i}" for i in range(BATCH_SIZE_LIMIT * 2 + 5)]
+    results = drive_client.get_files(file_ids)
+
+    assert [len(b.requests) for b in batches] == [100, 100, 5]
+    assert [r.id for r in results] == file_ids
+
+
+@pytest.mark.parametrize(
+    "status_code,error_class,error_message",
+    [
+        (401, PermissionError, "Insufficient permissions to access Google Drive."),
+        (500, RuntimeError, "Failed to get files:"),
+    ],
+)
+def test_get_files_batch_error_handling(
+    drive_client, mock_service, status_code, error_class, error_message
+):
+    """Test get_files maps errors affecting the whole batch."""
+    batch = Mock()
+    batch.execute.side_effect = _http_error(status_code)
+    mock_service.new_batch_http_request = Mock(return_value=batch)
+
+    with pytest.raises(error_class, match=error_message):
+        drive_client.get_files(["123"])
+
+
+def test_list_files_retries_rate_limited_requests(drive_client, mock_service):
+    """Test that a 429 is retried instead of failing the listing."""
+    list_mock = Mock()
+    list_mock.execute.side_effect = [_http_error(429), {"files": [{"id": "1"}]}]
+    mock_service.files().list = Mock(return_value=list_mock)
+
+    result = drive_client.list_files()
+
+    assert [f.id for f in result["files"]] == ["1"]
+    assert list_mock.execute.call_count == 2
+
+
+def test_get_file_raises_rate_limit_error_after_retries(drive_client, mock_service):
+    """Test that persistent rate limiting surfaces as RateLimitError."""
+    drive_client.retry_policy.max_retries = 2
+    get_mock = Mock()
+    get_mock.execute.side_effect = _http_error(429)
+    mock_service.files().get = Mock(return_value=get_mock)
+
+    with pytest.raises(RateLimitError):
+        drive_client.get_file("123")
+    assert get_mock.execute.call_count == 3
+
+
+def test_get_files_retries_rate_limited_items(drive_client, mock_service):
+    """Test that rate limited lookups inside a batch are retried."""
+    batches = []
+    attempts = {}
+
+    def new_batch(callback):
+        batches.append(FakeBatch(callback))
+        return batches[-1]
+
+    def get(fileId, fields):
+        request = Mock()
+        attempts[fileId] = attempts.get(fileId, 0) + 1
+        if fileId == "busy" and attempts[fileId] == 1:
+            request.execute.side_effect = _http_error(429)
+        elif fileId == "always-busy":
+            request.execute.side_effect = _http_error(429)
+        else:
+            request.execute.return_value = {"id": fileId}
+        return request
+
+    drive_client.retry_policy.max_retries = 2
+    mock_service.new_batch_http_request = Mock(side_effect=new_batch)
+    mock_service.files().get = Mock(side_effect=get)
+
+    results = drive_client.get_files(["ok", "busy", "always-busy"])
+
+    assert results[0].id == "ok"
+    assert results[1].id == "busy"
+    assert isinstance(results[2], RateLimitError)
+    assert [len(b.requests) for b in batches] == [3, 2, 1]
+
+
+class TestMetadataCaching:
+    """Test that DriveClient answers repeated lookups from the cache."""
+
+    @pytest.fixture
+    def cached_client(self, drive_client, tmp_path):
+        drive_client.cache = MetadataCache(tmp_path / "cache.sqlite3")
+        yield drive_client
+        drive_client.cache.close()
+
+    def test_cache_follows_configuration(self, mock_auth, monkeypatch):
+        """Test that enable_cache and cache_ttl_seconds are honored."""
+        monkeypatch.setenv("ZENODOTOS_ENABLE_CACHE", "true")
+        monkeypatch.setenv("ZENODOTOS_CACHE_TTL_SECONDS", "120")
+        mock_auth.config = Config()
+
+        client = DriveClient()
+
+        assert client.cache.ttl_seconds == 120
+        assert client.cache.path == mock_auth.config.config_dir / "cache.sqlite3"
+
+    def test_cache_disabled(self, drive_client):
+        """Test that no cache is used when enable_cache is false."""
+        assert drive_client.cache is None
+
+    def test_get_file_served_from_cache(self, cached_client, mock_service):
+        """Test that a repeated get_file makes no API call."""
+        get_mock = Mock()
+        get_mock.execute.return_value = {"id": "123", "name": "test.txt"}
+        mock_service.files().get = Mock(return_value=get_mock)
+
+        first = cached_client.get_file("123")
+        second = cached_client.get_file("123")
+
+        assert first.name == second.name == "test.txt"
+        assert get_mock.execute.call_count == 1
+
+    def test_list_files_served_from_cache(self, cached_client, mock_service):
+        """Test that a repeated listing makes no API call."""
+        list_mock = Mock()
+        list_mock.execute.return_value = {
+            "files": [{"id": "1", "name": "a.txt"}],
+            "nextPageToken": "next",
+        }
+        mock_service.files().list = Mock(return_value=list_mock)
+
+        cached_client.list_files(query="name contains 'a'")
+        result = cached_client.list_files(query="name  contains 'a'")
+
+        assert [f.name for f in result["files"]] == ["a.txt"]
+        assert result["next_page_token"] == "next"
+        assert list_mock.execute.call_count == 1
+
+    def test_get_files_only_requests_cache_misses(self, cached_client, mock_service):
+        """Test that cached files are left out of batch requests."""
+        batches = []
+
+        def new_batch(callback):
+            batches.append(FakeBatch(callback))
+            return batches[-1]
+
+        def get(fileId, fields):
+            request = Mock()
+            request.execute.return_value = {"id": fileId}
+            return request
+
+        mock_service.new_batch_http_request = Mock(side_effect=new_batch)
+        mock_service.files().get = Mock(side_effect=get)
+
+        cached_client.get_files(["a", "b"])
+        results = cached_client.get_files(["b", "c", "a"])
+
+        assert [r.id for r in results] == ["b", "c", "a"]
+        assert [[i for i, _ in b.requests] for b in batches] == [["0", "1"], ["1"]]
+
+    def test_list_files_can_bypass_cache(self, cached_client, mock_service):
+        """Test that use_cache=False always calls the API and stores nothing."""
+        list_mock = Mock()
+        list_mock.execute.return_value = {"files": [{"id": "1"}]}
+        mock_service.files().list = Mock(return_value=list_mock)
+
+        cached_client.list_files(use_cache=False)
+        cached_client.list_files(use_cache=False)
+        cached_client.list_files()
+
+        assert list_mock.execute.call_count == 3
+
+    def test_get_file_can_bypass_cache(self, cached_client, mock_service):
+        """Test that use_cache=False fetches fresh metadata."""
+        get_mock = Mock()
+        get_mock.execute.return_value = {"id": "123", "name": "test.txt"}
+        mock_service.files().get = Mock(return_value=get_mock)
+
+        cached_client.get_file("123")
+        cached_client.get_file("123", use_cache=False)
+        cached_client.get_files(["123"], use_cache=False)
+
+        assert get_mock.execute.call_count == 2
+        assert mock_service.new_batch_http_request.call_count == 1
+
+    @pytest.mark.parametrize("broken", ["not_a_directory", "corrupt_database"])
+    def test_unusable_cache_falls_back_to_api(
+        self, drive_client, mock_service, tmp_path, caplog, broken
+    ):
+        """Test that a cache that cannot be opened is disabled, not fatal."""
+        if broken == "not_a_directory":
+            (tmp_path / "config").write_text("")
+            path = tmp_path / "config" / "cache.sqlite3"
+        else:
+            path = tmp_path / "cache.sqlite3"
+            path.write_bytes(b"not a database" * 100)
+        drive_client.cache = MetadataCache(path)
+        get_mock = Mock()
+        get_mock.execute.return_value = {"id": "123", "name": "test.txt"}
+        mock_service.files().get = Mock(return_value=get_mock)
+
+        first = drive_client.get_file("123")
+        second = drive_client.get_file("123")
+
+        assert first.name == second.name == "test.txt"
+        assert get_mock.execute.call_count == 2
+        assert drive_client.cache is None
+        assert "Metadata cache at" in caplog.text
+
+
+class TestChanges:
+    """Test reading the Drive change log."""
+
+    def test_get_start_page_token(self, drive_client, mock_service):
+        """Test get_start_page_token returns the token from the API."""
+        mock_service.changes().getStartPageToken().execute.return_value = {
+            "startPageToken": "42"
+        }
+
+        assert drive_client.get_start_page_token() == "42"
+
+    def test_list_changes(self, drive_client, mock_service):
+        """Test list_changes maps updates and removals."""
+        list_mock = mock_service.changes().list
+        list_mock.return_value.execute.return_value = {
+            "changes": [
+                {
+                    "fileId": "1",
+                    "removed": False,
+                    "file": {"id": "1", "name": "a.txt", "parents": ["root"]},
+                },
+                {"fileId": "2", "removed": True},
+                {"changeType": "drive", "driveId": "shared"},
+            ],
+            "newStartPageToken": "43",
+        }
+
+        result = drive_client.list_changes("42", fields=["id", "name", "parents"])
+
+        assert [c["file_id"] for c in result["changes"]] == ["1", "2"]
+        assert result["changes"][0]["file"].parents == ["root"]
+        assert result["changes"][1] == {"file_id": "2", "removed": True, "file": None}
+        assert result["next_page_token"] is None
+        assert result["new_start_page_token"] == "43"
+        list_mock.assert_called_with(
+            pageToken="42",
+            pageSize=1000,
+            includeRemoved=True,
+            spaces="drive",
+            fields="nextPageToken, newStartPageToken, "
+            "changes(fileId, removed, file(id, name, parents))",
+        )
+
+    @pytest.mark.parametrize(
+        "status,expected", [(403, PermissionError), (500, RuntimeError)]
+    )
+    def test_list_changes_errors(self, drive_client, mock_service, status, expected):
+        """Test list_changes maps API errors."""
+        drive_client.retry_policy.max_retries = 0
+        mock_service.changes().list().execute.side_effect = _http_error(status)
+
+        with pytest.raises(expected):
+            drive_client.list_changes("42")
+
+
 class TestExportFormatHandling:
     """Test export format handling methods."""
 
@@ -0,0 +1,135 @@
+"""Tests for Drive discovery document handling."""
+
+import json
+from unittest.mock import Mock, patch
+
+import pytest
+
+from zenodotos.drive import discovery
+
+
+@pytest.fixture(autouse=True)
+def reset_document_cache():
+    """Start every test without a cached discovery document."""
+    saved = discovery._document
+    discovery._document = None
+    yield
+    discovery._document = saved
+
+
+def test_load_discovery_document_parses_once():
+    """Test that the packaged document is only read and parsed once."""
+    with patch.object(
+        discovery.discovery_cache,
+        "get_static_doc",
+        wraps=discovery.discovery_cache.get_static_doc,
+    ) as get_static_doc:
+        first = discovery.load_discovery_document()
+        second = discovery.load_discovery_document()
+
+    assert first is second
+    assert first["name"] == "drive"
+    assert first["version"] == "v3"
+    get_static_doc.assert_called_once_with("drive", "v3")
+
+
+def test_load_discovery_document_missing_static_doc():
+    """Test that no document is returned when none is packaged."""
+    with patch.object(discovery.discovery_cache, "get_static_doc", return_value=None):
+        assert discovery.load_discovery_document() is None
+
+
+def test_load_discovery_document_rejects_other_versions():
+    """Test the version check on the packaged document."""
+    document = '{"name": "drive", "version": "v2", "resources": {"files": {}}}'
+    with patch.object(
+        discovery.discovery_cache, "get_static_doc", return_value=document
+    ):
+        assert discovery.load_discovery_document() is None
+
+
+def test_build_service_uses_cached_document():
+    """Test that services are built from the shared document offline."""
+    credentials = Mock()
+    with patch.object(discovery, "build_from_document") as build_from_document:
+        with patch.object(
+            discovery, "load_discovery_document", return_value={"name": "drive"}
+        ):
+            service = discovery.build_service(credentials)
+
+    build_from_document.assert_called_once_with(
+        {"name": "drive"}, credentials=credentials
+    )
+    assert service is build_from_document.return_value
+
+
+def test_build_service_falls_back_to_build():
+    """Test the fallback when no usable packaged document exists."""
+    credentials = Mock()
+    with patch.object(discovery, "build") as build:
+        with patch.object(discovery, "load_discovery_document", return_value=None):
+            service = discovery.build_service(credentials)
+
+    build.assert_called_once_with("drive", "v3", credentials=credentials)
+    assert service is build.return_value
+
+
+def test_built_services_have_drive_resources():
+    """Test that services built from the shared document are usable."""
+    from google.auth.credentials import AnonymousCredentials
+
+    service = discovery.build_service(AnonymousCredentials())
+    request = service.files().get(fileId="abc", fields="id")
+
+    assert "files/abc" in request.uri
+
+
+def test_prepared_document_is_saved_and_reused(tmp_path):
+    """Test the prepared document is saved and later loaded without preparing."""
+    first = discovery.load_discovery_document(tmp_path)
+    saved = json.loads((tmp_path / discovery.DOCUMENT_CACHE_NAME).read_text())
+
+    assert saved["format"] == discovery.DOCUMENT_CACHE_FORMAT
+    assert saved["client_version"] == discovery.CLIENT_VERSION
+    assert saved["document"] == first
+
+    discovery._document = None
+    with patch.object(discovery.discovery_cache, "get_static_doc") as get_static_doc:
+        second = discovery.load_discovery_document(tmp_path)
+
+    get_static_doc.assert_not_called()
+    assert second == first
+    assert not any(p.name.endswith(".tmp") for p in tmp_path.iterdir())
+
+
+@pytest.mark.parametrize(
+    "content",
+    [
+        "not json",
+        json.dumps({"format": 0, "client_version": discovery.CLIENT_VERSION}),
+        json.dumps(
+            {
+                "format": discovery.DOCUMENT_CACHE_FORMAT,
+                "client_version": "0.0.0",
+                "document": {"name": "drive", "version": "v3", "resources": {}},
+            }
+        ),
+    ],
+)
+def test_outdated_saved_document_is_replaced(tmp_path, content):
+    """Test a corrupt or outdated saved document is prepared again."""
+    path = tmp_path / discovery.DOCUMENT_CACHE_NAME
+    path.write_text(content)
+
+    document = discovery.load_discovery_document(tmp_path)
+
+    assert "files" in document["resources"]
+    assert json.loads(path.read_text())["document"] == document
+
+
+def test_unwritable_cache_dir_is_ignored(tmp_path):
+    """Test the document is still loaded when it cannot be saved."""
+    cache_dir = tmp_path / "file"
+    cache_dir.write_text("")
+
+    assert discovery.load_discovery_document(cache_dir)["name"] == "drive"
@@ -1,5 +1,7 @@
 """Tests for drive download functionality."""
 
+import hashlib
+
 import pytest
 from unittest.mock import Mock, patch, MagicMock
 from pathlib import Path
@@ -7,6 +9,44 @@ import tempfile
 import os
 
 from zenodotos.drive.client import DriveClient
+from zenodotos.drive.models import DriveFile
+from zenodotos.drive.retry import RetryPolicy
+from zenodotos.exceptions import ChecksumMismatchError, NetworkError
+
+SLIDES = "application/vnd.google-apps.presentation"
+
+
+class FakeMediaIoBaseDownload:
+    """Stand-in for MediaIoBaseDownload writing the mocked payload in chunks."""
+
+    instances = []
+
+    def __init__(self, fd, request, chunksize):
+        self.fd = fd
+        self.request = request
+        self.chunksize = chunksize
+        self.content = None
+        self.chunks = 0
+        FakeMediaIoBaseDownload.instances.append(self)
+
+    def next_chunk(self):
+        if self.content is None:
+            self.content = self.request.execute()
+        chunk = self.content[: self.chunksize]
+        self.content = self.content[self.chunksize :]
+        self.fd.write(chunk)
+        self.chunks += 1
+        return Mock(), not self.content
+
+
+@pytest.fixture(autouse=True)
+def fake_media_download():
+    """Replace chunked media downloads with an in-memory fake."""
+    FakeMediaIoBaseDownload.instances = []
+    with patch(
+        "zenodotos.drive.client.MediaIoBaseDownload", FakeMediaIoBaseDownload
+    ) as fake:
+        yield fake
 
 
 @pytest.fixture
@@ -50,10 +90,18 @@ class TestDriveClientDownload:
             mock_google_drive_service = MagicMock()
             mock_google_export_request = MagicMock()
             mock_google_export_request.execute.return_value = mock_google_export_content
-            mock_google_drive_service.files().export.return_value = (
+            mock_google_drive_service.files().export_media.return_value = (
                 mock_google_export_request
             )
 
+            # Mock Google's file metadata call for smart default format detection
+            mock_google_get_request = MagicMock()
+            mock_google_get_request.execute.return_value = {
+                "name": "Test Document",
+                "mimeType": "application/vnd.google-apps.document",
+            }
+            mock_google_drive_service.files().get.return_value = mock_google_get_request
+
             # Setup client with mocked Google service
             client = DriveClient()
             client.service = mock_google_drive_service
@@ -62,7 +110,7 @@ class TestDriveClientDownload:
             client.export(file_id, str(output_path))
 
             # Verify the Google API was called correctly
-            mock_google_drive_service.files().export.assert_called_once_with(
+            mock_google_drive_service.files().export_media.assert_called_once_with(
                 fileId=file_id,
                 mimeType="application/zip",  # HTML export format for Google Docs
             )
@@ -102,7 +150,7 @@ class TestDriveClientDownload:
                 # Mock Google's export request
                 mock_google_export_request = MagicMock()
                 mock_google_export_request.execute.return_value = mock_export_content
-                mock_google_drive_service.files().export.return_value = (
+                mock_google_drive_service.files().export_media.return_value = (
                     mock_google_export_request
                 )
 
@@ -119,17 +167,12 @@ class TestDriveClientDownload:
                 assert expected_path.read_bytes() == mock_export_content
                 assert result_path == str(expected_path)
 
-                # Verify Google API calls - now we call get twice: once for mimeType (smart default), once for name
-                assert mock_google_drive_service.files().get.call_count == 2
-                # First call for mimeType (smart default)
-                mock_google_drive_service.files().get.assert_any_call(
-                    fileId=file_id, fields="mimeType"
+                # Verify Google API calls - a single metadata call serves both
+                # format detection and output naming
+                mock_google_drive_service.files().get.assert_called_once_with(
+                    fileId=file_id, fields="name,mimeType,modifiedTime,size"
                 )
-                # Second call for name
-                mock_google_drive_service.files().get.assert_any_call(
-                    fileId=file_id, fields="name"
-                )
-                mock_google_drive_service.files().export.assert_called_once_with(
+                mock_google_drive_service.files().export_media.assert_called_once_with(
                     fileId=file_id, mimeType="application/zip"
                 )
 
@@ -179,7 +222,7 @@ class TestDriveClientDownload:
             "mimeType": "application/vnd.google-apps.document",
         }
         mock_google_drive_service.files().get.return_value = mock_google_get_request
-        mock_google_drive_service.files().export.side_effect = mock_http_error
+        mock_google_drive_service.files().export_media.side_effect = mock_http_error
 
         client = DriveClient()
         client.service = mock_google_drive_service
@@ -207,7 +250,7 @@ class TestDriveClientDownload:
             "mimeType": "application/vnd.google-apps.document",
         }
         mock_google_drive_service.files().get.return_value = mock_google_get_request
-        mock_google_drive_service.files().export.side_effect = mock_http_error
+        mock_google_drive_service.files().export_media.side_effect = mock_http_error
 
         client = DriveClient()
         client.service = mock_google_drive_service
@@ -226,7 +269,7 @@ class TestDriveClientDownload:
         # Mock Google's export request
         mock_google_export_request = MagicMock()
         mock_google_export_request.execute.return_value = b"exported content"
-        mock_google_drive_service.files().export.return_value = (
+        mock_google_drive_service.files().export_media.return_value = (
             mock_google_export_request
         )
 
@@ -243,7 +286,7 @@ class TestDriveClientDownload:
             result = client.export("test_id", output_path=output_path, format="pdf")
 
             # Verify the correct MIME type was used for PDF
-            mock_google_drive_service.files().export.assert_called_with(
+            mock_google_drive_service.files().export_media.assert_called_with(
                 fileId="test_id", mimeType="application/pdf"
             )
             assert result == output_path
@@ -258,7 +301,7 @@ class TestDriveClientDownload:
         # Mock Google's export request
         mock_google_export_request = MagicMock()
         mock_google_export_request.execute.return_value = b"exported content"
-        mock_google_drive_service.files().export.return_value = (
+        mock_google_drive_service.files().export_media.return_value = (
             mock_google_export_request
         )
 
@@ -277,7 +320,7 @@ class TestDriveClientDownload:
             result = client.export("test_id", output_path=output_path)
 
             # Verify HTML format was used as default for docs
-            mock_google_drive_service.files().export.assert_called_with(
+            mock_google_drive_service.files().export_media.assert_called_with(
                 fileId="test_id", mimeType="application/zip"
             )
             assert result == output_path
@@ -292,7 +335,7 @@ class TestDriveClientDownload:
         # Mock Google's export request
         mock_google_export_request = MagicMock()
         mock_google_export_request.execute.return_value = b"exported content"
-        mock_google_drive_service.files().export.return_value = (
+        mock_google_drive_service.files().export_media.return_value = (
             mock_google_export_request
         )
 
@@ -311,7 +354,7 @@ class TestDriveClientDownload:
             result = client.export("test_id", output_path=output_path)
 
             # Verify XLSX format was used as default for sheets
-            mock_google_drive_service.files().export.assert_called_with(
+            mock_google_drive_service.files().export_media.assert_called_with(
                 fileId="test_id",
                 mimeType="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
             )
@@ -327,7 +370,7 @@ class TestDriveClientDownload:
         # Mock Google's export request
         mock_google_export_request = MagicMock()
         mock_google_export_request.execute.return_value = b"exported ods content"
-        mock_google_drive_service.files().export.return_value = (
+        mock_google_drive_service.files().export_media.return_value = (
             mock_google_export_request
         )
 
@@ -344,7 +387,7 @@ class TestDriveClientDownload:
             result = client.export("test_id", output_path=output_path, format="ods")
 
             # Verify ODS format was used
-            mock_google_drive_service.files().export.assert_called_with(
+            mock_google_drive_service.files().export_media.assert_called_with(
                 fileId="test_id",
                 mimeType="application/vnd.oasis.opendocument.spreadsheet",
             )
@@ -390,20 +433,11 @@ class TestDriveClientDownload:
             ("application/pdf", "pdf"),  # Non-native file
         ],
     )
-    def test_get_smart_default_format(self, mime_type, expected_format):
+    def test_get_default_format_for_mime_type(self, mime_type, expected_format):
         """Test smart default format detection for different MIME types."""
         client = DriveClient()
 
-        # Mock the Google Drive API service
-        mock_google_drive_service = MagicMock()
-        mock_google_get_request = MagicMock()
-        mock_google_get_request.execute.return_value = {"mimeType": mime_type}
-        mock_google_drive_service.files().get.return_value = mock_google_get_request
-
-        # Setup client with mocked Google service
-        client.service = mock_google_drive_service
-
-        result = client._get_smart_default_format("test_id")
+        result = client._get_default_format_for_mime_type(mime_type)
         assert result == expected_format
 
     def test_export_google_doc_to_markdown(self):
@@ -418,7 +452,7 @@ class TestDriveClientDownload:
         mock_google_export_request.execute.return_value = (
             b"# Markdown content\n\nThis is a test document."
         )
-        mock_google_drive_service.files().export.return_value = (
+        mock_google_drive_service.files().export_media.return_value = (
             mock_google_export_request
         )
 
@@ -435,7 +469,7 @@ class TestDriveClientDownload:
             result = client.export("test_id", output_path=output_path, format="md")
 
             # Verify the correct MIME type was used for markdown
-            mock_google_drive_service.files().export.assert_called_with(
+            mock_google_drive_service.files().export_media.assert_called_with(
                 fileId="test_id", mimeType="text/markdown"
             )
             assert result == output_path
@@ -469,7 +503,7 @@ class TestDriveClientDownload:
         mock_google_export_request.execute.return_value = (
             b"Plain text content\n\nThis is a test document in plain text format."
         )
-        mock_google_drive_service.files().export.return_value = (
+        mock_google_drive_service.files().export_media.return_value = (
             mock_google_export_request
         )
 
@@ -486,7 +520,7 @@ class TestDriveClientDownload:
             result = client.export("test_id", output_path=output_path, format="txt")
 
             # Verify the correct MIME type was used for plain text
-            mock_google_drive_service.files().export.assert_called_with(
+            mock_google_drive_service.files().export_media.assert_called_with(
                 fileId="test_id", mimeType="text/plain"
             )
             assert result == output_path
@@ -521,7 +555,7 @@ class TestDriveClientDownload:
         # Mock Google's export request
         mock_google_export_request = MagicMock()
         mock_google_export_request.execute.return_value = b"EPUB content here"
-        mock_google_drive_service.files().export.return_value = (
+        mock_google_drive_service.files().export_media.return_value = (
             mock_google_export_request
         )
 
@@ -538,7 +572,7 @@ class TestDriveClientDownload:
             result = client.export("test_id", output_path=output_path, format="epub")
 
             # Verify the correct MIME type was used for EPUB
-            mock_google_drive_service.files().export.assert_called_with(
+            mock_google_drive_service.files().export_media.assert_called_with(
                 fileId="test_id", mimeType="application/epub+zip"
             )
             assert result == output_path
@@ -559,3 +593,419 @@ class TestDriveClientDownload:
         client = DriveClient()
         extension = client._get_file_extension_for_format("epub")
         assert extension == "epub"
+
+
+class TestStreamingExport:
+    """Tests for streaming exports to disk in chunks."""
+
+    def test_export_streams_content_in_chunks(self, tmp_path):
+        """Test that export writes the document chunk by chunk."""
+        content = b"0123456789" * 10
+        mock_service = MagicMock()
+        mock_service.files().export_media.return_value.execute.return_value = content
+
+        client = DriveClient(chunk_size=16)
+        client.service = mock_service
+
+        output_path = tmp_path / "report.pdf"
+        client.export("test_id", output_path=str(output_path), format="pdf")
+
+        assert output_path.read_bytes() == content
+        downloader = FakeMediaIoBaseDownload.instances[0]
+        assert downloader.chunksize == 16
+        assert downloader.chunks == 7
+
+    def test_export_leaves_no_partial_file_on_failure(self, tmp_path):
+        """Test that an interrupted export does not leave files behind."""
+        from googleapiclient.errors import HttpError
+
+        mock_error_response = Mock()
+        mock_error_response.status = 500
+        mock_service = MagicMock()
+        mock_service.files().export_media.return_value.execute.side_effect = HttpError(
+            mock_error_response, b"Internal server error"
+        )
+
+        client = DriveClient()
+        client.service = mock_service
+
+        output_path = tmp_path / "report.pdf"
+        output_path.write_bytes(b"previous export")
+        with pytest.raises(RuntimeError, match="Failed to export file"):
+            client.export("test_id", output_path=str(output_path), format="pdf")
+
+        assert output_path.read_bytes() == b"previous export"
+        assert list(tmp_path.iterdir()) == [output_path]
+
+
+class FakeMediaHttp:
+    """Serves byte ranges of a payload the way Drive answers media requests."""
+
+    def __init__(self, content, status=None, fail_after=None):
+        self.content = content
+        self.status = status
+        self.fail_after = fail_after
+        self.ranges = []
+
+    def request(self, uri, method, headers):
+        import httplib2
+
+        if self.fail_after is not None and len(self.ranges) >= self.fail_after:
+            raise ConnectionError("connection reset")
+        start, end = (int(n) for n in headers["range"][6:].split("-"))
+        self.ranges.append((start, end))
+        total = len(self.content)
+        if self.status is not None:
+            return httplib2.Response({"status": self.status}), b"error"
+        if start >= total:
+            return httplib2.Response(
+                {"status": 416, "content-range": f"bytes */{total}"}
+            ), b""
+        chunk = self.content[start : end + 1]
+        return httplib2.Response(
+            {
+                "status": 206,
+                "content-range": f"bytes {start}-{start + len(chunk) - 1}/{total}",
+            }
+        ), chunk
+
+
+class TestBinaryDownload:
+    """Tests for resumable downloads of binary files."""
+
+    content = bytes(range(100))
+    md5 = hashlib.md5(content).hexdigest()
+
+    def make_client(self, http, chunk_size=16):
+        client = DriveClient(chunk_size=chunk_size)
+        client.retry_policy = RetryPolicy(max_retries=0)
+        client.service = MagicMock()
+        media_request = client.service.files().get_media.return_value
+        media_request.http = http
+        media_request.uri = "https://drive/files/file_id?alt=media"
+        media_request.headers = {"accept-encoding": "gzip"}
+        return client
+
+    def pdf(self, md5_checksum=None):
+        return DriveFile(
+            id="file_id",
+            name="scan.pdf",
+            mime_type="application/pdf",
+            md5_checksum=md5_checksum or self.md5,
+        )
+
+    def partial(self, tmp_path, md5_checksum=None):
+        return tmp_path / f".scan.pdf.{md5_checksum or self.md5}.part"
+
+    def test_download_in_ranges(self, tmp_path):
+        """Test the content is fetched one chunk-sized range at a time."""
+        http = FakeMediaHttp(self.content)
+        client = self.make_client(http)
+        output_path = tmp_path / "scan.pdf"
+
+        result = client.download("file_id", str(output_path), file=self.pdf())
+
+        assert result == str(output_path)
+        assert output_path.read_bytes() == self.content
+        assert http.ranges == [(n, n + 15) for n in range(0, 100, 16)]
+        assert list(tmp_path.iterdir()) == [output_path]
+
+    def test_interrupted_download_resumes(self, tmp_path):
+        """Test a second attempt continues from the bytes already received."""
+        output_path = tmp_path / "scan.pdf"
+        client = self.make_client(FakeMediaHttp(self.content, fail_after=2))
+
+        with pytest.raises(NetworkError):
+            client.download("file_id", str(output_path), file=self.pdf())
+        assert self.partial(tmp_path).read_bytes() == self.content[:32]
+
+        http = FakeMediaHttp(self.content)
+        client = self.make_client(http)
+        client.download("file_id", str(output_path), file=self.pdf())
+
+        assert output_path.read_bytes() == self.content
+        assert http.ranges[0] == (32, 47)
+        assert list(tmp_path.iterdir()) == [output_path]
+
+    def test_stale_partial_files_are_removed(self, tmp_path):
+        """Test partial files left for older content are deleted."""
+        stale = self.partial(tmp_path, "0" * 32)
+        stale.write_bytes(b"old content")
+        unrelated = tmp_path / ".scan.pdf.1234abcd.part"
+        unrelated.write_bytes(b"an export in progress")
+        output_path = tmp_path / "scan.pdf"
+
+        self.make_client(FakeMediaHttp(self.content)).download(
+            "file_id", str(output_path), file=self.pdf()
+        )
+
+        assert sorted(tmp_path.iterdir()) == sorted([output_path, unrelated])
+
+    def test_complete_partial_file_is_verified(self, tmp_path):
+        """Test a partial file holding all the content is finished with one request."""
+        self.partial(tmp_path).write_bytes(self.content)
+        http = FakeMediaHttp(self.content)
+
+        self.make_client(http).download(
+            "file_id", str(tmp_path / "scan.pdf"), file=self.pdf()
+        )
+
+        assert (tmp_path / "scan.pdf").read_bytes() == self.content
+        assert http.ranges == [(100, 115)]
+
+    def test_empty_file(self, tmp_path):
+        """Test an empty file completes on the unsatisfiable first range."""
+        empty_md5 = hashlib.md5(b"").hexdigest()
+
+        self.make_client(FakeMediaHttp(b"")).download(
+            "file_id", str(tmp_path / "scan.pdf"), file=self.pdf(empty_md5)
+        )
+
+        assert (tmp_path / "scan.pdf").read_bytes() == b""
+
+    def test_whole_content_response_replaces_partial(self, tmp_path):
+        """Test a response ignoring the range restarts the partial file."""
+        import httplib2
+
+        self.partial(tmp_path).write_bytes(b"stale")
+        http = Mock()
+        http.request.return_value = (httplib2.Response({"status": 200}), self.content)
+
+        self.make_client(http).download(
+            "file_id", str(tmp_path / "scan.pdf"), file=self.pdf()
+        )
+
+        assert (tmp_path / "scan.pdf").read_bytes() == self.content
+
+    def test_checksum_mismatch(self, tmp_path):
+        """Test corrupted content is rejected and discarded."""
+        client = self.make_client(FakeMediaHttp(self.content))
+
+        with pytest.raises(ChecksumMismatchError, match="expected 0{32}"):
+            client.download(
+                "file_id", str(tmp_path / "scan.pdf"), file=self.pdf("0" * 32)
+            )
+
+        assert list(tmp_path.iterdir()) == []
+
+    def test_download_fetches_metadata(self, tmp_path, monkeypatch):
+        """Test the file name and checksum are fetched when not given."""
+        client = self.make_client(FakeMediaHttp(self.content))
+        client.service.files().get.return_value.execute.return_value = {
+            "name": "scans/may.pdf",
+            "mimeType": "application/pdf",
+            "md5Checksum": self.md5,
+        }
+        monkeypatch.chdir(tmp_path)
+
+        assert client.download("file_id") == "scans_may.pdf"
+
+        assert (tmp_path / "scans_may.pdf").read_bytes() == self.content
+        client.service.files().get.assert_called_with(
+            fileId="file_id", fields="name,mimeType,size,md5Checksum"
+        )
+
+    def test_download_without_checksum(self, tmp_path):
+        """Test files without a checksum are streamed without resuming."""
+        client = self.make_client(FakeMediaHttp(self.content))
+        client.service.files().get_media.return_value.execute.return_value = b"data"
+        file = DriveFile(id="file_id", name="scan.pdf", mime_type="application/pdf")
+
+        client.download("file_id", str(tmp_path / "scan.pdf"), file=file)
+
+        assert (tmp_path / "scan.pdf").read_bytes() == b"data"
+
+    def test_download_rejects_workspace_documents(self, tmp_path):
+        """Test Google Workspace documents must be exported instead."""
+        client = self.make_client(FakeMediaHttp(self.content))
+        file = DriveFile(
+            id="file_id", name="Notes", mime_type="application/vnd.google-apps.document"
+        )
+
+        with pytest.raises(ValueError, match="export it instead"):
+            client.download("file_id", str(tmp_path / "notes"), file=file)
+
+    @pytest.mark.parametrize(
+        "status, error, message",
+        [
+            (404, FileNotFoundError, "File with ID file_id not found"),
+            (403, PermissionError, "Insufficient permissions to download"),
+            (500, RuntimeError, "Failed to download file"),
+        ],
+    )
+    def test_download_errors(self, tmp_path, status, error, message):
+        """Test that API errors are mapped to library exceptions."""
+        client = self.make_client(FakeMediaHttp(self.content, status=status))
+
+        with pytest.raises(error, match=message):
+            client.download("file_id", str(tmp_path / "scan.pdf"), file=self.pdf())
+        assert list(tmp_path.iterdir()) == []
+
+
+class TestExportMany:
+    """Tests for bulk exports through the worker pool."""
+
+    def test_export_many_picks_unique_names(self, tmp_path):
+        """Test that files sharing a name get distinct output paths."""
+        from zenodotos.drive.models import DriveFile
+
+        mock_service = MagicMock()
+        mock_service.files().export_media.return_value.execute.return_value = b"pdf"
+
+        client = DriveClient()
+        client.service = mock_service
+        files = [
+            DriveFile(id="a", name="Report", mime_type=SLIDES),
+            DriveFile(id="b", name="report", mime_type=SLIDES),
+            DriveFile(id="c", name="Notes/2024", mime_type=SLIDES),
+        ]
+
+        with patch.object(client, "clone", return_value=client):
+            summary = client.export_many(files, output_dir=str(tmp_path), jobs=2)
+
+        assert summary["failed"] == {}
+        assert summary["exported"] == {
+            "a": str(tmp_path / "Report.pdf"),
+            "b": str(tmp_path / "report (2).pdf"),
+            "c": str(tmp_path / "Notes_2024.pdf"),
+        }
+        assert (tmp_path / "report (2).pdf").read_bytes() == b"pdf"
+
+    def test_export_many_reports_failures(self, tmp_path):
+        """Test that one failed export does not stop the others."""
+        from googleapiclient.errors import HttpError
+        from zenodotos.drive.models import DriveFile
+
+        mock_error_response = Mock()
+        mock_error_response.status = 404
+
+        def export_media(fileId, mimeType):
+            request = MagicMock()
+            if fileId == "missing":
+                request.execute.side_effect = HttpError(mock_error_response, b"")
+            else:
+                request.execute.return_value = b"content"
+            return request
+
+        mock_service = MagicMock()
+        mock_service.files().export_media.side_effect = export_media
+
+        client = DriveClient()
+        client.service = mock_service
+        files = [
+            DriveFile(id="ok", name="Doc", mime_type=SLIDES),
+            DriveFile(id="missing", name="Gone", mime_type=SLIDES),
+        ]
+
+        with patch.object(client, "clone", return_value=client):
+            summary = client.export_many(
+                files, output_dir=str(tmp_path), format="pdf", jobs=2
+            )
+
+        assert list(summary["exported"]) == ["ok"]
+        assert isinstance(summary["failed"]["missing"], FileNotFoundError)
+
+    def test_export_many_uses_one_client_per_thread(self, tmp_path):
+        """Test that workers never share a Drive service object."""
+        from zenodotos.drive.models import DriveFile
+
+        client = DriveClient()
+        client.service = MagicMock()
+        clones = []
+
+        def clone():
+            worker = Mock()
+            worker.export.side_effect = lambda file_id, path, fmt, file: path
+            clones.append(worker)
+            return worker
+
+        files = [
+            DriveFile(id=str(i), name=f"Doc {i}", mime_type=SLIDES) for i in range(6)
+        ]
+        with patch.object(client, "clone", side_effect=clone):
+            summary = client.export_many(files, output_dir=str(tmp_path), jobs=3)
+
+        assert len(summary["exported"]) == 6
+        assert 1 <= len(clones) <= 3
+        assert sum(worker.export.call_count for worker in clones) == 6
+
+    def test_export_many_rejects_binary_files(self, tmp_path):
+        """Test that files which are not documents are never sent to export."""
+        from zenodotos.drive.models import DriveFile
+
+        client = DriveClient()
+        client.service = MagicMock()
+        worker = Mock()
+        worker.export.side_effect = lambda file_id, path, fmt, file: path
+        files = [
+            DriveFile(id="doc", name="Slides", mime_type=SLIDES),
+            DriveFile(id="pdf", name="Scan.pdf", mime_type="application/pdf"),
+            DriveFile(
+                id="form", name="Survey", mime_type="application/vnd.google-apps.form"
+            ),
+        ]
+
+        with patch.object(client, "clone", return_value=worker):
+            summary = client.export_many(files, output_dir=str(tmp_path))
+
+        assert list(summary["exported"]) == ["doc"]
+        assert set(summary["failed"]) == {"pdf", "form"}
+        assert isinstance(summary["failed"]["pdf"], ValueError)
+        assert "download it instead" in str(summary["failed"]["pdf"])
+        assert [c.args[0] for c in worker.export.call_args_list] == ["doc"]
+
+    def test_export_many_rejects_invalid_jobs(self):
+        """Test that the worker count must be positive."""
+        client = DriveClient()
+        with pytest.raises(ValueError, match="jobs must be at least 1"):
+            client.export_many([], jobs=0)
+
+    def test_clone_has_its_own_service(self):
+        """Test that a clone shares credentials but not the service object."""
+        client = DriveClient()
+        client.service = MagicMock()
+
+        clone = client.clone()
+
+        assert clone.auth is client.auth
+        assert clone.service is None
+
+
+class TestExportMetadata:
+    """Tests for the metadata requests made by export."""
+
+    def test_export_with_drive_file_skips_metadata_call(self, tmp_path):
+        """Test that a known DriveFile provides the name and MIME type."""
+        from zenodotos.drive.models import DriveFile
+
+        mock_service = MagicMock()
+        mock_service.files().export_media.return_value.execute.return_value = b"x"
+        client = DriveClient()
+        client.service = mock_service
+
+        file = DriveFile(
+            id="sheet_id",
+            name="Budget",
+            mime_type="application/vnd.google-apps.spreadsheet",
+        )
+        original_cwd = os.getcwd()
+        os.chdir(tmp_path)
+        try:
+            result = client.export("sheet_id", file=file)
+        finally:
+            os.chdir(original_cwd)
+
+        assert result == "Budget.xlsx"
+        assert (tmp_path / "Budget.xlsx").read_bytes() == b"x"
+        mock_service.files().get.assert_not_called()
+
+    def test_export_with_path_and_format_skips_metadata_call(self, tmp_path):
+        """Test that no metadata is needed when path and format are known."""
+        mock_service = MagicMock()
+        mock_service.files().export_media.return_value.execute.return_value = b"x"
+        client = DriveClient()
+        client.service = mock_service
+
+        client.export("doc_id", output_path=str(tmp_path / "doc.pdf"), format="pdf")
+
+        mock_service.files().get.assert_not_called()
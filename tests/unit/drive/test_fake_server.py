@@ -0,0 +1,214 @@
+"""Tests for the local fake Drive API server."""
+
+import asyncio
+import hashlib
+
+import pytest
+
+from zenodotos.drive.async_client import AsyncDriveClient
+from zenodotos.drive.client import DriveClient
+from zenodotos.drive.fake_server import (
+    FOLDER_MIME_TYPE,
+    FakeDriveServer,
+    SyntheticDrive,
+    parse_fields,
+    select_fields,
+)
+from zenodotos.walker import FolderWalker
+
+DOC = "application/vnd.google-apps.document"
+
+
+@pytest.fixture
+def drive():
+    """Create a small drive with known files."""
+    drive = SyntheticDrive()
+    folder = drive.add_file("Reports", FOLDER_MIME_TYPE)["id"]
+    drive.add_file("Summary", DOC, folder)
+    drive.add_file("data.bin", "application/octet-stream", folder, b"0123456789")
+    return drive
+
+
+@pytest.fixture
+def server(drive):
+    """Serve the drive."""
+    with FakeDriveServer(drive) as server:
+        yield server
+
+
+@pytest.fixture
+def client(server):
+    """Create a Drive client pointed at the server."""
+    return DriveClient(api_endpoint=server.url)
+
+
+def file_id(drive, name):
+    return next(i for i in drive.file_ids() if drive.get(i)["name"] == name)
+
+
+class TestSyntheticDrive:
+    """Tests for SyntheticDrive."""
+
+    def test_generate_is_deterministic(self):
+        """Test the same seed generates the same drive."""
+        first = SyntheticDrive.generate(100, seed=3)
+        second = SyntheticDrive.generate(100, seed=3)
+
+        assert len(first.file_ids()) == 101
+        assert [first.get(i) for i in first.file_ids()] == [
+            second.get(i) for i in second.file_ids()
+        ]
+
+    def test_binary_files_have_checksums(self):
+        """Test generated binaries carry a matching size and md5Checksum."""
+        drive = SyntheticDrive.generate(20)
+        pdf = next(
+            i for i in drive.file_ids() if drive.get(i)["mimeType"] == "application/pdf"
+        )
+        content = drive.content(pdf)
+
+        assert drive.get(pdf)["size"] == str(len(content))
+        assert drive.get(pdf)["md5Checksum"] == hashlib.md5(content).hexdigest()
+
+    @pytest.mark.parametrize(
+        "fields, expected",
+        [
+            ("id,name", {"id": "a", "name": "n"}),
+            ("files(id)", {"files": [{"id": "a"}, {"id": "b"}]}),
+            (
+                "files/owners(emailAddress)",
+                {"files": [{"owners": [{"emailAddress": "x"}]}, {}]},
+            ),
+            ("*", None),
+        ],
+    )
+    def test_select_fields(self, fields, expected):
+        """Test partial response selectors."""
+        value = {
+            "id": "a",
+            "name": "n",
+            "files": [
+                {"id": "a", "owners": [{"emailAddress": "x", "displayName": "X"}]},
+                {"id": "b"},
+            ],
+        }
+        result = select_fields(value, parse_fields(fields))
+
+        assert result == (expected if expected is not None else value)
+
+
+class TestFakeDriveServer:
+    """Tests for FakeDriveServer through DriveClient."""
+
+    def test_list_files_with_query_and_paging(self, client, drive):
+        """Test queries are evaluated and results paged."""
+        folder = file_id(drive, "Reports")
+        query = f"'{folder}' in parents and trashed = false"
+
+        first = client.list_files(page_size=1, query=query, use_cache=False)
+        second = client.list_files(
+            page_size=1, page_token=first["next_page_token"], query=query
+        )
+
+        assert [f.name for f in first["files"]] == ["data.bin"]
+        assert [f.name for f in second["files"]] == ["Summary"]
+        assert second["next_page_token"] is None
+
+    def test_list_files_sees_changes(self, client, drive):
+        """Test files changed after a listing show up in the next one."""
+        client.list_files()
+        drive.update_file(file_id(drive, "Summary"), name="Final summary")
+
+        result = client.list_files(query="name contains 'final'")
+
+        assert [f.name for f in result["files"]] == ["Final summary"]
+
+    def test_get_file_and_batch(self, client, drive):
+        """Test single and batched lookups, including a missing file."""
+        summary = file_id(drive, "Summary")
+
+        assert client.get_file(summary).name == "Summary"
+        results = client.get_files([summary, "missing"], fields=["id", "name"])
+        assert results[0].name == "Summary"
+        assert isinstance(results[1], FileNotFoundError)
+
+    def test_download_with_ranges(self, client, drive, tmp_path):
+        """Test a checksum-verified download in several ranges."""
+        client.chunk_size = 4
+        output = tmp_path / "data.bin"
+
+        client.download(file_id(drive, "data.bin"), str(output))
+
+        assert output.read_bytes() == b"0123456789"
+
+    def test_export(self, client, drive, tmp_path):
+        """Test documents export and binaries cannot be exported."""
+        output = client.export(file_id(drive, "Summary"), str(tmp_path / "out"))
+
+        assert b"exported as application/zip" in open(output, "rb").read()
+        with pytest.raises(PermissionError):
+            client.export(
+                file_id(drive, "data.bin"), str(tmp_path / "bin"), format="pdf"
+            )
+
+    def test_changes(self, client, drive):
+        """Test the change log reports updates and removals."""
+        token = client.get_start_page_token()
+        drive.update_file(file_id(drive, "Summary"), name="Renamed")
+        drive.delete_file(file_id(drive, "data.bin"))
+
+        result = client.list_changes(token, fields=["id", "name"])
+
+        assert [
+            (c["removed"], c["file"] and c["file"].name) for c in result["changes"]
+        ] == [
+            (False, "Renamed"),
+            (True, None),
+        ]
+        assert result["new_start_page_token"] == client.get_start_page_token()
+
+    def test_walk(self):
+        """Test a generated tree is walked completely."""
+        with FakeDriveServer(size=200) as server:
+            client = DriveClient(api_endpoint=server.url)
+            corpus = server.drive.file_ids()[0]
+
+            files = list(FolderWalker(client, jobs=2).walk(corpus))
+
+        assert len(files) == 200
+
+    def test_injected_errors_are_retried(self, drive, no_retry_sleep):
+        """Test injected server errors are retried by the client."""
+        with FakeDriveServer(drive, error_rate=0.5, error_statuses=[503]) as server:
+            client = DriveClient(api_endpoint=server.url)
+            for _ in range(5):
+                assert len(client.list_files()["files"]) == 3
+
+        assert no_retry_sleep.called
+        assert server.request_count > 5
+
+    def test_async_client(self, server, drive):
+        """Test AsyncDriveClient also talks to the server unauthorized."""
+
+        async def fetch():
+            async with AsyncDriveClient(api_endpoint=server.url) as client:
+                return await client.get_file(file_id(drive, "Summary"))
+
+        assert asyncio.run(fetch()).name == "Summary"
+
+    def test_api_endpoint_setting(self, monkeypatch, server):
+        """Test the environment variable points the client at the server."""
+        monkeypatch.setenv("ZENODOTOS_API_ENDPOINT", server.url)
+
+        client = DriveClient()
+
+        assert client.api_endpoint == server.url
+        assert len(client.list_files()["files"]) == 3
+
+    @pytest.mark.parametrize(
+        "kwargs", [{"latency": -1}, {"jitter": -0.5}, {"error_rate": 1.5}]
+    )
+    def test_invalid_settings(self, drive, kwargs):
+        """Test invalid latency and error settings are rejected."""
+        with pytest.raises(ValueError):
+            FakeDriveServer(drive, **kwargs)
@@ -0,0 +1,204 @@
+"""Tests for request hooks and metrics collectors."""
+
+import pytest
+
+from zenodotos.drive.client import DriveClient
+from zenodotos.drive.fake_server import FakeDriveServer, SyntheticDrive
+from zenodotos.drive.hooks import RequestEvent, RequestHook
+from zenodotos.drive.metrics import (
+    LatencyHistogram,
+    PrometheusTextfileExporter,
+    textfile_exporter,
+)
+
+
+class Recorder(RequestHook):
+    """Hook keeping every event it receives."""
+
+    def __init__(self):
+        self.started = []
+        self.finished = []
+
+    def request_started(self, event):
+        assert event.latency is None
+        self.started.append(event)
+
+    def request_finished(self, event):
+        self.finished.append(event)
+
+
+@pytest.fixture
+def drive():
+    """Create a drive with one binary file."""
+    drive = SyntheticDrive()
+    drive.add_file("data.bin", "application/octet-stream", content=b"x" * 10)
+    return drive
+
+
+def event(method="drive.files.get", latency=0.1, status=200, **kwargs):
+    return RequestEvent(
+        method=method, start_time=0.0, latency=latency, status=status, **kwargs
+    )
+
+
+class TestHooks:
+    """Tests for the hooks of DriveClient."""
+
+    def test_requests_are_reported(self, drive, tmp_path):
+        """Test metadata, batch and media requests all reach the hooks."""
+        recorder = Recorder()
+        with FakeDriveServer(drive) as server:
+            client = DriveClient(api_endpoint=server.url)
+            client.add_hook(recorder)
+            client.clone().list_files()
+            client.get_files(drive.file_ids())
+            client.chunk_size = 4
+            client.download(drive.file_ids()[0], str(tmp_path / "data.bin"))
+
+        methods = [e.method for e in recorder.finished]
+        assert methods == [
+            "drive.files.list",
+            "batch",
+            "drive.files.get",
+            "drive.files.get",
+            "drive.files.get",
+            "drive.files.get",
+        ]
+        assert recorder.started == recorder.finished
+        assert all(e.status in (200, 206) for e in recorder.finished)
+        assert [e.bytes_received for e in recorder.finished[3:]] == [4, 4, 2]
+        assert all(e.latency > 0 and e.retries == 0 for e in recorder.finished)
+
+    def test_retries_and_errors_are_reported(self, drive):
+        """Test retries are counted and the final error is reported."""
+        recorder = Recorder()
+        with FakeDriveServer(drive, error_rate=1.0, error_statuses=[503]) as server:
+            client = DriveClient(api_endpoint=server.url)
+            client.add_hook(recorder)
+            with pytest.raises(RuntimeError):
+                client.list_files()
+
+        (finished,) = recorder.finished
+        assert finished.status == 503
+        assert finished.retries == client.retry_policy.max_retries
+        assert finished.attempts == server.request_count
+        assert finished.error is not None
+
+    def test_remove_hook(self, drive):
+        """Test a removed hook hears of no more requests."""
+        recorder = Recorder()
+        with FakeDriveServer(drive) as server:
+            client = DriveClient(api_endpoint=server.url)
+            client.add_hook(recorder)
+            client.remove_hook(recorder)
+            client.list_files()
+
+        assert recorder.finished == []
+
+
+class TestLatencyHistogram:
+    """Tests for LatencyHistogram."""
+
+    def test_snapshot_counts_per_method(self):
+        """Test requests are bucketed and counted per method."""
+        histogram = LatencyHistogram(buckets=[0.1, 1.0])
+        histogram.request_finished(event(latency=0.05, bytes_received=10))
+        histogram.request_finished(event(latency=0.5, retries=2, status=429))
+        histogram.request_finished(event(method="batch", latency=5.0))
+
+        stats = histogram.snapshot()["drive.files.get"]
+        assert stats["buckets"] == [(0.1, 1), (1.0, 2), (float("inf"), 2)]
+        assert stats["count"] == 2
+        assert stats["sum"] == pytest.approx(0.55)
+        assert stats["retries"] == 2
+        assert stats["attempts"] == 4
+        assert stats["bytes_received"] == 10
+        assert stats["statuses"] == {200: 1, 429: 1}
+        assert histogram.snapshot()["batch"]["buckets"][-1] == (float("inf"), 1)
+
+    def test_quantiles_and_summary(self):
+        """Test quantiles are interpolated within buckets."""
+        histogram = LatencyHistogram(buckets=[1.0, 2.0])
+        for latency in (0.5, 0.5, 1.5, 1.5):
+            histogram.request_finished(event(latency=latency))
+        histogram.request_finished(event(method="slow", latency=9.0, status=None))
+
+        assert histogram.quantile("drive.files.get", 0.5) == pytest.approx(1.0)
+        assert histogram.quantile("drive.files.get", 0.75) == pytest.approx(1.5)
+        assert histogram.quantile("slow", 0.99) == 2.0
+        assert histogram.quantile("unknown", 0.5) is None
+        summary = histogram.summary()
+        assert summary["drive.files.get"]["mean"] == pytest.approx(1.0)
+        assert summary["drive.files.get"]["errors"] == 0
+        assert summary["slow"]["errors"] == 1
+
+        histogram.reset()
+        assert histogram.snapshot() == {}
+
+    def test_buckets_required(self):
+        """Test a histogram needs buckets."""
+        with pytest.raises(ValueError, match="At least one bucket"):
+            LatencyHistogram(buckets=[])
+
+
+class TestPrometheusTextfileExporter:
+    """Tests for PrometheusTextfileExporter."""
+
+    def test_render(self, tmp_path):
+        """Test metrics are rendered in the Prometheus text format."""
+        exporter = PrometheusTextfileExporter(
+            tmp_path / "drive.prom", buckets=[0.5], write_interval=3600
+        )
+        exporter.request_finished(event(latency=0.25, retries=1, bytes_received=7))
+        exporter.request_finished(event(method='odd"name', latency=1.0, status=None))
+
+        text = exporter.render()
+
+        assert (
+            'zenodotos_drive_request_duration_seconds_bucket{method="drive.files.get",le="0.5"} 1'
+            in text
+        )
+        assert (
+            'zenodotos_drive_request_duration_seconds_bucket{method="drive.files.get",le="+Inf"} 1'
+            in text
+        )
+        assert (
+            'zenodotos_drive_requests_total{method="drive.files.get",status="200"} 1'
+            in text
+        )
+        assert (
+            'zenodotos_drive_requests_total{method="odd\\"name",status="none"} 1'
+            in text
+        )
+        assert (
+            'zenodotos_drive_request_attempts_total{method="drive.files.get"} 2' in text
+        )
+        assert (
+            'zenodotos_drive_response_bytes_total{method="drive.files.get"} 7' in text
+        )
+        assert "# TYPE zenodotos_drive_request_duration_seconds histogram" in text
+
+    def test_writes_when_due(self, tmp_path):
+        """Test the file is written on the first request, then at intervals."""
+        path = tmp_path / "metrics" / "drive.prom"
+        exporter = PrometheusTextfileExporter(path, write_interval=3600)
+
+        exporter.request_finished(event())
+        first = path.read_text()
+        exporter.request_finished(event())
+
+        assert path.read_text() == first
+        exporter.write()
+        assert path.read_text() != first
+        assert [p.name for p in path.parent.iterdir()] == ["drive.prom"]
+
+    def test_metrics_textfile_setting(self, monkeypatch, tmp_path):
+        """Test clients configured with a textfile share its exporter."""
+        path = tmp_path / "drive.prom"
+        monkeypatch.setenv("ZENODOTOS_METRICS_TEXTFILE", str(path))
+
+        first = DriveClient()
+        second = DriveClient()
+
+        assert first.hooks == [textfile_exporter(path)]
+        assert first.hooks == second.hooks
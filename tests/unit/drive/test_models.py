@@ -161,3 +161,85 @@ def test_drive_file_repr():
     )
 
     assert repr(file) == expected_repr
+
+
+def test_drive_file_parses_timestamps_lazily():
+    """Test API timestamps are kept raw until first read."""
+    file = DriveFile.from_api_response(
+        {"id": "123", "createdTime": "2024-01-01T00:00:00.123Z"}
+    )
+
+    assert file._created_time == "2024-01-01T00:00:00.123Z"
+    assert file.created_time == datetime(2024, 1, 1, 0, 0, 0, 123000, timezone.utc)
+    assert isinstance(file._created_time, datetime)
+
+
+def test_drive_file_falls_back_to_dateutil():
+    """Test timestamps outside ISO 8601 are still parsed."""
+    file = DriveFile(modified_time="Jan 2 2024 10:00 UTC")
+
+    assert file.modified_time == datetime(2024, 1, 2, 10, 0, tzinfo=timezone.utc)
+
+
+def test_drive_file_has_no_instance_dict():
+    """Test DriveFile instances use slots rather than a per-instance dict."""
+    file = DriveFile(id="123")
+
+    assert not hasattr(file, "__dict__")
+    with pytest.raises(AttributeError):
+        file.unknown = "value"  # ty: ignore
+
+
+def test_drive_file_to_dict():
+    """Test to_dict keys values by API field name."""
+    file = DriveFile(
+        id="123",
+        name="test.txt",
+        mime_type="text/plain",
+        created_time="2024-01-01T00:00:00Z",
+        modified_time=datetime(2024, 1, 2, tzinfo=timezone.utc),
+    )
+
+    assert file.to_dict(["mimeType", "createdTime", "modifiedTime", "starred"]) == {
+        "mimeType": "text/plain",
+        "createdTime": "2024-01-01T00:00:00Z",
+        "modifiedTime": "2024-01-02T00:00:00+00:00",
+        "starred": None,
+    }
+    assert list(file.to_dict()) == [
+        "id",
+        "name",
+        "mimeType",
+        "size",
+        "createdTime",
+        "modifiedTime",
+        "description",
+        "owners",
+        "webViewLink",
+        "parents",
+        "trashed",
+        "md5Checksum",
+        "version",
+    ]
+
+
+def test_drive_file_to_dict_path():
+    """Test the walk path is only included when requested."""
+    file = DriveFile(id="123", name="b.txt", path="a/b.txt")
+
+    assert file.to_dict(["path", "name"]) == {"path": "a/b.txt", "name": "b.txt"}
+    assert "path" not in file.to_dict()
+
+
+def test_drive_file_to_dict_keeps_api_values():
+    """Test to_dict emits missing fields as None and int64 fields as strings."""
+    file = DriveFile.from_api_response({"id": "123", "size": "1024", "version": "7"})
+
+    assert file.name == "N/A"
+    assert file.to_dict(["name", "mimeType", "size", "version", "owners"]) == {
+        "name": None,
+        "mimeType": None,
+        "size": "1024",
+        "version": "7",
+        "owners": None,
+    }
@@ -0,0 +1,153 @@
+"""Tests for retrying transient Google Drive API failures."""
+
+import json
+from unittest.mock import Mock, patch
+
+import httplib2
+import pytest
+from googleapiclient.errors import HttpError
+
+from zenodotos.drive.retry import (
+    RetryPolicy,
+    is_rate_limit_error,
+    is_retryable_error,
+    retry_after_seconds,
+)
+from zenodotos.exceptions import NetworkError, RateLimitError
+
+
+def _http_error(status, reason=None, headers=None):
+    resp = httplib2.Response({"status": status, **(headers or {})})
+    resp.reason = "Test error"
+    content = b"error"
+    if reason:
+        content = json.dumps(
+            {"error": {"errors": [{"reason": reason}], "message": reason}}
+        ).encode()
+    return HttpError(resp, content)
+
+
+@pytest.mark.parametrize(
+    "status,reason,expected",
+    [
+        (429, None, True),
+        (500, None, True),
+        (503, None, True),
+        (403, "userRateLimitExceeded", True),
+        (403, "rateLimitExceeded", True),
+        (403, "insufficientFilePermissions", False),
+        (404, None, False),
+        (400, None, False),
+    ],
+)
+def test_is_retryable_error(status, reason, expected):
+    """Test which API errors are retried."""
+    assert is_retryable_error(_http_error(status, reason)) is expected
+
+
+def test_is_rate_limit_error():
+    """Test that server errors are retryable but not rate limits."""
+    assert is_rate_limit_error(_http_error(429))
+    assert not is_rate_limit_error(_http_error(500))
+
+
+@pytest.mark.parametrize(
+    "headers,expected",
+    [
+        ({}, None),
+        ({"retry-after": "7"}, 7.0),
+        ({"retry-after": "-3"}, 0.0),
+        ({"retry-after": "soon"}, None),
+        ({"retry-after": "Wed, 21 Oct 2015 07:28:00 GMT"}, 0.0),
+    ],
+)
+def test_retry_after_seconds(headers, expected):
+    """Test parsing of the Retry-After header."""
+    assert retry_after_seconds(_http_error(429, headers=headers)) == expected
+
+
+def test_backoff_delay_uses_full_jitter():
+    """Test that delays are drawn between zero and the capped exponential."""
+    policy = RetryPolicy(base_delay=1.0, max_delay=5.0)
+    with patch("zenodotos.drive.retry.random.uniform", return_value=0.5) as uniform:
+        assert policy.backoff_delay(0) == 0.5
+        policy.backoff_delay(2)
+        policy.backoff_delay(10)
+
+    assert [c.args for c in uniform.call_args_list] == [(0, 1.0), (0, 4.0), (0, 5.0)]
+
+
+def test_call_retries_until_success(no_retry_sleep):
+    """Test that transient errors are retried and the result returned."""
+    func = Mock(side_effect=[_http_error(503), _http_error(429), {"ok": True}])
+
+    assert RetryPolicy(max_retries=3).call(func) == {"ok": True}
+    assert func.call_count == 3
+    assert no_retry_sleep.call_count == 2
+
+
+def test_call_honors_retry_after(no_retry_sleep):
+    """Test that the server-requested delay replaces the backoff delay."""
+    func = Mock(side_effect=[_http_error(429, headers={"retry-after": "12"}), "ok"])
+
+    assert RetryPolicy().call(func) == "ok"
+    no_retry_sleep.assert_called_once_with(12.0)
+
+
+@pytest.mark.parametrize("retry_after", ["86400", "Fri, 31 Dec 9999 23:59:59 GMT"])
+def test_call_caps_retry_after(no_retry_sleep, retry_after):
+    """Test that server-requested delays are capped at max_delay."""
+    error = _http_error(429, headers={"retry-after": retry_after})
+    func = Mock(side_effect=[error, "ok"])
+
+    assert RetryPolicy(max_delay=5.0).call(func) == "ok"
+    no_retry_sleep.assert_called_once_with(5.0)
+
+
+def test_call_raises_rate_limit_error_when_exhausted():
+    """Test that persistent rate limiting surfaces as RateLimitError."""
+    error = _http_error(429)
+    func = Mock(side_effect=error)
+
+    with pytest.raises(RateLimitError, match="after 2 retries") as excinfo:
+        RetryPolicy(max_retries=2).call(func)
+
+    assert excinfo.value.original_error is error
+    assert func.call_count == 3
+
+
+def test_call_raises_server_error_when_exhausted():
+    """Test that persistent server errors are re-raised unchanged."""
+    func = Mock(side_effect=_http_error(500))
+
+    with pytest.raises(HttpError):
+        RetryPolicy(max_retries=1).call(func)
+    assert func.call_count == 2
+
+
+def test_call_raises_network_error_when_exhausted():
+    """Test that persistent network failures surface as NetworkError."""
+    func = Mock(side_effect=ConnectionResetError("connection reset"))
+
+    with pytest.raises(NetworkError, match="connection reset"):
+        RetryPolicy(max_retries=2).call(func)
+    assert func.call_count == 3
+
+
+def test_call_does_not_retry_client_errors(no_retry_sleep):
+    """Test that errors such as 404 fail immediately."""
+    func = Mock(side_effect=_http_error(404))
+
+    with pytest.raises(HttpError):
+        RetryPolicy().call(func)
+    assert func.call_count == 1
+    no_retry_sleep.assert_not_called()
+
+
+def test_zero_max_retries_disables_retrying():
+    """Test that max_retries=0 makes a single attempt."""
+    func = Mock(side_effect=_http_error(429))
+
+    with pytest.raises(RateLimitError):
+        RetryPolicy(max_retries=0).call(func)
+    assert func.call_count == 1
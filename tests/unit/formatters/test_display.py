@@ -2,7 +2,7 @@
 
 from datetime import datetime
 
-from zenodotos.formatters.display import format_file_list
+from zenodotos.formatters.display import format_file_list, format_file_stream
 from zenodotos.drive.models import DriveFile
 
 
@@ -235,3 +235,46 @@ def test_format_file_list_with_missing_data():
     assert "Name" in lines[0]
     assert "Size" in lines[0]
     assert "N/A" in result  # Should show N/A for missing fields
+
+
+def test_format_file_stream_yields_each_page():
+    """Test streaming formats each page as it is consumed with fixed widths."""
+    consumed = []
+
+    def pages():
+        for page in (
+            [DriveFile(id="1", name="short.txt", mime_type="text/plain", size=5)],
+            [],
+            [DriveFile(id="2", name="a" * 50, mime_type="text/plain", size=1024)],
+        ):
+            consumed.append(page)
+            yield page
+
+    chunks = format_file_stream(pages(), ["name", "size"])
+
+    first = next(chunks)
+    assert len(consumed) == 1
+    assert first.split("\n") == [
+        f"{'Name':<40}  {'Size':>10}",
+        f"{'-' * 40}  {'-' * 10}",
+        f"{'short.txt':<40}  {'5':>10}",
+    ]
+    assert list(chunks) == [f"{'a' * 37 + '...'}  {'1,024':>10}"]
+
+
+def test_format_file_stream_column_widths():
+    """Test configured widths override the defaults for the given fields."""
+    file = DriveFile(id="1", name="report.pdf", mime_type="application/pdf")
+
+    (chunk,) = format_file_stream([[file]], None, {"name": 6, "mimeType": 3})
+
+    assert chunk.split("\n") == [
+        f"Name    Typ  {'Size':>10}",
+        f"------  ---  {'-' * 10}",
+        f"rep...  app  {'N/A':>10}",
+    ]
+
+
+def test_format_file_stream_empty():
+    """Test streaming with no files at all."""
+    assert list(format_file_stream([[], []])) == ["No files found."]
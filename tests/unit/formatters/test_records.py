@@ -0,0 +1,106 @@
+"""Test cases for the machine-readable output formats."""
+
+import csv
+import io
+import json
+from datetime import datetime, timezone
+
+import pytest
+
+from zenodotos.drive.models import DriveFile
+from zenodotos.formatters.records import format_records
+
+FIELDS = ["id", "name", "size", "modifiedTime", "owners", "trashed"]
+
+
+def make_pages():
+    return [
+        [
+            DriveFile.from_api_response(
+                {
+                    "id": "1",
+                    "name": "Report, final",
+                    "size": "2048",
+                    "modifiedTime": "2024-01-02T03:04:05.678Z",
+                    "owners": [{"emailAddress": "me@example.com"}],
+                    "trashed": False,
+                }
+            )
+        ],
+        [],
+        [
+            DriveFile(
+                id="2",
+                name="Café",
+                modified_time=datetime(2024, 1, 1, tzinfo=timezone.utc),
+            )
+        ],
+    ]
+
+
+def test_ndjson_one_record_per_line():
+    """Test NDJSON emits raw values, one page per chunk."""
+    chunks = list(format_records(make_pages(), FIELDS, "ndjson"))
+
+    assert len(chunks) == 2
+    records = [json.loads(line) for line in "".join(chunks).splitlines()]
+    assert records == [
+        {
+            "id": "1",
+            "name": "Report, final",
+            "size": "2048",
+            "modifiedTime": "2024-01-02T03:04:05.678Z",
+            "owners": [{"emailAddress": "me@example.com"}],
+            "trashed": False,
+        },
+        {
+            "id": "2",
+            "name": "Café",
+            "size": None,
+            "modifiedTime": "2024-01-01T00:00:00+00:00",
+            "owners": None,
+            "trashed": None,
+        },
+    ]
+
+
+def test_csv_has_header_and_encoded_cells():
+    """Test CSV quotes values and encodes lists and booleans as JSON."""
+    chunks = list(format_records(make_pages(), FIELDS, "csv"))
+
+    rows = list(csv.reader(io.StringIO("".join(chunks))))
+    assert rows == [
+        FIELDS,
+        [
+            "1",
+            "Report, final",
+            "2048",
+            "2024-01-02T03:04:05.678Z",
+            '[{"emailAddress":"me@example.com"}]',
+            "false",
+        ],
+        ["2", "Café", "", "2024-01-01T00:00:00+00:00", "", ""],
+    ]
+    assert chunks[0].startswith("id,name,")
+
+
+def test_json_array_is_streamed():
+    """Test the JSON array is produced page by page and parses as a whole."""
+    chunks = list(format_records(make_pages(), ["id"], "json"))
+
+    assert len(chunks) == 3
+    assert json.loads("".join(chunks)) == [{"id": "1"}, {"id": "2"}]
+
+
+@pytest.mark.parametrize(
+    "output_format, expected", [("ndjson", ""), ("csv", "id\n"), ("json", "[]\n")]
+)
+def test_no_files(output_format, expected):
+    """Test each format with an empty listing."""
+    assert "".join(format_records([[]], ["id"], output_format)) == expected
+
+
+def test_unsupported_format():
+    """Test an unknown format is rejected."""
+    with pytest.raises(ValueError, match="Unsupported output format"):
+        format_records([], ["id"], "xml")
@@ -0,0 +1,53 @@
+"""Tests for the asyncio Zenodotos library interface."""
+
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+pytest.importorskip("httpx")
+
+from zenodotos.async_client import AsyncZenodotos  # noqa: E402
+from zenodotos.drive.models import DriveFile  # noqa: E402
+
+
+class TestAsyncZenodotos:
+    """Tests for AsyncZenodotos."""
+
+    def test_list_files_returns_files(self):
+        """Test list_files returns only the files of the first page."""
+        with patch("zenodotos.async_client.AsyncDriveClient") as mock_client_class:
+            mock_client = mock_client_class.return_value
+            file = DriveFile(id="1", name="Doc")
+            mock_client.list_files = AsyncMock(
+                return_value={"files": [file], "next_page_token": "next"}
+            )
+
+            zenodotos = AsyncZenodotos(max_concurrency=8)
+            result = asyncio.run(zenodotos.list_files(page_size=5, query="q"))
+
+            assert result == [file]
+            mock_client_class.assert_called_once_with(
+                credentials_path=None, max_concurrency=8
+            )
+            mock_client.list_files.assert_awaited_once_with(
+                page_size=5, query="q", fields=None
+            )
+
+    def test_get_files_and_export_delegate(self):
+        """Test get_files and export_file delegate to the async Drive client."""
+        with patch("zenodotos.async_client.AsyncDriveClient") as mock_client_class:
+            mock_client = mock_client_class.return_value
+            mock_client.get_files = AsyncMock(return_value=[])
+            mock_client.export = AsyncMock(return_value="out.pdf")
+            mock_client.aclose = AsyncMock()
+
+            async def run():
+                async with AsyncZenodotos() as zenodotos:
+                    await zenodotos.get_files(["1"], fields=["id"])
+                    return await zenodotos.export_file("1", format="pdf")
+
+            assert asyncio.run(run()) == "out.pdf"
+            mock_client.get_files.assert_awaited_once_with(["1"], fields=["id"])
+            mock_client.export.assert_awaited_once_with("1", None, "pdf", file=None)
+            mock_client.aclose.assert_awaited_once()
@@ -74,7 +74,9 @@ def test_get_credentials_refresh_token(mock_config, mock_credentials):
         "builtins.open", mock_open(read_data='{"token": "old_token"}')
     ), patch(
         "zenodotos.auth.Credentials.from_authorized_user_info"
-    ) as mock_from_info, patch("zenodotos.auth.Request") as mock_request:
+    ) as mock_from_info, patch(
+        "google.auth.transport.requests.Request"
+    ) as mock_request:
         mock_exists.return_value = True
         mock_from_info.return_value = mock_credentials
 
@@ -89,7 +91,7 @@ def test_get_credentials_refresh_token(mock_config, mock_credentials):
 def test_get_credentials_new_oauth_flow(mock_config, mock_flow, mock_credentials):
     """Test starting new OAuth flow when no token exists."""
     with patch("os.path.exists") as mock_exists, patch(
-        "zenodotos.auth.InstalledAppFlow.from_client_secrets_file"
+        "google_auth_oauthlib.flow.InstalledAppFlow.from_client_secrets_file"
     ) as mock_flow_class, patch("builtins.open", mock_open()):
         mock_exists.return_value = False
         mock_flow_class.return_value = mock_flow
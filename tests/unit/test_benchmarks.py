@@ -0,0 +1,129 @@
+"""Tests for the benchmark runner."""
+
+import json
+import os
+from time import sleep
+from unittest.mock import patch
+
+import pytest
+
+from benchmarks.runner import compare, main, over_budget, run, select
+from benchmarks.suite import BENCHMARKS, Benchmark
+
+
+def results(**per_item):
+    return {
+        "benchmarks": {
+            name: {"median_per_item": value} for name, value in per_item.items()
+        }
+    }
+
+
+class TestBenchmarkRunner:
+    """Tests for running and comparing benchmarks."""
+
+    def test_every_benchmark_runs(self):
+        """Test each benchmark runs at a tiny scale."""
+        progress = []
+
+        result = run(
+            list(BENCHMARKS),
+            scale=0.005,
+            rounds=1,
+            progress=lambda name, _: progress.append(name),
+        )
+
+        assert progress == list(BENCHMARKS)
+        for entry in result["benchmarks"].values():
+            assert entry["items"] >= 1
+            assert len(entry["times"]) == 1
+            assert entry["median_per_item"] > 0
+        assert (
+            result["benchmarks"]["drive_file.from_api_response"]["memory_per_item"] > 0
+        )
+        assert "memory_per_item" not in result["benchmarks"]["format_file_list"]
+
+    def test_batch_beats_sequential_with_latency(self):
+        """Test batched lookups are faster per file once requests have latency."""
+        # The fake server's latency needs the sleep patched out by conftest
+        with patch("time.sleep", sleep):
+            result = run(select(["remote."]), scale=0.1, rounds=1)["benchmarks"]
+
+        batch = result["remote.get_files.batch"]["median_per_item"]
+        sequential = result["remote.get_file.sequential"]["median_per_item"]
+        assert batch * 10 < sequential
+
+    def test_run_leaves_configuration_alone(self, tmp_path, monkeypatch):
+        """Test a run neither reads nor writes the developer's configuration."""
+        monkeypatch.setenv("HOME", str(tmp_path))
+        monkeypatch.setenv("ZENODOTOS_METRICS_TEXTFILE", str(tmp_path / "m.prom"))
+
+        run(["list_files.pagination", "cli.startup"], scale=0.001, rounds=1)
+
+        assert list(tmp_path.iterdir()) == []
+        assert os.environ["HOME"] == str(tmp_path)
+        assert os.environ["ZENODOTOS_METRICS_TEXTFILE"] == str(tmp_path / "m.prom")
+
+    def test_select(self):
+        """Test benchmarks are selected by the words in their names."""
+        assert select(["get_file"]) == [
+            "get_files.batch",
+            "get_file.sequential",
+            "remote.get_files.batch",
+            "remote.get_file.sequential",
+        ]
+        assert select([]) == list(BENCHMARKS)
+        with pytest.raises(ValueError, match="No benchmark matches 'nope'"):
+            select(["nope"])
+
+    def test_compare_flags_regressions(self):
+        """Test slowdowns over the threshold are flagged."""
+        baseline = results(fast=1.0, slow=1.0, gone=1.0)
+        current = results(fast=0.5, slow=1.5, new=1.0)
+
+        comparison = compare(current, baseline, threshold=0.2)
+
+        assert comparison == {
+            "fast": {"ratio": 0.5, "regression": False},
+            "slow": {"ratio": 1.5, "regression": True},
+        }
+
+    def test_over_budget(self):
+        """Test benchmarks slower than their budget are reported."""
+        current = {
+            "benchmarks": {
+                "slow": {"median_per_item": 2.0, "budget": 1.0},
+                "fast": {"median_per_item": 0.5, "budget": 1.0},
+                "free": {"median_per_item": 9.0, "budget": None},
+            }
+        }
+
+        assert over_budget(current) == ["slow"]
+
+    def test_main_fails_over_budget(self, tmp_path, monkeypatch, capsys):
+        """Test a benchmark over its budget fails the run without a baseline."""
+        slow = Benchmark(
+            "slow.op", "Too slow", lambda context: (lambda: None, 1), budget=0.0
+        )
+        monkeypatch.setitem(BENCHMARKS, "slow.op", slow)
+        args = ["slow.op", "--rounds", "1", "--output", str(tmp_path / "out.json")]
+
+        assert main([*args, "--baseline", str(tmp_path / "none.json")]) == 1
+        assert "slow.op                          OVER BUDGET" in capsys.readouterr().out
+
+    def test_main_saves_and_compares(self, tmp_path, capsys):
+        """Test a baseline is saved, then compared with on the next run."""
+        output = tmp_path / "latest.json"
+        baseline = tmp_path / "baseline.json"
+        args = ["field_parser", "--scale", "0.001", "--rounds", "1"]
+        args += ["--output", str(output), "--baseline", str(baseline)]
+
+        assert main([*args, "--save-baseline"]) == 0
+        saved = json.loads(baseline.read_text())
+        assert list(saved["benchmarks"]) == ["field_parser.parse_fields"]
+
+        saved["benchmarks"]["field_parser.parse_fields"]["median_per_item"] /= 100
+        baseline.write_text(json.dumps(saved))
+        assert main(args) == 1
+        assert "REGRESSION" in capsys.readouterr().out
+        assert output.exists()
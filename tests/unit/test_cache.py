@@ -0,0 +1,153 @@
+"""Tests for the persistent metadata cache."""
+
+import sqlite3
+from unittest.mock import patch
+
+import pytest
+
+from zenodotos.cache import MetadataCache, file_version, normalize_query
+
+
+@pytest.fixture
+def cache(tmp_path):
+    """Provide a cache backed by a temporary database."""
+    cache = MetadataCache(tmp_path / "cache.sqlite3", ttl_seconds=60)
+    yield cache
+    cache.close()
+
+
+def _file(file_id, modified="2024-01-01T00:00:00Z", **extra):
+    return {"id": file_id, "name": f"{file_id}.txt", "modifiedTime": modified, **extra}
+
+
+class TestHelpers:
+    """Tests for the cache key helpers."""
+
+    def test_file_version_prefers_version(self):
+        """Test that the version field wins over modifiedTime."""
+        assert file_version(_file("a", version="12")) == "12"
+        assert file_version(_file("a")) == "2024-01-01T00:00:00Z"
+        assert file_version({"id": "a"}) is None
+
+    @pytest.mark.parametrize(
+        "query,expected",
+        [
+            (None, ""),
+            ("", ""),
+            ("  name   contains 'x' ", "name contains 'x'"),
+        ],
+    )
+    def test_normalize_query(self, query, expected):
+        """Test that whitespace differences share a cache entry."""
+        assert normalize_query(query) == expected
+
+
+class TestMetadataCache:
+    """Tests for MetadataCache."""
+
+    def test_database_uses_wal_mode(self, cache):
+        """Test that the database is created lazily in WAL mode."""
+        assert not cache.path.exists()
+        cache.put_file("a", "id,name", _file("a"))
+
+        connection = sqlite3.connect(cache.path)
+        assert connection.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        connection.close()
+
+    def test_file_round_trip_by_field_mask(self, cache):
+        """Test that file entries are keyed by ID and field mask."""
+        cache.put_file("a", "id,name", _file("a"))
+
+        assert cache.get_file("a", "id,name") == _file("a")
+        assert cache.get_file("a", "id") is None
+        assert cache.get_file("b", "id,name") is None
+
+    def test_listing_round_trip(self, cache):
+        """Test that listings are keyed by normalized query, page and fields."""
+        page = {"files": [_file("a")], "nextPageToken": "next"}
+        cache.put_listing("name  contains 'a'", 10, None, "files(id)", page)
+
+        assert cache.get_listing("name contains 'a'", 10, None, "files(id)") == page
+        assert cache.get_listing("name contains 'a'", 20, None, "files(id)") is None
+        assert cache.get_listing("name contains 'a'", 10, "tok", "files(id)") is None
+        assert cache.get_listing(None, 10, None, "files(id)") is None
+
+    def test_entries_expire_after_ttl(self, cache):
+        """Test that entries older than the TTL are ignored and purged."""
+        with patch("zenodotos.cache.time.time", return_value=1000.0):
+            cache.put_file("a", "id", _file("a"))
+            cache.put_listing(None, 10, None, "f", {"files": [_file("a")]})
+
+        with patch("zenodotos.cache.time.time", return_value=1059.0):
+            assert cache.get_file("a", "id") is not None
+        with patch("zenodotos.cache.time.time", return_value=1061.0):
+            assert cache.get_file("a", "id") is None
+            assert cache.get_listing(None, 10, None, "f") is None
+            cache.purge_expired()
+
+        connection = cache._connect()
+        assert connection.execute("SELECT COUNT(*) FROM files").fetchone()[0] == 0
+        assert connection.execute("SELECT COUNT(*) FROM listings").fetchone()[0] == 0
+
+    def test_writes_purge_expired_entries(self, tmp_path):
+        """Test expired entries are purged on the first write and periodically."""
+        cache = MetadataCache(
+            tmp_path / "cache.sqlite3", ttl_seconds=60, purge_interval=3
+        )
+        with patch("zenodotos.cache.time.time", return_value=1000.0):
+            cache.put_file("a", "id", _file("a"))
+            cache.put_listing(None, 10, None, "f", {"files": [_file("a")]})
+        cache.close()
+
+        def count(table):
+            return connection.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+
+        reopened = MetadataCache(
+            tmp_path / "cache.sqlite3", ttl_seconds=60, purge_interval=3
+        )
+        connection = reopened._connect()
+        with patch("zenodotos.cache.time.time", return_value=1061.0):
+            reopened.put_file("b", "id", _file("b"))
+        assert (count("files"), count("listings"), count("listing_files")) == (1, 0, 0)
+
+        with patch("zenodotos.cache.time.time", return_value=1200.0):
+            reopened.put_file("c", "id", _file("c"))
+            reopened.put_file("d", "id", _file("d"))
+            assert count("files") == 3
+            reopened.put_file("e", "id", _file("e"))
+        rows = connection.execute("SELECT file_id FROM files ORDER BY file_id")
+        assert [file_id for (file_id,) in rows] == ["c", "d", "e"]
+        reopened.close()
+
+    def test_new_file_version_invalidates_entries(self, cache):
+        """Test that seeing a new version drops entries holding the old one."""
+        cache.put_file("a", "id,name,modifiedTime", _file("a"))
+        cache.put_listing(None, 10, None, "f", {"files": [_file("a"), _file("b")]})
+        cache.put_listing("q", 10, None, "f", {"files": [_file("b")]})
+
+        cache.put_file("a", "id,modifiedTime", _file("a", "2024-02-01T00:00:00Z"))
+
+        assert cache.get_file("a", "id,name,modifiedTime") is None
+        assert cache.get_listing(None, 10, None, "f") is None
+        assert cache.get_listing("q", 10, None, "f") is not None
+
+    def test_listing_with_same_version_keeps_entries(self, cache):
+        """Test that unchanged files keep their cached entries."""
+        cache.put_file("a", "id,modifiedTime", _file("a"))
+        cache.put_listing(None, 10, None, "f", {"files": [_file("a")]})
+
+        assert cache.get_file("a", "id,modifiedTime") == _file("a")
+
+    def test_invalidate_and_clear(self, cache):
+        """Test explicit invalidation of files and of the whole cache."""
+        cache.put_file("a", "id", _file("a"))
+        cache.put_file("b", "id", _file("b"))
+        cache.put_listing(None, 10, None, "f", {"files": [_file("b")]})
+
+        cache.invalidate(["a"])
+        assert cache.get_file("a", "id") is None
+        assert cache.get_file("b", "id") is not None
+
+        cache.clear()
+        assert cache.get_file("b", "id") is None
+        assert cache.get_listing(None, 10, None, "f") is None
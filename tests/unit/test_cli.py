@@ -1,9 +1,22 @@
 """Tests for CLI commands."""
 
+import json
+import os
+import pstats
+import subprocess
+import sys
+
+import pytest
 from click.testing import CliRunner
-from unittest.mock import Mock, patch
-from zenodotos.cli import cli
+from unittest.mock import Mock, call, patch
+from zenodotos.cli import COMMANDS, cli
+from zenodotos.drive.client import DriveClient
+from zenodotos.drive.fake_server import FakeDriveServer, SyntheticDrive
 from zenodotos.drive.models import DriveFile
+from zenodotos.exceptions import ChecksumMismatchError
+from zenodotos.index import LocalIndex
+from zenodotos.timings import get_timings
+from zenodotos.utils import DEFAULT_JOBS
 from datetime import datetime
 
 
@@ -13,7 +26,7 @@ class TestListFiles:
     def test_basic_usage(self):
         """Test basic list-files command."""
         runner = CliRunner()
-        with patch("zenodotos.cli.commands.Zenodotos") as mock_zenodotos_class:
+        with patch("zenodotos.client.Zenodotos") as mock_zenodotos_class:
             mock_zenodotos = Mock()
             mock_zenodotos_class.return_value = mock_zenodotos
 
@@ -49,7 +62,7 @@ class TestListFiles:
     def test_with_query(self):
         """Test list-files with query parameter."""
         runner = CliRunner()
-        with patch("zenodotos.cli.commands.Zenodotos") as mock_zenodotos_class:
+        with patch("zenodotos.client.Zenodotos") as mock_zenodotos_class:
             mock_zenodotos = Mock()
             mock_zenodotos_class.return_value = mock_zenodotos
 
@@ -85,7 +98,7 @@ class TestListFiles:
     def test_with_custom_fields(self):
         """Test list-files with custom fields."""
         runner = CliRunner()
-        with patch("zenodotos.cli.commands.Zenodotos") as mock_zenodotos_class:
+        with patch("zenodotos.client.Zenodotos") as mock_zenodotos_class:
             mock_zenodotos = Mock()
             mock_zenodotos_class.return_value = mock_zenodotos
 
@@ -121,6 +134,277 @@ class TestListFiles:
             expected_fields = ["name", "size", "createdTime", "mimeType"]
             assert all(field in call_args[1]["fields"] for field in expected_fields)
 
+    def test_offline(self):
+        """Test list-files --offline lists files from the local index."""
+        runner = CliRunner()
+        with patch("zenodotos.client.Zenodotos") as mock_zenodotos_class:
+            mock_zenodotos = mock_zenodotos_class.return_value
+            mock_zenodotos.get_field_parser.return_value.parse_fields.return_value = (
+                ["id", "name", "mimeType", "size"],
+                None,
+            )
+            mock_zenodotos.list_files_with_pagination.return_value = {
+                "files": [DriveFile(id="1", name="report.pdf", mime_type="x")],
+                "next_page_token": "10",
+            }
+
+            result = runner.invoke(
+                cli,
+                [
+                    "list-files",
+                    "--query",
+                    "name contains 'report'",
+                    "--no-interactive",
+                    "--offline",
+                ],
+            )
+
+            assert result.exit_code == 0
+            assert "report.pdf" in result.output
+            mock_zenodotos.list_files_with_pagination.assert_called_once_with(
+                page_size=10,
+                page_token=None,
+                query="name contains 'report'",
+                fields=["id", "name", "mimeType", "size"],
+                offline=True,
+                use_cache=True,
+            )
+
+    def test_no_cache(self):
+        """Test list-files --no-cache bypasses the metadata cache."""
+        runner = CliRunner()
+        with patch("zenodotos.client.Zenodotos") as mock_zenodotos_class:
+            mock_zenodotos = mock_zenodotos_class.return_value
+            mock_zenodotos.get_field_parser.return_value.parse_fields.return_value = (
+                ["id", "name", "mimeType", "size"],
+                None,
+            )
+            mock_zenodotos.list_files_with_pagination.return_value = {
+                "files": [DriveFile(id="1", name="report.pdf", mime_type="x")],
+                "next_page_token": None,
+            }
+
+            result = runner.invoke(
+                cli, ["list-files", "--no-interactive", "--no-cache"]
+            )
+
+            assert result.exit_code == 0
+            call_args = mock_zenodotos.list_files_with_pagination.call_args
+            assert call_args[1]["use_cache"] is False
+
+    def test_all_streams_every_page(self):
+        """Test list-files --all prints each page as it is fetched."""
+        runner = CliRunner()
+        with patch("zenodotos.client.Zenodotos") as mock_zenodotos_class:
+            mock_zenodotos = mock_zenodotos_class.return_value
+            mock_zenodotos.get_field_parser.return_value.parse_fields.return_value = (
+                ["id", "name", "mimeType", "size"],
+                ["name"],
+            )
+            mock_zenodotos.list_files_with_pagination.side_effect = [
+                {
+                    "files": [DriveFile(id="1", name="first.txt", mime_type="x")],
+                    "next_page_token": "page2",
+                },
+                {
+                    "files": [DriveFile(id="2", name="second.txt", mime_type="x")],
+                    "next_page_token": None,
+                },
+            ]
+
+            result = runner.invoke(
+                cli,
+                ["list-files", "--all", "--query", "trashed = false"]
+                + ["--column-widths", "name=12"],
+            )
+
+            assert result.exit_code == 0
+            assert result.output.splitlines() == [
+                "Name        ",
+                "------------",
+                "first.txt   ",
+                "second.txt  ",
+            ]
+            assert mock_zenodotos.list_files_with_pagination.call_args_list == [
+                call(
+                    page_size=1000,
+                    page_token=token,
+                    query="trashed = false",
+                    fields=["id", "name", "mimeType", "size"],
+                    offline=False,
+                    use_cache=True,
+                )
+                for token in (None, "page2")
+            ]
+
+    def test_ndjson_output(self):
+        """Test list-files --output-format ndjson prints raw records."""
+        runner = CliRunner()
+        with patch("zenodotos.client.Zenodotos") as mock_zenodotos_class:
+            mock_zenodotos = mock_zenodotos_class.return_value
+            mock_zenodotos.get_field_parser.return_value.parse_fields.return_value = (
+                ["id", "name", "mimeType", "size"],
+                ["id", "size"],
+            )
+            mock_zenodotos.list_files_with_pagination.return_value = {
+                "files": [
+                    DriveFile(id="1", name="a", size=1024),
+                    DriveFile(id="2", name="b"),
+                ],
+                "next_page_token": "page2",
+            }
+
+            result = runner.invoke(
+                cli, ["list-files", "--fields", "id,size", "--output-format", "ndjson"]
+            )
+
+            assert result.exit_code == 0
+            assert result.stdout == '{"id":"1","size":"1024"}\n{"id":"2","size":null}\n'
+            assert "Next page token: page2" in result.stderr
+
+    def test_all_csv_output(self):
+        """Test list-files --all --output-format csv streams every page."""
+        runner = CliRunner()
+        with patch("zenodotos.client.Zenodotos") as mock_zenodotos_class:
+            mock_zenodotos = mock_zenodotos_class.return_value
+            mock_zenodotos.get_field_parser.return_value.parse_fields.return_value = (
+                ["id", "name", "mimeType", "size"],
+                None,
+            )
+            mock_zenodotos.list_files_with_pagination.side_effect = [
+                {"files": [DriveFile(id="1", name="a")], "next_page_token": "p2"},
+                {"files": [DriveFile(id="2", name="b")], "next_page_token": None},
+            ]
+
+            result = runner.invoke(
+                cli, ["list-files", "--all", "--output-format", "csv"]
+            )
+
+            assert result.exit_code == 0
+            assert result.output.splitlines() == [
+                "id,name,mimeType,size",
+                "1,a,,",
+                "2,b,,",
+            ]
+
+    def test_recursive_streams_paths(self):
+        """Test list-files --recursive prints every file with its path."""
+        runner = CliRunner()
+        with patch("zenodotos.client.Zenodotos") as mock_zenodotos_class:
+            mock_zenodotos = mock_zenodotos_class.return_value
+            mock_zenodotos.get_field_parser.return_value.parse_fields.return_value = (
+                ["id", "name", "mimeType", "size"],
+                None,
+            )
+            mock_zenodotos.walk.return_value = iter(
+                [
+                    DriveFile(id="1", name="Docs", mime_type="folder", path="Docs"),
+                    DriveFile(
+                        id="2", name="a.pdf", mime_type="pdf", size=5, path="Docs/a.pdf"
+                    ),
+                ]
+            )
+
+            result = runner.invoke(
+                cli,
+                ["list-files", "--recursive", "folder", "--jobs", "8"]
+                + ["--column-widths", "path=12,mimeType=6"],
+            )
+
+            assert result.exit_code == 0
+            assert result.output.splitlines() == [
+                "Path          Type          Size",
+                "------------  ------  ----------",
+                "Docs          folder         N/A",
+                "Docs/a.pdf    pdf              5",
+            ]
+            mock_zenodotos.walk.assert_called_once_with(
+                "folder", fields=["id", "name", "mimeType", "size"], jobs=8
+            )
+
+    def test_recursive_ndjson_output(self):
+        """Test --recursive records include the path when requested."""
+        runner = CliRunner()
+        with patch("zenodotos.client.Zenodotos") as mock_zenodotos_class:
+            mock_zenodotos = mock_zenodotos_class.return_value
+            mock_zenodotos.get_field_parser.return_value.parse_fields.return_value = (
+                ["path", "id", "name", "mimeType", "size"],
+                ["path", "id"],
+            )
+            mock_zenodotos.walk.return_value = iter(
+                [DriveFile(id="2", name="a.pdf", path="Docs/a.pdf")]
+            )
+
+            result = runner.invoke(
+                cli,
+                ["list-files", "--recursive", "folder", "--fields", "path,id"]
+                + ["--output-format", "ndjson"],
+            )
+
+            assert result.exit_code == 0
+            assert json.loads(result.output) == {"path": "Docs/a.pdf", "id": "2"}
+            mock_zenodotos.walk.assert_called_once_with(
+                "folder", fields=["id", "name", "mimeType", "size"], jobs=DEFAULT_JOBS
+            )
+
+    def test_recursive_rejects_query(self):
+        """Test --recursive lists a folder tree, not query results."""
+        runner = CliRunner()
+        with patch("zenodotos.client.Zenodotos") as mock_zenodotos_class:
+            result = runner.invoke(
+                cli, ["list-files", "--recursive", "folder", "--query", "x"]
+            )
+
+            assert result.exit_code == 1
+            assert "--recursive cannot be combined" in result.output
+            mock_zenodotos_class.assert_not_called()
+
+    def test_all_rejects_page_token(self):
+        """Test --all cannot start from a page token."""
+        runner = CliRunner()
+        result = runner.invoke(cli, ["list-files", "--all", "--page-token", "abc"])
+
+        assert result.exit_code == 1
+        assert "mutually exclusive" in result.output
+
+    def test_invalid_column_widths(self):
+        """Test malformed --column-widths values are rejected."""
+        runner = CliRunner()
+        result = runner.invoke(
+            cli, ["list-files", "--all", "--column-widths", "name=wide"]
+        )
+
+        assert result.exit_code == 2
+        assert "expected FIELD=WIDTH" in result.output
+
+    def test_interactive_prefetch_depth(self):
+        """Test that list-files passes --prefetch to interactive pagination."""
+        runner = CliRunner()
+        with (
+            patch("zenodotos.client.Zenodotos") as mock_zenodotos_class,
+            patch("zenodotos.cli.commands.interactive_pagination") as mock_paginate,
+        ):
+            mock_zenodotos = Mock()
+            mock_zenodotos_class.return_value = mock_zenodotos
+            mock_zenodotos.get_field_parser.return_value.parse_fields.return_value = (
+                ["id", "name"],
+                None,
+            )
+
+            result = runner.invoke(cli, ["list-files", "--prefetch", "3"])
+
+            assert result.exit_code == 0
+            mock_paginate.assert_called_once_with(
+                mock_zenodotos,
+                10,
+                None,
+                ["id", "name"],
+                None,
+                prefetch_depth=3,
+                offline=False,
+                use_cache=True,
+            )
+
 
 class TestGetFile:
     """Test the get-file command."""
@@ -128,7 +412,7 @@ class TestGetFile:
     def test_basic_usage(self):
         """Test basic get-file command."""
         runner = CliRunner()
-        with patch("zenodotos.cli.commands.Zenodotos") as mock_zenodotos_class:
+        with patch("zenodotos.client.Zenodotos") as mock_zenodotos_class:
             mock_zenodotos = Mock()
             mock_zenodotos_class.return_value = mock_zenodotos
 
@@ -180,12 +464,14 @@ class TestGetFile:
             assert "test.txt" in result.output
             assert "text/plain" in result.output
             assert "1,024" in result.output
-            mock_zenodotos.get_file.assert_called_once_with("test123")
+            mock_zenodotos.get_file.assert_called_once_with(
+                "test123", offline=False, use_cache=True
+            )
 
     def test_with_custom_fields(self):
         """Test get-file with custom fields."""
         runner = CliRunner()
-        with patch("zenodotos.cli.commands.Zenodotos") as mock_zenodotos_class:
+        with patch("zenodotos.client.Zenodotos") as mock_zenodotos_class:
             mock_zenodotos = Mock()
             mock_zenodotos_class.return_value = mock_zenodotos
 
@@ -214,12 +500,34 @@ class TestGetFile:
             assert result.exit_code == 0
             assert "test.txt" in result.output
             assert "Test file" in result.output
-            mock_zenodotos.get_file.assert_called_once_with("test123")
+            mock_zenodotos.get_file.assert_called_once_with(
+                "test123", offline=False, use_cache=True
+            )
+
+    def test_json_output(self):
+        """Test get-file --output-format json prints a JSON array."""
+        runner = CliRunner()
+        with patch("zenodotos.client.Zenodotos") as mock_zenodotos_class:
+            mock_zenodotos = mock_zenodotos_class.return_value
+            mock_zenodotos.get_field_parser.return_value.parse_fields.return_value = (
+                ["id", "name", "mimeType", "size"],
+                ["id", "name"],
+            )
+            mock_zenodotos.get_file.return_value = DriveFile(id="test123", name="a")
+
+            result = runner.invoke(
+                cli,
+                ["get-file", "test123", "--fields", "id,name"]
+                + ["--output-format", "json"],
+            )
+
+            assert result.exit_code == 0
+            assert json.loads(result.output) == [{"id": "test123", "name": "a"}]
 
     def test_file_not_found(self):
         """Test get-file with non-existent file."""
         runner = CliRunner()
-        with patch("zenodotos.cli.commands.Zenodotos") as mock_zenodotos_class:
+        with patch("zenodotos.client.Zenodotos") as mock_zenodotos_class:
             mock_zenodotos = Mock()
             mock_zenodotos_class.return_value = mock_zenodotos
 
@@ -244,7 +552,7 @@ class TestGetFile:
     def test_permission_error(self):
         """Test get-file with permission error."""
         runner = CliRunner()
-        with patch("zenodotos.cli.commands.Zenodotos") as mock_zenodotos_class:
+        with patch("zenodotos.client.Zenodotos") as mock_zenodotos_class:
             mock_zenodotos = Mock()
             mock_zenodotos_class.return_value = mock_zenodotos
 
@@ -269,7 +577,7 @@ class TestGetFile:
     def test_general_error(self):
         """Test get-file with general error."""
         runner = CliRunner()
-        with patch("zenodotos.cli.commands.Zenodotos") as mock_zenodotos_class:
+        with patch("zenodotos.client.Zenodotos") as mock_zenodotos_class:
             mock_zenodotos = Mock()
             mock_zenodotos_class.return_value = mock_zenodotos
 
@@ -289,6 +597,84 @@ class TestGetFile:
             assert "Failed to get file" in result.output
             assert "Unexpected error" in result.output
 
+    def test_with_multiple_file_ids(self):
+        """Test get-file with several IDs uses the batched lookup."""
+        runner = CliRunner()
+        with patch("zenodotos.client.Zenodotos") as mock_zenodotos_class:
+            mock_zenodotos = Mock()
+            mock_zenodotos_class.return_value = mock_zenodotos
+
+            mock_field_parser = Mock()
+            mock_zenodotos.get_field_parser.return_value = mock_field_parser
+            mock_field_parser.parse_fields.return_value = (
+                ["id", "name", "mimeType", "size"],
+                ["id", "name"],
+            )
+
+            mock_zenodotos.get_files.return_value = [
+                DriveFile(id="test123", name="first.txt", mime_type="text/plain"),
+                DriveFile(id="test456", name="second.txt", mime_type="text/plain"),
+            ]
+
+            result = runner.invoke(cli, ["get-file", "test123", "test456"])
+
+            assert result.exit_code == 0
+            assert "first.txt" in result.output
+            assert "second.txt" in result.output
+            mock_zenodotos.get_files.assert_called_once_with(
+                ["test123", "test456"],
+                fields=["id", "name", "mimeType", "size"],
+                offline=False,
+                use_cache=True,
+            )
+            mock_zenodotos.get_file.assert_not_called()
+
+    def test_no_cache(self):
+        """Test get-file --no-cache bypasses the metadata cache."""
+        runner = CliRunner()
+        with patch("zenodotos.client.Zenodotos") as mock_zenodotos_class:
+            mock_zenodotos = mock_zenodotos_class.return_value
+            mock_zenodotos.get_field_parser.return_value.parse_fields.return_value = (
+                ["id", "name", "mimeType", "size"],
+                None,
+            )
+            mock_zenodotos.get_file.return_value = DriveFile(
+                id="test123", name="test.txt", mime_type="text/plain"
+            )
+
+            result = runner.invoke(cli, ["get-file", "test123", "--no-cache"])
+
+            assert result.exit_code == 0
+            mock_zenodotos.get_file.assert_called_once_with(
+                "test123", offline=False, use_cache=False
+            )
+
+    def test_with_multiple_file_ids_partial_failure(self):
+        """Test get-file shows found files and reports the IDs that failed."""
+        runner = CliRunner()
+        with patch("zenodotos.client.Zenodotos") as mock_zenodotos_class:
+            mock_zenodotos = Mock()
+            mock_zenodotos_class.return_value = mock_zenodotos
+
+            mock_field_parser = Mock()
+            mock_zenodotos.get_field_parser.return_value = mock_field_parser
+            mock_field_parser.parse_fields.return_value = (
+                ["id", "name", "mimeType", "size"],
+                ["id", "name"],
+            )
+
+            mock_zenodotos.get_files.return_value = [
+                DriveFile(id="test123", name="first.txt", mime_type="text/plain"),
+                FileNotFoundError("File with ID missing not found."),
+            ]
+
+            result = runner.invoke(cli, ["get-file", "test123", "missing"])
+
+            assert result.exit_code == 1
+            assert "first.txt" in result.output
+            assert "Error: missing: File with ID missing not found." in result.output
+            assert "Failed to get 1 of 2 files" in result.output
+
     def test_missing_file_id(self):
         """Test get-file without file ID."""
         runner = CliRunner()
@@ -310,7 +696,7 @@ class TestGetFile:
     def test_with_query_single_match(self):
         """Test get-file with query that returns single match."""
         runner = CliRunner()
-        with patch("zenodotos.cli.commands.Zenodotos") as mock_zenodotos_class:
+        with patch("zenodotos.client.Zenodotos") as mock_zenodotos_class:
             mock_zenodotos = Mock()
             mock_zenodotos_class.return_value = mock_zenodotos
 
@@ -365,13 +751,36 @@ class TestGetFile:
             assert "application/pdf" in result.output
             assert "2,048" in result.output
             mock_zenodotos.search_and_get_file.assert_called_once_with(
-                'name contains "report"'
+                'name contains "report"', offline=False, use_cache=True
+            )
+
+    def test_with_query_offline(self):
+        """Test get-file --query --offline searches the local index."""
+        runner = CliRunner()
+        with patch("zenodotos.client.Zenodotos") as mock_zenodotos_class:
+            mock_zenodotos = mock_zenodotos_class.return_value
+            mock_zenodotos.get_field_parser.return_value.parse_fields.return_value = (
+                ["id", "name", "mimeType", "size"],
+                None,
+            )
+            mock_zenodotos.search_and_get_file.side_effect = RuntimeError(
+                "The local index has not been synced yet. Run: zenodotos index sync"
+            )
+
+            result = runner.invoke(
+                cli, ["get-file", "--query", "name = 'report'", "--offline"]
+            )
+
+            assert result.exit_code == 1
+            assert "zenodotos index sync" in result.output
+            mock_zenodotos.search_and_get_file.assert_called_once_with(
+                "name = 'report'", offline=True, use_cache=True
             )
 
     def test_with_query_multiple_matches(self):
         """Test get-file with query that returns multiple matches."""
         runner = CliRunner()
-        with patch("zenodotos.cli.commands.Zenodotos") as mock_zenodotos_class:
+        with patch("zenodotos.client.Zenodotos") as mock_zenodotos_class:
             mock_zenodotos = Mock()
             mock_zenodotos_class.return_value = mock_zenodotos
 
@@ -413,7 +822,7 @@ class TestGetFile:
     def test_with_query_no_matches(self):
         """Test get-file with query that returns no matches."""
         runner = CliRunner()
-        with patch("zenodotos.cli.commands.Zenodotos") as mock_zenodotos_class:
+        with patch("zenodotos.client.Zenodotos") as mock_zenodotos_class:
             mock_zenodotos = Mock()
             mock_zenodotos_class.return_value = mock_zenodotos
 
@@ -462,7 +871,7 @@ class TestExport:
     def test_basic_usage(self):
         """Test basic export command."""
         runner = CliRunner()
-        with patch("zenodotos.cli.commands.Zenodotos") as mock_zenodotos_class:
+        with patch("zenodotos.client.Zenodotos") as mock_zenodotos_class:
             mock_zenodotos = Mock()
             mock_zenodotos_class.return_value = mock_zenodotos
 
@@ -481,7 +890,7 @@ class TestExport:
     def test_with_format(self):
         """Test export with specific format."""
         runner = CliRunner()
-        with patch("zenodotos.cli.commands.Zenodotos") as mock_zenodotos_class:
+        with patch("zenodotos.client.Zenodotos") as mock_zenodotos_class:
             mock_zenodotos = Mock()
             mock_zenodotos_class.return_value = mock_zenodotos
 
@@ -497,7 +906,7 @@ class TestExport:
     def test_with_epub_format(self):
         """Test export with EPUB format."""
         runner = CliRunner()
-        with patch("zenodotos.cli.commands.Zenodotos") as mock_zenodotos_class:
+        with patch("zenodotos.client.Zenodotos") as mock_zenodotos_class:
             mock_zenodotos = Mock()
             mock_zenodotos_class.return_value = mock_zenodotos
 
@@ -513,7 +922,7 @@ class TestExport:
     def test_with_output_path(self):
         """Test export with output path."""
         runner = CliRunner()
-        with patch("zenodotos.cli.commands.Zenodotos") as mock_zenodotos_class:
+        with patch("zenodotos.client.Zenodotos") as mock_zenodotos_class:
             mock_zenodotos = Mock()
             mock_zenodotos_class.return_value = mock_zenodotos
 
@@ -531,7 +940,7 @@ class TestExport:
     def test_with_query_single_match(self):
         """Test export with query that finds single match."""
         runner = CliRunner()
-        with patch("zenodotos.cli.commands.Zenodotos") as mock_zenodotos_class:
+        with patch("zenodotos.client.Zenodotos") as mock_zenodotos_class:
             mock_zenodotos = Mock()
             mock_zenodotos_class.return_value = mock_zenodotos
 
@@ -550,7 +959,7 @@ class TestExport:
     def test_with_query_multiple_matches(self):
         """Test export with query that finds multiple matches."""
         runner = CliRunner()
-        with patch("zenodotos.cli.commands.Zenodotos") as mock_zenodotos_class:
+        with patch("zenodotos.client.Zenodotos") as mock_zenodotos_class:
             mock_zenodotos = Mock()
             mock_zenodotos_class.return_value = mock_zenodotos
 
@@ -577,7 +986,7 @@ class TestExport:
     def test_with_query_no_matches(self):
         """Test export with query that finds no matches."""
         runner = CliRunner()
-        with patch("zenodotos.cli.commands.Zenodotos") as mock_zenodotos_class:
+        with patch("zenodotos.client.Zenodotos") as mock_zenodotos_class:
             mock_zenodotos = Mock()
             mock_zenodotos_class.return_value = mock_zenodotos
 
@@ -615,7 +1024,7 @@ class TestExport:
     def test_file_not_found(self):
         """Test export with non-existent file."""
         runner = CliRunner()
-        with patch("zenodotos.cli.commands.Zenodotos") as mock_zenodotos_class:
+        with patch("zenodotos.client.Zenodotos") as mock_zenodotos_class:
             mock_zenodotos = Mock()
             mock_zenodotos_class.return_value = mock_zenodotos
 
@@ -629,7 +1038,7 @@ class TestExport:
     def test_permission_error(self):
         """Test export with permission error."""
         runner = CliRunner()
-        with patch("zenodotos.cli.commands.Zenodotos") as mock_zenodotos_class:
+        with patch("zenodotos.client.Zenodotos") as mock_zenodotos_class:
             mock_zenodotos = Mock()
             mock_zenodotos_class.return_value = mock_zenodotos
 
@@ -645,7 +1054,7 @@ class TestExport:
     def test_invalid_format(self):
         """Test export with invalid format."""
         runner = CliRunner()
-        with patch("zenodotos.cli.commands.Zenodotos") as mock_zenodotos_class:
+        with patch("zenodotos.client.Zenodotos") as mock_zenodotos_class:
             mock_zenodotos = Mock()
             mock_zenodotos_class.return_value = mock_zenodotos
 
@@ -655,3 +1064,356 @@ class TestExport:
 
             assert result.exit_code == 1
             assert "Invalid format" in result.output
+
+
+class TestDownload:
+    """Test the download command."""
+
+    def test_download(self):
+        """Test download saves the file and reports where."""
+        runner = CliRunner()
+        with patch("zenodotos.client.Zenodotos") as mock_zenodotos_class:
+            mock_zenodotos = mock_zenodotos_class.return_value
+            mock_zenodotos.download_file.return_value = "out/scan.pdf"
+
+            result = runner.invoke(
+                cli, ["download", "file_id", "--output", "out/scan.pdf", "--verbose"]
+            )
+
+            assert result.exit_code == 0
+            assert "Downloading file with ID: file_id" in result.stdout
+            assert "Successfully downloaded to: out/scan.pdf" in result.stdout
+            mock_zenodotos.download_file.assert_called_once_with(
+                "file_id", output_path="out/scan.pdf"
+            )
+
+    @pytest.mark.parametrize(
+        "error, message",
+        [
+            (FileNotFoundError("File with ID file_id not found."), "File not found"),
+            (PermissionError("Insufficient permissions"), "Permission denied"),
+            (ValueError("Notes is a Google Workspace document"), "Cannot download"),
+            (ChecksumMismatchError("Checksum mismatch"), "Download failed"),
+        ],
+    )
+    def test_download_errors(self, error, message):
+        """Test download errors are reported with their cause."""
+        runner = CliRunner()
+        with patch("zenodotos.client.Zenodotos") as mock_zenodotos_class:
+            mock_zenodotos_class.return_value.download_file.side_effect = error
+
+            result = runner.invoke(cli, ["download", "file_id"])
+
+            assert result.exit_code == 1
+            assert str(error) in result.stderr
+            assert message in result.stderr
+
+
+class TestMirror:
+    """Test the mirror command."""
+
+    @staticmethod
+    def summary(**counts):
+        summary = {
+            "downloaded": 0,
+            "exported": 0,
+            "moved": 0,
+            "unchanged": 0,
+            "deleted": 0,
+            "unsupported": 0,
+            "failed": {},
+        }
+        summary.update(counts)
+        return summary
+
+    def test_mirror(self, tmp_path):
+        """Test mirror prints a summary of the run."""
+        runner = CliRunner()
+        with patch("zenodotos.client.Zenodotos") as mock_zenodotos_class:
+            mock_zenodotos = mock_zenodotos_class.return_value
+            mock_zenodotos.mirror_folder.return_value = self.summary(
+                downloaded=2, exported=1, unchanged=5, unsupported=1
+            )
+
+            result = runner.invoke(
+                cli, ["mirror", "folder", str(tmp_path), "--delete", "--jobs", "2"]
+            )
+
+            assert result.exit_code == 0
+            assert (
+                "Mirror complete: 2 downloaded, 1 exported, 0 moved, "
+                "5 unchanged, 0 deleted" in result.stdout
+            )
+            assert "Skipped 1 Google files" in result.stdout
+            mock_zenodotos.mirror_folder.assert_called_once_with(
+                "folder", str(tmp_path), delete=True, jobs=2
+            )
+
+    def test_mirror_reports_failures(self, tmp_path):
+        """Test failed transfers are listed and make the command fail."""
+        runner = CliRunner()
+        with patch("zenodotos.client.Zenodotos") as mock_zenodotos_class:
+            mock_zenodotos_class.return_value.mirror_folder.return_value = self.summary(
+                failed={"Sub/scan.pdf": RuntimeError("Failed to download file")}
+            )
+
+            result = runner.invoke(cli, ["mirror", "folder", str(tmp_path)])
+
+            assert result.exit_code == 1
+            assert "Sub/scan.pdf: Failed to download file" in result.stderr
+            assert "Failed to transfer 1 files" in result.stderr
+
+    def test_mirror_error(self, tmp_path):
+        """Test errors listing the folder are reported."""
+        runner = CliRunner()
+        with patch("zenodotos.client.Zenodotos") as mock_zenodotos_class:
+            mock_zenodotos_class.return_value.mirror_folder.side_effect = ValueError(
+                "not a mirror of this folder"
+            )
+
+            result = runner.invoke(cli, ["mirror", "folder", str(tmp_path)])
+
+            assert result.exit_code == 1
+            assert "not a mirror of this folder" in result.stderr
+            assert "Mirror failed" in result.stderr
+
+
+class TestSearch:
+    """Test the search command."""
+
+    def test_search(self):
+        """Test search lists matches from the local index."""
+        runner = CliRunner()
+        with patch("zenodotos.client.Zenodotos") as mock_zenodotos_class:
+            mock_zenodotos = mock_zenodotos_class.return_value
+            mock_zenodotos.get_field_parser.return_value.parse_fields.return_value = (
+                ["id", "name", "mimeType", "size"],
+                ["id", "name"],
+            )
+            mock_zenodotos.search_files.return_value = [
+                DriveFile(id="abc123", name="Quarterly Report", mime_type="x")
+            ]
+
+            result = runner.invoke(
+                cli, ["search", "quart rep", "--limit", "5", "--fields", "id,name"]
+            )
+
+            assert result.exit_code == 0
+            assert "abc123" in result.output
+            assert "Quarterly Report" in result.output
+            mock_zenodotos.search_files.assert_called_once_with(
+                "quart rep", limit=5, include_trashed=False
+            )
+
+    def test_search_no_matches(self):
+        """Test search exits with an error when nothing matches."""
+        runner = CliRunner()
+        with patch("zenodotos.client.Zenodotos") as mock_zenodotos_class:
+            mock_zenodotos = mock_zenodotos_class.return_value
+            mock_zenodotos.get_field_parser.return_value.parse_fields.return_value = (
+                [],
+                None,
+            )
+            mock_zenodotos.search_files.return_value = []
+
+            result = runner.invoke(cli, ["search", "nothing", "--include-trashed"])
+
+            assert result.exit_code == 1
+            assert "No files found" in result.output
+            mock_zenodotos.search_files.assert_called_once_with(
+                "nothing", limit=20, include_trashed=True
+            )
+
+    def test_search_unsynced_index(self):
+        """Test search reports a missing index."""
+        runner = CliRunner()
+        with patch("zenodotos.client.Zenodotos") as mock_zenodotos_class:
+            mock_zenodotos = mock_zenodotos_class.return_value
+            mock_zenodotos.get_field_parser.return_value.parse_fields.return_value = (
+                [],
+                None,
+            )
+            mock_zenodotos.search_files.side_effect = RuntimeError(
+                "The local index has not been synced yet"
+            )
+
+            result = runner.invoke(cli, ["search", "report"])
+
+            assert result.exit_code == 1
+            assert "has not been synced yet" in result.output
+            assert "Search failed" in result.output
+
+
+class TestIndexCommands:
+    """Test the index command group."""
+
+    def test_sync(self):
+        """Test index sync reports what was applied."""
+        runner = CliRunner()
+        with patch("zenodotos.client.Zenodotos") as mock_zenodotos_class:
+            mock_zenodotos = mock_zenodotos_class.return_value
+            mock_zenodotos.sync_index.return_value = {
+                "full": False,
+                "updated": 3,
+                "removed": 1,
+                "api_calls": 1,
+            }
+
+            result = runner.invoke(cli, ["index", "sync"])
+
+            assert result.exit_code == 0
+            assert "Incremental sync complete: 3 updated, 1 removed" in result.output
+            mock_zenodotos.sync_index.assert_called_once_with(full=False)
+
+    def test_sync_full_failure(self):
+        """Test index sync --full reports failures."""
+        runner = CliRunner()
+        with patch("zenodotos.client.Zenodotos") as mock_zenodotos_class:
+            mock_zenodotos = mock_zenodotos_class.return_value
+            mock_zenodotos.sync_index.side_effect = RuntimeError("API down")
+
+            result = runner.invoke(cli, ["index", "sync", "--full"])
+
+            assert result.exit_code == 1
+            assert "Error: API down" in result.output
+            assert "Index sync failed" in result.output
+            mock_zenodotos.sync_index.assert_called_once_with(full=True)
+
+    def test_status(self):
+        """Test index status shows the file count and last sync time."""
+        runner = CliRunner()
+        with patch("zenodotos.client.Zenodotos") as mock_zenodotos_class:
+            local_index = mock_zenodotos_class.return_value.get_index.return_value
+            local_index.last_synced = datetime(2024, 1, 1)
+            local_index.count.return_value = 12345
+
+            result = runner.invoke(cli, ["index", "status"])
+
+            assert result.exit_code == 0
+            assert "Files: 12,345" in result.output
+            assert "Last synced: 2024-01-01" in result.output
+
+    def test_status_never_synced(self):
+        """Test index status before the first sync."""
+        runner = CliRunner()
+        with patch("zenodotos.client.Zenodotos") as mock_zenodotos_class:
+            local_index = mock_zenodotos_class.return_value.get_index.return_value
+            local_index.last_synced = None
+
+            result = runner.invoke(cli, ["index", "status"])
+
+            assert result.exit_code == 0
+            assert "has not been synced yet" in result.output
+
+
+class TestGlobalOptions:
+    """Test the options of the cli group."""
+
+    def test_timings(self, monkeypatch):
+        """Test --timings reports the phases of a command on stderr."""
+        with FakeDriveServer(size=30) as server:
+            monkeypatch.setenv("ZENODOTOS_API_ENDPOINT", server.url)
+            result = CliRunner().invoke(
+                cli, ["--timings", "list-files", "--all", "--output-format", "csv"]
+            )
+
+        assert result.exit_code == 0
+        assert "Timings" not in result.stdout
+        phases = [line.split()[0] for line in result.stderr.splitlines()[1:]]
+        assert phases == [
+            "import",
+            "config",
+            "service",
+            "api",
+            "parse",
+            "format",
+            "other",
+            "total",
+        ]
+        assert get_timings() is None
+
+    def test_profile(self, tmp_path):
+        """Test --profile saves cProfile stats of the command."""
+        profile_path = tmp_path / "list.prof"
+        with patch("zenodotos.client.Zenodotos") as mock_zenodotos_class:
+            mock_zenodotos = mock_zenodotos_class.return_value
+            mock_zenodotos.get_field_parser.return_value.parse_fields.return_value = (
+                ["name"],
+                ["name"],
+            )
+            mock_zenodotos.list_files_with_pagination.return_value = {
+                "files": [],
+                "next_page_token": None,
+            }
+
+            result = CliRunner().invoke(
+                cli, ["--profile", str(profile_path), "list-files", "--no-interactive"]
+            )
+
+        assert result.exit_code == 0
+        stats = pstats.Stats(str(profile_path))
+        assert any(name == "list_files" for _, _, name in stats.stats)
+
+
+@pytest.fixture(scope="module")
+def synced_home(tmp_path_factory):
+    """Provide a home directory holding a synced local index."""
+    home = tmp_path_factory.mktemp("home")
+    drive = SyntheticDrive()
+    drive.add_file("Quarterly report.pdf", "application/pdf")
+    with FakeDriveServer(drive) as server:
+        local_index = LocalIndex(home / ".config" / "zenodotos" / "index.sqlite3")
+        local_index.sync(DriveClient(api_endpoint=server.url))
+        local_index.close()
+    return home
+
+
+class TestStartup:
+    """Test the CLI starts without loading the Google API libraries."""
+
+    HEAVY_MODULES = ["googleapiclient", "google_auth_oauthlib", "httplib2", "dateutil"]
+
+    @pytest.mark.parametrize(
+        "args",
+        [
+            ["--help"],
+            ["--version"],
+            ["search", "report"],
+            ["list-files", "--offline", "--no-interactive"],
+            ["get-file", "--offline", "--query", "name contains 'report'"],
+            ["index", "status"],
+        ],
+    )
+    def test_no_heavy_imports(self, args, synced_home):
+        """Test --help, --version and offline commands import no Google API library."""
+        script = (
+            "import sys\n"
+            "from zenodotos.cli import cli\n"
+            "try:\n"
+            f"    cli({args!r})\n"
+            "except SystemExit as e:\n"
+            "    assert not e.code, e.code\n"
+            "print(sorted({m.split('.')[0] for m in sys.modules}))\n"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", script],
+            capture_output=True,
+            text=True,
+            check=True,
+            env={**os.environ, "HOME": str(synced_home)},
+        )
+
+        modules = result.stdout.splitlines()[-1]
+        for module in self.HEAVY_MODULES:
+            assert repr(module) not in modules
+
+    def test_help_lists_every_command(self):
+        """Test lazily loaded commands are listed and run."""
+        runner = CliRunner()
+
+        result = runner.invoke(cli, ["--help"])
+
+        assert result.exit_code == 0
+        for name in COMMANDS:
+            assert name in result.output
+        assert runner.invoke(cli, ["nope"]).exit_code == 2
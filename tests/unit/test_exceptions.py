@@ -7,6 +7,7 @@ from zenodotos.exceptions import (
     FileNotFoundError,
     PermissionError,
     ExportError,
+    ChecksumMismatchError,
     ValidationError,
     ConfigurationError,
     RateLimitError,
@@ -70,6 +71,16 @@ class TestExportError:
         assert isinstance(error, ZenodotosError)
 
 
+class TestChecksumMismatchError:
+    """Test ChecksumMismatchError exception."""
+
+    def test_checksum_mismatch_error_creation(self):
+        """Test ChecksumMismatchError creation."""
+        error = ChecksumMismatchError("Checksum mismatch for scan.pdf")
+        assert str(error) == "Checksum mismatch for scan.pdf"
+        assert isinstance(error, ZenodotosError)
+
+
 class TestValidationError:
     """Test ValidationError exception."""
 
@@ -156,6 +167,7 @@ class TestExceptionInheritance:
             FileNotFoundError,
             PermissionError,
             ExportError,
+            ChecksumMismatchError,
             ValidationError,
             ConfigurationError,
             RateLimitError,
@@ -16,7 +16,7 @@ class TestExportCommand:
         runner = CliRunner()
 
         # Mock the Zenodotos.export_file method
-        with patch("zenodotos.cli.commands.Zenodotos") as mock_zenodotos_class:
+        with patch("zenodotos.client.Zenodotos") as mock_zenodotos_class:
             mock_zenodotos = Mock()
             mock_zenodotos_class.return_value = mock_zenodotos
             mock_zenodotos.export_file.return_value = "My Document.zip"
@@ -40,7 +40,7 @@ class TestExportCommand:
         with tempfile.TemporaryDirectory() as temp_dir:
             output_path = os.path.join(temp_dir, "custom_name.zip")
 
-            with patch("zenodotos.cli.commands.Zenodotos") as mock_zenodotos_class:
+            with patch("zenodotos.client.Zenodotos") as mock_zenodotos_class:
                 mock_zenodotos = Mock()
                 mock_zenodotos_class.return_value = mock_zenodotos
                 mock_zenodotos.export_file.return_value = output_path
@@ -62,7 +62,7 @@ class TestExportCommand:
         """Test export command when file doesn't exist."""
         runner = CliRunner()
 
-        with patch("zenodotos.cli.commands.Zenodotos") as mock_zenodotos_class:
+        with patch("zenodotos.client.Zenodotos") as mock_zenodotos_class:
             mock_zenodotos = Mock()
             mock_zenodotos_class.return_value = mock_zenodotos
             mock_zenodotos.export_file.side_effect = FileNotFoundError("File not found")
@@ -76,7 +76,7 @@ class TestExportCommand:
         """Test export command when user lacks permission."""
         runner = CliRunner()
 
-        with patch("zenodotos.cli.commands.Zenodotos") as mock_zenodotos_class:
+        with patch("zenodotos.client.Zenodotos") as mock_zenodotos_class:
             mock_zenodotos = Mock()
             mock_zenodotos_class.return_value = mock_zenodotos
             mock_zenodotos.export_file.side_effect = PermissionError(
@@ -92,7 +92,7 @@ class TestExportCommand:
         """Test export command when a generic error occurs."""
         runner = CliRunner()
 
-        with patch("zenodotos.cli.commands.Zenodotos") as mock_zenodotos_class:
+        with patch("zenodotos.client.Zenodotos") as mock_zenodotos_class:
             mock_zenodotos = Mock()
             mock_zenodotos_class.return_value = mock_zenodotos
             mock_zenodotos.export_file.side_effect = RuntimeError(
@@ -127,7 +127,7 @@ class TestExportCommand:
         """Test export command with verbose flag."""
         runner = CliRunner()
 
-        with patch("zenodotos.cli.commands.Zenodotos") as mock_zenodotos_class:
+        with patch("zenodotos.client.Zenodotos") as mock_zenodotos_class:
             mock_zenodotos = Mock()
             mock_zenodotos_class.return_value = mock_zenodotos
             mock_zenodotos.export_file.return_value = "My Document.zip"
@@ -142,7 +142,7 @@ class TestExportCommand:
         """Test export command with format option."""
         runner = CliRunner()
 
-        with patch("zenodotos.cli.commands.Zenodotos") as mock_zenodotos_class:
+        with patch("zenodotos.client.Zenodotos") as mock_zenodotos_class:
             mock_zenodotos = Mock()
             mock_zenodotos_class.return_value = mock_zenodotos
             mock_zenodotos.export_file.return_value = "My Document.pdf"
@@ -179,7 +179,7 @@ class TestExportCommand:
         """Test export command uses smart defaults when no format specified."""
         runner = CliRunner()
 
-        with patch("zenodotos.cli.commands.Zenodotos") as mock_zenodotos_class:
+        with patch("zenodotos.client.Zenodotos") as mock_zenodotos_class:
             mock_zenodotos = Mock()
             mock_zenodotos_class.return_value = mock_zenodotos
             mock_zenodotos.export_file.return_value = "My Document.zip"
@@ -196,7 +196,7 @@ class TestExportCommand:
         """Test export command with RTF format."""
         runner = CliRunner()
 
-        with patch("zenodotos.cli.commands.Zenodotos") as mock_zenodotos_class:
+        with patch("zenodotos.client.Zenodotos") as mock_zenodotos_class:
             mock_zenodotos = Mock()
             mock_zenodotos_class.return_value = mock_zenodotos
             mock_zenodotos.export_file.return_value = "My Document.rtf"
@@ -216,7 +216,7 @@ class TestExportCommand:
         """Test export command with TXT format."""
         runner = CliRunner()
 
-        with patch("zenodotos.cli.commands.Zenodotos") as mock_zenodotos_class:
+        with patch("zenodotos.client.Zenodotos") as mock_zenodotos_class:
             mock_zenodotos = Mock()
             mock_zenodotos_class.return_value = mock_zenodotos
             mock_zenodotos.export_file.return_value = "My Document.txt"
@@ -236,7 +236,7 @@ class TestExportCommand:
         """Test export command with ODT format."""
         runner = CliRunner()
 
-        with patch("zenodotos.cli.commands.Zenodotos") as mock_zenodotos_class:
+        with patch("zenodotos.client.Zenodotos") as mock_zenodotos_class:
             mock_zenodotos = Mock()
             mock_zenodotos_class.return_value = mock_zenodotos
             mock_zenodotos.export_file.return_value = "My Document.odt"
@@ -257,7 +257,7 @@ class TestExportCommand:
         """Test export command with query that returns single match."""
         runner = CliRunner()
 
-        with patch("zenodotos.cli.commands.Zenodotos") as mock_zenodotos_class:
+        with patch("zenodotos.client.Zenodotos") as mock_zenodotos_class:
             mock_zenodotos = Mock()
             mock_zenodotos_class.return_value = mock_zenodotos
 
@@ -280,7 +280,7 @@ class TestExportCommand:
         """Test export command with query that returns multiple matches."""
         runner = CliRunner()
 
-        with patch("zenodotos.cli.commands.Zenodotos") as mock_zenodotos_class:
+        with patch("zenodotos.client.Zenodotos") as mock_zenodotos_class:
             mock_zenodotos = Mock()
             mock_zenodotos_class.return_value = mock_zenodotos
 
@@ -317,7 +317,7 @@ class TestExportCommand:
         """Test export command with query that returns no matches."""
         runner = CliRunner()
 
-        with patch("zenodotos.cli.commands.Zenodotos") as mock_zenodotos_class:
+        with patch("zenodotos.client.Zenodotos") as mock_zenodotos_class:
             mock_zenodotos = Mock()
             mock_zenodotos_class.return_value = mock_zenodotos
 
@@ -365,7 +365,7 @@ class TestExportCommand:
         """Test export command with query and verbose flag for single match."""
         runner = CliRunner()
 
-        with patch("zenodotos.cli.commands.Zenodotos") as mock_zenodotos_class:
+        with patch("zenodotos.client.Zenodotos") as mock_zenodotos_class:
             mock_zenodotos = Mock()
             mock_zenodotos_class.return_value = mock_zenodotos
 
@@ -383,7 +383,7 @@ class TestExportCommand:
         """Test export command with file ID and verbose flag."""
         runner = CliRunner()
 
-        with patch("zenodotos.cli.commands.Zenodotos") as mock_zenodotos_class:
+        with patch("zenodotos.client.Zenodotos") as mock_zenodotos_class:
             mock_zenodotos = Mock()
             mock_zenodotos_class.return_value = mock_zenodotos
             mock_zenodotos.export_file.return_value = "My Document.zip"
@@ -398,7 +398,7 @@ class TestExportCommand:
         """Test export command handles generic exceptions."""
         runner = CliRunner()
 
-        with patch("zenodotos.cli.commands.Zenodotos") as mock_zenodotos_class:
+        with patch("zenodotos.client.Zenodotos") as mock_zenodotos_class:
             mock_zenodotos = Mock()
             mock_zenodotos_class.return_value = mock_zenodotos
             # Raise a generic exception that's not FileNotFoundError, PermissionError, or ValueError
@@ -409,3 +409,67 @@ class TestExportCommand:
             assert result.exit_code == 1
             assert "Error: Network error" in result.output
             assert "Export failed" in result.output
+
+    def test_export_all_matches(self):
+        """Test export --all exports every match in parallel."""
+        runner = CliRunner()
+
+        with patch("zenodotos.client.Zenodotos") as mock_zenodotos_class:
+            mock_zenodotos = Mock()
+            mock_zenodotos_class.return_value = mock_zenodotos
+            mock_zenodotos.search_and_export_all.return_value = {
+                "exported": {"1": "out/Report.pdf", "2": "out/Report (2).pdf"},
+                "failed": {},
+            }
+
+            result = runner.invoke(
+                cli,
+                [
+                    "export",
+                    "--query",
+                    "name contains 'Report'",
+                    "--all",
+                    "--jobs",
+                    "8",
+                    "--output",
+                    "out",
+                    "--format",
+                    "pdf",
+                ],
+            )
+
+            assert result.exit_code == 0
+            assert "Successfully exported to: out/Report (2).pdf" in result.output
+            assert "Exported 2 of 2 files" in result.output
+            mock_zenodotos.search_and_export_all.assert_called_once_with(
+                "name contains 'Report'", output_dir="out", format="pdf", jobs=8
+            )
+
+    def test_export_all_with_failures(self):
+        """Test export --all reports failed files and exits with an error."""
+        runner = CliRunner()
+
+        with patch("zenodotos.client.Zenodotos") as mock_zenodotos_class:
+            mock_zenodotos = Mock()
+            mock_zenodotos_class.return_value = mock_zenodotos
+            mock_zenodotos.search_and_export_all.return_value = {
+                "exported": {"1": "Report.pdf"},
+                "failed": {"2": RuntimeError("Failed to export file: boom")},
+            }
+
+            result = runner.invoke(
+                cli, ["export", "--query", "name contains 'Report'", "--all"]
+            )
+
+            assert result.exit_code == 1
+            assert "Error: 2: Failed to export file: boom" in result.output
+            assert "Failed to export 1 of 2 files" in result.output
+
+    def test_export_all_requires_query(self):
+        """Test export --all cannot be used with a file ID."""
+        runner = CliRunner()
+
+        result = runner.invoke(cli, ["export", "1abc123", "--all"])
+
+        assert result.exit_code == 1
+        assert "--all requires --query" in result.output
@@ -0,0 +1,254 @@
+"""Tests for the local metadata index."""
+
+from datetime import datetime, timezone
+from unittest.mock import Mock
+
+import pytest
+
+from zenodotos.drive.models import DriveFile
+from zenodotos.index import INDEX_FIELDS, LocalIndex
+
+
+@pytest.fixture
+def index(tmp_path):
+    """Create an empty index in a temporary directory."""
+    local_index = LocalIndex(tmp_path / "index.sqlite3")
+    yield local_index
+    local_index.close()
+
+
+def make_file(file_id, name, parents=("root",), trashed=False):
+    return DriveFile(
+        id=file_id,
+        name=name,
+        mime_type="application/vnd.google-apps.document",
+        size=10,
+        modified_time=datetime(2024, 1, 2, 3, 4, 5, tzinfo=timezone.utc),
+        owners=[{"emailAddress": "me@example.com"}],
+        parents=list(parents),
+        trashed=trashed,
+    )
+
+
+def change(file_id, file=None):
+    return {"file_id": file_id, "removed": file is None, "file": file}
+
+
+@pytest.fixture
+def client():
+    """Mock Drive client with a two-page drive listing."""
+    client = Mock()
+    client.get_start_page_token.return_value = "100"
+    client.list_files.side_effect = [
+        {"files": [make_file("1", "Report")], "next_page_token": "page2"},
+        {"files": [make_file("2", "Budget")], "next_page_token": None},
+    ]
+    return client
+
+
+class TestLocalIndex:
+    """Tests for LocalIndex."""
+
+    def test_first_sync_lists_every_file(self, index, client):
+        """Test the first sync builds the index from a complete listing."""
+        result = index.sync(client)
+
+        assert result == {"full": True, "updated": 2, "removed": 0, "api_calls": 3}
+        assert index.count() == 2
+        assert index.start_page_token == "100"
+        assert index.last_synced is not None
+        client.list_files.assert_called_with(
+            page_size=1000, page_token="page2", fields=INDEX_FIELDS, use_cache=False
+        )
+        client.list_changes.assert_not_called()
+
+        file = index.get_file("1")
+        assert file.name == "Report"
+        assert file.size == 10
+        assert file.modified_time == datetime(2024, 1, 2, 3, 4, 5, tzinfo=timezone.utc)
+        assert file.owners == [{"emailAddress": "me@example.com"}]
+        assert file.parents == ["root"]
+        assert file.trashed is False
+
+    def test_quiet_sync_costs_one_call(self, index, client):
+        """Test a sync with no changes makes a single API call."""
+        index.sync(client)
+        client.list_changes.return_value = {
+            "changes": [],
+            "next_page_token": None,
+            "new_start_page_token": "100",
+        }
+
+        result = index.sync(client)
+
+        assert result == {"full": False, "updated": 0, "removed": 0, "api_calls": 1}
+        client.list_changes.assert_called_once_with(
+            "100", page_size=1000, fields=INDEX_FIELDS
+        )
+        assert client.list_files.call_count == 2
+
+    def test_changes_reflect_deletions_trashing_and_moves(self, index, client):
+        """Test incremental sync applies removals, trashing and moves."""
+        index.sync(client)
+        client.list_changes.side_effect = [
+            {
+                "changes": [
+                    change("1", make_file("1", "Report", parents=["folder"])),
+                    change("2", make_file("2", "Budget", trashed=True)),
+                ],
+                "next_page_token": "101",
+                "new_start_page_token": None,
+            },
+            {
+                "changes": [change("3", make_file("3", "New")), change("1")],
+                "next_page_token": None,
+                "new_start_page_token": "102",
+            },
+        ]
+
+        result = index.sync(client)
+
+        assert result == {"full": False, "updated": 3, "removed": 1, "api_calls": 2}
+        assert index.get_file("1") is None
+        assert index.get_file("2").trashed is True
+        assert index.get_file("3").name == "New"
+        assert index.start_page_token == "102"
+
+    def test_moves_replace_parents(self, index, client):
+        """Test a moved file keeps only its new parents."""
+        index.sync(client)
+        client.list_changes.return_value = {
+            "changes": [change("2", make_file("2", "Budget", parents=["a", "b"]))],
+            "next_page_token": None,
+            "new_start_page_token": "101",
+        }
+
+        index.sync(client)
+
+        assert sorted(index.get_file("2").parents) == ["a", "b"]
+
+    def test_interrupted_sync_resumes_from_last_page(self, index, client):
+        """Test an incremental sync failing midway keeps the applied pages."""
+        index.sync(client)
+        client.list_changes.side_effect = [
+            {
+                "changes": [change("2")],
+                "next_page_token": "101",
+                "new_start_page_token": None,
+            },
+            RuntimeError("boom"),
+        ]
+
+        with pytest.raises(RuntimeError):
+            index.sync(client)
+
+        assert index.get_file("2") is None
+        assert index.start_page_token == "101"
+
+    def test_failed_full_sync_keeps_previous_index(self, index, client):
+        """Test a failed rebuild leaves the previous index untouched."""
+        index.sync(client)
+        client.list_files.side_effect = [
+            {"files": [make_file("9", "Other")], "next_page_token": "page2"},
+            RuntimeError("boom"),
+        ]
+
+        with pytest.raises(RuntimeError):
+            index.sync(client, full=True)
+
+        assert index.count() == 2
+        assert index.get_file("9") is None
+        assert index.start_page_token == "100"
+
+    def test_clear(self, index, client):
+        """Test clear empties the index and forgets the sync state."""
+        index.sync(client)
+
+        index.clear()
+
+        assert index.count() == 0
+        assert index.start_page_token is None
+        assert index.last_synced is None
+
+
+class TestSearch:
+    """Tests for full-text search over the index."""
+
+    @pytest.fixture
+    def synced(self, index, client):
+        client.list_files.side_effect = [
+            {
+                "files": [
+                    make_file("1", "Quarterly Report"),
+                    make_file("2", "Budget"),
+                    make_file("3", "Résumé draft"),
+                    make_file("4", "Old report", trashed=True),
+                ],
+                "next_page_token": None,
+            }
+        ]
+        index.sync(client)
+        return index
+
+    def test_prefix_words(self, synced):
+        """Test every word matches as a prefix, ignoring case."""
+        assert [f.id for f in synced.search("quart REP")] == ["1"]
+        assert [f.id for f in synced.search("re")] == ["1", "3"]
+
+    def test_accents_are_ignored(self, synced):
+        """Test accented names match unaccented searches."""
+        assert [f.id for f in synced.search("resume")] == ["3"]
+
+    def test_trashed_files_are_optional(self, synced):
+        """Test trashed files are only returned on request."""
+        assert [f.id for f in synced.search("report")] == ["1"]
+        found = synced.search("report", include_trashed=True)
+        assert sorted(f.id for f in found) == ["1", "4"]
+
+    def test_name_matches_rank_first(self, synced, client):
+        """Test a name match outranks a description match."""
+        described = make_file("5", "Notes")
+        described.description = "Budget figures"
+        client.list_changes.return_value = {
+            "changes": [change("5", described)],
+            "next_page_token": None,
+            "new_start_page_token": "101",
+        }
+        synced.sync(client)
+
+        assert [f.id for f in synced.search("budget")] == ["2", "5"]
+
+    def test_updates_and_removals_are_searchable(self, synced, client):
+        """Test the search index follows renames and deletions."""
+        client.list_changes.return_value = {
+            "changes": [change("1", make_file("1", "Annual summary")), change("2")],
+            "next_page_token": None,
+            "new_start_page_token": "101",
+        }
+        synced.sync(client)
+
+        assert synced.search("quarterly") == []
+        assert synced.search("budget") == []
+        assert [f.id for f in synced.search("annual")] == ["1"]
+
+    def test_limit_and_punctuation(self, synced):
+        """Test results are capped and query syntax is treated as text."""
+        assert len(synced.search("report OR budget", limit=1)) == 0
+        assert len(synced.search("re", limit=1)) == 1
+        assert synced.search('"*:') == []
+
+    def test_existing_index_is_indexed_for_search(self, tmp_path, client):
+        """Test an index created before search gets its files indexed."""
+        path = tmp_path / "index.sqlite3"
+        index = LocalIndex(path)
+        index.sync(client)
+        connection = index._connect()
+        connection.executescript(
+            "DROP TRIGGER files_fts_insert; DROP TRIGGER files_fts_delete; "
+            "DROP TRIGGER files_fts_update; DROP TABLE files_fts;"
+        )
+        index.close()
+
+        reopened = LocalIndex(path)
+        assert [f.id for f in reopened.search("budget")] == ["2"]
+        reopened.close()
@@ -1,10 +1,12 @@
 """Tests for the Zenodotos library components."""
 
 import pytest
-from unittest.mock import Mock, patch
-from zenodotos import Zenodotos, FieldParser
+from unittest.mock import Mock, call, patch
+from zenodotos import Zenodotos, FieldParser, NoFilesFoundError
+from zenodotos.drive.fake_server import FakeDriveServer, SyntheticDrive
 from zenodotos.drive.models import DriveFile
 from datetime import datetime
+from pathlib import Path
 
 
 class TestZenodotos:
@@ -12,7 +14,7 @@ class TestZenodotos:
 
     def test_zenodotos_initialization(self):
         """Test Zenodotos client initialization."""
-        with patch("zenodotos.client.DriveClient") as mock_client_class:
+        with patch("zenodotos.drive.client.DriveClient") as mock_client_class:
             mock_client = Mock()
             mock_client_class.return_value = mock_client
 
@@ -22,7 +24,7 @@ class TestZenodotos:
 
     def test_zenodotos_initialization_with_credentials_path(self):
         """Test Zenodotos client initialization with custom credentials path."""
-        with patch("zenodotos.client.DriveClient") as mock_client_class:
+        with patch("zenodotos.drive.client.DriveClient") as mock_client_class:
             mock_client = Mock()
             mock_client_class.return_value = mock_client
 
@@ -35,7 +37,7 @@ class TestZenodotos:
 
     def test_list_files_basic(self):
         """Test basic list_files functionality."""
-        with patch("zenodotos.client.DriveClient") as mock_client_class:
+        with patch("zenodotos.drive.client.DriveClient") as mock_client_class:
             mock_client = Mock()
             mock_client_class.return_value = mock_client
 
@@ -56,12 +58,12 @@ class TestZenodotos:
 
             assert result == [mock_file]
             mock_client.list_files.assert_called_once_with(
-                page_size=10, query=None, fields=None
+                page_size=10, query=None, fields=None, use_cache=True
             )
 
     def test_list_files_with_query(self):
         """Test list_files with query parameter."""
-        with patch("zenodotos.client.DriveClient") as mock_client_class:
+        with patch("zenodotos.drive.client.DriveClient") as mock_client_class:
             mock_client = Mock()
             mock_client_class.return_value = mock_client
 
@@ -83,12 +85,15 @@ class TestZenodotos:
 
             assert result == [mock_file]
             mock_client.list_files.assert_called_once_with(
-                page_size=20, query="name contains 'report'", fields=["name", "size"]
+                page_size=20,
+                query="name contains 'report'",
+                fields=["name", "size"],
+                use_cache=True,
             )
 
     def test_list_files_with_pagination(self):
         """Test list_files_with_pagination returns full result."""
-        with patch("zenodotos.client.DriveClient") as mock_client_class:
+        with patch("zenodotos.drive.client.DriveClient") as mock_client_class:
             mock_client = Mock()
             mock_client_class.return_value = mock_client
 
@@ -115,11 +120,77 @@ class TestZenodotos:
                 page_token="current_token",
                 query="test query",
                 fields=None,
+                use_cache=True,
             )
 
+    def test_iter_files_follows_page_tokens_lazily(self):
+        """Test iter_files yields files page by page as they are consumed."""
+        with patch("zenodotos.drive.client.DriveClient") as mock_client_class:
+            mock_client = Mock()
+            mock_client_class.return_value = mock_client
+
+            first = DriveFile(id="1", name="First")
+            second = DriveFile(id="2", name="Second")
+            mock_client.list_files.side_effect = [
+                {"files": [first], "next_page_token": "token"},
+                {"files": [second], "next_page_token": None},
+            ]
+
+            zenodotos = Zenodotos()
+            files = zenodotos.iter_files(query="test query", fields=["id"])
+
+            assert next(files) == first
+            assert mock_client.list_files.call_count == 1
+            assert list(files) == [second]
+            assert mock_client.list_files.call_args_list == [
+                call(
+                    page_size=100,
+                    page_token=None,
+                    query="test query",
+                    fields=["id"],
+                    use_cache=True,
+                ),
+                call(
+                    page_size=100,
+                    page_token="token",
+                    query="test query",
+                    fields=["id"],
+                    use_cache=True,
+                ),
+            ]
+
+    def test_iter_files_stops_at_limit(self):
+        """Test iter_files stops requesting pages once the limit is reached."""
+        with patch("zenodotos.drive.client.DriveClient") as mock_client_class:
+            mock_client = Mock()
+            mock_client_class.return_value = mock_client
+
+            page = [DriveFile(id=str(n), name=f"File {n}") for n in range(2)]
+            mock_client.list_files.side_effect = [
+                {"files": page, "next_page_token": "token"},
+                {"files": page, "next_page_token": "more"},
+            ]
+
+            zenodotos = Zenodotos()
+            files = list(zenodotos.iter_files(page_size=2, limit=3))
+
+            assert len(files) == 3
+            assert mock_client.list_files.call_count == 2
+            assert mock_client.list_files.call_args.kwargs["page_size"] == 1
+
+    def test_iter_files_rejects_invalid_arguments(self):
+        """Test iter_files validates page_size and limit."""
+        with patch("zenodotos.drive.client.DriveClient"):
+            zenodotos = Zenodotos()
+
+            with pytest.raises(ValueError, match="page_size must be at least 1"):
+                list(zenodotos.iter_files(page_size=0))
+            with pytest.raises(ValueError, match="limit must not be negative"):
+                list(zenodotos.iter_files(limit=-1))
+
     def test_get_file(self):
         """Test get_file functionality."""
-        with patch("zenodotos.client.DriveClient") as mock_client_class:
+        with patch("zenodotos.drive.client.DriveClient") as mock_client_class:
             mock_client = Mock()
             mock_client_class.return_value = mock_client
 
@@ -137,11 +208,29 @@ class TestZenodotos:
             result = zenodotos.get_file("test123")
 
             assert result == mock_file
-            mock_client.get_file.assert_called_once_with("test123")
+            mock_client.get_file.assert_called_once_with("test123", use_cache=True)
+
+    def test_get_files(self):
+        """Test get_files delegates to the batched client lookup."""
+        with patch("zenodotos.drive.client.DriveClient") as mock_client_class:
+            mock_client = Mock()
+            mock_client_class.return_value = mock_client
+
+            mock_file = DriveFile(id="test123", name="test.txt")
+            error = FileNotFoundError("File with ID missing not found.")
+            mock_client.get_files.return_value = [mock_file, error]
+
+            zenodotos = Zenodotos()
+            result = zenodotos.get_files(["test123", "missing"], fields=["id"])
+
+            assert result == [mock_file, error]
+            mock_client.get_files.assert_called_once_with(
+                ["test123", "missing"], fields=["id"], use_cache=True
+            )
 
     def test_export_file(self):
         """Test export_file functionality."""
-        with patch("zenodotos.client.DriveClient") as mock_client_class:
+        with patch("zenodotos.drive.client.DriveClient") as mock_client_class:
             mock_client = Mock()
             mock_client_class.return_value = mock_client
 
@@ -154,12 +243,96 @@ class TestZenodotos:
 
             assert result == "/path/to/exported/file.pdf"
             mock_client.export.assert_called_once_with(
-                "test123", "/custom/path.pdf", "pdf"
+                "test123", "/custom/path.pdf", "pdf", file=None
+            )
+
+    def test_export_many_resolves_file_ids(self):
+        """Test export_many looks up IDs in one batch and reports failures."""
+        with patch("zenodotos.drive.client.DriveClient") as mock_client_class:
+            mock_client = Mock()
+            mock_client_class.return_value = mock_client
+
+            known = DriveFile(id="known", name="Known")
+            listed = DriveFile(id="listed", name="Listed")
+            missing = FileNotFoundError("File with ID missing not found.")
+            mock_client.get_files.return_value = [known, missing]
+            mock_client.export_many.return_value = {
+                "exported": {"listed": "Listed.pdf", "known": "Known.pdf"},
+                "failed": {},
+            }
+
+            zenodotos = Zenodotos()
+            result = zenodotos.export_many(
+                [listed, "known", "missing"], output_dir="out", format="pdf", jobs=2
+            )
+
+            mock_client.get_files.assert_called_once_with(["known", "missing"])
+            mock_client.export_many.assert_called_once_with(
+                [listed, known], output_dir="out", format="pdf", jobs=2
+            )
+            assert result["exported"] == {
+                "listed": "Listed.pdf",
+                "known": "Known.pdf",
+            }
+            assert result["failed"] == {"missing": missing}
+
+    def test_search_and_export_all_skips_binary_files(self, monkeypatch, tmp_path):
+        """Test binary matches are reported as not exportable, not sent to export."""
+        drive = SyntheticDrive()
+        drive.add_file("Report", "application/vnd.google-apps.document")
+        drive.add_file("Report scan.pdf", "application/pdf", content=b"%PDF")
+        with FakeDriveServer(drive) as server:
+            monkeypatch.setenv("ZENODOTOS_API_ENDPOINT", server.url)
+            result = Zenodotos().search_and_export_all(
+                "name contains 'Report'", output_dir=str(tmp_path)
+            )
+            exports = server.request_count
+
+        (scan_id,) = result["failed"]
+        assert drive.get(scan_id)["name"] == "Report scan.pdf"
+        assert "download it instead" in str(result["failed"][scan_id])
+        assert [Path(p).name for p in result["exported"].values()] == ["Report.zip"]
+        assert exports == 2
+
+    def test_search_and_export_all_follows_pagination(self):
+        """Test search_and_export_all exports matches from every page."""
+        with patch("zenodotos.drive.client.DriveClient") as mock_client_class:
+            mock_client = Mock()
+            mock_client_class.return_value = mock_client
+
+            first = DriveFile(id="1", name="First")
+            second = DriveFile(id="2", name="Second")
+            mock_client.list_files.side_effect = [
+                {"files": [first], "next_page_token": "token"},
+                {"files": [second], "next_page_token": None},
+            ]
+            mock_client.export_many.return_value = {"exported": {}, "failed": {}}
+
+            zenodotos = Zenodotos()
+            zenodotos.search_and_export_all("name contains 'x'", jobs=8)
+
+            assert mock_client.list_files.call_count == 2
+            mock_client.export_many.assert_called_once_with(
+                [first, second], output_dir=None, format=None, jobs=8
             )
 
+    def test_search_and_export_all_no_matches(self):
+        """Test search_and_export_all raises when nothing matches."""
+        with patch("zenodotos.drive.client.DriveClient") as mock_client_class:
+            mock_client = Mock()
+            mock_client_class.return_value = mock_client
+            mock_client.list_files.return_value = {
+                "files": [],
+                "next_page_token": None,
+            }
+
+            zenodotos = Zenodotos()
+            with pytest.raises(NoFilesFoundError):
+                zenodotos.search_and_export_all("name contains 'x'")
+
     def test_search_and_export_single_match(self):
         """Test search_and_export with single match."""
-        with patch("zenodotos.client.DriveClient") as mock_client_class:
+        with patch("zenodotos.drive.client.DriveClient") as mock_client_class:
             mock_client = Mock()
             mock_client_class.return_value = mock_client
 
@@ -185,15 +358,18 @@ class TestZenodotos:
 
             assert result == "/path/to/exported/report.pdf"
             mock_client.list_files.assert_called_once_with(
-                page_size=100, query="name contains 'report'", fields=None
+                page_size=100,
+                query="name contains 'report'",
+                fields=None,
+                use_cache=True,
             )
             mock_client.export.assert_called_once_with(
-                "test123", "/custom/path.pdf", "pdf"
+                "test123", "/custom/path.pdf", "pdf", file=mock_file
             )
 
     def test_search_and_export_no_matches(self):
         """Test search_and_export with no matches."""
-        with patch("zenodotos.client.DriveClient") as mock_client_class:
+        with patch("zenodotos.drive.client.DriveClient") as mock_client_class:
             mock_client = Mock()
             mock_client_class.return_value = mock_client
 
@@ -207,7 +383,7 @@ class TestZenodotos:
 
     def test_search_and_export_multiple_matches(self):
         """Test search_and_export with multiple matches."""
-        with patch("zenodotos.client.DriveClient") as mock_client_class:
+        with patch("zenodotos.drive.client.DriveClient") as mock_client_class:
             mock_client = Mock()
             mock_client_class.return_value = mock_client
 
@@ -231,7 +407,7 @@ class TestZenodotos:
 
     def test_search_and_get_file_single_match(self):
         """Test search_and_get_file with single match."""
-        with patch("zenodotos.client.DriveClient") as mock_client_class:
+        with patch("zenodotos.drive.client.DriveClient") as mock_client_class:
             mock_client = Mock()
             mock_client_class.return_value = mock_client
 
@@ -266,13 +442,16 @@ class TestZenodotos:
 
             assert result == mock_detailed_file
             mock_client.list_files.assert_called_once_with(
-                page_size=100, query="name contains 'report'", fields=None
+                page_size=100,
+                query="name contains 'report'",
+                fields=None,
+                use_cache=True,
             )
-            mock_client.get_file.assert_called_once_with("test123")
+            mock_client.get_file.assert_called_once_with("test123", use_cache=True)
 
     def test_search_and_get_file_no_matches(self):
         """Test search_and_get_file with no matches."""
-        with patch("zenodotos.client.DriveClient") as mock_client_class:
+        with patch("zenodotos.drive.client.DriveClient") as mock_client_class:
             mock_client = Mock()
             mock_client_class.return_value = mock_client
 
@@ -286,7 +465,7 @@ class TestZenodotos:
 
     def test_search_and_get_file_multiple_matches(self):
         """Test search_and_get_file with multiple matches."""
-        with patch("zenodotos.client.DriveClient") as mock_client_class:
+        with patch("zenodotos.drive.client.DriveClient") as mock_client_class:
             mock_client = Mock()
             mock_client_class.return_value = mock_client
 
@@ -310,12 +489,146 @@ class TestZenodotos:
 
     def test_get_field_parser(self):
         """Test get_field_parser returns FieldParser instance."""
-        with patch("zenodotos.client.DriveClient"):
+        with patch("zenodotos.drive.client.DriveClient"):
             zenodotos = Zenodotos()
             field_parser = zenodotos.get_field_parser()
 
             assert isinstance(field_parser, FieldParser)
 
+    def test_download_file(self):
+        """Test download_file delegates to the Drive client."""
+        with patch("zenodotos.drive.client.DriveClient") as mock_client_class:
+            mock_client = mock_client_class.return_value
+            mock_client.download.return_value = "scan.pdf"
+
+            assert Zenodotos().download_file("file_id") == "scan.pdf"
+            mock_client.download.assert_called_once_with("file_id", None, file=None)
+
+    def test_walk(self):
+        """Test walk runs a FolderWalker over the Drive client."""
+        with (
+            patch("zenodotos.drive.client.DriveClient") as mock_client_class,
+            patch("zenodotos.walker.FolderWalker") as mock_walker_class,
+        ):
+            mock_walker_class.return_value.walk.return_value = iter(["file"])
+
+            assert list(Zenodotos().walk("folder", fields=["size"], jobs=2)) == ["file"]
+            mock_walker_class.assert_called_once_with(
+                mock_client_class.return_value, fields=["size"], jobs=2
+            )
+            mock_walker_class.return_value.walk.assert_called_once_with("folder")
+
+    def test_mirror_folder(self, tmp_path):
+        """Test mirror_folder runs a FolderMirror with the Drive client."""
+        with (
+            patch("zenodotos.drive.client.DriveClient") as mock_client_class,
+            patch("zenodotos.mirror.FolderMirror") as mock_mirror_class,
+        ):
+            mock_mirror_class.return_value.run.return_value = {"downloaded": 1}
+
+            summary = Zenodotos().mirror_folder("folder", str(tmp_path), delete=True)
+
+            assert summary == {"downloaded": 1}
+            mock_mirror_class.assert_called_once_with(
+                mock_client_class.return_value,
+                "folder",
+                tmp_path,
+                delete=True,
+                jobs=4,
+            )
+
+
+class TestLocalIndexAccess:
+    """Tests for the local index entry points."""
+
+    def test_sync_index_uses_index_in_config_dir(self):
+        """Test sync_index syncs the index stored in the config directory."""
+        with (
+            patch("zenodotos.drive.client.DriveClient") as mock_client_class,
+            patch("zenodotos.client.Config") as mock_config_class,
+            patch("zenodotos.client.LocalIndex") as mock_index_class,
+        ):
+            mock_client = mock_client_class.return_value
+            mock_config_class.return_value.config_dir = Path("/config")
+            mock_index = mock_index_class.return_value
+            mock_index.sync.return_value = {"full": True}
+
+            zenodotos = Zenodotos()
+            assert zenodotos.sync_index(full=True) == {"full": True}
+            assert zenodotos.get_index() is mock_index
+
+            mock_index_class.assert_called_once_with(Path("/config/index.sqlite3"))
+            mock_index.sync.assert_called_once_with(mock_client, full=True)
+
+    def test_offline_queries_use_synced_index(self):
+        """Test offline listing and lookups read the local index only."""
+        with (
+            patch("zenodotos.drive.client.DriveClient") as mock_client_class,
+            patch("zenodotos.client.LocalIndex") as mock_index_class,
+        ):
+            mock_client = mock_client_class.return_value
+            mock_index = mock_index_class.return_value
+            file = DriveFile(id="1", name="Report", mime_type="text/plain")
+            mock_index.list_files.return_value = {
+                "files": [file],
+                "next_page_token": None,
+            }
+
+            zenodotos = Zenodotos()
+            assert zenodotos.list_files(query="name = 'Report'", offline=True) == [file]
+            assert list(zenodotos.iter_files(offline=True)) == [file]
+            assert (
+                zenodotos.search_and_get_file("name = 'Report'", offline=True) is file
+            )
+
+            mock_index.list_files.assert_called_with(
+                page_size=100, query="name = 'Report'"
+            )
+            mock_client.list_files.assert_not_called()
+            mock_client.get_file.assert_not_called()
+            mock_client_class.assert_not_called()
+
+    def test_offline_get_files(self):
+        """Test offline lookups report files missing from the index."""
+        with (
+            patch("zenodotos.drive.client.DriveClient") as mock_client_class,
+            patch("zenodotos.client.LocalIndex") as mock_index_class,
+        ):
+            file = DriveFile(id="1", name="Report", mime_type="text/plain")
+            mock_index_class.return_value.get_file.side_effect = [file, None]
+
+            results = Zenodotos().get_files(["1", "2"], offline=True)
+
+            assert results[0] is file
+            assert isinstance(results[1], FileNotFoundError)
+            mock_client_class.assert_not_called()
+
+    def test_search_files(self):
+        """Test search_files searches the synced index."""
+        with (
+            patch("zenodotos.drive.client.DriveClient") as mock_client_class,
+            patch("zenodotos.client.LocalIndex") as mock_index_class,
+        ):
+            mock_index = mock_index_class.return_value
+            mock_index.search.return_value = ["file"]
+
+            assert Zenodotos().search_files("report", limit=5) == ["file"]
+            mock_index.search.assert_called_once_with(
+                "report", limit=5, include_trashed=False
+            )
+            mock_client_class.assert_not_called()
+
+    def test_offline_requires_synced_index(self):
+        """Test offline queries fail clearly before the first sync."""
+        with (
+            patch("zenodotos.drive.client.DriveClient"),
+            patch("zenodotos.client.LocalIndex") as mock_index_class,
+        ):
+            mock_index_class.return_value.last_synced = None
+
+            with pytest.raises(RuntimeError, match="index sync"):
+                Zenodotos().list_files(offline=True)
+
 
 class TestFieldParser:
     """Test the FieldParser utility class."""
@@ -407,3 +720,38 @@ class TestFieldParser:
         assert "size" in all_fields
         assert len(all_fields) == 6
         assert requested_fields == ["createdTime", "id", "modifiedTime", "name"]
+
+
+class TestLazyExports:
+    """Test the exports of the zenodotos package."""
+
+    def test_every_export_resolves(self):
+        """Test every name in __all__ is importable from the package."""
+        import zenodotos
+
+        for name in zenodotos.__all__:
+            assert getattr(zenodotos, name) is not None
+        assert zenodotos.Zenodotos is Zenodotos
+        assert set(zenodotos.__all__) <= set(dir(zenodotos))
+
+    def test_version_fallback(self):
+        """Test the version falls back when the package is not installed."""
+        import importlib.metadata
+
+        import zenodotos
+
+        vars(zenodotos).pop("__version__", None)
+        with patch.object(
+            importlib.metadata,
+            "version",
+            side_effect=importlib.metadata.PackageNotFoundError,
+        ):
+            assert zenodotos.__version__ == "0.0.0"
+        vars(zenodotos).pop("__version__")
+
+    def test_unknown_attribute(self):
+        """Test unknown names still raise AttributeError."""
+        import zenodotos
+
+        with pytest.raises(AttributeError, match="has no attribute 'nope'"):
+            zenodotos.nope
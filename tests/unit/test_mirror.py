@@ -0,0 +1,203 @@
+"""Tests for the one-way folder mirror."""
+
+import json
+
+import pytest
+
+from zenodotos.drive.formats import ExportFormatsMixin
+from zenodotos.drive.models import DriveFile
+from zenodotos.mirror import STATE_FILE_NAME, FolderMirror
+
+DOC = "application/vnd.google-apps.document"
+FOLDER = "application/vnd.google-apps.folder"
+FORM = "application/vnd.google-apps.form"
+PDF = "application/pdf"
+
+
+class FakeDrive(ExportFormatsMixin):
+    """In-memory Drive holding a folder tree and recording transfers."""
+
+    def __init__(self):
+        self.children = {}
+        self.content = {}
+        self.transfers = []
+        self.fail = set()
+
+    def add(self, parent, file_id, name, mime_type=PDF, content=b"", **kwargs):
+        if mime_type != FOLDER and not mime_type.startswith("application/vnd.google"):
+            kwargs.setdefault("md5_checksum", f"md5-{content.hex()}")
+        self.children.setdefault(parent, []).append(
+            DriveFile(id=file_id, name=name, mime_type=mime_type, **kwargs)
+        )
+        self.content[file_id] = content
+
+    def remove(self, parent, file_id):
+        self.children[parent] = [f for f in self.children[parent] if f.id != file_id]
+
+    def list_files(self, page_size, page_token, query, fields, use_cache):
+        parent = query.split("'")[1]
+        return {"files": list(self.children.get(parent, [])), "next_page_token": None}
+
+    def get_service(self):
+        return None
+
+    def clone(self):
+        return self
+
+    def download(self, file_id, output_path, file=None):
+        return self._write("download", file_id, output_path)
+
+    def export(self, file_id, output_path, file=None):
+        return self._write("export", file_id, output_path)
+
+    def _write(self, kind, file_id, output_path):
+        self.transfers.append((kind, file_id))
+        if file_id in self.fail:
+            raise RuntimeError("Failed to download file: boom")
+        with open(output_path, "wb") as f:
+            f.write(self.content[file_id])
+        return output_path
+
+
+@pytest.fixture
+def drive():
+    """Create a Drive with a small folder tree."""
+    drive = FakeDrive()
+    drive.add("root", "doc", "Notes", DOC, version=3, content=b"notes")
+    drive.add("root", "pdf", "Scan.pdf", content=b"scan")
+    drive.add("root", "sub", "Sub", FOLDER)
+    drive.add("sub", "img", "photo.jpg", "image/jpeg", content=b"jpeg")
+    return drive
+
+
+def run(drive, destination, **kwargs):
+    return FolderMirror(drive, "root", destination, **kwargs).run()
+
+
+class TestFolderMirror:
+    """Tests for FolderMirror."""
+
+    def test_first_run_copies_tree(self, drive, tmp_path):
+        """Test binaries are downloaded and native documents exported."""
+        summary = run(drive, tmp_path)
+
+        assert summary["downloaded"] == 2
+        assert summary["exported"] == 1
+        assert summary["failed"] == {}
+        assert (tmp_path / "Scan.pdf").read_bytes() == b"scan"
+        assert (tmp_path / "Sub" / "photo.jpg").read_bytes() == b"jpeg"
+        assert (tmp_path / "Notes.zip").read_bytes() == b"notes"
+        state = json.loads((tmp_path / STATE_FILE_NAME).read_text())
+        assert state["folder_id"] == "root"
+        assert {entry["path"] for entry in state["files"]} == {
+            "Notes.zip",
+            "Scan.pdf",
+            "Sub/photo.jpg",
+        }
+
+    def test_second_run_skips_unchanged(self, drive, tmp_path):
+        """Test nothing is transferred again when nothing changed."""
+        run(drive, tmp_path)
+        drive.transfers.clear()
+
+        summary = run(drive, tmp_path)
+
+        assert summary["unchanged"] == 3
+        assert drive.transfers == []
+
+    def test_changed_files_are_transferred_again(self, drive, tmp_path):
+        """Test checksum and version changes trigger a new transfer."""
+        run(drive, tmp_path)
+        drive.transfers.clear()
+        drive.remove("root", "pdf")
+        drive.add("root", "pdf", "Scan.pdf", content=b"rescanned")
+        drive.remove("root", "doc")
+        drive.add("root", "doc", "Notes", DOC, version=4, content=b"edited")
+
+        summary = run(drive, tmp_path)
+
+        assert sorted(drive.transfers) == [("download", "pdf"), ("export", "doc")]
+        assert summary["unchanged"] == 1
+        assert (tmp_path / "Scan.pdf").read_bytes() == b"rescanned"
+
+    def test_missing_local_copy_is_transferred_again(self, drive, tmp_path):
+        """Test a deleted local copy is restored."""
+        run(drive, tmp_path)
+        drive.transfers.clear()
+        (tmp_path / "Scan.pdf").unlink()
+
+        run(drive, tmp_path)
+
+        assert drive.transfers == [("download", "pdf")]
+
+    def test_renamed_file_is_moved_locally(self, drive, tmp_path):
+        """Test a renamed but unchanged file is moved, not downloaded."""
+        run(drive, tmp_path)
+        drive.transfers.clear()
+        drive.remove("sub", "img")
+        drive.add("root", "img", "holiday.jpg", "image/jpeg", content=b"jpeg")
+
+        summary = run(drive, tmp_path)
+
+        assert summary["moved"] == 1
+        assert drive.transfers == []
+        assert (tmp_path / "holiday.jpg").read_bytes() == b"jpeg"
+        assert not (tmp_path / "Sub" / "photo.jpg").exists()
+
+    def test_removed_files_are_kept_unless_delete(self, drive, tmp_path):
+        """Test local copies are only deleted when asked to."""
+        run(drive, tmp_path)
+        drive.remove("root", "pdf")
+
+        assert run(drive, tmp_path)["deleted"] == 0
+        assert (tmp_path / "Scan.pdf").exists()
+
+        assert run(drive, tmp_path, delete=True)["deleted"] == 1
+        assert not (tmp_path / "Scan.pdf").exists()
+        state = json.loads((tmp_path / STATE_FILE_NAME).read_text())
+        assert "pdf" not in {entry["id"] for entry in state["files"]}
+
+    def test_failed_transfer_is_retried(self, drive, tmp_path):
+        """Test a failure is reported and retried on the next run."""
+        drive.fail.add("pdf")
+
+        summary = run(drive, tmp_path)
+
+        assert list(summary["failed"]) == ["Scan.pdf"]
+        assert summary["downloaded"] == 1
+        drive.fail.clear()
+        drive.transfers.clear()
+        run(drive, tmp_path)
+        assert drive.transfers == [("download", "pdf")]
+
+    def test_name_collisions_get_stable_names(self, drive, tmp_path):
+        """Test files sharing a name are numbered in a stable order."""
+        drive.add("root", "pdf2", "Scan.pdf", content=b"second")
+        drive.add("root", "state", STATE_FILE_NAME, content=b"drive file")
+
+        run(drive, tmp_path)
+
+        assert (tmp_path / "Scan.pdf").read_bytes() == b"scan"
+        assert (tmp_path / "Scan (2).pdf").read_bytes() == b"second"
+        assert (tmp_path / "zenodotos-mirror.json").read_bytes() == b"drive file"
+
+    def test_unsupported_native_files_are_counted(self, drive, tmp_path):
+        """Test native types without an export are skipped."""
+        drive.add("root", "form", "Survey", FORM)
+
+        summary = run(drive, tmp_path)
+
+        assert summary["unsupported"] == 1
+        assert ("export", "form") not in drive.transfers
+
+    def test_destination_of_another_folder_is_rejected(self, drive, tmp_path):
+        """Test a destination can only mirror one folder."""
+        run(drive, tmp_path)
+
+        with pytest.raises(ValueError, match="is a mirror of folder root"):
+            FolderMirror(drive, "other", tmp_path).run()
+
+    def test_invalid_jobs(self, drive, tmp_path):
+        """Test jobs must be positive."""
+        with pytest.raises(ValueError, match="jobs must be at least 1"):
+            FolderMirror(drive, "root", tmp_path, jobs=0)
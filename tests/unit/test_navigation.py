@@ -1,6 +1,11 @@
 """Tests for the navigation module."""
 
-from unittest.mock import Mock, patch, call
+import subprocess
+import sys
+import time
+from unittest.mock import Mock, patch
+
+import pytest
 
 from zenodotos.cli.navigation import (
     fetch_page,
@@ -11,6 +16,7 @@ from zenodotos.cli.navigation import (
     interactive_pagination,
 )
 from zenodotos.cli.pagination import PaginationState
+from zenodotos.cli.prefetch import PagePrefetcher
 from zenodotos import Zenodotos
 from zenodotos.drive.models import DriveFile
 
@@ -34,7 +40,12 @@ class TestFetchPage:
         result = fetch_page(mock_zenodotos, state, fields)
 
         mock_zenodotos.list_files_with_pagination.assert_called_once_with(
-            page_size=20, page_token="current_token", query="query test", fields=fields
+            page_size=20,
+            page_token="current_token",
+            query="query test",
+            fields=fields,
+            offline=False,
+            use_cache=True,
         )
         assert result == expected_result
         assert state.current_result == expected_result
@@ -51,7 +62,12 @@ class TestFetchPage:
         result = fetch_page(mock_zenodotos, state, fields)
 
         mock_zenodotos.list_files_with_pagination.assert_called_once_with(
-            page_size=10, page_token=None, query=None, fields=fields
+            page_size=10,
+            page_token=None,
+            query=None,
+            fields=fields,
+            offline=False,
+            use_cache=True,
         )
         assert result == expected_result
 
@@ -292,72 +308,86 @@ class TestNavigateToPreviousPage:
 
     def test_navigate_to_previous_page_from_page_2(self):
         """Test navigate_to_previous_page simple case from page 2 to page 1."""
-        mock_zenodotos = Mock(spec=Zenodotos)
         state = PaginationState(10, "test query")
         state.page_number = 2
         state.page_token = "current_token"
-        fields = ["id", "name"]
 
-        navigate_to_previous_page(mock_zenodotos, state, fields)
+        navigate_to_previous_page(state)
 
-        # Should reset to first page without calling client.list_files
         assert state.page_number == 1
         assert state.page_token is None
-        mock_zenodotos.list_files_with_pagination.assert_not_called()
 
-    def test_navigate_to_previous_page_from_page_3_complex_case(self):
-        """Test navigate_to_previous_page complex case from page 3+ by rebuilding path."""
+    def test_navigate_to_previous_page_uses_recorded_token(self):
+        """Test navigate_to_previous_page restores the token of a deep page."""
+        state = PaginationState(10, "test query")
+        for token in ["token_to_page_2", "token_to_page_3", "token_to_page_4"]:
+            state.current_result = {"files": [], "next_page_token": token}
+            state.go_to_next_page()
+        assert state.page_number == 4
+
+        navigate_to_previous_page(state)
+
+        assert state.page_number == 3
+        assert state.page_token == "token_to_page_3"
+
+    def test_back_and_forward_cost_no_api_calls_for_seen_pages(self):
+        """Test that revisiting pages is served from the page cache."""
         mock_zenodotos = Mock(spec=Zenodotos)
-        # Mock client to return successive page tokens for path reconstruction
-        mock_zenodotos.list_files_with_pagination.side_effect = [
-            {"files": [], "next_page_token": "token_to_page_2"},
-            {"files": [], "next_page_token": "token_to_page_3"},
+        pages = [
+            {"files": [{"id": str(n)}], "next_page_token": f"token_to_page_{n + 1}"}
+            for n in range(1, 51)
         ]
-
+        mock_zenodotos.list_files_with_pagination.side_effect = pages
         state = PaginationState(10, "test query")
-        state.page_number = 4  # Navigate from page 4 to page 3
-        state.page_token = "current_token_page_4"
-        fields = ["id", "name", "size"]
+        fields = ["id", "name"]
 
-        navigate_to_previous_page(mock_zenodotos, state, fields)
+        fetch_page(mock_zenodotos, state, fields)
+        for _ in range(49):
+            state.go_to_next_page()
+            fetch_page(mock_zenodotos, state, fields)
+        assert mock_zenodotos.list_files_with_pagination.call_count == 50
 
-        # Should make 2 calls to rebuild path to page 3 (target_page - 1 = 3 - 1 = 2 calls)
-        assert mock_zenodotos.list_files_with_pagination.call_count == 2
-        # Verify calls were made correctly for path reconstruction
-        expected_calls = [
-            call(page_size=10, page_token=None, query="test query", fields=fields),
-            call(
-                page_size=10,
-                page_token="token_to_page_2",
-                query="test query",
-                fields=fields,
-            ),
-        ]
-        mock_zenodotos.list_files_with_pagination.assert_has_calls(expected_calls)
+        navigate_to_previous_page(state)
+        result = fetch_page(mock_zenodotos, state, fields)
+        assert result == pages[48]
+        state.go_to_next_page()
+        result = fetch_page(mock_zenodotos, state, fields)
+        assert result == pages[49]
 
-        # Should end up on page 3 with the correct token
-        assert state.page_number == 3
-        assert state.page_token == "token_to_page_3"
+        assert mock_zenodotos.list_files_with_pagination.call_count == 50
 
-    def test_navigate_to_previous_page_with_early_break(self):
-        """Test navigate_to_previous_page when next_page_token becomes None during reconstruction."""
+    def test_evicted_page_is_refetched_with_recorded_token(self):
+        """Test that a page evicted from the cache costs a single API call."""
         mock_zenodotos = Mock(spec=Zenodotos)
-        # First call returns token, second call returns None (end of results)
         mock_zenodotos.list_files_with_pagination.side_effect = [
             {"files": [], "next_page_token": "token_to_page_2"},
-            {"files": [], "next_page_token": None},  # No more pages
+            {"files": [], "next_page_token": "token_to_page_3"},
+            {"files": [], "next_page_token": "token_to_page_4"},
+            {"files": [], "next_page_token": "token_to_page_3"},
         ]
-
-        state = PaginationState(10, None)
-        state.page_number = 5  # Try to navigate from page 5 to page 4
+        state = PaginationState(10, "test query", max_cached_pages=2)
         fields = ["id", "name"]
 
-        navigate_to_previous_page(mock_zenodotos, state, fields)
+        fetch_page(mock_zenodotos, state, fields)
+        for _ in range(2):
+            state.go_to_next_page()
+            fetch_page(mock_zenodotos, state, fields)
 
-        # Should make 2 calls but break early when next_page_token is None
-        assert mock_zenodotos.list_files_with_pagination.call_count == 2
-        assert state.page_number == 4  # Target page
-        assert state.page_token is None  # Should be None due to early break
+        navigate_to_previous_page(state)
+        fetch_page(mock_zenodotos, state, fields)
+        navigate_to_previous_page(state)
+        fetch_page(mock_zenodotos, state, fields)
+
+        assert mock_zenodotos.list_files_with_pagination.call_count == 4
+        mock_zenodotos.list_files_with_pagination.assert_called_with(
+            page_size=10,
+            page_token=None,
+            query="test query",
+            fields=fields,
+            offline=False,
+            use_cache=True,
+        )
+        assert state.page_number == 1
 
 
 class TestGetNavigationOptions:
@@ -381,3 +411,172 @@ class TestGetNavigationOptions:
         options = get_navigation_options(state)
 
         assert options == ["[P]rev", "[N]ext", "[Q]uit"]
+
+
+class TestPagePrefetcher:
+    """Tests for background page prefetching."""
+
+    @staticmethod
+    def _pages(count):
+        return [
+            {"files": [{"id": str(n)}], "next_page_token": f"token_to_page_{n + 1}"}
+            for n in range(1, count + 1)
+        ]
+
+    def test_next_page_is_fetched_in_background(self):
+        """Test that turning the page reuses the prefetched result."""
+        mock_zenodotos = Mock(spec=Zenodotos)
+        pages = self._pages(2)
+        mock_zenodotos.list_files_with_pagination.side_effect = pages
+        state = PaginationState(10, "test query")
+        fields = ["id", "name"]
+
+        with PagePrefetcher(mock_zenodotos, fields, depth=1) as prefetcher:
+            fetch_page(mock_zenodotos, state, fields, prefetcher)
+            prefetcher.schedule(state)
+            state.go_to_next_page()
+            result = fetch_page(mock_zenodotos, state, fields, prefetcher)
+
+        assert result == pages[1]
+        assert mock_zenodotos.list_files_with_pagination.call_count == 2
+        mock_zenodotos.list_files_with_pagination.assert_called_with(
+            page_size=10,
+            page_token="token_to_page_2",
+            query="test query",
+            fields=fields,
+            offline=False,
+            use_cache=True,
+        )
+
+    def test_prefetch_depth_chains_page_tokens(self):
+        """Test that deeper prefetches use the tokens of the pages before them."""
+        mock_zenodotos = Mock(spec=Zenodotos)
+        mock_zenodotos.list_files_with_pagination.side_effect = self._pages(4)
+        state = PaginationState(10, None)
+        fields = ["id"]
+
+        with PagePrefetcher(mock_zenodotos, fields, depth=3) as prefetcher:
+            fetch_page(mock_zenodotos, state, fields, prefetcher)
+            prefetcher.schedule(state)
+            for _ in range(3):
+                state.go_to_next_page()
+                fetch_page(mock_zenodotos, state, fields, prefetcher)
+
+        tokens = [
+            c.kwargs["page_token"]
+            for c in mock_zenodotos.list_files_with_pagination.call_args_list
+        ]
+        assert tokens == [None, "token_to_page_2", "token_to_page_3", "token_to_page_4"]
+
+    def test_no_prefetch_past_last_page(self):
+        """Test that nothing is prefetched when there is no next page."""
+        mock_zenodotos = Mock(spec=Zenodotos)
+        mock_zenodotos.list_files_with_pagination.return_value = {
+            "files": [],
+            "next_page_token": None,
+        }
+        state = PaginationState(10, None)
+
+        with PagePrefetcher(mock_zenodotos, ["id"], depth=2) as prefetcher:
+            fetch_page(mock_zenodotos, state, ["id"], prefetcher)
+            prefetcher.schedule(state)
+
+        assert mock_zenodotos.list_files_with_pagination.call_count == 1
+
+    def test_prefetch_error_is_raised_on_its_page_and_retry_refetches(self):
+        """Test that a failed prefetch surfaces when its page is shown."""
+        mock_zenodotos = Mock(spec=Zenodotos)
+        pages = self._pages(2)
+        mock_zenodotos.list_files_with_pagination.side_effect = [
+            pages[0],
+            RuntimeError("boom"),
+            pages[1],
+        ]
+        state = PaginationState(10, None)
+        fields = ["id"]
+
+        with PagePrefetcher(mock_zenodotos, fields, depth=2) as prefetcher:
+            fetch_page(mock_zenodotos, state, fields, prefetcher)
+            prefetcher.schedule(state)
+            state.go_to_next_page()
+            with pytest.raises(RuntimeError, match="boom"):
+                fetch_page(mock_zenodotos, state, fields, prefetcher)
+
+            result = fetch_page(mock_zenodotos, state, fields, prefetcher)
+
+        assert result == pages[1]
+        assert mock_zenodotos.list_files_with_pagination.call_count == 3
+
+    def test_close_stops_prefetching(self):
+        """Test that nothing is prefetched once the prefetcher is closed."""
+        mock_zenodotos = Mock(spec=Zenodotos)
+        state = PaginationState(10, None)
+        state.current_result = {"files": [], "next_page_token": "token_to_page_2"}
+        prefetcher = PagePrefetcher(mock_zenodotos, ["id"], depth=1)
+
+        prefetcher.close()
+        prefetcher.schedule(state)
+
+        mock_zenodotos.list_files_with_pagination.assert_not_called()
+
+    def test_exit_does_not_wait_for_running_prefetch(self):
+        """Test that quitting while a page is being prefetched exits at once."""
+        script = (
+            "import threading\n"
+            "from unittest.mock import Mock\n"
+            "from zenodotos.cli.pagination import PaginationState\n"
+            "from zenodotos.cli.prefetch import PagePrefetcher\n"
+            "started = threading.Event()\n"
+            "def hang(**kwargs):\n"
+            "    started.set()\n"
+            "    threading.Event().wait(60)\n"
+            "zenodotos = Mock()\n"
+            "zenodotos.list_files_with_pagination.side_effect = hang\n"
+            "state = PaginationState(10, None)\n"
+            "state.current_result = {'files': [], 'next_page_token': 'token'}\n"
+            "with PagePrefetcher(zenodotos, ['id'], depth=1) as prefetcher:\n"
+            "    prefetcher.schedule(state)\n"
+            "    started.wait(10)\n"
+        )
+        started = time.monotonic()
+
+        subprocess.run([sys.executable, "-c", script], check=True, timeout=30)
+
+        assert time.monotonic() - started < 10
+
+    def test_negative_depth_is_rejected(self):
+        """Test that a negative prefetch depth raises ValueError."""
+        with pytest.raises(ValueError, match="depth must not be negative"):
+            PagePrefetcher(Mock(spec=Zenodotos), ["id"], depth=-1)
+
+
+class TestInteractivePaginationErrors:
+    """Tests for page errors during interactive pagination."""
+
+    @patch("zenodotos.cli.navigation.click.getchar")
+    @patch("zenodotos.cli.navigation.click.clear")
+    @patch("zenodotos.cli.navigation.click.echo")
+    def test_page_error_is_shown_and_navigation_continues(
+        self, mock_echo, mock_clear, mock_getchar
+    ):
+        """Test that a failed page shows its error and offers a retry."""
+        mock_zenodotos = Mock(spec=Zenodotos)
+        mock_zenodotos.list_files_with_pagination.side_effect = [
+            RuntimeError("API down"),
+            {"files": [], "next_page_token": None},
+        ]
+        mock_getchar.side_effect = ["r", "q"]
+
+        interactive_pagination(
+            zenodotos=mock_zenodotos,
+            page_size=10,
+            query=None,
+            all_fields=["id", "name"],
+            requested_fields=["id", "name"],
+            prefetch_depth=0,
+        )
+
+        mock_echo.assert_any_call("Error loading page 1: API down", err=True)
+        mock_echo.assert_any_call("\n[R]etry [Q]uit: ", nl=False)
+        assert mock_zenodotos.list_files_with_pagination.call_count == 2
+        mock_echo.assert_called_with("\nGoodbye!")
@@ -0,0 +1,162 @@
+"""Tests for offline evaluation of Drive search queries."""
+
+from datetime import datetime, timezone
+from unittest.mock import Mock
+
+import pytest
+
+from zenodotos.drive.models import DriveFile
+from zenodotos.exceptions import ValidationError
+from zenodotos.index import LocalIndex
+from zenodotos.query import compile_query, format_timestamp
+
+DOC = "application/vnd.google-apps.document"
+SHEET = "application/vnd.google-apps.spreadsheet"
+
+
+def make_file(file_id, name, mime_type=DOC, day=1, **kwargs):
+    return DriveFile(
+        id=file_id,
+        name=name,
+        mime_type=mime_type,
+        modified_time=datetime(2024, 1, day, tzinfo=timezone.utc),
+        created_time=datetime(2023, 12, day, tzinfo=timezone.utc),
+        **kwargs,
+    )
+
+
+FILES = [
+    make_file(
+        "report",
+        "Quarterly Report",
+        day=3,
+        parents=["folder"],
+        owners=[{"emailAddress": "alice@example.com"}],
+    ),
+    make_file(
+        "budget",
+        "Budget 100%",
+        SHEET,
+        day=2,
+        parents=["folder", "shared"],
+        owners=[{"emailAddress": "bob@example.com"}],
+        description="Yearly report figures",
+    ),
+    make_file("old", "Old notes", day=1, parents=["root"], trashed=True),
+]
+
+
+@pytest.fixture
+def index(tmp_path):
+    """Create an index holding FILES."""
+    client = Mock()
+    client.get_start_page_token.return_value = "1"
+    client.list_files.return_value = {"files": FILES, "next_page_token": None}
+    local_index = LocalIndex(tmp_path / "index.sqlite3")
+    local_index.sync(client)
+    yield local_index
+    local_index.close()
+
+
+def matching(index, query):
+    return [file.id for file in index.query(query)]
+
+
+class TestQuery:
+    """Tests for LocalIndex.query and the query compiler."""
+
+    @pytest.mark.parametrize(
+        "query, expected",
+        [
+            ("name contains 'report'", ["report"]),
+            ("name = 'Old notes'", ["old"]),
+            ("name != 'Old notes'", ["report", "budget"]),
+            ("name contains '100%'", ["budget"]),
+            ("name contains '_'", []),
+            ("fullText contains 'report'", ["report", "budget"]),
+            (f"mimeType = '{SHEET}'", ["budget"]),
+            ("mimeType contains 'document'", ["report", "old"]),
+            ("modifiedTime > '2024-01-01T12:00:00'", ["report", "budget"]),
+            ("modifiedTime <= '2024-01-02T00:00:00Z'", ["budget", "old"]),
+            ("createdTime < '2023-12-02'", ["old"]),
+            ("trashed = true", ["old"]),
+            ("trashed = false", ["report", "budget"]),
+            ("'shared' in parents", ["budget"]),
+            ("'alice@example.com' in owners", ["report"]),
+            ("name contains 'o' and not name contains 'budget'", ["report", "old"]),
+            ("name = 'Old notes' or 'shared' in parents", ["budget", "old"]),
+            (
+                "('folder' in parents or trashed = true) and name contains 'e'",
+                ["report", "budget", "old"],
+            ),
+            ("not fullText contains 'report'", ["old"]),
+            ("NAME CONTAINS 'x'", None),
+        ],
+    )
+    def test_queries(self, index, query, expected):
+        """Test each supported term against the indexed files."""
+        if expected is None:
+            with pytest.raises(ValidationError):
+                index.query(query)
+        else:
+            assert matching(index, query) == expected
+
+    def test_and_binds_tighter_than_or(self, index):
+        """Test and/or precedence follows the Drive grammar."""
+        query = "trashed = true or name contains 'budget' and 'shared' in parents"
+        assert matching(index, query) == ["budget", "old"]
+
+    def test_escaped_quotes(self, index):
+        """Test backslash escapes inside quoted values."""
+        sql, params = compile_query(r"name = 'Bob\'s file'")
+        assert sql == "name = ?"
+        assert params == ["Bob's file"]
+
+    def test_double_quoted_values(self, index):
+        """Test values may also be enclosed in double quotes."""
+        assert matching(index, 'name contains "notes"') == ["old"]
+
+    def test_no_query_matches_everything(self, index):
+        """Test an empty query returns every file, newest first."""
+        assert matching(index, None) == ["report", "budget", "old"]
+
+    def test_list_files_pages_through_matches(self, index):
+        """Test list_files returns pages with offset tokens."""
+        first = index.list_files(page_size=2)
+        second = index.list_files(page_size=2, page_token=first["next_page_token"])
+
+        assert [f.id for f in first["files"]] == ["report", "budget"]
+        assert first["next_page_token"] == "2"
+        assert [f.id for f in second["files"]] == ["old"]
+        assert second["next_page_token"] is None
+
+    def test_list_files_invalid_page_token(self, index):
+        """Test a page token from the Drive API is rejected offline."""
+        with pytest.raises(ValidationError, match="Invalid page token"):
+            index.list_files(page_token="not-an-offset")
+
+    @pytest.mark.parametrize(
+        "query, message",
+        [
+            ("name contains", "expected a quoted value at end"),
+            ("name ~ 'x'", "unexpected character '~'"),
+            ("(name = 'x'", r"expected '\)' at end"),
+            ("name = 'x' name = 'y'", "Unexpected 'name'"),
+            ("size > '10'", "unsupported field 'size'"),
+            ("trashed contains 'x'", "operator 'contains' is not supported"),
+            ("name > 'x'", "operator '>' is not supported"),
+            ("modifiedTime > 'yesterday'", "not an RFC 3339 timestamp"),
+            ("'x' in writers", "Unsupported collection 'writers'"),
+            ("'x' parents", "Expected 'in' before 'parents'"),
+        ],
+    )
+    def test_invalid_queries(self, query, message):
+        """Test malformed and unsupported queries raise ValidationError."""
+        with pytest.raises(ValidationError, match=message):
+            compile_query(query)
+
+    def test_format_timestamp_sorts_chronologically(self):
+        """Test timestamps in other zones are normalized to UTC."""
+        local = datetime.fromisoformat("2024-01-01T09:00:00+10:00")
+        assert format_timestamp(local) == "2023-12-31T23:00:00.000000+00:00"
+        assert format_timestamp(None) is None
@@ -0,0 +1,110 @@
+"""Tests for phase timings."""
+
+import threading
+from unittest.mock import patch
+
+import pytest
+
+from zenodotos.drive.client import DriveClient
+from zenodotos.drive.fake_server import FakeDriveServer
+from zenodotos.drive.metrics import TimingsHook
+from zenodotos.timings import (
+    Timings,
+    disable_timings,
+    enable_timings,
+    get_timings,
+    phase,
+)
+
+
+@pytest.fixture
+def timings():
+    """Record timings for the duration of a test."""
+    yield enable_timings()
+    disable_timings()
+
+
+def clock(*values):
+    """Patch the clock of the timings module to return the given values."""
+    return patch("zenodotos.timings.time.perf_counter", side_effect=values)
+
+
+class TestTimings:
+    """Tests for Timings."""
+
+    def test_nested_phases_are_exclusive(self):
+        """Test time in a nested phase is not counted in the enclosing one."""
+        timings = Timings(started=0.0)
+        with clock(1.0, 2.0, 5.0, 7.0):
+            timings.start("api batch")
+            timings.start("parse")
+            timings.stop()
+            timings.stop()
+        timings.add("parse", 0.5)
+
+        assert timings.phases() == {
+            "parse": {"seconds": 3.5, "count": 2},
+            "api batch": {"seconds": 3.0, "count": 1},
+        }
+
+    def test_report(self):
+        """Test the report lists every phase and the time left over."""
+        timings = Timings(started=0.0)
+        timings.add("import", 0.25)
+        timings.add("api drive.files.list", 1.5)
+
+        with clock(2.0):
+            report = timings.report()
+
+        assert report.splitlines() == [
+            "Timings (seconds):",
+            "  import                      1x      0.250",
+            "  api drive.files.list        1x      1.500",
+            "  other                               0.250",
+            "  total                               2.000",
+        ]
+
+    def test_report_with_worker_threads(self):
+        """Test worker thread phases are flagged as overlapping."""
+        timings = Timings()
+        timings.add("format", 0.1)
+        worker = threading.Thread(target=timings.add, args=("parse", 0.1))
+        worker.start()
+        worker.join()
+
+        assert "worker threads overlap" in timings.report()
+        assert "other" not in timings.report()
+
+
+class TestPhase:
+    """Tests for the phase context manager."""
+
+    def test_disabled(self):
+        """Test phases record nothing when timing is disabled."""
+        assert get_timings() is None
+        with phase("parse"):
+            pass
+
+    def test_enabled(self, timings):
+        """Test phases are recorded in the enabled timings."""
+        with clock(1.0, 1.5, 2.0, 2.25):
+            with phase("parse"):
+                pass
+            with phase("parse"):
+                pass
+
+        assert timings.phases() == {"parse": {"seconds": 0.75, "count": 2}}
+
+    def test_requests_are_timed(self, timings):
+        """Test clients created while timing time their requests."""
+        with FakeDriveServer(size=5) as server:
+            client = DriveClient(api_endpoint=server.url)
+            client.list_files()
+
+        assert any(isinstance(hook, TimingsHook) for hook in client.hooks)
+        assert list(timings.phases()) == [
+            "config",
+            "service build",
+            "api drive.files.list",
+            "parse",
+        ]
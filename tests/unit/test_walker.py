@@ -0,0 +1,116 @@
+"""Tests for the concurrent folder tree walker."""
+
+import threading
+from unittest.mock import Mock
+
+import pytest
+
+from zenodotos.drive.models import DriveFile
+from zenodotos.walker import FOLDER_MIME_TYPE, FolderWalker
+
+
+def folder(file_id, name):
+    return DriveFile(id=file_id, name=name, mime_type=FOLDER_MIME_TYPE)
+
+
+def pdf(file_id, name):
+    return DriveFile(id=file_id, name=name, mime_type="application/pdf")
+
+
+TREE = {
+    "root": [pdf("r1", "b.pdf"), folder("docs", "Docs"), pdf("r2", "a.pdf")],
+    "docs": [folder("old", "Old"), pdf("d1", "spec.pdf")],
+    "old": [pdf("o1", "v1.pdf"), folder("root", "Loop")],
+}
+
+
+def make_client(tree, files_per_page=None):
+    """Create a client listing ``tree``, optionally split into pages."""
+    client = Mock()
+    client.clone.return_value = client
+
+    def list_files(page_size, page_token, query, fields, use_cache):
+        children = tree.get(query.split("'")[1], [])
+        if files_per_page is None:
+            return {"files": list(children), "next_page_token": None}
+        start = int(page_token or 0)
+        end = start + files_per_page
+        next_token = str(end) if end < len(children) else None
+        return {"files": children[start:end], "next_page_token": next_token}
+
+    client.list_files.side_effect = list_files
+    return client
+
+
+class TestFolderWalker:
+    """Tests for FolderWalker."""
+
+    def test_walk_yields_paths(self):
+        """Test every file is yielded once with its path, folders first."""
+        files = list(FolderWalker(make_client(TREE)).walk("root"))
+
+        assert [f.path for f in files] == [
+            "Docs",
+            "a.pdf",
+            "b.pdf",
+            "Docs/Old",
+            "Docs/spec.pdf",
+            "Docs/Old/Loop",
+            "Docs/Old/v1.pdf",
+        ]
+
+    def test_walk_follows_page_tokens(self):
+        """Test folders with several pages of children are listed fully."""
+        client = make_client(TREE, files_per_page=2)
+
+        files = list(FolderWalker(client).walk("root"))
+
+        assert len(files) == 7
+        assert client.list_files.call_count == 4
+
+    def test_queries_skip_trashed_files(self):
+        """Test each folder is listed with an uncached parents query."""
+        client = make_client({"root": []})
+
+        list(FolderWalker(client, fields=["size"]).walk("root"))
+
+        client.list_files.assert_called_once_with(
+            page_size=1000,
+            page_token=None,
+            query="'root' in parents and trashed = false",
+            fields=["id", "name", "mimeType", "size"],
+            use_cache=False,
+        )
+
+    def test_folders_are_listed_concurrently(self):
+        """Test sibling folders are listed at the same time, up to jobs."""
+        tree = {"root": [folder(str(n), f"f{n}") for n in range(6)]}
+        barrier = threading.Barrier(3, timeout=5)
+        client = make_client(tree)
+        list_files = client.list_files.side_effect
+
+        def wait_for_siblings(**kwargs):
+            if kwargs["query"].startswith("'root'"):
+                return list_files(**kwargs)
+            # Only passes once three listings are running together
+            barrier.wait()
+            return list_files(**kwargs)
+
+        client.list_files.side_effect = wait_for_siblings
+
+        files = list(FolderWalker(client, jobs=3).walk("root"))
+
+        assert len(files) == 6
+
+    def test_listing_error_stops_the_walk(self):
+        """Test API errors are raised to the caller."""
+        client = make_client(TREE)
+        client.list_files.side_effect = RuntimeError("Failed to list files")
+
+        with pytest.raises(RuntimeError, match="Failed to list files"):
+            list(FolderWalker(client).walk("root"))
+
+    def test_invalid_jobs(self):
+        """Test jobs must be positive."""
+        with pytest.raises(ValueError, match="jobs must be at least 1"):
+            FolderWalker(Mock(), jobs=0)